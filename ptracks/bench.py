@@ -0,0 +1,752 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+bench
+
+benchmark do núcleo de emulação. Gera exercícios sintéticos com N tráfegos distribuídos pelos
+procedimentos de tabTrj, tabEsp e tabSub, executa o newton em fast-time (sem interface) por uma
+duração simulada fixa e grava os resultados (ticks/s, custo por aeronave, custo do check de
+proximidade e custo de codificação das mensagens) em json.
+
+no modo -C (--cine), verifica que a atualização vetorial da frota (CCineFrota) produz o mesmo
+estado que a escalar (dados_dinamicos), passo a passo, para uma frota sintética.
+
+uso: python -m ptracks.bench -n 10,100,1000 -d 600 -o bench.json
+     python -m ptracks.bench -n 10,1000 -C 2000
+
+revision 0.1  2016/out  mlabru
+initial release (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import argparse
+import ConfigParser
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import xml.etree.ElementTree as ET
+
+# model
+from .model import data
+from .model import glb_defs as gdefs
+from .model.emula.cine import cine_data as cdata
+from .model.emula.cine import cine_frota as cinfrota
+from .model.emula.cine import dados_dinamicos as cine
+from .model.newton import defs_newton as ldefs
+from .model.newton import trk_codec as tcodec
+
+# < defines >--------------------------------------------------------------------------------------
+
+# nome do exercício sintético
+D_BCH_EXE = "BENCH"
+
+# deslocamento máximo (graus) aplicado às coordenadas de partida, para espalhar os tráfegos
+D_BCH_JITTER = .05
+
+# tamanho do datagrama de lote na medida de codificação (o default de net.tmtu)
+D_BCH_MTU = 1400
+
+# intervalo nominal entre ticks na verificação da cinemática (s)
+D_CIN_TICK = .5
+
+# intervalo (em ticks) entre mudanças de demanda na frota sintética
+D_CIN_DEM = 20
+
+# tolerância absoluta da verificação CCineFrota x dados_dinamicos, por campo. Os dois caminhos
+# fazem as mesmas operações em ordem diferente, a diferença esperada é de arredondamento (as proas
+# são arredondadas em 0.01 gr nos dois caminhos e têm que ser iguais)
+D_CIN_TOL = (("f_trf_x", 1e-3),             # m
+             ("f_trf_y", 1e-3),             # m
+             ("f_trf_alt_atu", 1e-6),       # m
+             ("f_trf_pro_atu", 1e-6),       # gr
+             ("f_trf_vel_atu", 1e-9))       # m/s
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+M_LOG = logging.getLogger(__name__)
+M_LOG.setLevel(logging.INFO)
+
+# trafego do exercício sintético
+M_TRF_XML = """
+    <trafego nTrf="{id}">
+        <designador>{prf}</designador>
+        <ssr>{ssr}</ssr>
+        <indicativo>{ind}</indicativo>
+        <procedimento>{prc}</procedimento>
+        <temptrafego>0</temptrafego>
+        <coord>
+{coord}
+        </coord>
+        <velocidade>{vel}</velocidade>
+        <altitude>{alt}</altitude>
+        <proa>{pro}</proa>
+    </trafego>
+"""
+
+# -------------------------------------------------------------------------------------------------
+
+def bench_encode(fi_rep):
+    """
+    mede o custo de codificação de uma mensagem de pista nos formatos texto, binário e lote
+
+    @param fi_rep: quantidade de repetições
+
+    @return dicionário com o custo por pista (us)
+    """
+    # pista típica, com os valores que o newton envia (ssr em texto octal, sem SPI = -1)
+    lt_trk = (1, "7003", -1, 3000., -15.861641, -47.897610, 250., 0., 46., "TAM6543", "B737", 1234.5)
+
+    # pista pré-codificada para o lote
+    ls_trk = tcodec.pack_trk(*lt_trk)
+
+    # pistas por datagrama de lote
+    li_lote = max(1, (D_BCH_MTU - tcodec.M_BIN_LOTE_SIZE) // tcodec.D_BIN_TRK.size)
+
+    # custo por pista (us)
+    lf_txt = timeit.timeit(lambda: tcodec.encode_txt(*lt_trk), number=fi_rep) / fi_rep * 1e6
+    lf_bin = timeit.timeit(lambda: tcodec.encode_trk(*lt_trk), number=fi_rep) / fi_rep * 1e6
+    lf_pack = timeit.timeit(lambda: tcodec.pack_trk(*lt_trk), number=fi_rep) / fi_rep * 1e6
+    lf_lote = timeit.timeit(lambda: tcodec.encode_lote(0, [ls_trk] * li_lote), number=fi_rep) / fi_rep * 1e6
+
+    # return
+    return {"txt_us": lf_txt,
+            "bin_us": lf_bin,
+            "lote_us": lf_pack + (lf_lote / li_lote),
+            "lote_trks": li_lote}
+
+# < class CAtvCine >-------------------------------------------------------------------------------
+
+class CAtvCine(object):
+    """
+    aeronave sintética da verificação da cinemática, somente com os dados usados por
+    dados_dinamicos e CCineFrota
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, fdct_ini):
+        """
+        @param fdct_ini: estado inicial (campo -> valor)
+        """
+        # aeronave ativa, em vôo normal
+        self.v_atv_ok = True
+        self.en_trf_est_atv = ldefs.E_ATIVA
+        self.c_atv_status_voo = 'N'
+
+        # sem fixos de referência e sem SPI
+        self.ptr_atv_fix_eto = None
+        self.ptr_atv_fix_prc = None
+        self.ptr_atv_fix_drd = None
+        self.i_atv_spi = -1
+
+        # hora da última atualização
+        self.l_atv_time_ant = 0.
+
+        # dados calculados
+        self.f_atv_vel_gnd = 0.
+        self.f_atv_dst_crd = 0.
+        self.f_atv_rad_crd = 0.
+
+        # estado inicial
+        self.__dict__.update(fdct_ini)
+
+# < class CFeCine >--------------------------------------------------------------------------------
+
+class CFeCine(object):
+    """
+    flight engine sintético da verificação da cinemática (faz também o papel de cine_voo)
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, f_atv):
+        """
+        @param f_atv: aeronave sintética
+        """
+        self.atv = f_atv
+        self.cine_data = cdata.CCineData()
+        self.cine_voo = self
+
+        # variação de tempo usada pelos procedimentos
+        self.f_delta_t = 0.
+
+    # ---------------------------------------------------------------------------------------------
+
+    def send_trks(self):
+        """
+        não há consoles na verificação
+        """
+        pass
+
+# < class CRelogioCine >---------------------------------------------------------------------------
+
+class CRelogioCine(object):
+    """
+    relógio da simulação da verificação da cinemática, avançado a cada tick
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self):
+
+        # hora atual (s)
+        self.f_hora = 0.
+
+    # ---------------------------------------------------------------------------------------------
+
+    def obtem_hora_sim(self):
+        """
+        hora atual da simulação (s)
+        """
+        return self.f_hora
+
+    # ---------------------------------------------------------------------------------------------
+
+    def get_hora_sim(self):
+        """
+        hora atual da simulação (s)
+        """
+        return self.f_hora
+
+# -------------------------------------------------------------------------------------------------
+
+def __demanda_cine(f_rnd, ff_alt, ff_vel):
+    """
+    sorteia demandas de altitude, proa e velocidade (nivelado, subindo, descendo, curvando pela
+    esquerda, direita, menor ângulo ou indefinidamente, acelerando e freando)
+
+    @param f_rnd: gerador de números aleatórios
+    @param ff_alt: altitude atual (m)
+    @param ff_vel: velocidade atual (m/s)
+
+    @return dicionário campo -> valor
+    """
+    # sentido e razão de curva
+    li_sentido = f_rnd.choice(ldefs.SET_SENTIDOS_CURVA)
+    lf_raz_crv = f_rnd.choice((1.5, 3.))
+
+    if (ldefs.E_MENOR == li_sentido) and (f_rnd.random() < .5):
+        lf_raz_crv = -lf_raz_crv
+
+    # proa de demanda (< 0: curva indefinida)
+    lf_pro_dem = -1. if f_rnd.random() < .1 else round(f_rnd.uniform(0., 359.99), 2)
+
+    # return
+    return {"f_atv_alt_dem": f_rnd.choice((ff_alt, ff_alt + f_rnd.uniform(100., 3000.), max(0., ff_alt - f_rnd.uniform(100., 3000.)))),
+            "f_atv_vel_dem": f_rnd.choice((ff_vel, f_rnd.uniform(70., 260.))),
+            "f_atv_pro_dem": lf_pro_dem,
+            "f_atv_raz_crv": lf_raz_crv,
+            "f_atv_raz_sub": f_rnd.uniform(5., 20.),
+            "f_atv_acel": f_rnd.uniform(.5, 2.),
+            "en_atv_sentido_curva": li_sentido}
+
+# -------------------------------------------------------------------------------------------------
+
+def bench_cine(fi_trf, fi_ticks, f_rnd):
+    """
+    verifica que CCineFrota e dados_dinamicos produzem o mesmo estado. Avança a mesma frota
+    sintética fi_ticks ticks pelos dois caminhos, com as mesmas mudanças de demanda, e compara x,
+    y, altitude, proa e velocidade de todas as aeronaves a cada tick (tolerâncias em D_CIN_TOL)
+
+    @param fi_trf: quantidade de aeronaves
+    @param fi_ticks: quantidade de ticks
+    @param f_rnd: gerador de números aleatórios
+
+    @return dicionário com o erro máximo por campo, o resultado e o custo por aeronave (us) de
+            cada caminho
+    """
+    # estado inicial da frota
+    llst_ini = []
+
+    for li_ndx in xrange(fi_trf):
+
+        lf_alt = f_rnd.uniform(300., 12000.)
+        lf_vel = f_rnd.uniform(70., 260.)
+
+        ldct_ini = {"f_trf_x": f_rnd.uniform(-200000., 200000.),
+                    "f_trf_y": f_rnd.uniform(-200000., 200000.),
+                    "f_trf_alt_atu": lf_alt,
+                    "f_trf_pro_atu": round(f_rnd.uniform(0., 359.99), 2),
+                    "f_trf_vel_atu": lf_vel,
+                    "f_atv_vel_tas": lf_vel}
+
+        ldct_ini.update(__demanda_cine(f_rnd, lf_alt, lf_vel))
+        llst_ini.append(ldct_ini)
+
+    # mudanças de demanda: tick -> lista de (aeronave, demandas)
+    ldct_dem = {}
+
+    for li_tick in xrange(D_CIN_DEM, fi_ticks, D_CIN_DEM):
+        ldct_dem[li_tick] = [(li_ndx, __demanda_cine(f_rnd, llst_ini[li_ndx]["f_trf_alt_atu"], llst_ini[li_ndx]["f_trf_vel_atu"]))
+                             for li_ndx in f_rnd.sample(xrange(fi_trf), max(1, fi_trf // 10))]
+
+    # intervalos entre ticks (com variação, como no relógio real)
+    llst_dt = [D_CIN_TICK * f_rnd.uniform(.8, 1.2) for _ in xrange(fi_ticks)]
+
+    # as duas frotas, com o mesmo estado inicial
+    llst_esc = [CFeCine(CAtvCine(ldct_ini)) for ldct_ini in llst_ini]
+    llst_vet = [CFeCine(CAtvCine(ldct_ini)) for ldct_ini in llst_ini]
+
+    # relógios
+    l_rel_esc = CRelogioCine()
+    l_rel_vet = CRelogioCine()
+
+    # caminho vetorial
+    l_frota = cinfrota.CCineFrota(l_rel_vet)
+
+    # erro máximo por campo
+    ldct_err = dict((ls_cpo, 0.) for ls_cpo, _ in D_CIN_TOL)
+
+    lf_esc = lf_vet = 0.
+
+    for li_tick in xrange(fi_ticks):
+
+        # mesmas mudanças de demanda nas duas frotas
+        for li_ndx, ldct_d in ldct_dem.get(li_tick, []):
+            llst_esc[li_ndx].atv.__dict__.update(ldct_d)
+            llst_vet[li_ndx].atv.__dict__.update(ldct_d)
+
+        # avança os relógios
+        l_rel_esc.f_hora += llst_dt[li_tick]
+        l_rel_vet.f_hora += llst_dt[li_tick]
+
+        # caminho escalar (como cine_voo.update_cinematica)
+        lf_ini = time.time()
+
+        for l_fe in llst_esc:
+
+            lf_delta_t = l_rel_esc.f_hora - l_fe.atv.l_atv_time_ant
+            l_fe.atv.l_atv_time_ant = l_rel_esc.f_hora
+
+            cine.dados_dinamicos(l_fe.atv, l_fe.cine_data, lf_delta_t, l_rel_esc)
+
+        lf_esc += time.time() - lf_ini
+
+        # caminho vetorial
+        lf_ini = time.time()
+
+        l_frota.update_cinematica(llst_vet)
+
+        lf_vet += time.time() - lf_ini
+
+        # compara o estado das frotas
+        for l_fe_esc, l_fe_vet in zip(llst_esc, llst_vet):
+
+            for ls_cpo, _ in D_CIN_TOL:
+
+                lf_err = abs(getattr(l_fe_esc.atv, ls_cpo) - getattr(l_fe_vet.atv, ls_cpo))
+
+                # proa, a diferença é circular
+                if "f_trf_pro_atu" == ls_cpo:
+                    lf_err = min(lf_err, abs(360. - lf_err))
+
+                if lf_err > ldct_err[ls_cpo]:
+                    ldct_err[ls_cpo] = lf_err
+
+    # passos de aeronave executados
+    li_atv = max(1, fi_trf * fi_ticks)
+
+    # return
+    return {"flights": fi_trf,
+            "ticks": fi_ticks,
+            "erro": ldct_err,
+            "tol": dict(D_CIN_TOL),
+            "ok": all(ldct_err[ls_cpo] <= lf_tol for ls_cpo, lf_tol in D_CIN_TOL),
+            "scalar_us": lf_esc / li_atv * 1e6,
+            "vector_us": lf_vet / li_atv * 1e6}
+
+# -------------------------------------------------------------------------------------------------
+
+def carrega_prcs(fs_dir_prc, fs_dir_tab):
+    """
+    carrega os pontos de partida dos procedimentos (primeiro breakpoint das trajetórias e subidas,
+    fixo das esperas) e as performances
+
+    @param fs_dir_prc: diretório de procedimentos
+    @param fs_dir_tab: diretório de tabelas
+
+    @return dicionário tipo -> lista de (procedimento, coord, altitude, velocidade) e lista de
+            performances
+    """
+    # fixos: id -> coord
+    ldct_fix = {}
+
+    for l_fix in ET.parse(os.path.join(fs_dir_tab, "tabFix.xml")).getroot().iter("fixo"):
+        ldct_fix[l_fix.get("nFix")] = __coord(l_fix.find("coord"))
+
+    # procedimentos por tipo
+    ldct_prc = {"TRJ": [], "ESP": [], "SUB": []}
+
+    # trajetórias e subidas: partem do primeiro breakpoint
+    for ls_tab, ls_tag, ls_id, ls_tip in (("tabTrj.xml", "trajetoria", "nTrj", "TRJ"),
+                                          ("tabSub.xml", "subida", "nSub", "SUB")):
+
+        for l_prc in ET.parse(os.path.join(fs_dir_prc, ls_tab)).getroot().iter(ls_tag):
+
+            # primeiro breakpoint
+            l_brk = l_prc.find("breakpoint")
+
+            if (l_brk is None) or (l_brk.find("coord") is None):
+                continue
+
+            ldct_prc[ls_tip].append((ls_tip + l_prc.get(ls_id),
+                                     __coord(l_brk.find("coord")),
+                                     int(float(l_brk.findtext("altitude", "10000"))),
+                                     int(float(l_brk.findtext("velocidade", "250")))))
+
+    # esperas: partem do fixo da espera
+    for l_esp in ET.parse(os.path.join(fs_dir_prc, "tabEsp.xml")).getroot().iter("espera"):
+
+        # coordenada do fixo
+        ldct_coord = ldct_fix.get(l_esp.findtext("fixo", "").strip(), None)
+
+        if ldct_coord is None:
+            continue
+
+        ldct_prc["ESP"].append(("ESP" + l_esp.get("nEsp"), ldct_coord, 10000, 220))
+
+    # performances
+    llst_prf = [l_prf.get("nPrf") for l_prf in ET.parse(os.path.join(fs_dir_tab, "tabPrf.xml")).getroot().iter("performance")]
+
+    # return
+    return ldct_prc, llst_prf
+
+# -------------------------------------------------------------------------------------------------
+
+def __coord(f_elem):
+    """
+    converte um elemento coord em dicionário (tipo, campoA, ...)
+    """
+    # return
+    return dict((l_cpo.tag, (l_cpo.text or "").strip()) for l_cpo in f_elem)
+
+# -------------------------------------------------------------------------------------------------
+
+def gera_exe(fs_dir_dat, fi_trf, fdct_prc, flst_prf, f_rnd):
+    """
+    gera o exercício sintético e a sua tabela de tráfegos
+
+    @param fs_dir_dat: diretório de dados do benchmark
+    @param fi_trf: quantidade de tráfegos
+    @param fdct_prc: procedimentos por tipo (carrega_prcs)
+    @param flst_prf: performances
+    @param f_rnd: gerador de números aleatórios
+    """
+    # exercício
+    with open(os.path.join(fs_dir_dat, gdefs.D_DIR_EXE, D_BCH_EXE + ".exe.xml"), "w") as l_fd:
+
+        l_fd.write("<?xml version='1.0' encoding='UTF-8'?>\n<!DOCTYPE exercicios>\n"
+                   "<exercicios VERSION=\"0001\" CODE=\"1961\" FORMAT=\"NEWTON\">\n\n"
+                   "    <exercicio nExe=\"{}\">\n"
+                   "        <descricao>Benchmark {} trafegos</descricao>\n"
+                   "        <horainicio>06:00</horainicio>\n"
+                   "    </exercicio>\n\n</exercicios>\n".format(D_BCH_EXE, fi_trf))
+
+    # tipos de procedimento existentes (os tráfegos são distribuídos entre eles)
+    llst_tip = sorted(ls_tip for ls_tip, llst_prc in fdct_prc.iteritems() if llst_prc)
+    assert llst_tip
+
+    # tráfegos
+    llst_trf = []
+
+    for li_ndx in xrange(fi_trf):
+
+        # procedimento (alterna os tipos)
+        ls_prc, ldct_coord, li_alt, li_vel = f_rnd.choice(fdct_prc[llst_tip[li_ndx % len(llst_tip)]])
+
+        # espalha as coordenadas geográficas
+        if "L" == ldct_coord.get("tipo", "").upper():
+
+            ldct_coord = dict(ldct_coord)
+            ldct_coord["campoA"] = str(float(ldct_coord["campoA"]) + f_rnd.uniform(-D_BCH_JITTER, D_BCH_JITTER))
+            ldct_coord["campoB"] = str(float(ldct_coord["campoB"]) + f_rnd.uniform(-D_BCH_JITTER, D_BCH_JITTER))
+
+        # coord no mesmo formato das tabelas
+        ls_coord = "\n".join("            <{0}>{1}</{0}>".format(ls_cpo, ldct_coord[ls_cpo])
+                             for ls_cpo in sorted(ldct_coord))
+
+        llst_trf.append(M_TRF_XML.format(id=li_ndx + 1,
+                                         prf=f_rnd.choice(flst_prf),
+                                         ssr="{:04o}".format(li_ndx % 4096),
+                                         ind="BCH{:05d}".format(li_ndx + 1),
+                                         prc=ls_prc,
+                                         coord=ls_coord,
+                                         vel=li_vel,
+                                         alt=li_alt,
+                                         pro=f_rnd.randint(0, 359)))
+
+    # tabela de tráfegos
+    with open(os.path.join(fs_dir_dat, gdefs.D_DIR_TRF, D_BCH_EXE + ".trf.xml"), "w") as l_fd:
+
+        l_fd.write("<?xml version='1.0' encoding='UTF-8'?>\n<!DOCTYPE trafegos>\n"
+                   "<trafegos VERSION=\"0001\" CODE=\"1961\" FORMAT=\"NEWTON\">\n")
+        l_fd.write("".join(llst_trf))
+        l_fd.write("\n</trafegos>\n")
+
+# -------------------------------------------------------------------------------------------------
+
+def roda(fs_cfg, fs_dir_src, fi_trf, ff_dur, fdct_prc, flst_prf, f_rnd, fv_keep):
+    """
+    executa o newton em fast-time com um exercício sintético
+
+    @param fs_cfg: arquivo de configuração base
+    @param fs_dir_src: diretório de dados original (tabelas e procedimentos)
+    @param fi_trf: quantidade de tráfegos
+    @param ff_dur: duração simulada (s)
+    @param fdct_prc: procedimentos por tipo
+    @param flst_prf: performances
+    @param f_rnd: gerador de números aleatórios
+    @param fv_keep: mantém o diretório de trabalho
+
+    @return dicionário com os resultados
+    """
+    # diretório de trabalho
+    ls_dir_wrk = tempfile.mkdtemp(prefix="ptracks-bench-")
+    ls_dir_dat = os.path.join(ls_dir_wrk, gdefs.D_DIR_DAT)
+
+    os.mkdir(ls_dir_dat)
+
+    # tabelas, procedimentos, ... do diretório de dados original
+    for ls_ent in os.listdir(fs_dir_src):
+
+        if ls_ent not in (gdefs.D_DIR_EXE, gdefs.D_DIR_TRF):
+            os.symlink(os.path.join(fs_dir_src, ls_ent), os.path.join(ls_dir_dat, ls_ent))
+
+    os.mkdir(os.path.join(ls_dir_dat, gdefs.D_DIR_EXE))
+    os.mkdir(os.path.join(ls_dir_dat, gdefs.D_DIR_TRF))
+
+    # gera o exercício
+    gera_exe(ls_dir_dat, fi_trf, fdct_prc, flst_prf, f_rnd)
+
+    # arquivo de métricas
+    ls_mtr = os.path.join(ls_dir_wrk, "metrics.json")
+
+    # configuração do benchmark (a base com os ajustes do modo fast-time)
+    l_cp = ConfigParser.SafeConfigParser()
+    l_cp.read(fs_cfg)
+
+    for ls_sec, ls_opt, ls_val in (("glb", "exe", D_BCH_EXE),
+                                   ("dir", "dat", ls_dir_dat),
+                                   ("dir", "exe", gdefs.D_DIR_EXE),
+                                   ("dir", "trf", gdefs.D_DIR_TRF),
+                                   ("sch", "mode", "fast"),
+                                   ("sch", "fdur", str(ff_dur)),
+                                   ("sch", "fout", os.path.join(ls_dir_wrk, "tracks.trk")),
+                                   ("mpi", "bal", "static"),
+                                   ("mtr", "file", ls_mtr)):
+
+        if not l_cp.has_section(ls_sec):
+            l_cp.add_section(ls_sec)
+
+        l_cp.set(ls_sec, ls_opt, ls_val)
+
+    with open(os.path.join(ls_dir_wrk, gdefs.D_CFG_FILE), "w") as l_fd:
+        l_cp.write(l_fd)
+
+    # ambiente com a árvore sob teste no path (o diretório que contém o pacote ptracks)
+    ldct_env = dict(os.environ)
+    ldct_env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.path.dirname(data.M_DATA_DIR), ldct_env.get("PYTHONPATH")]))
+
+    # executa o newton
+    lf_ini = time.time()
+
+    with open(os.path.join(ls_dir_wrk, "newton.log"), "w") as l_fd:
+        li_rc = subprocess.call([sys.executable, "-m", "ptracks.newton", "-e", D_BCH_EXE, "-f"],
+                                cwd=ls_dir_wrk, env=ldct_env, stdout=l_fd, stderr=subprocess.STDOUT)
+
+    lf_wall = time.time() - lf_ini
+
+    # resultado
+    ldct_res = {"flights": fi_trf, "dur": ff_dur, "rc": li_rc, "wall": lf_wall}
+
+    try:
+        # carrega as métricas
+        with open(ls_mtr) as l_fd:
+            ldct_mtr = json.load(l_fd)
+
+    # em caso de erro...
+    except (IOError, ValueError) as ls_err:
+
+        # logger
+        l_log = logging.getLogger("bench::roda")
+        l_log.setLevel(logging.ERROR)
+        l_log.error(u"<E01: métricas não disponíveis ({}), veja {}.".format(ls_err, ls_dir_wrk))
+
+        ldct_res["erro"] = str(ls_err)
+        fv_keep = True
+
+    # senão, métricas ok
+    else:
+        ldct_fast = ldct_mtr["tick"].get("fast", {"count": 0, "sum": 0., "mean": 0., "max": 0.})
+        ldct_prox = ldct_mtr["tick"].get("prox", {"count": 0, "sum": 0., "mean": 0., "max": 0.})
+
+        # passos de aeronave executados
+        li_atv = ldct_mtr.get("cnt", {}).get("fast.atv", 0)
+
+        ldct_res.update({"ticks": ldct_fast["count"],
+                         "ticks_per_s": (ldct_fast["count"] / ldct_fast["sum"]) if ldct_fast["sum"] else 0.,
+                         "tick_mean_s": ldct_fast["mean"],
+                         "tick_max_s": ldct_fast["max"],
+                         "atv_steps": li_atv,
+                         "atv_cost_us": (ldct_fast["sum"] / li_atv * 1e6) if li_atv else 0.,
+                         "prox_checks": ldct_prox["count"],
+                         "prox_cost_us": ldct_prox["mean"] * 1e6,
+                         "prox_max_us": ldct_prox["max"] * 1e6,
+                         "prc": ldct_mtr.get("prc", {})})
+
+    # remove o diretório de trabalho
+    if not fv_keep:
+        shutil.rmtree(ls_dir_wrk, ignore_errors=True)
+
+    else:
+        ldct_res["dir"] = ls_dir_wrk
+
+    # return
+    return ldct_res
+
+# -------------------------------------------------------------------------------------------------
+
+def main():
+    """
+    drive application
+    """
+    # cria o parser de argumentos
+    l_parser = argparse.ArgumentParser(description="ptracks benchmark")
+    assert l_parser
+
+    l_parser.add_argument("-n", "--flights", dest="flights", default="10,100,1000",
+                          help=u"quantidades de tráfegos, separadas por vírgula (default: 10,100,1000)")
+    l_parser.add_argument("-d", "--dur", dest="dur", type=float, default=600.,
+                          help=u"duração simulada de cada execução (s) (default: 600)")
+    l_parser.add_argument("-o", "--out", dest="out", default="bench.json",
+                          help=u"arquivo de resultados (default: bench.json)")
+    l_parser.add_argument("-c", "--cfg", dest="cfg", default=None,
+                          help=u"arquivo de configuração base (default: o mesmo do newton)")
+    l_parser.add_argument("-D", "--dat", dest="dat", default=None,
+                          help=u"diretório de dados (default: dir.dat da configuração)")
+    l_parser.add_argument("-s", "--seed", dest="seed", type=int, default=1961,
+                          help=u"semente dos tráfegos sintéticos (default: 1961)")
+    l_parser.add_argument("-k", "--keep", dest="keep", action="store_true", default=False,
+                          help=u"mantém os diretórios de trabalho")
+    l_parser.add_argument("-C", "--cine", dest="cine", type=int, default=0,
+                          help=u"somente verifica CCineFrota x dados_dinamicos por N ticks (default: 0, não verifica)")
+
+    l_args = l_parser.parse_args()
+
+    # verificação da cinemática vetorial ?
+    if l_args.cine > 0:
+
+        # numpy não disponível ?
+        if not cinfrota.numpy_ok():
+            print "NumPy nao disponivel, CCineFrota nao pode ser verificado."
+            sys.exit(1)
+
+        llst_cin = []
+
+        # para cada quantidade de tráfegos...
+        for li_trf in [int(ls_n) for ls_n in l_args.flights.split(',') if ls_n.strip()]:
+
+            # mesma frota a cada execução com a mesma semente
+            ldct_res = bench_cine(li_trf, l_args.cine, random.Random(l_args.seed + li_trf))
+            llst_cin.append(ldct_res)
+
+            print u"{:6d} trafegos, {} ticks: {} escalar {:.2f}us, vetorial {:.2f}us por aeronave, erro max {}".format(
+                  li_trf, l_args.cine, "ok" if ldct_res["ok"] else "FALHOU", ldct_res["scalar_us"], ldct_res["vector_us"],
+                  ", ".join("{} {:.3g}".format(ls_cpo, ldct_res["erro"][ls_cpo]) for ls_cpo, _ in D_CIN_TOL))
+
+        # grava os resultados
+        with open(l_args.out, "w") as l_fd:
+            json.dump({"seed": l_args.seed, "cine": llst_cin}, l_fd, indent=2, sort_keys=True)
+
+        # falhou se alguma frota divergiu
+        sys.exit(0 if all(ldct_res["ok"] for ldct_res in llst_cin) else 1)
+
+    # arquivo de configuração base
+    ls_cfg = l_args.cfg
+
+    if ls_cfg is None:
+
+        # procura como o newton
+        for ls_path in (os.path.join(os.getcwd(), gdefs.D_CFG_FILE),
+                        os.path.join("/etc/ptracks", gdefs.D_CFG_FILE),
+                        os.path.join(os.path.dirname(os.path.realpath(__file__)), gdefs.D_CFG_FILE)):
+
+            if os.path.exists(ls_path):
+                ls_cfg = ls_path
+                break
+
+        # não achou ?
+        else:
+            print "Arquivo de configuracao {} nao encontrado.".format(gdefs.D_CFG_FILE)
+            sys.exit(1)
+
+    # diretório de dados original
+    l_cp = ConfigParser.SafeConfigParser()
+    l_cp.read(ls_cfg)
+
+    if l_args.dat is not None:
+        ls_dir_src = os.path.abspath(l_args.dat)
+
+    # senão, o mesmo do newton
+    else:
+        ls_dir_src = data.filepath(l_cp.get("dir", "dat") if l_cp.has_option("dir", "dat") else gdefs.D_DIR_DAT)
+
+    # procedimentos e performances
+    ldct_prc, llst_prf = carrega_prcs(os.path.join(ls_dir_src, gdefs.D_DIR_PRC),
+                                      os.path.join(ls_dir_src, gdefs.D_DIR_TAB))
+
+    # resultados
+    ldct_bch = {"date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "host": platform.node(),
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "cfg": ls_cfg,
+                "seed": l_args.seed,
+                "encode": bench_encode(20000),
+                "runs": []}
+
+    print u"encode: txt {txt_us:.2f}us, bin {bin_us:.2f}us, lote {lote_us:.2f}us por pista".format(**ldct_bch["encode"])
+
+    # para cada quantidade de tráfegos...
+    for li_trf in [int(ls_n) for ls_n in l_args.flights.split(',') if ls_n.strip()]:
+
+        # mesmos tráfegos a cada execução com a mesma semente
+        l_rnd = random.Random(l_args.seed + li_trf)
+
+        # executa
+        ldct_res = roda(ls_cfg, ls_dir_src, li_trf, l_args.dur, ldct_prc, llst_prf, l_rnd, l_args.keep)
+        ldct_bch["runs"].append(ldct_res)
+
+        print u"{:6d} trafegos: {:10.1f} ticks/s, {:8.2f}us por aeronave, prox {:10.1f}us, {:.1f}s".format(
+              li_trf, ldct_res.get("ticks_per_s", 0.), ldct_res.get("atv_cost_us", 0.),
+              ldct_res.get("prox_cost_us", 0.), ldct_res["wall"])
+
+        # grava a cada execução (resultados parciais se interrompido)
+        with open(l_args.out, "w") as l_fd:
+            json.dump(ldct_bch, l_fd, indent=2, sort_keys=True)
+
+# -------------------------------------------------------------------------------------------------
+# this is the bootstrap process
+
+if "__main__" == __name__:
+
+    # logger
+    logging.basicConfig()
+
+    # run application
+    main()
+
+# < the end >--------------------------------------------------------------------------------------
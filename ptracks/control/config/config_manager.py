@@ -73,6 +73,7 @@ class CConfigManager(object):
                     "net.trks": gdefs.D_NET_TRKS,    # endereço multicast de pistas
                     "net.voip": gdefs.D_NET_VOIP,    # endereço multicast de voip
                     "net.port": gdefs.D_NET_PORT,    # porta de comunicação
+                    "net.qmax": gdefs.D_NET_QMAX,    # tamanho máximo das queues de envio
                     "net.vers": gdefs.D_MSG_VRS,     # versão do protocolo
 
                     "tim.accl": gdefs.D_TIM_ACCL,    # fast-time simulation acceleration factor (1x)
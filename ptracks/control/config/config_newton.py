@@ -50,8 +50,40 @@ class CConfigNewton(config.CConfigManager):
     __CFG_NEWTON = {"glb.canal": 3,     # canal
                     "glb.exe": None,    # exercício
 
+                    "mpi.bal": "static",    # distribuição das aeronaves entre os ranks (static/dynamic)
+                    "mpi.mmax": 4,          # máximo de aeronaves migradas por rodada de balanceamento
+                    "mpi.mtol": .25,        # desbalanceamento tolerado entre os ranks antes de migrar
+
+                    "mtr.file": "",    # arquivo de gravação periódica das métricas ("" = não grava)
+                    "mtr.tdmp": 10,    # intervalo de gravação das métricas (s)
+
+                    "net.tbat": 0,        # pistas binárias de um tick em lote (0/1)
+                    "net.tfmt": "txt",    # formato das mensagens de pista (txt/bin)
+                    "net.tmtu": 1400,     # tamanho máximo do datagrama de lote (bytes)
+
+                    "prd.dhrz": 9260.,    # separação horizontal mínima na previsão (m, 5NM)
+                    "prd.dvrt": 300.,     # separação vertical mínima na previsão (m, ~1000ft)
+                    "prd.hrzn": 600,      # horizonte da previsão de trajetória (s, 0 = desligada)
+                    "prd.step": 2.,       # passo de integração da previsão (s)
+                    "prd.tchk": 5,        # intervalo de verificação das previsões (s)
+                    "prd.tsmp": 10,       # intervalo entre as amostras da trajetória prevista (s)
+                    "prd.tval": 60,       # validade de uma previsão sem comando de pilotagem (s)
+
+                    "sch.cine": "scalar",    # cinemática no modo tick (scalar/numpy)
+                    "sch.fdur": 0,           # duração simulada do modo fast (s, 0 = até esgotar o tráfego)
+                    "sch.fout": "tracks.trk",    # arquivo de pistas do modo fast
+                    "sch.lazy": 0,           # antecedência da carga dos tráfegos (s, 0 = todo o exercício na partida)
+                    "sch.mode": "thread",    # escalonamento dos flight engines (thread/tick/fast)
+                    "sch.pool": 1,           # quantidade de workers do scheduler (modo tick)
+                    "sch.rprt": 10,          # intervalo do relatório de tempo de tick (s)
+
                     "srv.addr": "localhost",    # server address
+                    "srv.fila": 64,             # conexões aguardando um worker do servidor web
+                    "srv.gzip": 1,              # compressão gzip das respostas json estáticas (0/1)
                     "srv.port": 61000,          # server port (61244)
+                    "srv.tfed": 1,              # intervalo do snapshot e do feed de aeronaves (s)
+                    "srv.tout": 10,             # espera máxima numa conexão keep-alive ociosa (s)
+                    "srv.wrks": 32,             # workers do servidor web (conexões simultâneas)
 
                     "tab.aer": "tabAer",    # tabela de aeródromos
                     "tab.esp": "tabEsp",    # tabela de procedimentos de espera
@@ -102,6 +134,12 @@ class CConfigNewton(config.CConfigManager):
                               default=self.dct_config["glb.exe"],
                               help=u"Exercício (default: {})".format(self.dct_config["glb.exe"]))
 
+        # argumento: modo fast-time
+        l_parser.add_argument("-f", "--fast",
+                              dest="fast",
+                              action="store_true",
+                              help=u"Executa o exercício em fast-time, sem interface, gravando as pistas em arquivo")
+
         # faz o parser da linha de argumentos
         l_args = l_parser.parse_args()
         assert l_args
@@ -110,6 +148,10 @@ class CConfigNewton(config.CConfigManager):
         self.dct_config["glb.canal"] = abs(int(l_args.canal))
         self.dct_config["glb.exe"] = str(l_args.exe)
 
+        # modo fast-time ?
+        if l_args.fast:
+            self.dct_config["sch.mode"] = "fast"
+
         # load dirs section
         self.__load_dirs()
 
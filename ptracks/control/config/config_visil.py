@@ -48,6 +48,7 @@ class CConfigVisil(config.CConfigManager):
                    "tab.fix": "tabFix",    # tabela de fixos
                    "tab.sub": "tabSub",    # tabela de subidas
                    "tab.trj": "tabTrj",    # tabela de trajetórias
+                   "trl.tam": 100,         # posições do rastro radar de cada aeronave
                   }  # __CFG_VISIL
 
     # ---------------------------------------------------------------------------------------------
@@ -42,9 +42,12 @@ from ..view import view_newton as view
 from ..control.events import events_basic as events
 from ..control import control_basic as control
 from ..control.config import config_newton as config
+from ..control.network import file_sender as fsender
 from ..control.network import get_address as gaddr
 from ..control.network import net_listener as listener
 from ..control.network import net_sender as sender
+from ..control.network import trk_batch as tbatch
+from ..control.simula import sim_stat as sstat
 from ..control.simula import sim_time as stime
 
 # < module data >----------------------------------------------------------------------------------
@@ -92,9 +95,13 @@ class CControlNewton(control.CControlBasic):
         # create simulation time engine
         self.sim_time = stime.CSimTime(self)
         assert self.sim_time
+
+        # cria o registro de métricas
+        self.sim_stat = sstat.CSimStat()
+        assert self.sim_stat
       
         # cria a queue de envio de comando/controle/configuração
-        self.__q_snd_cnfg = multiprocessing.Queue()
+        self.__q_snd_cnfg = multiprocessing.Queue(int(self.config.dct_config["net.qmax"]))
         assert self.__q_snd_cnfg
 
         # obtém o endereço de envio
@@ -104,16 +111,46 @@ class CControlNewton(control.CControlBasic):
         self.__sck_snd_cnfg = sender.CNetSender(lt_ifce, ls_addr, li_port, self.__q_snd_cnfg)
         assert self.__sck_snd_cnfg
 
+        # set as daemon
+        self.__sck_snd_cnfg.daemon = True
+
         # cria a queue de envio de pistas
-        self.__q_snd_trks = multiprocessing.Queue()
+        self.__q_snd_trks = multiprocessing.Queue(int(self.config.dct_config["net.qmax"]))
         assert self.__q_snd_trks
 
-        # obtém o endereço de envio
-        lt_ifce, ls_addr, li_port = gaddr.get_address(self.config, "net.trks")
+        # modo fast-time ?
+        if self.v_fast:
+
+            # a hora da simulação avança por passos, desacoplada do relógio do sistema
+            self.sim_time.v_fast = True
+
+            # as pistas são gravadas em arquivo, uma mensagem texto por linha
+            self.__sck_snd_trks = fsender.CFileSender(self.config.dct_config["sch.fout"])
+            assert self.__sck_snd_trks
+
+            self.config.dct_config["net.tfmt"] = "txt"
 
-        # cria o socket de envio de pistas
-        self.__sck_snd_trks = sender.CNetSender(lt_ifce, ls_addr, li_port, self.__q_snd_trks)
-        assert self.__sck_snd_trks
+        # senão, tempo real
+        else:
+            # obtém o endereço de envio
+            lt_ifce, ls_addr, li_port = gaddr.get_address(self.config, "net.trks")
+
+            # cria o socket de envio de pistas
+            self.__sck_snd_trks = sender.CNetSender(lt_ifce, ls_addr, li_port, self.__q_snd_trks)
+            assert self.__sck_snd_trks
+
+            # set as daemon
+            self.__sck_snd_trks.daemon = True
+
+        # lote de pistas por tick
+        self.__trk_batch = None
+
+        # pistas binárias em lote ?
+        if ("bin" == str(self.config.dct_config["net.tfmt"]).lower()) and int(self.config.dct_config["net.tbat"]):
+
+            # cria o lote de pistas
+            self.__trk_batch = tbatch.CTrkBatch(self.__sck_snd_trks, self.config.dct_config["net.tmtu"])
+            assert self.__trk_batch
 
         # cria a queue de recebimento de comando/controle/configuração
         self.__q_rcv_cnfg = multiprocessing.Queue()
@@ -155,11 +192,52 @@ class CControlNewton(control.CControlBasic):
         self.view = view.CViewNewton(self.model, self)
         assert self.view
 
+        # registra os medidores de rede
+        self.__add_gauges()
+
         # logger
         # M_LOG.info("__init__:<<")
 
     # ---------------------------------------------------------------------------------------------
 
+    def __add_gauges(self):
+        """
+        registra no registro de métricas os medidores de mensagens e de profundidade das queues
+        """
+        # senders e listeners
+        llst_net = [("net.cnfg.snd", self.__sck_snd_cnfg),
+                    ("net.cnfg.rcv", self.__sck_rcv_cnfg),
+                    ("net.cpil.rcv", self.__sck_rcv_cpil)]
+
+        # tempo real ?
+        if not self.v_fast:
+
+            # sender de pistas
+            llst_net.append(("net.trks.snd", self.__sck_snd_trks))
+
+        # para todos os senders e listeners...
+        for ls_nome, l_sck in llst_net:
+
+            # profundidade da queue
+            self.sim_stat.add_gauge(ls_nome + ".queue", lambda l_sck=l_sck: l_sck.i_queue)
+
+            # sender ?
+            if isinstance(l_sck, sender.CNetSender):
+
+                # mensagens enviadas, descartadas e com erro
+                self.sim_stat.add_gauge(ls_nome + ".sent", lambda l_sck=l_sck: l_sck.i_sent)
+                self.sim_stat.add_gauge(ls_nome + ".drop", lambda l_sck=l_sck: l_sck.i_drop)
+                self.sim_stat.add_gauge(ls_nome + ".erro", lambda l_sck=l_sck: l_sck.i_erro)
+
+            # senão, listener
+            else:
+                # mensagens recebidas e descartadas
+                self.sim_stat.add_gauge(ls_nome + ".recv", lambda l_sck=l_sck: l_sck.i_recv)
+                self.sim_stat.add_gauge(ls_nome + ".desc", lambda l_sck=l_sck: l_sck.i_desc)
+                self.sim_stat.add_gauge(ls_nome + ".perd", lambda l_sck=l_sck: l_sck.i_perd)
+
+    # ---------------------------------------------------------------------------------------------
+
     def cbk_termina(self):
         """
         termina a aplicação
@@ -198,17 +276,34 @@ class CControlNewton(control.CControlBasic):
         # temporização de scheduler
         lf_tim_rrbn = self.config.dct_config["tim.rrbn"]
 
+        # arquivo e intervalo de gravação das métricas
+        ls_mtr_file = str(self.config.dct_config["mtr.file"] or "")
+        lf_mtr_tdmp = float(self.config.dct_config["mtr.tdmp"])
+        lf_mtr_time = time.time() + lf_mtr_tdmp
+
         # ativa o relógio da simulação
         self.start_time()
 
+        # inicia o envio de mensagens de comando/controle/configuração(ccc)
+        self.__sck_snd_cnfg.start()
+
+        # tempo real ?
+        if not self.v_fast:
+
+            # inicia o envio de pistas
+            self.__sck_snd_trks.start()
+
         # inicia o recebimento de mensagens de comando/controle/configuração(ccc)
         self.__sck_rcv_cnfg.start()
 
         # starts flight model
         self.__emula_model.start()
 
-        # starts web server
-        self.view.start()
+        # tempo real ?
+        if not self.v_fast:
+
+            # starts web server
+            self.view.start()
 
         # keep things running
         gdata.G_KEEP_RUN = True
@@ -219,6 +314,15 @@ class CControlNewton(control.CControlBasic):
         # application loop
         while gdata.G_KEEP_RUN:
 
+            # hora de gravar as métricas ?
+            if ls_mtr_file and (time.time() >= lf_mtr_time):
+
+                # grava as métricas
+                self.sim_stat.dump(ls_mtr_file)
+
+                # próxima gravação
+                lf_mtr_time += lf_mtr_tdmp
+
             try:
                 # obtém um item da queue de mensagens de comando/controle/configuração (nowait)
                 llst_data = self.__q_rcv_cnfg.get(False)
@@ -283,6 +387,19 @@ class CControlNewton(control.CControlBasic):
                     l_log.setLevel(logging.WARNING)
                     l_log.warning("<E02: atrasou: {}.".format(lf_dif - lf_tim_rrbn))
 
+        # grava as métricas finais
+        if ls_mtr_file:
+            self.sim_stat.dump(ls_mtr_file)
+
+        # termina o envio de mensagens
+        self.__sck_snd_cnfg.stop()
+
+        # tempo real ?
+        if not self.v_fast:
+
+            # termina o envio de pistas
+            self.__sck_snd_trks.stop()
+
         # self.sim_stat.noProcFlights = fe.flightsProcessed
         # self.sim_stat.printScore()
 
@@ -337,6 +454,24 @@ class CControlNewton(control.CControlBasic):
 
     # ---------------------------------------------------------------------------------------------
 
+    @property
+    def trk_batch(self):
+        """
+        get lote de pistas por tick (None se as pistas são enviadas uma a uma)
+        """
+        return self.__trk_batch
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def v_fast(self):
+        """
+        get flag modo fast-time
+        """
+        return "fast" == str(self.config.dct_config["sch.mode"]).lower()
+
+    # ---------------------------------------------------------------------------------------------
+
     @property
     def mpi_comm(self):
         """
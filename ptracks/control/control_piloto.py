@@ -94,7 +94,7 @@ class CControlPiloto(control.CControlBasic):
         assert self.sim_time
 
         # cria a queue de envio
-        self.__q_snd_cpil = multiprocessing.Queue()
+        self.__q_snd_cpil = multiprocessing.Queue(int(self.config.dct_config["net.qmax"]))
         assert self.__q_snd_cpil
 
         # obtém o endereço de envio
@@ -104,6 +104,9 @@ class CControlPiloto(control.CControlBasic):
         self.__sck_snd_cpil = sender.CNetSender(lt_ifce, ls_addr, li_port, self.__q_snd_cpil)
         assert self.__sck_snd_cpil
 
+        # set as daemon
+        self.__sck_snd_cpil.daemon = True
+
         # cria a queue de recebimento de configuração
         self.__q_rcv_cnfg = multiprocessing.Queue()
         assert self.__q_rcv_cnfg
@@ -175,6 +178,9 @@ class CControlPiloto(control.CControlBasic):
         # ativa o relógio
         self.start_time()
 
+        # inicia o envio de comandos de pilotagem
+        self.__sck_snd_cpil.start()
+
         # inicia o recebimento de mensagens de configuração
         self.__sck_rcv_cnfg.start()
 
@@ -284,6 +290,9 @@ class CControlPiloto(control.CControlBasic):
                     # permite o scheduler
                     time.sleep(lf_tim_rrbn - lf_dif)
 
+        # termina o envio de comandos de pilotagem
+        self.__sck_snd_cpil.stop()
+
         # logger
         # M_LOG.info("run:<<")
 
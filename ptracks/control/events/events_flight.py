@@ -89,4 +89,40 @@ class CFlightUpdate(model.CEventsModel):
         self.s_name = "FlightUpdate event"
         self.__s_callsign = ls_callsign
 
+# < class CFlightsUpdate >--------------------------------------------------------------------------
+
+
+class CFlightsUpdate(model.CEventsModel):
+    """
+    CFlightsUpdate event class: aeronaves alteradas num quadro de tela (um único evento para
+    todas as pistas recebidas no quadro)
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, fset_callsigns):
+        """
+        @param fset_callsigns: callsigns das aeronaves alteradas
+        """
+        # init super class
+        super(CFlightsUpdate, self).__init__()
+
+        # herdados de CEventsModel
+        # self.s_name    # event name
+
+        self.s_name = "FlightsUpdate event"
+        self.__set_callsigns = fset_callsigns
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def set_callsigns(self):
+        """
+        get callsigns das aeronaves alteradas
+        """
+        return self.__set_callsigns
+
 # < the end >--------------------------------------------------------------------------------------
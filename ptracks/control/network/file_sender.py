@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+file_sender.
+
+sender que grava as mensagens em arquivo (uma por linha) em vez de enviá-las pela rede. Usado
+no modo fast-time para gerar dados de vigilância sem multicast.
+
+revision 0.1  2016/out  mlabru
+initial release (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+# import logging
+import threading
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# < class CFileSender >----------------------------------------------------------------------------
+
+class CFileSender(object):
+    """
+    mesma interface de envio do CNetSender (send_data), gravando em arquivo
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, fs_path):
+        """
+        initializes file sender
+
+        @param fs_path: path do arquivo de saída
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # check input parameters
+        assert fs_path
+
+        # salva o path localmente
+        self.__s_path = fs_path
+
+        # abre o arquivo de saída
+        self.__fd_send = open(fs_path, "w")
+        assert self.__fd_send
+
+        # trava de escrita (várias aeronaves gravam no mesmo arquivo)
+        self.__lck_send = threading.Lock()
+        assert self.__lck_send
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def close(self):
+        """
+        fecha o arquivo de saída
+        """
+        # logger
+        # M_LOG.info("close:>>")
+
+        with self.__lck_send:
+
+            # arquivo aberto ?
+            if not self.__fd_send.closed:
+
+                # fecha o arquivo
+                self.__fd_send.close()
+
+        # logger
+        # M_LOG.info("close:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def send_data(self, fs_msg):
+        """
+        @param fs_msg: mensagem a gravar
+        """
+        # logger
+        # M_LOG.info("send_data:>>")
+
+        with self.__lck_send:
+
+            # arquivo aberto ?
+            if not self.__fd_send.closed:
+
+                # grava a mensagem
+                self.__fd_send.write(fs_msg + "\n")
+
+        # logger
+        # M_LOG.info("send_data:<<")
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def s_path(self):
+        """
+        get path do arquivo de saída
+        """
+        return self.__s_path
+
+# < the end >--------------------------------------------------------------------------------------
@@ -33,6 +33,7 @@ import time
 # model
 from ...model import glb_data as gdata
 from ...model import glb_defs as gdefs
+from ...model.newton import trk_codec as tcodec
 
 # < module data >----------------------------------------------------------------------------------
 
@@ -113,6 +114,14 @@ class CNetListener(multiprocessing.Process):
         # set some more multicast options
         self.__fd_recv.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, l_mreq)
 
+        # contadores (compartilhados com o processo de recebimento)
+        self.__i_recv = multiprocessing.Value('L', 0)    # mensagens colocadas na queue
+        self.__i_desc = multiprocessing.Value('L', 0)    # mensagens não reconhecidas
+        self.__i_perd = multiprocessing.Value('L', 0)    # lotes de pistas perdidos
+
+        # seqüência do último lote de pistas aceito de cada sender (só no processo de recebimento)
+        self.__dct_seq = {}
+
         # logger
         M_LOG.info("__init__:<<")
 
@@ -139,10 +148,55 @@ class CNetListener(multiprocessing.Process):
 
             M_LOG.debug("net_listener.run: wait recvfrom.")
             
-            # aguarda receber uma mensagem (de até 512 bytes)
-            l_data, l_addr = self.__fd_recv.recvfrom(512)
+            # aguarda receber uma mensagem (lotes de pistas ocupam até um datagrama inteiro)
+            l_data, l_addr = self.__fd_recv.recvfrom(65535)
             M_LOG.debug("Msg [{}] recebida de [{}]: ".format(l_data, l_addr))
 
+            # mensagem binária de pista ou lote de pistas ?
+            if tcodec.is_binary(l_data):
+
+                # número de seqüência do lote
+                li_seq = tcodec.seq_lote(l_data)
+
+                # é um lote ?
+                if li_seq is not None:
+
+                    # verifica a seqüência em relação ao último lote do sender
+                    lv_ok, li_perd = tcodec.verifica_seq(self.__dct_seq.get(l_addr, None), li_seq)
+
+                    # lote repetido ou atrasado ?
+                    if not lv_ok:
+
+                        # descarta o lote
+                        self.__conta(self.__i_desc)
+
+                        # próxima mensagem
+                        continue
+
+                    # lotes perdidos ?
+                    if li_perd > 0:
+
+                        # conta os lotes perdidos
+                        self.__conta(self.__i_perd, li_perd)
+
+                    # último lote aceito do sender
+                    self.__dct_seq[l_addr] = li_seq
+
+                # decodifica as pistas (mesma lista de campos da mensagem texto)
+                llst_trks = tcodec.decode_trks(l_data)
+
+                # para cada pista...
+                for llst_data in llst_trks:
+
+                    # coloca a mensagem na queue
+                    self.__q_queue.put(llst_data)
+
+                # conta as mensagens
+                self.__conta(self.__i_recv if llst_trks else self.__i_desc, len(llst_trks) or 1)
+
+                # próxima mensagem
+                continue
+
             # divide a mensagem em seus componentes
             llst_data = l_data.split(gdefs.D_MSG_SEP)
             M_LOG.debug("Msg [{}] em partes [{}]: ".format(l_data, llst_data))
@@ -150,6 +204,9 @@ class CNetListener(multiprocessing.Process):
             # versão da mensagem não reconhecida ?
             if gdefs.D_MSG_VRS != int(llst_data[0]):
 
+                # conta a mensagem
+                self.__conta(self.__i_desc)
+
                 # próxima mensagem
                 continue
 
@@ -159,8 +216,14 @@ class CNetListener(multiprocessing.Process):
                 # coloca a mensagem na queue
                 self.__q_queue.put(llst_data[1:])
 
+                # conta a mensagem
+                self.__conta(self.__i_recv)
+
             # senão, mensagem não reconhecida ou inválida
             else:
+                # conta a mensagem
+                self.__conta(self.__i_desc)
+
                 # logger
                 l_log = multiprocessing.getLogger("CNetListener::run")
                 l_log.setLevel(logging.WARNING)
@@ -175,6 +238,16 @@ class CNetListener(multiprocessing.Process):
 
     # ---------------------------------------------------------------------------------------------
 
+    @staticmethod
+    def __conta(f_val, fi_qtd=1):
+        """
+        incrementa um contador compartilhado
+        """
+        with f_val.get_lock():
+            f_val.value += fi_qtd
+
+    # ---------------------------------------------------------------------------------------------
+
     def get_data(self):
         """
         DOCUMENT ME!
@@ -200,6 +273,50 @@ class CNetListener(multiprocessing.Process):
 
     # ---------------------------------------------------------------------------------------------
 
+    @property
+    def i_desc(self):
+        """
+        get quantidade de mensagens não reconhecidas
+        """
+        return self.__i_desc.value
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_perd(self):
+        """
+        get quantidade de lotes de pistas perdidos (lacunas na seqüência)
+        """
+        return self.__i_perd.value
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_queue(self):
+        """
+        get quantidade aproximada de mensagens na queue
+        """
+        try:
+            # return
+            return self.__q_queue.qsize()
+
+        # plataforma sem sem_getvalue (Mac OS X)...
+        except NotImplementedError:
+
+            # return
+            return -1
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_recv(self):
+        """
+        get quantidade de mensagens recebidas (colocadas na queue)
+        """
+        return self.__i_recv.value
+
+    # ---------------------------------------------------------------------------------------------
+
     @property
     def queue(self):
         """
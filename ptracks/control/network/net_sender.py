@@ -4,7 +4,10 @@
 ---------------------------------------------------------------------------------------------------
 net_sender.
 
-DOCUMENT ME!
+sender assíncrono de mensagens multicast.
+
+revision 0.4  2016/out  mlabru
+envio em processo próprio a partir de uma queue limitada
 
 revision 0.3  2015/nov  mlabru
 pep8 style conventions
@@ -17,15 +20,16 @@ revision 0.1  2014/nov  mlabru
 initial release (Linux/Python)
 ---------------------------------------------------------------------------------------------------
 """
-__version__ = "$revision: 0.3$"
+__version__ = "$revision: 0.4$"
 __author__ = "mlabru, sophosoft"
 __date__ = "2015/11"
 
 # < imports >--------------------------------------------------------------------------------------
 
 # python library
-# import logging
+import logging
 import multiprocessing
+import Queue
 import socket
 
 # < module data >----------------------------------------------------------------------------------
@@ -34,11 +38,16 @@ import socket
 # M_LOG = logging.getLogger(__name__)
 # M_LOG.setLevel(logging.DEBUG)
 
+# quantidade máxima de mensagens retiradas da queue por volta do loop de envio
+M_MAX_LOTE = 64
+
 # < class CNetSender >-----------------------------------------------------------------------------
 
 class CNetSender(multiprocessing.Process):
     """
-    DOCUMENT ME!
+    sender assíncrono: send_data só coloca a mensagem na queue (sem bloquear) e o processo de envio
+    esvazia a queue em lotes, fazendo o sendto fora das threads de cinemática. Com a queue cheia a
+    mensagem é descartada e contada
     """
     # ---------------------------------------------------------------------------------------------
 
@@ -49,7 +58,7 @@ class CNetSender(multiprocessing.Process):
         @param ft_ifce: tupla in/out de interfaces. ('eth0', 'eth0')
         @param fs_addr: endereço. ('255.12.2')
         @param fi_port: porta (1970)
-        @param f_queue: queue de mensagens
+        @param f_queue: queue de mensagens (limitada, multiprocessing.Queue(maxsize))
         """
         # logger
         # M_LOG.info("__init__:>>")
@@ -62,7 +71,7 @@ class CNetSender(multiprocessing.Process):
         # inicializa a super class
         super(CNetSender, self).__init__()
 
-        # salva o event manager localmente
+        # salva a queue de mensagens localmente
         self.__queue = f_queue
                 
         # salva tupla endereço e porta
@@ -80,14 +89,116 @@ class CNetSender(multiprocessing.Process):
         # config sender socket
         self.__fd_send.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
 
+        # processo de envio iniciado ?
+        self.__v_started = False
+
+        # contadores (compartilhados com o processo de envio)
+        self.__i_drop = multiprocessing.Value('L', 0)    # descartadas com a queue cheia
+        self.__i_erro = multiprocessing.Value('L', 0)    # erros de sendto
+        self.__i_lote = multiprocessing.Value('L', 0)    # voltas do loop de envio
+        self.__i_sent = multiprocessing.Value('L', 0)    # mensagens enviadas
+
         # logger
         # M_LOG.info("__init__:<<")
 
     # ---------------------------------------------------------------------------------------------
 
+    def __envia(self, fs_msg):
+        """
+        envia uma mensagem pelo socket
+
+        @param fs_msg: mensagem
+
+        @return True se enviou, senão False
+        """
+        try:
+            # envia a mensagem
+            self.__fd_send.sendto(fs_msg, self.__t_addr)
+            # M_LOG.debug("dados [{}] enviados para [{}]".format(fs_msg, self.__t_addr))
+
+        # em caso de erro...
+        except socket.error as ls_err:
+
+            # conta o erro
+            with self.__i_erro.get_lock():
+                self.__i_erro.value += 1
+
+            # logger
+            l_log = logging.getLogger("CNetSender::__envia")
+            l_log.setLevel(logging.WARNING)
+            l_log.warning(u"<E01: erro no envio para {}:[{}].".format(self.__t_addr, ls_err))
+
+            # não enviou
+            return False
+
+        # enviou
+        return True
+
+    # ---------------------------------------------------------------------------------------------
+
+    def run(self):
+        """
+        loop de envio: retira da queue até M_MAX_LOTE mensagens por volta e as envia. Termina ao
+        receber None (stop)
+        """
+        # logger
+        # M_LOG.info("run:>>")
+
+        # check requirements
+        assert self.__fd_send
+
+        # loop de envio
+        while True:
+
+            # aguarda uma mensagem
+            llst_msg = [self.__queue.get()]
+
+            try:
+                # retira o que mais estiver na queue, até o tamanho do lote
+                while len(llst_msg) < M_MAX_LOTE:
+                    llst_msg.append(self.__queue.get_nowait())
+
+            # em caso de não haver mais mensagens...
+            except Queue.Empty:
+
+                # não faz nada...
+                pass
+
+            # mensagens enviadas nesta volta
+            li_sent = 0
+
+            # para todas as mensagens do lote...
+            for ls_msg in llst_msg:
+
+                # fim de execução ?
+                if ls_msg is None:
+
+                    # logger
+                    # M_LOG.info("run:<<")
+
+                    # cai fora...
+                    return
+
+                # envia a mensagem
+                if self.__envia(ls_msg):
+                    li_sent += 1
+
+            # atualiza os contadores
+            with self.__i_sent.get_lock():
+                self.__i_sent.value += li_sent
+
+            with self.__i_lote.get_lock():
+                self.__i_lote.value += 1
+
+    # ---------------------------------------------------------------------------------------------
+
     def send_data(self, fs_msg):
         """
-        @param fs_msg: DOCUMENT ME!
+        coloca a mensagem na queue de envio, sem bloquear
+
+        @param fs_msg: mensagem
+
+        @return True se a mensagem foi aceita, False se foi descartada (queue cheia)
         """
         # logger
         # M_LOG.info("send_data:>>")
@@ -95,11 +206,117 @@ class CNetSender(multiprocessing.Process):
         # check requirements
         assert self.__fd_send
 
-        # envia a mensagem
-        self.__fd_send.sendto(fs_msg, self.__t_addr)
-        # M_LOG.debug("dados [{}] enviados para [{}]".format(fs_msg, self.__t_addr))
+        # processo de envio não foi iniciado ?
+        if not self.__v_started:
+
+            # envia direto (sender não iniciado)
+            return self.__envia(fs_msg)
+
+        try:
+            # coloca a mensagem na queue
+            self.__queue.put_nowait(fs_msg)
+
+        # em caso de queue cheia...
+        except Queue.Full:
+
+            # conta o descarte
+            with self.__i_drop.get_lock():
+                self.__i_drop.value += 1
+
+            # descartada
+            return False
 
         # logger
         # M_LOG.info("send_data:<<")
 
+        # aceita
+        return True
+
+    # ---------------------------------------------------------------------------------------------
+
+    def start(self):
+        """
+        inicia o processo de envio; a partir daí send_data só enfileira
+        """
+        # inicia o processo
+        super(CNetSender, self).start()
+
+        # processo de envio iniciado
+        self.__v_started = True
+
+    # ---------------------------------------------------------------------------------------------
+
+    def stop(self):
+        """
+        pede o término do processo de envio, depois de esvaziar a queue
+        """
+        # logger
+        # M_LOG.info("stop:>>")
+
+        # processo de envio iniciado ?
+        if self.__v_started:
+
+            # coloca a marca de fim na queue (bloqueia se estiver cheia)
+            self.__queue.put(None)
+
+        # logger
+        # M_LOG.info("stop:<<")
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_drop(self):
+        """
+        get quantidade de mensagens descartadas (queue cheia)
+        """
+        return self.__i_drop.value
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_erro(self):
+        """
+        get quantidade de erros de envio
+        """
+        return self.__i_erro.value
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_lote(self):
+        """
+        get quantidade de voltas do loop de envio
+        """
+        return self.__i_lote.value
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_queue(self):
+        """
+        get quantidade aproximada de mensagens na queue
+        """
+        try:
+            # return
+            return self.__queue.qsize()
+
+        # plataforma sem sem_getvalue (Mac OS X)...
+        except NotImplementedError:
+
+            # return
+            return -1
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_sent(self):
+        """
+        get quantidade de mensagens enviadas
+        """
+        return self.__i_sent.value
+
 # < the end >--------------------------------------------------------------------------------------
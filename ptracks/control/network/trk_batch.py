@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+trk_batch.
+
+acumula as pistas (binárias) de um tick e as envia em datagramas de até net.tmtu bytes, cada um com
+número de seqüência e quantidade de pistas, em vez de um datagrama por pista.
+
+revision 0.1  2016/out  mlabru
+initial release (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+# import logging
+import threading
+
+# model
+from ...model.newton import trk_codec as tcodec
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# < class CTrkBatch >------------------------------------------------------------------------------
+
+class CTrkBatch(object):
+    """
+    lote de pistas de um tick
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, f_sender, fi_mtu):
+        """
+        @param f_sender: sender das pistas (send_data)
+        @param fi_mtu: tamanho máximo do datagrama (bytes)
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # check input parameters
+        assert f_sender
+
+        # salva o sender localmente
+        self.__sender = f_sender
+
+        # quantidade máxima de pistas por datagrama
+        self.__i_max = max(1, (int(fi_mtu) - tcodec.M_BIN_LOTE_SIZE) // tcodec.D_BIN_TRK.size)
+
+        # pistas aguardando envio
+        self.__lst_trk = []
+
+        # número de seqüência do próximo datagrama
+        self.__i_seq = 0
+
+        # trava do lote (várias aeronaves/workers acrescentam pistas)
+        self.__lck_trk = threading.Lock()
+        assert self.__lck_trk
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def add_trk(self, fs_trk):
+        """
+        acrescenta uma pista ao lote; envia o datagrama se ele ficou cheio
+
+        @param fs_trk: pista codificada por tcodec.pack_trk
+        """
+        with self.__lck_trk:
+
+            # acrescenta a pista
+            self.__lst_trk.append(fs_trk)
+
+            # datagrama cheio ?
+            if len(self.__lst_trk) >= self.__i_max:
+
+                # envia o datagrama
+                self.__envia()
+
+    # ---------------------------------------------------------------------------------------------
+
+    def flush(self):
+        """
+        envia as pistas pendentes (fim de tick)
+        """
+        with self.__lck_trk:
+
+            # existem pistas pendentes ?
+            if self.__lst_trk:
+
+                # envia o datagrama
+                self.__envia()
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __envia(self):
+        """
+        envia as pistas pendentes em um datagrama (chamado com a trava adquirida)
+        """
+        # envia o lote
+        self.__sender.send_data(tcodec.encode_lote(self.__i_seq, self.__lst_trk))
+
+        # próximo datagrama
+        self.__i_seq += 1
+        self.__lst_trk = []
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_max(self):
+        """
+        get quantidade máxima de pistas por datagrama
+        """
+        return self.__i_max
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+sim_stat.
+
+registro de métricas da simulação: histogramas de duração de tick, atrasos dos loops, tempo por
+procedimento e medidores (aeronaves ativas, mensagens, profundidade das queues). Exposto em
+/data/metrics.json e, opcionalmente, gravado periodicamente em arquivo.
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import json
+import logging
+import os
+import threading
+import time
+
+# < defines >--------------------------------------------------------------------------------------
+
+# limites superiores das faixas do histograma de duração (s); a última faixa é aberta
+D_HST_LIM = (.001, .002, .005, .01, .02, .05, .1, .2, .5, 1., 2.)
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# < class CSimStat >-------------------------------------------------------------------------------
+
+class CSimStat(object):
+    """
+    registro de métricas. Os contadores são acumulados pelas threads de simulação (add_*) e os
+    medidores são funções consultadas somente no momento do snapshot
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        cria o registro de métricas
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # início do registro
+        self.__f_ini = time.time()
+
+        # histogramas de duração de tick: nome -> [contagem, soma, máximo, faixas]
+        self.__dct_tick = {}
+
+        # atrasos dos loops: nome -> [contagem, soma, máximo]
+        self.__dct_late = {}
+
+        # tempo por procedimento: nome -> [contagem, soma, máximo]
+        self.__dct_prc = {}
+
+        # contadores: nome -> total
+        self.__dct_cnt = {}
+
+        # medidores: nome -> função
+        self.__dct_gauge = {}
+
+        # trava dos acumuladores
+        self.__lck_stat = threading.Lock()
+        assert self.__lck_stat
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __acumula(fdct_ser, fs_nome, ff_val):
+        """
+        acumula um valor numa série [contagem, soma, máximo] (chamado com a trava adquirida)
+        """
+        # obtém a série
+        llst_ser = fdct_ser.get(fs_nome, None)
+
+        # série nova ?
+        if llst_ser is None:
+
+            # cria a série
+            llst_ser = fdct_ser[fs_nome] = [0, 0., 0.]
+
+        # acumula
+        llst_ser[0] += 1
+        llst_ser[1] += ff_val
+
+        if ff_val > llst_ser[2]:
+            llst_ser[2] = ff_val
+
+        # return
+        return llst_ser
+
+    # ---------------------------------------------------------------------------------------------
+
+    def add_cnt(self, fs_nome, fi_qtd=1):
+        """
+        incrementa um contador
+
+        @param fs_nome: nome do contador
+        @param fi_qtd: incremento
+        """
+        with self.__lck_stat:
+
+            # incrementa o contador
+            self.__dct_cnt[fs_nome] = self.__dct_cnt.get(fs_nome, 0) + fi_qtd
+
+    # ---------------------------------------------------------------------------------------------
+
+    def add_gauge(self, fs_nome, f_get):
+        """
+        registra um medidor
+
+        @param fs_nome: nome do medidor
+        @param f_get: função sem parâmetros que retorna o valor atual
+        """
+        # check input parameters
+        assert f_get
+
+        with self.__lck_stat:
+
+            # registra o medidor
+            self.__dct_gauge[fs_nome] = f_get
+
+    # ---------------------------------------------------------------------------------------------
+
+    def add_late(self, fs_nome, ff_late):
+        """
+        registra o atraso de um loop temporizado
+
+        @param fs_nome: nome do loop
+        @param ff_late: atraso (s)
+        """
+        with self.__lck_stat:
+
+            # acumula o atraso
+            self.__acumula(self.__dct_late, fs_nome, ff_late)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def add_prc(self, fs_nome, ff_tempo):
+        """
+        registra o tempo de execução de um procedimento
+
+        @param fs_nome: nome do procedimento (prc_trajetoria, prc_espera, ...)
+        @param ff_tempo: tempo de parede (s)
+        """
+        with self.__lck_stat:
+
+            # acumula o tempo
+            self.__acumula(self.__dct_prc, fs_nome, ff_tempo)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def add_tick(self, fs_nome, ff_wall):
+        """
+        registra a duração de um tick
+
+        @param fs_nome: nome da série (worker, fast, prox, ...)
+        @param ff_wall: tempo de parede do tick (s)
+        """
+        with self.__lck_stat:
+
+            # obtém a série
+            llst_ser = self.__dct_tick.get(fs_nome, None)
+
+            # série nova ?
+            if llst_ser is None:
+
+                # cria a série com as faixas do histograma
+                llst_ser = self.__dct_tick[fs_nome] = [0, 0., 0., [0] * (len(D_HST_LIM) + 1)]
+
+            # acumula
+            self.__acumula(self.__dct_tick, fs_nome, ff_wall)
+
+            # procura a faixa do histograma
+            for li_ndx, lf_lim in enumerate(D_HST_LIM):
+
+                if ff_wall <= lf_lim:
+                    break
+
+            # senão, última faixa (aberta)
+            else:
+                li_ndx = len(D_HST_LIM)
+
+            # conta na faixa
+            llst_ser[3][li_ndx] += 1
+
+    # ---------------------------------------------------------------------------------------------
+
+    def dump(self, fs_path):
+        """
+        grava o snapshot em arquivo (grava num temporário e renomeia, para quem lê nunca ver o
+        arquivo pela metade)
+
+        @param fs_path: path do arquivo
+        """
+        # logger
+        # M_LOG.info("dump:>>")
+
+        # arquivo temporário
+        ls_tmp = fs_path + ".tmp"
+
+        try:
+            # grava o snapshot
+            with open(ls_tmp, "w") as l_fd:
+                json.dump(self.snapshot(), l_fd)
+
+            # substitui o arquivo
+            os.rename(ls_tmp, fs_path)
+
+        # em caso de erro...
+        except (IOError, OSError) as ls_err:
+
+            # logger
+            l_log = logging.getLogger("CSimStat::dump")
+            l_log.setLevel(logging.WARNING)
+            l_log.warning(u"<E01: erro na gravação de {}:[{}].".format(fs_path, ls_err))
+
+        # logger
+        # M_LOG.info("dump:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def snapshot(self):
+        """
+        monta o snapshot das métricas
+
+        @return dicionário (serializável em json)
+        """
+        # logger
+        # M_LOG.info("snapshot:>>")
+
+        with self.__lck_stat:
+
+            # copia os acumuladores
+            ldct_tick = dict((ls_nome, {"count": llst_ser[0], "sum": llst_ser[1], "max": llst_ser[2],
+                                        "mean": llst_ser[1] / llst_ser[0] if llst_ser[0] else 0.,
+                                        "hist": list(llst_ser[3])})
+                             for ls_nome, llst_ser in self.__dct_tick.iteritems())
+
+            ldct_late = self.__serie(self.__dct_late)
+            ldct_prc = self.__serie(self.__dct_prc)
+            ldct_cnt = dict(self.__dct_cnt)
+
+            # copia os medidores
+            llst_gauge = self.__dct_gauge.items()
+
+        # consulta os medidores (fora da trava)
+        ldct_gauge = {}
+
+        for ls_nome, l_get in llst_gauge:
+
+            try:
+                # valor atual
+                ldct_gauge[ls_nome] = l_get()
+
+            # medidor indisponível (p.ex. qsize não implementado na plataforma)
+            except Exception:
+
+                # sem valor
+                ldct_gauge[ls_nome] = None
+
+        # logger
+        # M_LOG.info("snapshot:<<")
+
+        # return
+        return {"time": time.time(),
+                "uptime": time.time() - self.__f_ini,
+                "hist": list(D_HST_LIM),
+                "tick": ldct_tick,
+                "late": ldct_late,
+                "prc": ldct_prc,
+                "cnt": ldct_cnt,
+                "gauge": ldct_gauge}
+
+    # ---------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __serie(fdct_ser):
+        """
+        converte as séries [contagem, soma, máximo] em dicionários
+        """
+        # return
+        return dict((ls_nome, {"count": llst_ser[0], "sum": llst_ser[1], "max": llst_ser[2],
+                               "mean": llst_ser[1] / llst_ser[0] if llst_ser[0] else 0.})
+                    for ls_nome, llst_ser in fdct_ser.iteritems())
+
+# < the end >--------------------------------------------------------------------------------------
@@ -108,6 +108,12 @@ class CSimTime(threading.Thread):
         # tempo de congelamento do exercício
         self.__f_hora_frz = 0
 
+        # flag fast-time (hora da simulação avança por passos, desacoplada do relógio do sistema)
+        self.__v_fast = False
+
+        # tempo decorrido da simulação em modo fast-time (seg)
+        self.__f_hora_fast = 0.
+
         # logger
         # M_LOG.info("__init__:<<")
 
@@ -136,6 +142,32 @@ class CSimTime(threading.Thread):
 
     # ---------------------------------------------------------------------------------------------
 
+    def avanca(self, ff_dlt):
+        """
+        avança a hora da simulação em modo fast-time.
+
+        @param ff_dlt: passo de tempo simulado (seg).
+        """
+        # logger
+        # M_LOG.info("avanca:>>")
+
+        # check input parameters
+        assert ff_dlt > 0.
+
+        # só avança em modo fast-time
+        assert self.__v_fast
+
+        # hora descongelada ?
+        if not self.__v_congela:
+
+            # incrementa o tempo decorrido da simulação
+            self.__f_hora_fast += ff_dlt
+
+        # logger
+        # M_LOG.info("avanca:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
     def cbk_congela(self):
         """
         congela o relógio da simulação.
@@ -270,6 +302,12 @@ class CSimTime(threading.Thread):
         # logger
         # M_LOG.info("obtem_hora_sim:>>")
 
+        # modo fast-time ?
+        if self.__v_fast:
+
+            # hora zero da simulação mais o tempo decorrido em passos
+            return self.__f_zero_sim + self.__f_hora_fast
+
         # hora descongelada ?
         if not self.__v_congela:
 
@@ -368,6 +406,9 @@ class CSimTime(threading.Thread):
         self.__f_zero_sys = time.time()
         # M_LOG.debug("self.__f_zero_sys:[{:.3f}]".format(self.__f_zero_sys))
 
+        # reinicia o tempo decorrido em modo fast-time
+        self.__f_hora_fast = 0.
+
         # logger
         # M_LOG.info("set_hora:<<")
 
@@ -377,6 +418,35 @@ class CSimTime(threading.Thread):
 
     # ---------------------------------------------------------------------------------------------
 
+    @property
+    def f_hora_fast(self):
+        """
+        get tempo decorrido da simulação em modo fast-time (seg)
+        """
+        return self.__f_hora_fast
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def v_fast(self):
+        """
+        get flag fast-time
+        """
+        return self.__v_fast
+
+    @v_fast.setter
+    def v_fast(self, fv_val):
+        """
+        set flag fast-time
+        """
+        # check input parameters
+        assert isinstance(True, type(fv_val))
+
+        # flag fast-time
+        self.__v_fast = fv_val
+
+    # ---------------------------------------------------------------------------------------------
+
     @property
     def v_congela(self):
         """
@@ -0,0 +1,495 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+cine_frota
+
+atualiza os dados dinâmicos de toda a frota de aeronaves ativas de uma só vez, usando vetores NumPy
+(structure-of-arrays) no lugar da aritmética escalar de dados_dinamicos
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import logging
+
+# numpy
+try:
+    import numpy as np
+
+# em caso de erro...
+except ImportError:
+
+    # numpy não disponível, somente o cálculo escalar pode ser usado
+    np = None
+
+# model
+from ...newton import defs_newton as ldefs
+from ...emula.cine import dados_dinamicos as cine
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+M_LOG = logging.getLogger(__name__)
+M_LOG.setLevel(logging.DEBUG)
+
+# -------------------------------------------------------------------------------------------------
+
+def numpy_ok():
+    """
+    verifica se o NumPy está disponível
+
+    @return True se o cálculo vetorial pode ser usado, senão False
+    """
+    # retorna se o numpy foi carregado
+    return np is not None
+
+# < class CCineFrota >-----------------------------------------------------------------------------
+
+class CCineFrota(object):
+    """
+    mantém o estado cinemático da frota em vetores (x, y, altitude, proa, velocidade, demandas,
+    razões e aceleração) e aplica a atualização de velocidade, proa, altitude e posição de
+    dados_dinamicos a todas as aeronaves em um único passo
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, f_sim_time):
+        """
+        @param f_sim_time: relógio da simulação
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # check input parameters
+        assert f_sim_time
+
+        # verifica condições de execução
+        assert np is not None
+
+        # salva o relógio da simulação
+        self.__sim_time = f_sim_time
+
+        # capacidade atual dos vetores
+        self.__i_cap = 0
+
+        # cria os vetores de estado
+        self.__aloca(64)
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __aloca(self, fi_cap):
+        """
+        (re)aloca os vetores de estado da frota
+
+        @param fi_cap: capacidade mínima desejada
+        """
+        # logger
+        # M_LOG.info("__aloca:>>")
+
+        # capacidade suficiente ?
+        if fi_cap <= self.__i_cap:
+
+            # cai fora...
+            return
+
+        # dobra a capacidade até atender
+        li_cap = max(self.__i_cap, 1)
+
+        while li_cap < fi_cap:
+            li_cap *= 2
+
+        # posição (m)
+        self.__af_x = np.zeros(li_cap)
+        self.__af_y = np.zeros(li_cap)
+
+        # altitude atual e de demanda (m)
+        self.__af_alt = np.zeros(li_cap)
+        self.__af_alt_dem = np.zeros(li_cap)
+
+        # proa atual e de demanda (gr)
+        self.__af_pro = np.zeros(li_cap)
+        self.__af_pro_dem = np.zeros(li_cap)
+
+        # velocidade atual, de demanda, TAS e de solo (m/s)
+        self.__af_vel = np.zeros(li_cap)
+        self.__af_vel_dem = np.zeros(li_cap)
+        self.__af_vel_tas = np.zeros(li_cap)
+        self.__af_vel_gnd = np.zeros(li_cap)
+
+        # razão de subida (m/s), razão de curva (gr/s) e aceleração (m/s²)
+        self.__af_raz_sub = np.zeros(li_cap)
+        self.__af_raz_crv = np.zeros(li_cap)
+        self.__af_acel = np.zeros(li_cap)
+
+        # sentido de curva
+        self.__ai_sentido = np.zeros(li_cap, dtype=np.int8)
+
+        # variação de tempo desde a última atualização (s)
+        self.__af_delta_t = np.zeros(li_cap)
+
+        # passo da aeronave (m)
+        self.__af_delta_x = np.zeros(li_cap)
+        self.__af_delta_y = np.zeros(li_cap)
+
+        # salva a nova capacidade
+        self.__i_cap = li_cap
+
+        # logger
+        # M_LOG.info("__aloca:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __carrega(self, flst_atv, ff_tempo_atu):
+        """
+        carrega o estado das aeronaves nos vetores
+
+        @param flst_atv: lista de aeronaves ativas
+        @param ff_tempo_atu: hora atual da simulação (s)
+        """
+        # logger
+        # M_LOG.info("__carrega:>>")
+
+        # quantidade de aeronaves
+        li_num = len(flst_atv)
+
+        # garante a capacidade dos vetores
+        self.__aloca(li_num)
+
+        # carrega os vetores
+        self.__af_x[:li_num] = [l_atv.f_trf_x for l_atv in flst_atv]
+        self.__af_y[:li_num] = [l_atv.f_trf_y for l_atv in flst_atv]
+        self.__af_alt[:li_num] = [l_atv.f_trf_alt_atu for l_atv in flst_atv]
+        self.__af_alt_dem[:li_num] = [l_atv.f_atv_alt_dem for l_atv in flst_atv]
+        self.__af_pro[:li_num] = [l_atv.f_trf_pro_atu for l_atv in flst_atv]
+        self.__af_pro_dem[:li_num] = [l_atv.f_atv_pro_dem for l_atv in flst_atv]
+        self.__af_vel[:li_num] = [l_atv.f_trf_vel_atu for l_atv in flst_atv]
+        self.__af_vel_dem[:li_num] = [l_atv.f_atv_vel_dem for l_atv in flst_atv]
+        self.__af_vel_tas[:li_num] = [l_atv.f_atv_vel_tas for l_atv in flst_atv]
+        self.__af_raz_sub[:li_num] = [l_atv.f_atv_raz_sub for l_atv in flst_atv]
+        self.__af_raz_crv[:li_num] = [l_atv.f_atv_raz_crv for l_atv in flst_atv]
+        self.__af_acel[:li_num] = [l_atv.f_atv_acel for l_atv in flst_atv]
+        self.__ai_sentido[:li_num] = [l_atv.en_atv_sentido_curva for l_atv in flst_atv]
+
+        # calcula a variação de tempo desde a última atualização de cada aeronave
+        self.__af_delta_t[:li_num] = [ff_tempo_atu - l_atv.l_atv_time_ant for l_atv in flst_atv]
+
+        # logger
+        # M_LOG.info("__carrega:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __atualiza_velocidade(self, fi_num):
+        """
+        atualiza a velocidade atual das aeronaves (dados_dinamicos.__atualiza_velocidade)
+
+        @param fi_num: quantidade de aeronaves
+
+        @return a velocidade média do percurso
+        """
+        # vetores da frota
+        laf_vel = self.__af_vel[:fi_num]
+        laf_dem = self.__af_vel_dem[:fi_num]
+        laf_dlt = self.__af_acel[:fi_num] * self.__af_delta_t[:fi_num]
+
+        # salva velocidade atual para o cálculo da velocidade média
+        laf_vel_ant = laf_vel.copy()
+
+        # aeronaves variando a velocidade
+        lav_var = laf_vel_ant != laf_dem
+
+        # acelerando: v = vo + at, se ultrapassou a demanda, assume a demanda
+        lav_msk = laf_vel_ant < laf_dem
+        laf_vel[lav_msk] = np.minimum(laf_vel_ant[lav_msk] + laf_dlt[lav_msk], laf_dem[lav_msk])
+
+        # freando: v = vo - at, se ultrapassou a demanda, assume a demanda
+        lav_msk = laf_vel_ant > laf_dem
+        laf_vel[lav_msk] = np.maximum(laf_vel_ant[lav_msk] - laf_dlt[lav_msk], laf_dem[lav_msk])
+
+        # velocidade média do percurso
+        laf_vel_med = np.where(lav_var, (laf_vel_ant + laf_vel) / 2., laf_vel)
+
+        # atualiza a velocidade TAS das aeronaves que variaram a velocidade
+        self.__af_vel_tas[:fi_num][lav_var] = laf_vel[lav_var]
+
+        # evita divisão por zero
+        laf_vel_med[laf_vel_med == 0.] = 0.0001
+
+        # retorna a velocidade média
+        return laf_vel_med
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __atualiza_proa(self, fi_num):
+        """
+        atualiza a proa das aeronaves (dados_dinamicos.__atualiza_proa)
+
+        @param fi_num: quantidade de aeronaves
+        """
+        # vetores da frota
+        laf_pro = self.__af_pro[:fi_num]
+        laf_dem = self.__af_pro_dem[:fi_num]
+        laf_raz = self.__af_raz_crv[:fi_num]
+        lai_sen = self.__ai_sentido[:fi_num]
+
+        # ângulo de rotação no intervalo
+        laf_rot = laf_raz * self.__af_delta_t[:fi_num]
+
+        # curva indefinida (proa de demanda < 0)
+        lav_ind = laf_dem < 0.
+
+        # aeronaves curvando
+        lav_crv = (~lav_ind) & (laf_pro != laf_dem)
+
+        # curva indefinida ou pelo menor ângulo
+        lav_msk = lav_ind | (lav_crv & (ldefs.E_MENOR == lai_sen))
+
+        if lav_msk.any():
+
+            # diferença entre proas antes da curva
+            laf_dif_ant = np.abs(laf_pro[lav_msk] - laf_dem[lav_msk])
+            laf_dif_ant = np.where(laf_dif_ant > 180., 360. - laf_dif_ant, laf_dif_ant)
+
+            # calcula e normaliza a nova proa
+            laf_nov = self.__normaliza(laf_pro[lav_msk] + laf_rot[lav_msk])
+            laf_nov = np.round(laf_nov, 2)
+
+            # diferença entre proas após a curva
+            laf_dif_atu = np.abs(laf_nov - laf_dem[lav_msk])
+            laf_dif_atu = np.where(laf_dif_atu > 180., 360. - laf_dif_atu, laf_dif_atu)
+
+            # está oscilando (somente curva pelo menor ângulo) ?
+            lav_osc = (~lav_ind[lav_msk]) & (laf_dif_ant < np.abs(laf_raz[lav_msk])) & (laf_dif_ant < laf_dif_atu)
+
+            # evita o efeito oscilante...
+            laf_pro[lav_msk] = np.where(lav_osc, laf_dem[lav_msk], laf_nov)
+
+        # curva à direita
+        lav_msk = lav_crv & (ldefs.E_DIREITA == lai_sen)
+
+        if lav_msk.any():
+
+            # está do "lado" certo ? senão, ajusta o ângulo
+            laf_dem[lav_msk & (laf_dem < laf_pro)] += 360.
+
+            # incrementa a proa atual, se ultrapassou a demanda, assume a demanda
+            laf_pro[lav_msk] = np.round(np.minimum(laf_pro[lav_msk] + laf_rot[lav_msk], laf_dem[lav_msk]), 2)
+
+        # curva à esquerda
+        lav_msk = lav_crv & (ldefs.E_ESQUERDA == lai_sen)
+
+        if lav_msk.any():
+
+            # está do "lado" certo ? senão, ajusta o ângulo
+            laf_pro[lav_msk & (laf_pro < laf_dem)] += 360.
+
+            # decrementa a proa atual, se ultrapassou a demanda, assume a demanda
+            laf_pro[lav_msk] = np.round(np.maximum(laf_pro[lav_msk] - laf_rot[lav_msk], laf_dem[lav_msk]), 2)
+
+        # normaliza a nova proa das aeronaves que curvaram
+        lav_msk = lav_ind | lav_crv
+        laf_pro[lav_msk] = self.__normaliza(laf_pro[lav_msk])
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __atualiza_altitude(self, fi_num):
+        """
+        atualiza a altitude das aeronaves (dados_dinamicos.__atualiza_altitude)
+
+        o ângulo de ataque calculado no caminho escalar não é usado por __atualiza_posicao e,
+        portanto, não é calculado aqui
+
+        @param fi_num: quantidade de aeronaves
+        """
+        # vetores da frota
+        laf_alt = self.__af_alt[:fi_num]
+        laf_dem = self.__af_alt_dem[:fi_num]
+        laf_dlt = self.__af_raz_sub[:fi_num] * self.__af_delta_t[:fi_num]
+
+        # subindo: z = zo + vt, se ultrapassou a demanda, assume a demanda
+        lav_sub = laf_alt < laf_dem
+        # descendo: z = zo - vt, se ultrapassou a demanda, assume a demanda
+        lav_des = laf_alt > laf_dem
+
+        laf_alt[lav_sub] = np.minimum(laf_alt[lav_sub] + laf_dlt[lav_sub], laf_dem[lav_sub])
+        laf_alt[lav_des] = np.maximum(laf_alt[lav_des] - laf_dlt[lav_des], laf_dem[lav_des])
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __atualiza_posicao(self, fi_num):
+        """
+        atualiza a posição das aeronaves (dados_dinamicos.__atualiza_posicao)
+
+        @param fi_num: quantidade de aeronaves
+        """
+        # vetores da frota
+        laf_tas = self.__af_vel_tas[:fi_num]
+        laf_raz = self.__af_raz_sub[:fi_num]
+        laf_vel = self.__af_vel[:fi_num]
+        laf_dem = self.__af_vel_dem[:fi_num]
+        laf_dt = self.__af_delta_t[:fi_num]
+
+        # componente horizontal da velocidade em subida ou descida
+        laf_vel_anv = (laf_tas ** 2) - (laf_raz ** 2)
+        laf_vel_anv = np.sqrt(np.maximum(laf_vel_anv, 0.))
+
+        # velocidade de solo (vôo nivelado: TAS)
+        laf_gnd = np.where(self.__af_alt[:fi_num] == self.__af_alt_dem[:fi_num], laf_tas, laf_vel_anv)
+        self.__af_vel_gnd[:fi_num] = laf_gnd
+
+        # converte a proa atual para radianos
+        laf_sin = np.sin(np.radians(self.__af_pro[:fi_num]))
+        laf_cos = np.cos(np.radians(self.__af_pro[:fi_num]))
+
+        # passo da aeronave (v.t)
+        laf_stp = laf_gnd * laf_dt
+
+        # componente de aceleração (1/2 at^2), com sinal conforme acelera ou freia
+        laf_acl = np.sign(laf_dem - laf_vel) * self.__af_acel[:fi_num] * (laf_dt ** 2) / 2.
+
+        # decompõem o passo em x e y
+        self.__af_delta_x[:fi_num] = (laf_stp + laf_acl) * laf_sin
+        self.__af_delta_y[:fi_num] = (laf_stp + laf_acl) * laf_cos
+
+        # atualiza as coordenadas (x = xo + vot + 1/2 at^2)
+        self.__af_x[:fi_num] += self.__af_delta_x[:fi_num]
+        self.__af_y[:fi_num] += self.__af_delta_y[:fi_num]
+
+    # ---------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __normaliza(faf_pro):
+        """
+        normaliza as proas no intervalo [0, 360)
+
+        @param faf_pro: vetor de proas
+
+        @return vetor de proas normalizado
+        """
+        # normaliza a proa (uma volta, como no cálculo escalar)
+        return np.where(faf_pro >= 360., faf_pro - 360., np.where(faf_pro < 0., faf_pro + 360., faf_pro))
+
+    # ---------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __radial(faf_x, faf_y):
+        """
+        calcula a radial das posições (calc_proa_demanda.calc_proa_demanda)
+
+        @param faf_x: vetor de coordenadas X
+        @param faf_y: vetor de coordenadas Y
+
+        @return vetor de radiais (gr)
+        """
+        # evita divisão por zero (x = 0 é tratado a parte)
+        laf_x = np.where(0. == faf_x, 1., faf_x)
+        laf_atan = np.degrees(np.arctan(faf_y / laf_x))
+
+        # x > 0: 90 - atan, x < 0: 270 - atan (normalizado)
+        laf_rad = np.where(faf_x > 0., 90. - laf_atan, 270. - laf_atan)
+        laf_rad = np.where(laf_rad >= 360., laf_rad - 360., laf_rad)
+
+        # x = 0: 0 (y >= 0) ou 180 (y < 0)
+        laf_rad = np.where(0. == faf_x, np.where(faf_y >= 0., 0., 180.), laf_rad)
+
+        # retorna as radiais
+        return np.round(laf_rad, 2)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def update_cinematica(self, flst_fe):
+        """
+        atualiza os dados cinemáticos de todas as aeronaves e envia as pistas
+
+        @param flst_fe: lista de flight engines das aeronaves ativas
+        """
+        # logger
+        # M_LOG.info("update_cinematica:>>")
+
+        # somente aeronaves ativas
+        llst_fe = [l_fe for l_fe in flst_fe if l_fe.atv.v_atv_ok and (ldefs.E_ATIVA == l_fe.atv.en_trf_est_atv)]
+
+        # quantidade de aeronaves
+        li_num = len(llst_fe)
+
+        # não há aeronaves ?
+        if 0 == li_num:
+
+            # cai fora...
+            return
+
+        # lista de aeronaves
+        llst_atv = [l_fe.atv for l_fe in llst_fe]
+
+        # obtém a hora atual em segundos (única para todo o tick)
+        lf_tempo_atu = self.__sim_time.obtem_hora_sim()
+
+        # carrega o estado da frota
+        self.__carrega(llst_atv, lf_tempo_atu)
+
+        # calcula a nova velocidade das aeronaves
+        self.__atualiza_velocidade(li_num)
+
+        # atualiza a proa das aeronaves
+        self.__atualiza_proa(li_num)
+
+        # calcula a nova altitude das aeronaves
+        self.__atualiza_altitude(li_num)
+
+        # atualiza a posição das aeronaves
+        self.__atualiza_posicao(li_num)
+
+        # cálculo da distância e radial ao radar
+        laf_dst_crd = np.hypot(self.__af_x[:li_num], self.__af_y[:li_num])
+        laf_rad_crd = self.__radial(self.__af_x[:li_num], self.__af_y[:li_num])
+
+        # devolve o estado às aeronaves
+        for li_ndx, l_fe in enumerate(llst_fe):
+
+            # aeronave
+            l_atv = llst_atv[li_ndx]
+
+            # salva a hora atual
+            l_atv.l_atv_time_ant = lf_tempo_atu
+
+            # variação de tempo usada pelos procedimentos
+            l_fe.cine_voo.f_delta_t = float(self.__af_delta_t[li_ndx])
+
+            # dados dinâmicos
+            l_atv.f_trf_vel_atu = float(self.__af_vel[li_ndx])
+            l_atv.f_atv_vel_tas = float(self.__af_vel_tas[li_ndx])
+            l_atv.f_atv_vel_gnd = float(self.__af_vel_gnd[li_ndx])
+            l_atv.f_trf_pro_atu = float(self.__af_pro[li_ndx])
+            l_atv.f_atv_pro_dem = float(self.__af_pro_dem[li_ndx])
+            l_atv.f_trf_alt_atu = float(self.__af_alt[li_ndx])
+            l_atv.f_trf_x = float(self.__af_x[li_ndx])
+            l_atv.f_trf_y = float(self.__af_y[li_ndx])
+
+            # passo da aeronave
+            l_fe.cine_data.f_delta_x = float(self.__af_delta_x[li_ndx])
+            l_fe.cine_data.f_delta_y = float(self.__af_delta_y[li_ndx])
+
+            # distância e radial ao radar
+            l_atv.f_atv_dst_crd = float(laf_dst_crd[li_ndx])
+            l_atv.f_atv_rad_crd = float(laf_rad_crd[li_ndx])
+
+            # atualiza os dados relativos aos fixos de referência
+            cine.dados_referencias(l_atv, l_fe.cine_data, self.__sim_time)
+
+            # envia a pista para as consoles
+            l_fe.cine_voo.send_trks()
+
+        # logger
+        # M_LOG.info("update_cinematica:<<")
+
+# < the end >--------------------------------------------------------------------------------------
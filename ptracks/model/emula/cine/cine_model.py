@@ -24,8 +24,8 @@ import logging
 import math
 
 # model
-from ... import glb_defs as gdefs
 from ...newton import defs_newton as ldefs
+from ...newton import trk_codec as tcodec
 from ...coords import coord_defs as cdefs
 
 # import model.items.esp_trk as esptrk
@@ -87,6 +87,12 @@ class CCineModel(object):
         self.__sck_snd_trks = f_control.sck_snd_trks
         assert self.__sck_snd_trks
 
+        # formato das mensagens de pista (txt/bin)
+        self.__v_trk_bin = "bin" == str(f_control.config.dct_config.get("net.tfmt", "txt")).lower()
+
+        # lote de pistas por tick (None se as pistas são enviadas uma a uma)
+        self.__trk_batch = f_control.trk_batch
+
         # obtém o model manager
         l_model = f_control.model
         assert l_model
@@ -161,21 +167,67 @@ class CCineModel(object):
         #           str(round(self.__atv.f_trf_vel_atu * cdefs.D_CNV_MS2KT, 1))
         # M_LOG.debug("ls_buff: " + str(ls_buff))
 
+        # pistas em lote ?
+        if self.__trk_batch is not None:
+
+            try:
+                # acrescenta ao lote do tick
+                self.__trk_batch.add_trk(tcodec.pack_trk(self.__atv.i_trf_id,
+                                                         self.__atv.i_trf_ssr,
+                                                         self.__atv.i_atv_spi,
+                                                         lf_alt, lf_lat, lf_lng,
+                                                         self.__atv.f_trf_vel_atu * cdefs.D_CNV_MS2KT,
+                                                         self.__atv.f_atv_raz_sub,
+                                                         self.__atv.f_trf_pro_atu,
+                                                         self.__atv.s_trf_ind,
+                                                         self.__atv.ptr_trf_prf.s_prf_id,
+                                                         self.__sim_time.obtem_hora_sim()))
+
+                # cai fora...
+                return
+
+            # indicativo ou performance não cabem na mensagem binária ?
+            except ValueError:
+
+                # envia a pista no formato texto
+                pass
+
+        # formato binário ?
+        elif self.__v_trk_bin:
+
+            try:
+                # envia os dados de pista
+                self.__sck_snd_trks.send_data(tcodec.encode_trk(self.__atv.i_trf_id,
+                                                                self.__atv.i_trf_ssr,
+                                                                self.__atv.i_atv_spi,
+                                                                lf_alt, lf_lat, lf_lng,
+                                                                self.__atv.f_trf_vel_atu * cdefs.D_CNV_MS2KT,
+                                                                self.__atv.f_atv_raz_sub,
+                                                                self.__atv.f_trf_pro_atu,
+                                                                self.__atv.s_trf_ind,
+                                                                self.__atv.ptr_trf_prf.s_prf_id,
+                                                                self.__sim_time.obtem_hora_sim()))
+
+                # cai fora...
+                return
+
+            # indicativo ou performance não cabem na mensagem binária ?
+            except ValueError:
+
+                # envia a pista no formato texto
+                pass
+
         # monta o buffer de envio
-        ls_buff = str(gdefs.D_MSG_VRS) + \
-                  gdefs.D_MSG_SEP + str(gdefs.D_MSG_NEW) + \
-                  gdefs.D_MSG_SEP + str(self.__atv.i_trf_id) + \
-                  gdefs.D_MSG_SEP + str(self.__atv.i_trf_ssr) + \
-                  gdefs.D_MSG_SEP + str(self.__atv.i_atv_spi) + \
-                  gdefs.D_MSG_SEP + str(round(lf_alt, 1)) + \
-                  gdefs.D_MSG_SEP + str(round(lf_lat, 6)) + \
-                  gdefs.D_MSG_SEP + str(round(lf_lng, 6)) + \
-                  gdefs.D_MSG_SEP + str(round(self.__atv.f_trf_vel_atu * cdefs.D_CNV_MS2KT, 1)) + \
-                  gdefs.D_MSG_SEP + str(round(self.__atv.f_atv_raz_sub, 1)) + \
-                  gdefs.D_MSG_SEP + str(round(self.__atv.f_trf_pro_atu, 1)) + \
-                  gdefs.D_MSG_SEP + str(self.__atv.s_trf_ind) + \
-                  gdefs.D_MSG_SEP + str(self.__atv.ptr_trf_prf.s_prf_id) + \
-                  gdefs.D_MSG_SEP + str(self.__sim_time.obtem_hora_sim())
+        ls_buff = tcodec.encode_txt(self.__atv.i_trf_id,
+                                    self.__atv.i_trf_ssr,
+                                    self.__atv.i_atv_spi,
+                                    lf_alt, lf_lat, lf_lng,
+                                    self.__atv.f_trf_vel_atu * cdefs.D_CNV_MS2KT,
+                                    self.__atv.f_atv_raz_sub,
+                                    self.__atv.f_trf_pro_atu,
+                                    self.__atv.s_trf_ind,
+                                    self.__atv.ptr_trf_prf.s_prf_id,
+                                    self.__sim_time.obtem_hora_sim())
         # M_LOG.debug("ls_buff: " + str(ls_buff))
 
         # envia os dados de pista
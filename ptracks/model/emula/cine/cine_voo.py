@@ -280,4 +280,24 @@ class CCineVoo(cinmodel.CCineModel):
         # executa trajetória
         trj.prc_trajetoria(self.atv, self.cine_data, self.stk_context)
 
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def f_delta_t(self):
+        """
+        get variação de tempo desde a última atualização
+        """
+        return self.__f_delta_t
+
+    @f_delta_t.setter
+    def f_delta_t(self, f_val):
+        """
+        set variação de tempo desde a última atualização
+        """
+        self.__f_delta_t = f_val
+
 # < the end >--------------------------------------------------------------------------------------
@@ -752,51 +752,21 @@ def __calcula_tod(f_atv):
 
 # -------------------------------------------------------------------------------------------------
 
-def dados_dinamicos(f_atv, f_cine_data, ff_delta_t, f_stime):
+def dados_referencias(f_atv, f_cine_data, f_stime):
     """
-    atualiza os dados dinâmicos da aeronave
+    atualiza a distância e radial da aeronave aos fixos de referência (ETO, procedimento e
+    distância-radial) e a temporização do SPI
 
     @param f_atv: pointer para aeronave
     @param f_cine_data: pointer para CINDATA
     @param f_stime: pointer para sim_time
     """
     # logger
-    # M_LOG.info("dados_dinamicos:>>")
+    # M_LOG.info("dados_referencias:>>")
 
     # verifica parâmetros de entrada
     assert f_atv
     assert f_cine_data
-    assert f_stime
-
-    # verifica condições para execução (II)
-    if (not f_atv.v_atv_ok) or (ldefs.E_ATIVA != f_atv.en_trf_est_atv):
-
-        # logger
-        # M_LOG.info("dados_dinamicos:<E01: aeronave não ativa.")
-                        
-        # cai fora...
-        return
-
-    # calcula a nova velocidade e a velocidade média do percurso
-    lf_vel_med, lb_vel = __atualiza_velocidade(f_atv, ff_delta_t)
-
-    # if f_atv.f_atv_vel_mac_atu != f_atv.f_atv_vel_mac_dem:
-
-        # calcula e atualiza a velocidade MACH atual da aeronave
-        # __atualiza_mach(f_atv, ff_delta_t)
-
-    # atualiza a proa da aeronave
-    lb_proa = __atualiza_proa(f_atv, ff_delta_t)
-
-    # calcula a nova altitude e a variação de altitude
-    lf_alfa, lb_alt = __atualiza_altitude(f_atv, ff_delta_t, lf_vel_med)
-
-    # atualiza a posição da aeronave
-    __atualiza_posicao(f_atv, f_cine_data, ff_delta_t, lf_vel_med, lf_alfa)
-
-    # cálculo da distância e radial ao radar
-    f_atv.f_atv_dst_crd = math.sqrt((f_atv.f_trf_x ** 2) + (f_atv.f_trf_y ** 2))
-    f_atv.f_atv_rad_crd = cpd.calc_proa_demanda(f_atv.f_trf_x, f_atv.f_trf_y)
 
     # cálculo do tempo estimado para a aeronave alcancar o fixo (ETO)
     if (f_atv.ptr_atv_fix_eto is not None) and f_atv.ptr_atv_fix_eto.v_fix_ok:
@@ -884,6 +854,60 @@ def dados_dinamicos(f_atv, f_cine_data, ff_delta_t, f_stime):
         # reset SPI
         f_atv.i_atv_spi = -1
 
+    # logger
+    # M_LOG.info("dados_referencias:<<")
+
+# -------------------------------------------------------------------------------------------------
+
+def dados_dinamicos(f_atv, f_cine_data, ff_delta_t, f_stime):
+    """
+    atualiza os dados dinâmicos da aeronave
+
+    @param f_atv: pointer para aeronave
+    @param f_cine_data: pointer para CINDATA
+    @param f_stime: pointer para sim_time
+    """
+    # logger
+    # M_LOG.info("dados_dinamicos:>>")
+
+    # verifica parâmetros de entrada
+    assert f_atv
+    assert f_cine_data
+    assert f_stime
+
+    # verifica condições para execução (II)
+    if (not f_atv.v_atv_ok) or (ldefs.E_ATIVA != f_atv.en_trf_est_atv):
+
+        # logger
+        # M_LOG.info("dados_dinamicos:<E01: aeronave não ativa.")
+                        
+        # cai fora...
+        return
+
+    # calcula a nova velocidade e a velocidade média do percurso
+    lf_vel_med, lb_vel = __atualiza_velocidade(f_atv, ff_delta_t)
+
+    # if f_atv.f_atv_vel_mac_atu != f_atv.f_atv_vel_mac_dem:
+
+        # calcula e atualiza a velocidade MACH atual da aeronave
+        # __atualiza_mach(f_atv, ff_delta_t)
+
+    # atualiza a proa da aeronave
+    lb_proa = __atualiza_proa(f_atv, ff_delta_t)
+
+    # calcula a nova altitude e a variação de altitude
+    lf_alfa, lb_alt = __atualiza_altitude(f_atv, ff_delta_t, lf_vel_med)
+
+    # atualiza a posição da aeronave
+    __atualiza_posicao(f_atv, f_cine_data, ff_delta_t, lf_vel_med, lf_alfa)
+
+    # cálculo da distância e radial ao radar
+    f_atv.f_atv_dst_crd = math.sqrt((f_atv.f_trf_x ** 2) + (f_atv.f_trf_y ** 2))
+    f_atv.f_atv_rad_crd = cpd.calc_proa_demanda(f_atv.f_trf_x, f_atv.f_trf_y)
+
+    # atualiza os dados relativos aos fixos de referência
+    dados_referencias(f_atv, f_cine_data, f_stime)
+
     # aeronaves em trajetória ou manual ?
     # if (ldefs.E_TRAJETORIA == f_atv.en_trf_fnc_ope) or (ldefs.E_NOPROC == f_atv.en_trf_fnc_ope):
 
@@ -36,11 +36,13 @@ M_LOG.setLevel(logging.DEBUG)
 
 # -------------------------------------------------------------------------------------------------
 
-def obtem_brk(f_atv, f_brk, f_cine_data):
+def obtem_brk(f_atv, f_brk, f_cine_data, ft_rst=None):
     """
     @param f_atv: ponteiro para struct aeronaves
     @param f_brk: ponteiro para struct breakpoints
     @param f_cine_data: ponteiro para pilha
+    @param ft_rst: restrições pré-calculadas do breakpoint para a performance da aeronave
+                   (altitude, velocidade, antecipação), ver CPrcGeom.restricoes
     """
     # logger
     # M_LOG.info("obtem_brk:>>")
@@ -84,6 +86,17 @@ def obtem_brk(f_atv, f_brk, f_cine_data):
         # breakpoints inexistentes
         return
 
+    # não recebeu as restrições do breakpoint ?
+    if ft_rst is None:
+
+        # altitude limitada ao teto de serviço e velocidade limitada à velocidade máxima de cruzeiro
+        lf_alt_rst = min(f_brk.f_brk_alt, f_atv.ptr_trf_prf.f_prf_teto_sv)
+        lf_vel_rst = min(f_brk.f_brk_vel, f_atv.ptr_trf_prf.f_prf_vel_max_crz)
+
+    # senão, usa as restrições pré-calculadas
+    else:
+        lf_alt_rst, lf_vel_rst = ft_rst[:2]
+
     # + obtém a altitude do ponto se:
     #   - nada foi alterado (velocidade e altitude) durante a trajetória ou
     #   - apenas a velocidade foi alterada durante a trajetória
@@ -110,10 +123,10 @@ def obtem_brk(f_atv, f_brk, f_cine_data):
                 if f_brk.f_brk_alt > 0.:
 
                     # altitude do ponto maior que teto de serviço ?
-                    if f_brk.f_brk_alt > f_atv.ptr_trf_prf.f_prf_teto_sv:
+                    if lf_alt_rst < f_brk.f_brk_alt:
 
                         # altitude de demanda recebe teto de serviço
-                        f_atv.f_atv_alt_dem = f_atv.ptr_trf_prf.f_prf_teto_sv
+                        f_atv.f_atv_alt_dem = lf_alt_rst
 
                     else:
                         # se altitude do ponto maior que altitude de TRJ tráfego
@@ -134,20 +147,8 @@ def obtem_brk(f_atv, f_brk, f_cine_data):
                 # altitude do breakpoint contém dado ?
                 if f_brk.f_brk_alt > 0.:
 
-                    # altitude do breakpoint > teto de serviço ?
-                    if f_brk.f_brk_alt > f_atv.ptr_trf_prf.f_prf_teto_sv:
-
-                        # M_LOG.debug("obtem_brk:acima do teto de serviço")
-
-                        # altitude de demanda recebe teto de serviço
-                        f_atv.f_atv_alt_dem = f_atv.ptr_trf_prf.f_prf_teto_sv
-
-                    # senão, abaixo do teto de serviço 
-                    else:
-                        # M_LOG.debug("obtem_brk:usa altitude do breakpoint")
-
-                        # altitude de demanda recebe altitude do breakpoint
-                        f_atv.f_atv_alt_dem = f_brk.f_brk_alt
+                    # altitude de demanda recebe altitude do breakpoint ou teto de serviço, quem for menor
+                    f_atv.f_atv_alt_dem = lf_alt_rst
 
                 # senão, não tem altitude do breakpoint
                 else:
@@ -162,7 +163,7 @@ def obtem_brk(f_atv, f_brk, f_cine_data):
     # senão,...
     else:
         # altitude de demanda recebe altitude do breakpoint ou teto de serviço, quem for menor
-        f_atv.f_atv_alt_dem = min(f_brk.f_brk_alt, f_atv.ptr_trf_prf.f_prf_teto_sv)
+        f_atv.f_atv_alt_dem = lf_alt_rst
 
     # coordenada é do tipo 'T' (temporal)
     if f_brk.i_brk_t > 0:
@@ -291,19 +292,9 @@ def obtem_brk(f_atv, f_brk, f_cine_data):
                     # velocidade do breakpoint contém dado ?
                     if f_brk.f_brk_vel > 0.:
 
-                        # velocidade do ponto extrapolou o limite da performance ?
-                        if f_brk.f_brk_vel > f_atv.ptr_trf_prf.f_prf_vel_max_crz:
-
-                            # M_LOG.debug("obtem_brk:usa velocidade VelMaxCrz")
-
-                            # velocidade de demanda recebe a VelMaxCrz convertida para IAS
-                            f_atv.f_atv_vel_dem = f_atv.ptr_trf_prf.f_prf_vel_max_crz  # calcIAS ( f_atv.ptr_trf_prf.fAtrPrfVelMaxCrz, f_atv.f_atv_alt_dem, Exercicio.fExeVarTempISA )
-
-                        else:
-                            # M_LOG.debug("obtem_brk:usa velocidade do breakpoint")
-
-                            # velocidade de demanda recebe a velocidade do breakpoint convertida para IAS
-                            f_atv.f_atv_vel_dem = f_brk.f_brk_vel  # calcIAS ( f_brk.f_brk_vel, f_atv.f_atv_alt_dem, Exercicio.fExeVarTempISA )
+                        # velocidade de demanda recebe a velocidade do breakpoint ou a VelMaxCrz, a
+                        # que for menor (convertida para IAS)
+                        f_atv.f_atv_vel_dem = lf_vel_rst  # calcIAS ( lf_vel_rst, f_atv.f_atv_alt_dem, Exercicio.fExeVarTempISA )
 
                     # senão, não tem velocidade do breakpoint
                     else:
@@ -353,12 +344,8 @@ def obtem_brk(f_atv, f_brk, f_cine_data):
         # "altitude do breakpoint sem valor", forçava a aeronave a entrar na condição de vôo
         # abaixo de 10000FT, o que não é correto, pois, a mesma já cumpriu esta etapa do vôo.
 
-        # obtém altitude do ponto atual
-        lf_brk_alt = f_brk.f_brk_alt
-
-        # extrapolou o limite da performance ?
-        if f_brk.f_brk_alt > f_atv.ptr_trf_prf.f_prf_teto_sv:
-            lf_brk_alt = f_atv.ptr_trf_prf.f_prf_teto_sv
+        # obtém altitude do ponto atual (limitada ao teto de serviço)
+        lf_brk_alt = lf_alt_rst
 
         # existe altitude do ponto atual ?
         if 0 == lf_brk_alt:
@@ -36,9 +36,12 @@ from ...emula.cine import sentido_curva as scrv
 M_LOG = logging.getLogger(__name__)
 M_LOG.setLevel(logging.DEBUG)
 
+# tangente do semi-ângulo do cone de tolerância (10 graus)
+M_TAN_CONE = math.tan(math.radians(10))
+
 # -------------------------------------------------------------------------------------------------
 
-def prc_dir_ponto(f_atv, ff_pto_lng, ff_pto_lat, f_cine_data):
+def prc_dir_ponto(f_atv, ff_pto_lng, ff_pto_lat, f_cine_data, ff_antecipa=0.):
     """
     procedimento de direcionamento a ponto
     
@@ -46,6 +49,7 @@ def prc_dir_ponto(f_atv, ff_pto_lng, ff_pto_lat, f_cine_data):
     @param ff_pto_lng: longitude do ponto
     @param ff_pto_lat: latitude do ponto
     @param f_cine_data: ponteiro para pilha
+    @param ff_antecipa: antecipação de curva pré-calculada do ponto (CPrcGeom.restricoes)
     
     @return True se aeronave atingiu ponto, senão False
     """
@@ -66,7 +70,7 @@ def prc_dir_ponto(f_atv, ff_pto_lng, ff_pto_lat, f_cine_data):
         return None
 
     # calcula raio do cone de tolerância
-    lf_pto_rcone = f_atv.f_trf_alt_atu * math.tan(math.radians(10))
+    lf_pto_rcone = f_atv.f_trf_alt_atu * M_TAN_CONE
 
     # calcula distância da aeronave ao ponto (x, y)
     f_cine_data.f_dst_anv_pto_x = ff_pto_lng - f_atv.f_trf_x
@@ -79,7 +83,8 @@ def prc_dir_ponto(f_atv, ff_pto_lng, ff_pto_lat, f_cine_data):
     lf_passo_anv = math.sqrt((f_cine_data.f_delta_x ** 2) + (f_cine_data.f_delta_y ** 2))
 
     # (distância ao ponto <= raio de tolerância) ou (distância ao ponto <= passo da aeronave) ? (aeronave vai ultrapassar o ponto)
-    if (lf_dst_anv_pto <= lf_pto_rcone) or (lf_dst_anv_pto <= lf_passo_anv):
+    # ou (distância ao ponto <= antecipação) ? (hora de iniciar a curva para a próxima perna)
+    if (lf_dst_anv_pto <= lf_pto_rcone) or (lf_dst_anv_pto <= lf_passo_anv) or (lf_dst_anv_pto <= ff_antecipa):
 
         # logger
         # M_LOG.info(u"__ckeck_ok:<E02: aeronave atingiu o ponto.") 
@@ -136,15 +136,18 @@ def prc_subida(f_atv, f_cine_data, f_stk_context):
             return
 
         # obtém dados do breakpoint da subida
-        obrk.obtem_brk(f_atv, l_brk, f_cine_data)
+        obrk.obtem_brk(f_atv, l_brk, f_cine_data, l_sub.geo.rst_brk(f_atv.ptr_trf_prf, f_cine_data.i_brk_ndx))
 
     # fase direcionamento a ponto ?
     elif ldefs.E_FASE_DIRPONTO == f_atv.en_atv_fase:
 
         M_LOG.debug("Fase DirPonto")
 
+        # obtém a antecipação de curva pré-calculada do breakpoint
+        lt_rst = l_sub.geo.rst_brk(f_atv.ptr_trf_prf, f_cine_data.i_brk_ndx)
+
         # chegou ao breakpoint ?
-        if dp.prc_dir_ponto(f_atv, f_cine_data.f_coord_x_brk, f_cine_data.f_coord_y_brk, f_cine_data):
+        if dp.prc_dir_ponto(f_atv, f_cine_data.f_coord_x_brk, f_cine_data.f_coord_y_brk, f_cine_data, 0. if lt_rst is None else lt_rst[2]):
 
             # próxima fase
             f_atv.en_atv_fase = ldefs.E_FASE_BREAKPOINT
@@ -240,7 +243,7 @@ def prc_subida(f_atv, f_cine_data, f_stk_context):
                 return
 
             # obtém dados do breakpoint atual
-            obrk.obtem_brk(f_atv, l_brk, f_cine_data)
+            obrk.obtem_brk(f_atv, l_brk, f_cine_data, l_sub.geo.rst_brk(f_atv.ptr_trf_prf, f_cine_data.i_brk_ndx))
 
     # senão, fase não identificada
     else:
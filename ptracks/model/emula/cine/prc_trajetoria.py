@@ -113,7 +113,7 @@ def prc_trajetoria(f_atv, f_cine_data, f_stk_context):
             return
 
         # obtém dados do breakpoint da trajetória
-        obrk.obtem_brk(f_atv, l_brk, f_cine_data)
+        obrk.obtem_brk(f_atv, l_brk, f_cine_data, l_trj.geo.rst_brk(f_atv.ptr_trf_prf, 0))
 
     # fase de direção ao ponto
     elif ldefs.E_FASE_DIRPONTO == f_atv.en_atv_fase:
@@ -142,6 +142,10 @@ def prc_trajetoria(f_atv, f_cine_data, f_stk_context):
         lf_brk_y = f_cine_data.f_coord_y_brk
         # M_LOG.debug("prc_trajetoria:stk.f_brk_x:[{}] stk.f_brk_y:[{}]".format(f_cine_data.f_coord_x_brk, f_cine_data.f_coord_y_brk))
 
+        # obtém a antecipação de curva pré-calculada do breakpoint
+        lt_rst = l_trj.geo.rst_brk(f_atv.ptr_trf_prf, f_cine_data.i_brk_ndx)
+        lf_antecipa = 0. if lt_rst is None else lt_rst[2]
+
         '''# tratamento para vôo lateral
 
         # foi comandado na pilotagem vôo lateral ?
@@ -174,7 +178,7 @@ def prc_trajetoria(f_atv, f_cine_data, f_stk_context):
             lf_brk_y = lf_brk_y + l_brk.f_brk_y
         '''
         # faz o direcionamento ao breakpoint
-        if dp.prc_dir_ponto(f_atv, lf_brk_x, lf_brk_y, f_cine_data):
+        if dp.prc_dir_ponto(f_atv, lf_brk_x, lf_brk_y, f_cine_data, lf_antecipa):
 
             # ao bloquear o ponto, verifica se tem um procedimento associado ?
             if not tass.trata_associado(f_atv, l_brk, f_cine_data.i_brk_ndx, f_stk_context):
@@ -321,7 +325,7 @@ def prc_trajetoria(f_atv, f_cine_data, f_stk_context):
                 return
 
             # obtém dados do breakpoint atual
-            obrk.obtem_brk(f_atv, l_brk, f_cine_data)
+            obrk.obtem_brk(f_atv, l_brk, f_cine_data, l_trj.geo.rst_brk(f_atv.ptr_trf_prf, f_cine_data.i_brk_ndx))
 
     # fase de direcionamento a um fixo ?
     elif ldefs.E_FASE_DIRFIXO == f_atv.en_atv_fase:
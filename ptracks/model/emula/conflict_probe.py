@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+conflict_probe
+
+proximity (conflict) probe over a uniform spatial grid. Only flights in neighbouring cells are
+compared, instead of every flight against every other flight
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import logging
+import math
+
+# model
+from ..emula.cine import cine_calc as cincalc
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+M_LOG = logging.getLogger(__name__)
+M_LOG.setLevel(logging.DEBUG)
+
+# lado da célula horizontal (m): maior separação horizontal verificada (alerta no ar)
+D_CEL_HRZ = 900.
+
+# altura da faixa vertical (m): maior separação vertical verificada (alerta no ar)
+D_CEL_VRT = 150.
+
+# resultado da verificação de um par de aeronaves
+E_NENHUM, E_ALERTA, E_COLISAO = xrange(3)
+
+# < class CConflictProbe >-------------------------------------------------------------------------
+
+class CConflictProbe(object):
+    """
+    mantém as aeronaves ativas distribuídas em uma grade uniforme (células de D_CEL_HRZ x D_CEL_HRZ
+    por faixas de D_CEL_VRT) e, a cada verificação, compara cada aeronave somente com as aeronaves
+    das células vizinhas. Como o lado da célula é igual à maior separação verificada, nenhum par
+    dentro dos limites de alerta fica de fora. As aeronaves no solo ficam numa grade à parte (sem
+    faixas), pois entre aeronaves no solo só é verificada a separação horizontal
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        constructor
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # grade das aeronaves em vôo: (x, y, faixa) -> set de indicativos
+        self.__dct_cel_ar = {}
+
+        # grade das aeronaves no solo: (x, y) -> set de indicativos
+        self.__dct_cel_solo = {}
+
+        # célula atual de cada aeronave: indicativo -> (solo ?, (x, y), faixa)
+        self.__dct_pos = {}
+
+        # pares de aeronaves em alerta na última verificação
+        self.__lst_alert = []
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def check(self, fdct_flight):
+        """
+        atualiza a grade com as posições atuais e verifica a proximidade entre as aeronaves
+
+        @param fdct_flight: dicionário de vôos ativos (indicativo -> aeronave)
+        """
+        # logger
+        # M_LOG.info("check:>>")
+
+        # check input parameters
+        assert fdct_flight is not None
+
+        # cópia do dicionário (os vôos são ativados/desativados por outras threads)
+        ldct_flight = dict(fdct_flight)
+
+        # remove da grade os vôos que não estão mais ativos
+        for ls_ind in [ls_ind for ls_ind in self.__dct_pos if ls_ind not in ldct_flight]:
+
+            # remove o vôo
+            self.__remove(ls_ind)
+
+        # atualiza a célula de cada vôo ativo (só muda de célula quem saiu da célula anterior)
+        for ls_ind, l_atv in ldct_flight.iteritems():
+
+            # atualiza a posição na grade
+            self.__move(ls_ind, l_atv)
+
+        # pares em alerta e aeronaves envolvidas
+        llst_alert = []
+        lset_alert = set()
+
+        # percorre os vôos ativos...
+        for ls_ind1, l_atv1 in ldct_flight.iteritems():
+
+            # percorre os vôos das células vizinhas...
+            for ls_ind2 in self.__vizinhos(ls_ind1):
+
+                # cada par é verificado uma única vez
+                if ls_ind2 <= ls_ind1:
+
+                    # próximo vôo
+                    continue
+
+                # obtém a outra aeronave
+                l_atv2 = ldct_flight.get(ls_ind2, None)
+
+                if l_atv2 is None:
+
+                    # próximo vôo
+                    continue
+
+                # par em alerta ?
+                if E_ALERTA == self.__verifica_par(l_atv1, l_atv2):
+
+                    # salva o par
+                    llst_alert.append((ls_ind1, ls_ind2))
+
+                    # salva as aeronaves envolvidas
+                    lset_alert.add(ls_ind1)
+                    lset_alert.add(ls_ind2)
+
+        # atualiza o flag de alerta das aeronaves
+        for ls_ind, l_atv in ldct_flight.iteritems():
+
+            # está em algum par de alerta ?
+            l_atv.v_atv_alert = ls_ind in lset_alert
+
+        # salva os pares em alerta
+        self.__lst_alert = llst_alert
+
+        # logger
+        # M_LOG.info("check:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __move(self, fs_ind, f_atv):
+        """
+        coloca a aeronave na célula correspondente à sua posição atual
+
+        @param fs_ind: indicativo da aeronave
+        @param f_atv: aeronave
+        """
+        # calcula a célula atual
+        lv_solo = bool(f_atv.v_atv_solo)
+        lt_xy = (int(math.floor(f_atv.f_trf_x / D_CEL_HRZ)), int(math.floor(f_atv.f_trf_y / D_CEL_HRZ)))
+        li_vrt = int(math.floor(f_atv.f_trf_alt_atu / D_CEL_VRT))
+
+        lt_pos = (lv_solo, lt_xy, li_vrt)
+
+        # célula anterior
+        lt_ant = self.__dct_pos.get(fs_ind, None)
+
+        # continua na mesma célula ?
+        if lt_pos == lt_ant:
+
+            # nada a fazer
+            return
+
+        # estava na grade ?
+        if lt_ant is not None:
+
+            # remove da célula anterior
+            self.__remove(fs_ind)
+
+        # insere na nova célula
+        if lv_solo:
+            self.__dct_cel_solo.setdefault(lt_xy, set()).add(fs_ind)
+
+        else:
+            self.__dct_cel_ar.setdefault(lt_xy + (li_vrt,), set()).add(fs_ind)
+
+        # salva a célula atual
+        self.__dct_pos[fs_ind] = lt_pos
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __remove(self, fs_ind):
+        """
+        remove a aeronave da grade
+
+        @param fs_ind: indicativo da aeronave
+        """
+        # obtém a célula atual
+        lv_solo, lt_xy, li_vrt = self.__dct_pos.pop(fs_ind)
+
+        # seleciona a grade e a célula
+        if lv_solo:
+            ldct_cel = self.__dct_cel_solo
+            lt_key = lt_xy
+
+        else:
+            ldct_cel = self.__dct_cel_ar
+            lt_key = lt_xy + (li_vrt,)
+
+        # remove da célula
+        lset_cel = ldct_cel[lt_key]
+        lset_cel.discard(fs_ind)
+
+        # célula vazia ?
+        if not lset_cel:
+
+            # remove a célula
+            del ldct_cel[lt_key]
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __vizinhos(self, fs_ind):
+        """
+        obtém os vôos da célula da aeronave e das células vizinhas, nas duas grades
+
+        @param fs_ind: indicativo da aeronave
+
+        @return gerador de indicativos
+        """
+        # obtém a célula da aeronave
+        _, (li_x, li_y), li_vrt = self.__dct_pos[fs_ind]
+
+        # para todas as células vizinhas...
+        for li_dx in (-1, 0, 1):
+            for li_dy in (-1, 0, 1):
+
+                # aeronaves no solo
+                for ls_ind in self.__dct_cel_solo.get((li_x + li_dx, li_y + li_dy), ()):
+                    yield ls_ind
+
+                # aeronaves em vôo nas faixas vizinhas
+                for li_dz in (-1, 0, 1):
+                    for ls_ind in self.__dct_cel_ar.get((li_x + li_dx, li_y + li_dy, li_vrt + li_dz), ()):
+                        yield ls_ind
+
+    # ---------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __verifica_par(f_atv1, f_atv2):
+        """
+        verifica a separação entre duas aeronaves
+
+        @param f_atv1: aeronave 1
+        @param f_atv2: aeronave 2
+
+        @return E_NENHUM, E_ALERTA ou E_COLISAO
+        """
+        # calcula a distância euclidiana entre elas
+        lf_hrz = cincalc.distancia_entre_pontos((f_atv1.f_trf_y, f_atv1.f_trf_x), (f_atv2.f_trf_y, f_atv2.f_trf_x))
+
+        # calcula a separação vertical em metros entre elas
+        lf_vrt = abs(f_atv1.f_trf_alt_atu - f_atv2.f_trf_alt_atu)
+
+        # as duas estão em vôo ?
+        if (not f_atv1.v_atv_solo) and (not f_atv2.v_atv_solo):
+
+            # separação horizontal menor que 300m (1s a 300 Kt) e separação vertical menor que 70m (200ft) ?
+            if (lf_hrz < 300.) and (lf_vrt < 70.):
+
+                # colisão no ar entre as tráfegos
+                return E_COLISAO
+
+            # separação horizontal menor que 900m (3s a 300 Kt) e separação vertical menor que 150m (500ft) ?
+            if (lf_hrz < 900.) and (lf_vrt < 150.):
+
+                # alerta de colisão no ar entre as tráfegos
+                return E_ALERTA
+
+        # as duas estão no solo ?
+        elif f_atv1.v_atv_solo and f_atv2.v_atv_solo:
+
+            # separação menor que 20m (1s a 20 Kt) ?
+            if lf_hrz < 20.:
+
+                # colisão no solo entre as tráfegos
+                return E_COLISAO
+
+            # separação menor que 150m (5s a 30 Kt) ?
+            if lf_hrz < 150.:
+
+                # alerta de colisão no solo entre as tráfegos
+                return E_ALERTA
+
+        # uma no solo e a outra em vôo
+        else:
+            # separação horizontal menor que 50m (1s a 50 Kt) e separação vertical menor que 25m ?
+            if (lf_hrz < 50.) and (lf_vrt < 25.):
+
+                # colisão no solo e ar entre as tráfegos
+                return E_COLISAO
+
+            # separação horizontal menor que 100m (2s a 50 Kt) e separacão vertical menor que 50m ?
+            if (lf_hrz < 100.) and (lf_vrt < 50.):
+
+                # alerta de colisão no solo e ar entre as tráfegos
+                return E_ALERTA
+
+        # sem conflito
+        return E_NENHUM
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def lst_alert(self):
+        """
+        get pares de aeronaves (indicativos) em alerta na última verificação
+        """
+        return self.__lst_alert
+
+# < the end >--------------------------------------------------------------------------------------
@@ -29,9 +29,13 @@ import time
 from .. import glb_data as gdata
 from .. import glb_defs as gdefs
 
+from ..emula import conflict_probe as probe
 from ..emula import emula_model as model
 from ..emula import flight_engine as engine
-from ..emula.cine import cine_calc as cincalc
+from ..emula import flight_scheduler as sched
+from ..emula import rank_balance as rbal
+from ..emula import trf_ativ as tatv
+from ..emula import trj_predict as tprd
 
 from ..items import atv_new as atv
 from ..items import trf_new as trf
@@ -110,9 +114,17 @@ class CEmulaNewton(model.CEmulaModel):
         self.__sim_time = f_control.sim_time
         assert self.__sim_time
 
+        # obtém o registro de métricas
+        self.__sim_stat = f_control.sim_stat
+        assert self.__sim_stat
+
         # obtém o exercício
         self.__exe = f_model.exe
         assert self.__exe
+
+        # obtém o índice da carga preguiçosa dos tráfegos e a antecedência da carga (s)
+        self.__trf_lazy = f_model.trf_lazy
+        self.__f_lazy = float(self.dct_config["sch.lazy"])
  
         # monta as informações do servidor
         self.__s_srv_addr = str(gdefs.D_MSG_VRS) + gdefs.D_MSG_SEP + \
@@ -120,6 +132,68 @@ class CEmulaNewton(model.CEmulaModel):
                             "{}:{}".format(self.dct_config["srv.addr"], self.dct_config["srv.port"])
         assert self.__s_srv_addr
 
+        # workers do scheduler (modo tick)
+        self.__lst_sched = []
+
+        # modo fast-time ?
+        self.__v_fast = "fast" == str(self.dct_config["sch.mode"]).lower()
+
+        # flight engines escalonados por tick ?
+        if self.__v_fast or ("tick" == str(self.dct_config["sch.mode"]).lower()):
+
+            # cria o pool de workers do scheduler (no modo fast-time, um único worker sem thread)
+            for li_ndx in xrange(1 if self.__v_fast else max(1, int(self.dct_config["sch.pool"]))):
+
+                # cria o worker
+                l_sched = sched.CFlightScheduler(f_control, li_ndx)
+                assert l_sched
+
+                # coloca em modo deamon
+                l_sched.daemon = True
+
+                # salva na lista de workers
+                self.__lst_sched.append(l_sched)
+
+        # cria o verificador de proximidade
+        self.__probe = probe.CConflictProbe()
+        assert self.__probe
+
+        # cria o serviço de previsão de trajetória (prd.hrzn = 0 desliga)
+        self.__predict = tprd.CTrjPredict(f_control) if float(self.dct_config["prd.hrzn"]) > 0. else None
+
+        # balanceamento dinâmico entre os ranks (só com mais de um rank e fora do modo fast-time)
+        self.__v_bal = ("dynamic" == str(self.dct_config["mpi.bal"]).lower()) and \
+                       (self.__mpi_size > 1) and (not self.__v_fast)
+
+        # balanceamento dinâmico, rank que não é o master ?
+        if self.__v_bal and (0 != self.__mpi_rank):
+
+            # índice de ativação vazio (o rank 0 distribui todos os tráfegos)
+            self.__ativ = tatv.CTrfAtiv(self.__exe.dct_exe_trf, flst_ent=[])
+
+        # senão, índice de ativação dos tráfegos deste rank (no balanceamento dinâmico, todos)
+        else:
+            li_rank, li_size = (0, 1) if self.__v_bal else (self.__mpi_rank, self.__mpi_size)
+
+            self.__ativ = tatv.CTrfAtiv(self.__exe.dct_exe_trf, li_rank, li_size,
+                                        self.__trf_lazy.entradas(li_rank, li_size) if self.__trf_lazy is not None else None)
+
+        # serializador das aeronaves migradas
+        self.__migra = rbal.CMigraAtv(f_control) if self.__v_bal else None
+
+        # medidores de aeronaves
+        self.__sim_stat.add_gauge("flights.active", self.__i_ativas)
+        self.__sim_stat.add_gauge("flights.total", lambda: len(self.dct_flight))
+        self.__sim_stat.add_gauge("flights.pending", lambda: len(self.__ativ))
+        self.__sim_stat.add_gauge("flights.alert", lambda: len(self.__probe.lst_alert))
+        self.__sim_stat.add_gauge("flights.cnfl", lambda: len(self.lst_cnfl))
+
+        # flight engines escalonados por tick ?
+        if self.__lst_sched:
+
+            # aeronaves por worker
+            self.__sim_stat.add_gauge("sched.engines", lambda: [l_sched.i_engines for l_sched in self.__lst_sched])
+
         # cria a trava da lista de vôos
         # gdata.G_LCK_FLIGHT = threading.Lock()
         # assert gdata.G_LCK_FLIGHT  
@@ -150,11 +224,8 @@ class CEmulaNewton(model.CEmulaModel):
         l_atv.atv_fe = engine.CFlightEngine(self.control, l_atv)
         assert l_atv.atv_fe
 
-        # coloca em modo deamon
-        l_atv.atv_fe.daemon = True
-
         # põem a aeronave pra voar
-        l_atv.atv_fe.start()
+        self.__agenda_atv(l_atv)
 
         # marca a aeronave como processada
         # f_trf.setProcessed()
@@ -167,38 +238,344 @@ class CEmulaNewton(model.CEmulaModel):
 
     # ---------------------------------------------------------------------------------------------
 
-    def __check_time_in(self, f_trf):
+    def __agenda_atv(self, f_atv):
         """
-        checa se já deu o tempo de ativação de uma aeronave do exercício
+        coloca o flight engine da aeronave em execução (worker do scheduler ou thread própria)
 
-        @param f_trf: aeronave a verificar o tempo de ativação
+        @param f_atv: aeronave ativa
         """
-        # logger
-        # M_LOG.info("__check_time_in:>>")
-                
         # verifica parâmetros de entrada
-        assert f_trf
+        assert f_atv
+        assert f_atv.atv_fe
 
-        # verifica condições de execução
-        assert self.__sim_time
+        # flight engines escalonados por tick ?
+        if self.__lst_sched:
+
+            # entrega a aeronave ao worker menos carregado
+            min(self.__lst_sched, key=lambda l_sched: l_sched.i_engines).add_engine(f_atv.atv_fe)
+
+        # senão, uma thread por aeronave
+        else:
+            # coloca em modo deamon
+            f_atv.atv_fe.daemon = True
+
+            # põem a aeronave pra voar
+            f_atv.atv_fe.start()
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __balanceia(self):
+        """
+        rodada de balanceamento dinâmico, executada por todos os ranks a cada tim.fgen: o rank 0
+        recebe a carga de cada rank, distribui os tráfegos cuja hora de ativação chegou pelos ranks
+        menos carregados e, se necessário, manda o rank mais carregado migrar aeronaves ativas para
+        o menos carregado
+        """
+        # logger
+        # M_LOG.info("__balanceia:>>")
+
+        # aeronaves ativas neste rank
+        li_qtd = self.__i_ativas()
+
+        # tempo de tick deste rank (só no modo tick; 0 = usa a quantidade de aeronaves)
+        lf_tick = sum(l_sched.f_tick_wall for l_sched in self.__lst_sched)
+
+        # envia a carga ao rank 0
+        llst_carga = self.__mpi_comm.gather((li_qtd, lf_tick), root=0)
+
+        # plano da rodada
+        ldct_plano = None
+
+        # master node ?
+        if 0 == self.__mpi_rank:
+
+            # carga preguiçosa ?
+            if self.__trf_lazy is not None:
+
+                # tráfegos cuja hora de ativação chegou (no índice da carga preguiçosa a chave é o id,
+                # os tráfegos ainda não existem)
+                llst_trf = [(l_key, l_key) for l_key in self.__ativ.prontos(self.__sim_time.obtem_hora_sim())]
+
+            # senão,...
+            else:
+                # tráfegos automáticos cuja hora de ativação chegou
+                llst_trf = [(l_key, self.__exe.dct_exe_trf[l_key].i_trf_id)
+                            for l_key in self.__ativ.prontos(self.__sim_time.obtem_hora_sim())
+                            if l_key in self.__exe.dct_exe_trf]
+
+            # monta o plano
+            ldct_plano = rbal.plano(llst_carga, llst_trf, float(self.dct_config["mpi.mtol"]),
+                                    int(self.dct_config["mpi.mmax"]))
+
+        # distribui o plano a todos os ranks
+        ldct_plano = self.__mpi_comm.bcast(ldct_plano, root=0)
+
+        # carga preguiçosa ?
+        if self.__trf_lazy is not None:
+
+            # cria somente os tráfegos atribuídos a este rank
+            self.__trf_lazy.carrega_ids([l_key for l_key, li_rank in ldct_plano["ativ"].iteritems()
+                                         if self.__mpi_rank == li_rank])
+
+        # para todos os tráfegos do plano...
+        for l_key, li_rank in ldct_plano["ativ"].iteritems():
+
+            # remove do dicionário de tráfegos do exercício (em todos os ranks)
+            l_trf = self.__exe.dct_exe_trf.pop(l_key, None)
+
+            # tráfego deste rank ?
+            if (l_trf is not None) and (self.__mpi_rank == li_rank):
+
+                # cria uma nova aeronave ativa
+                l_atv = self.__ativa_trf(l_trf)
+                assert l_atv
+
+                # insere o vôo no dicionário de tráfegos ativos
+                self.dct_flight[l_atv.s_trf_ind] = l_atv
+
+        # existe migração ?
+        if ldct_plano["migra"] is not None:
+
+            # origem, destino e quantidade
+            li_src, li_dst, li_qtd = ldct_plano["migra"]
+
+            # rank de origem ?
+            if self.__mpi_rank == li_src:
+
+                # envia as aeronaves
+                self.__migra_envia(li_dst, li_qtd)
+
+            # senão, rank de destino ?
+            elif self.__mpi_rank == li_dst:
+
+                # recebe as aeronaves
+                self.__migra_recebe(li_src, li_qtd)
+
+        # logger
+        # M_LOG.info("__balanceia:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __i_ativas(self):
+        """
+        quantidade de aeronaves ativas neste rank (os vôos encerrados continuam no dicionário)
+        """
+        # return
+        return len([l_atv for l_atv in self.dct_flight.values() if l_atv.v_atv_ok and (ldefs.E_ATIVA == l_atv.en_trf_est_atv)])
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __migra_envia(self, fi_dst, fi_qtd):
+        """
+        pára e envia fi_qtd aeronaves ativas para o rank fi_dst. Sempre envia fi_qtd mensagens (None
+        quando a aeronave não pôde ser migrada), pois o destino espera exatamente fi_qtd
+
+        @param fi_dst: rank de destino
+        @param fi_qtd: quantidade de aeronaves
+        """
+        # logger
+        # M_LOG.info("__migra_envia:>>")
+
+        # aeronaves ativas, em ordem estável
+        llst_atv = [l_atv for _, l_atv in sorted(self.dct_flight.items())
+                    if l_atv.v_atv_ok and (ldefs.E_ATIVA == l_atv.en_trf_est_atv) and (l_atv.atv_fe is not None)][:fi_qtd]
+
+        # pede a parada das aeronaves (param no próximo passo)
+        for l_atv in llst_atv:
+            l_atv.atv_fe.v_migra = True
+
+        # prazo único para a parada de todas as aeronaves (as esperas não se somam)
+        lf_prazo = time.time() + 4. * float(self.dct_config["tim.wait"]) + 1.
+
+        # para todas as aeronaves a migrar...
+        for li_ndx in xrange(fi_qtd):
+
+            # dados da aeronave (None = não migrou)
+            ls_buf = None
+
+            # existe aeronave ?
+            if li_ndx < len(llst_atv):
+
+                # obtém a aeronave e o flight engine
+                l_atv = llst_atv[li_ndx]
+                l_fe = l_atv.atv_fe
+
+                # aguarda a parada até o prazo
+                lv_parou = l_fe.evt_migra.wait(max(0., lf_prazo - time.time()))
+
+                # não parou no prazo ?
+                if not lv_parou:
+
+                    # cancela a migração com a trava do passo (o flight engine não pára depois disso)
+                    l_fe.lck_step.acquire()
+
+                    try:
+                        l_fe.v_migra = False
+
+                    finally:
+                        l_fe.lck_step.release()
+
+                    # parou entre o fim da espera e o cancelamento ? (senão, encerrou o vôo ou continua)
+                    lv_parou = l_fe.evt_migra.is_set()
+
+                # aeronave parou ?
+                if lv_parou:
+
+                    try:
+                        # serializa a aeronave
+                        ls_buf = self.__migra.pack(l_atv)
+
+                        # remove do dicionário de tráfegos ativos
+                        del self.dct_flight[l_atv.s_trf_ind]
+
+                    # em caso de erro...
+                    except Exception, l_err:
+
+                        # logger
+                        l_log = logging.getLogger("CEmulaNewton::__migra_envia")
+                        l_log.setLevel(logging.WARNING)
+                        l_log.warning(u"<E01: {} não migrou: {}.".format(l_atv.s_trf_ind, l_err))
+
+                        # não migra
+                        ls_buf = None
+
+                        # continua a aeronave neste rank
+                        self.__retoma_atv(l_atv)
+
+            # envia a aeronave
+            self.__mpi_comm.send(ls_buf, dest=fi_dst, tag=rbal.D_TAG_MIGRA)
+
+        # logger
+        # M_LOG.info("__migra_envia:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __migra_recebe(self, fi_src, fi_qtd):
+        """
+        recebe fi_qtd aeronaves migradas do rank fi_src e as coloca para voar neste rank
+
+        @param fi_src: rank de origem
+        @param fi_qtd: quantidade de aeronaves
+        """
+        # logger
+        # M_LOG.info("__migra_recebe:>>")
+
+        # para todas as aeronaves migradas...
+        for _ in xrange(fi_qtd):
+
+            # recebe a aeronave
+            ls_buf = self.__mpi_comm.recv(source=fi_src, tag=rbal.D_TAG_MIGRA)
+
+            # aeronave não migrou ?
+            if ls_buf is None:
+
+                # próxima aeronave
+                continue
+
+            # recria a aeronave
+            l_atv, ldct_cine, llst_stk = self.__migra.unpack(ls_buf)
+
+            # cria o flight engine e restaura a cinemática e a pilha de contexto
+            l_atv.atv_fe = engine.CFlightEngine(self.control, l_atv)
+            assert l_atv.atv_fe
+
+            vars(l_atv.atv_fe.cine_data).update(ldct_cine)
+            l_atv.atv_fe.stk_context.extend(llst_stk)
+
+            # insere o vôo no dicionário de tráfegos ativos
+            self.dct_flight[l_atv.s_trf_ind] = l_atv
+
+            # põem a aeronave pra voar
+            self.__agenda_atv(l_atv)
+
+        # logger
+        # M_LOG.info("__migra_recebe:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __retoma_atv(self, f_atv):
+        """
+        volta a executar neste rank uma aeronave parada para migrar (um flight engine parado não
+        pode ser reiniciado, então cria outro com a mesma cinemática e pilha de contexto)
+
+        @param f_atv: aeronave ativa
+        """
+        # flight engine parado
+        l_fe_ant = f_atv.atv_fe
+
+        # cria o novo flight engine
+        f_atv.atv_fe = engine.CFlightEngine(self.control, f_atv)
+        assert f_atv.atv_fe
+
+        vars(f_atv.atv_fe.cine_data).update(vars(l_fe_ant.cine_data))
+        f_atv.atv_fe.stk_context.extend(l_fe_ant.stk_context)
+
+        # põem a aeronave pra voar
+        self.__agenda_atv(f_atv)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __check_ativ(self):
+        """
+        ativa os tráfegos do exercício cuja hora de ativação já chegou
+        """
+        # logger
+        # M_LOG.info("__check_ativ:>>")
 
         # obtém a hora da simulação
-        lb_h, lb_m, lb_s, _ = self.__sim_time.obtem_hora()
+        lf_hora = self.__sim_time.obtem_hora_sim()
+
+        # carga preguiçosa ?
+        if self.__trf_lazy is not None:
+
+            # cria os tráfegos deste rank que ativam dentro da antecedência de carga
+            self.__trf_lazy.carrega(lf_hora + self.__f_lazy, self.__mpi_rank, self.__mpi_size)
+
+        # para todos os tráfegos deste rank cuja hora de ativação já chegou (índice de ativação)...
+        for l_key in self.__ativ.prontos(lf_hora):
+
+            # obtém o tráfego
+            l_trf = self.__exe.dct_exe_trf.get(l_key, None)
+
+            # tráfego já removido ?
+            if l_trf is None:
+
+                # próximo tráfego
+                continue
+
+            # verifica aeronave
+            assert isinstance(l_trf, trf.CTrfNEW)
+
+            # checa estado operacional da aeronave (automática ou pilotada)
+            if ldefs.E_AUTOMATICA == l_trf.en_trf_est_ope:
 
-        # calcula o tempo da simulação
-        li_sim = (((lb_h * 60) + lb_m) * 60) + lb_s
+                # cria uma nova aeronave ativa
+                l_atv = self.__ativa_trf(l_trf)
+                assert l_atv
 
-        # obtém a hora de ativação da aeronave
-        lt_hatv = f_trf.t_trf_hor_atv
+                # insere os vôos no dicionário de tráfegos ativos
+                self.dct_flight[l_atv.s_trf_ind] = l_atv
 
-        # calcula o tempo da ativação
-        li_atv = (((lt_hatv[0] * 60) + lt_hatv[1]) * 60) + lt_hatv[2]
+                # remove do dicionário de tráfegos do exercício
+                del self.__exe.dct_exe_trf[l_key]
 
         # logger
-        # M_LOG.info("__check_time_in:<<")
-                
-        # retorna se já deu o tempo de entrada
-        return li_atv <= li_sim
+        # M_LOG.info("__check_ativ:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __check_prox(self):
+        """
+        verifica a proximidade entre os vôos ativos e registra a duração da verificação
+        """
+        # obtém o início da verificação
+        lf_ini = time.time()
+
+        # verifica a proximidade entre os vôos ativos
+        self.__probe.check(self.dct_flight)
+
+        # registra a duração da verificação
+        self.__sim_stat.add_tick("prox", time.time() - lf_ini)
 
     # ---------------------------------------------------------------------------------------------
 
@@ -276,9 +653,24 @@ class CEmulaNewton(model.CEmulaModel):
             # aguarda 1 seg
             time.sleep(1.)
 
+        # modo fast-time ?
+        if self.__v_fast:
+
+            # executa o exercício por passos de tempo simulado
+            self.__run_fast()
+
+            # cai fora...
+            return
+
         # round robin
         lf_tim_rrbn = float(self.dct_config["tim.rrbn"])
 
+        # inicia os workers do scheduler (modo tick)
+        for l_sched in self.__lst_sched:
+
+            # põem o worker pra rodar
+            l_sched.start()
+
         # init check if any new flights should be generated this iteration
         l_timer_thread_ativ = threading.Thread(target=self.__run_check_ativ)
         assert l_timer_thread_ativ
@@ -306,12 +698,32 @@ class CEmulaNewton(model.CEmulaModel):
             l_timer_thread_hora.daemon = True
             l_timer_thread_hora.start()
 
+        # pistas em lote fora do scheduler (modo thread) ?
+        if (self.control.trk_batch is not None) and (not self.__lst_sched):
+
+            # inicia o envio periódico dos lotes de pistas
+            l_timer_thread_trks = threading.Thread(target=self.__run_check_trks)
+            assert l_timer_thread_trks
+
+            l_timer_thread_trks.daemon = True
+            l_timer_thread_trks.start()
+
         # inicia check de colisão
-        # l_timer_thread_prox = threading.Thread(target=self.__run_check_prox)
-        # assert l_timer_thread_prox
+        l_timer_thread_prox = threading.Thread(target=self.__run_check_prox)
+        assert l_timer_thread_prox
         
-        # l_timer_thread_prox.daemon = True
-        # l_timer_thread_prox.start()
+        l_timer_thread_prox.daemon = True
+        l_timer_thread_prox.start()
+
+        # previsão de trajetória ligada ?
+        if self.__predict is not None:
+
+            # inicia a verificação das previsões
+            l_timer_thread_pred = threading.Thread(target=self.__run_check_pred)
+            assert l_timer_thread_pred
+
+            l_timer_thread_pred.daemon = True
+            l_timer_thread_pred.start()
 
         # inicia o recebimento de mensagens de pilotagem
         self.__sck_rcv_cpil.start()
@@ -374,6 +786,9 @@ class CEmulaNewton(model.CEmulaModel):
 
             # senão, atrasou...
             else:
+                # registra o atraso
+                self.__sim_stat.add_late("CEmulaNewton::run", lf_now - lf_call_time)
+
                 # logger
                 l_log = logging.getLogger("CEmulaNewton::run")
                 l_log.setLevel(logging.WARNING)
@@ -387,66 +802,150 @@ class CEmulaNewton(model.CEmulaModel):
                 
     # ---------------------------------------------------------------------------------------------
 
-    def __run_check_ativ(self):
+    def __run_fast(self):
         """
-        checks whether it's time to created another flight
+        executa o exercício em fast-time: a cada passo ativa os tráfegos, executa um tick de todas
+        as aeronaves, verifica a proximidade (a cada tim.prox simulado) e avança a hora simulada de
+        tim.wait, sem esperar o relógio do sistema
         """
         # logger
-        # M_LOG.info("__run_check_ativ:>>")
-                
+        # M_LOG.info("__run_fast:>>")
+
         # verifica condições de execução
         assert self.__exe
+        assert self.__sim_time.v_fast
 
-        # inicia o timer de check de ativação (30s)
-        lf_call_time = time.time()
+        # passo de tempo simulado
+        lf_tim_wait = float(self.dct_config["tim.wait"])
 
-        # loop de execução do check
+        # duração simulada (0 = até esgotar o tráfego)
+        lf_dur = float(self.dct_config["sch.fdur"])
+
+        # intervalo simulado do check de colisão
+        lf_tim_prox = float(self.dct_config["tim.prox"])
+        lf_prox_time = 0.
+
+        # intervalo simulado da verificação das previsões
+        lf_tim_pred = float(self.dct_config["prd.tchk"])
+        lf_pred_time = 0.
+
+        # worker único do modo fast-time
+        l_sched = self.__lst_sched[0]
+
+        # contadores para o relatório
+        li_passos = 0
+        lf_ini = time.time()
+
+        # loop de execução do simulador
         while gdata.G_KEEP_RUN:
 
-            # percorre os tráfegos do exercício
-            for l_key, l_trf in self.__exe.dct_exe_trf.items():
+            # ativa os tráfegos cuja hora de ativação já chegou
+            self.__check_ativ()
+
+            # obtém o início do passo
+            lf_tick = time.time()
+
+            # executa um passo de todas as aeronaves
+            l_sched.tick()
+
+            # registra a duração do passo e as aeronaves executadas (custo por aeronave)
+            self.__sim_stat.add_tick("fast", time.time() - lf_tick)
+            self.__sim_stat.add_cnt("fast.atv", l_sched.i_engines)
+
+            # hora do check de colisão ?
+            if self.__sim_time.f_hora_fast >= lf_prox_time:
+
+                # verifica a proximidade entre os vôos ativos
+                self.__check_prox()
+
+                # próximo check
+                lf_prox_time += lf_tim_prox
+
+            # hora da verificação das previsões ?
+            if (self.__predict is not None) and (self.__sim_time.f_hora_fast >= lf_pred_time):
+
+                # atualiza as previsões e os conflitos de médio prazo
+                self.__predict.check(self.dct_flight)
+
+                # próxima verificação
+                lf_pred_time += lf_tim_pred
 
-                # verifica aeronave
-                assert isinstance(l_trf, trf.CTrfNEW)
+            # avança a hora da simulação
+            self.__sim_time.avanca(lf_tim_wait)
+            li_passos += 1
 
-                # processa esta aeronave ?
-                if self.__mpi_rank == l_trf.i_trf_id % self.__mpi_size:
+            # duração definida ?
+            if lf_dur > 0.:
 
-                    # tráfego não está pendente ?
-                    # if ldefs.E_PENDENTE != l_trf.en_trf_est_atv:
+                # atingiu a duração ?
+                if self.__sim_time.f_hora_fast >= lf_dur:
 
-                        # próximo tráfego
-                        # continue
+                    # termina
+                    break
 
-                    # deu o tempo para a ativação ?
-                    if self.__check_time_in(l_trf):
+            # senão, esgotou o tráfego ?
+            elif (0 == l_sched.i_engines) and (not self.__trf_pendente()):
 
-                        # checa estado operacional da aeronave (automática ou pilotada)
-                        if ldefs.E_AUTOMATICA == l_trf.en_trf_est_ope:
+                # termina
+                break
 
-                            # cria uma nova aeronave ativa
-                            l_atv = self.__ativa_trf(l_trf)
-                            assert l_atv
+        # logger
+        l_log = logging.getLogger("CEmulaNewton::__run_fast")
+        l_log.setLevel(logging.INFO)
+        l_log.info(u"<I01: fast-time: {} passos, {:.1f}(s) simulados em {:.1f}(s).".format(
+                   li_passos, self.__sim_time.f_hora_fast, time.time() - lf_ini))
 
-                            # trava a lista de vôos
-                            # gdata.G_LCK_FLIGHT.acquire()
+        # fecha o arquivo de pistas
+        self.control.sck_snd_trks.close()
 
-                            try:
-                                # insere os vôos no dicionário de tráfegos ativos
-                                self.dct_flight[l_atv.s_trf_ind] = l_atv
+        # termina a aplicação
+        self.control.cbk_termina()
 
-                            finally:
+        # logger
+        # M_LOG.info("__run_fast:<<")
 
-                                # libera a lista de vôos
-                                pass  # gdata.G_LCK_FLIGHT.release()
+    # ---------------------------------------------------------------------------------------------
+
+    def __trf_pendente(self):
+        """
+        verifica se ainda existem tráfegos automáticos deste nó aguardando ativação
 
-                            # remove do dicionário de tráfegos do exercício
-                            del self.__exe.dct_exe_trf[l_key]
+        @return True se existem tráfegos pendentes, senão False
+        """
+        # return
+        return len(self.__ativ) > 0
 
-                        # senão, aeronave pilotada
-                        # else:
-                            # aeronave aguardando um piloto
-                            # l_trf.en_trf_est_atv = ldefs.E_QUEUED
+    # ---------------------------------------------------------------------------------------------
+
+    def __run_check_ativ(self):
+        """
+        checks whether it's time to created another flight
+
+        runs every tim.fgen seconds or, with the static distribution, as soon as the next flight in
+        the activation index is due
+        """
+        # logger
+        # M_LOG.info("__run_check_ativ:>>")
+                
+        # verifica condições de execução
+        assert self.__exe
+
+        # inicia o timer de check de ativação (30s ou a hora de ativação do próximo tráfego)
+        lf_call_time = time.time()
+
+        # loop de execução do check
+        while gdata.G_KEEP_RUN:
+
+            # balanceamento dinâmico ?
+            if self.__v_bal:
+
+                # ativa os tráfegos e balanceia as aeronaves entre os ranks
+                self.__balanceia()
+
+            # senão, distribuição estática (id do tráfego módulo quantidade de ranks)
+            else:
+                # ativa os tráfegos cuja hora de ativação já chegou
+                self.__check_ativ()
 
             # obtém o tempo atual em segundos
             lf_now = time.time()
@@ -454,6 +953,19 @@ class CEmulaNewton(model.CEmulaModel):
             # check de ativação (30s)
             lf_call_time += float(self.dct_config["tim.fgen"])
 
+            # distribuição estática ? (o balanceamento é coletivo entre os ranks e segue o tim.fgen)
+            if not self.__v_bal:
+
+                # hora de ativação do próximo tráfego
+                lf_prox = self.__ativ.f_proximo
+
+                # existe tráfego pendente ?
+                if lf_prox is not None:
+
+                    # antecipa o check para a hora de ativação (convertida para o relógio do sistema)
+                    lf_call_time = min(lf_call_time, lf_now + max(0., lf_prox - self.__sim_time.obtem_hora_sim()) /
+                                                              float(self.dct_config["tim.accl"]))
+
             # está adiantado ?
             if lf_call_time >= lf_now:
                                                                                                         
@@ -462,6 +974,9 @@ class CEmulaNewton(model.CEmulaModel):
 
             # senão, atrasou...
             else:
+                # registra o atraso
+                self.__sim_stat.add_late("CEmulaNewton::__run_check_ativ", lf_now - lf_call_time)
+
                 # logger
                 l_log = logging.getLogger("CEmulaNewton::__run_check_ativ")
                 l_log.setLevel(logging.WARNING)
@@ -509,6 +1024,9 @@ class CEmulaNewton(model.CEmulaModel):
 
             # senão, atrasou...
             else:
+                # registra o atraso
+                self.__sim_stat.add_late("CEmulaNewton::__run_check_cnfg", lf_now - lf_call_time)
+
                 # logger
                 l_log = logging.getLogger("CEmulaNewton::__run_check_cnfg")
                 l_log.setLevel(logging.WARNING)
@@ -560,6 +1078,9 @@ class CEmulaNewton(model.CEmulaModel):
 
             # senão, atrasou...
             else:
+                # registra o atraso
+                self.__sim_stat.add_late("CEmulaNewton::__run_check_hora", lf_now - lf_call_time)
+
                 # logger
                 l_log = logging.getLogger("CEmulaNewton::__run_check_hora")
                 l_log.setLevel(logging.WARNING)
@@ -573,137 +1094,126 @@ class CEmulaNewton(model.CEmulaModel):
                 
     # ---------------------------------------------------------------------------------------------
 
-    def __run_check_prox(self):
+    def __run_check_trks(self):
         """
-        calculates the proximity of the flights in the flight pair
-
-        should be run everytime new positions are calculated by the flight engine.  If two flights
-        are within 5 miles horizontically and at the same level or at the same position and (above
-        29000 ft) within 2000 ft or (under 29000 ft)  within 1000 ft vertically a danger situation
-        has occured
+        no modo thread cada aeronave acrescenta sua pista ao lote; envia o lote a cada tim.wait
         """
         # logger
-        # M_LOG.info("__run_check_prox:>>")
-
-        # inicia o timer de check de colisão (1s)
-        lf_call_time = time.time()
-
-        # loop de execução do check
-        while gdata.G_KEEP_RUN:
-
-            # percorre o dicionário de vôos ativos...
-            for _, l_atv1 in self.dct_flight.iteritems():
+        # M_LOG.info("__run_check_trks:>>")
 
-                # verifica aeronave
-                assert isinstance(l_atv1, atv.CAtvNEW)
+        # obtém o lote de pistas
+        l_trk_batch = self.control.trk_batch
+        assert l_trk_batch
 
-                # obtém a posição do vôo
-                lf_x1 = l_atv1.f_trf_x
-                lf_y1 = l_atv1.f_trf_y
+        # tempo de espera
+        lf_tim_wait = float(self.dct_config["tim.wait"])
 
-                # obtém a altitude do vôo em metros
-                ld_alt1 = l_atv1.f_trf_alt_atu
+        # inicia o timer de envio
+        lf_call_time = time.time()
 
-                # reset proximity alert
-                l_atv1.v_atv_alert = False
+        # loop de envio
+        while gdata.G_KEEP_RUN:
 
-                # percorre o dicionário de vôos ativos...
-                for _, l_atv2 in self.dct_flight.iteritems():
+            # envia as pistas pendentes
+            l_trk_batch.flush()
 
-                    # verifica aeronave
-                    assert isinstance(l_atv2, atv.CAtvNEW)
+            # obtém o tempo atual em segundos
+            lf_now = time.time()
 
-                    # é o mesmo vôo ?
-                    if l_atv1 == l_atv2:
+            # próximo envio
+            lf_call_time += lf_tim_wait
 
-                        # vai para o próximo vôo
-                        continue
+            # está adiantado ?
+            if lf_call_time >= lf_now:
 
-                    # obtém a posição do vôo
-                    lf_x2 = l_atv2.f_trf_x
-                    lf_y2 = l_atv2.f_trf_y
+                # agenda a próxima execução
+                time.sleep(lf_call_time - lf_now)
 
-                    # obtém a altitude do vôo em metros
-                    ld_alt2 = l_atv2.f_trf_alt_atu
+            # senão, atrasou...
+            else:
+                # registra o atraso
+                self.__sim_stat.add_late("CEmulaNewton::__run_check_trks", lf_now - lf_call_time)
 
-                    # calcula a distância euclidiana entre eles
-                    lf_hrz = cincalc.distancia_entre_pontos((lf_y1, lf_x1), (lf_y2, lf_x2))
+                # logger
+                l_log = logging.getLogger("CEmulaNewton::__run_check_trks")
+                l_log.setLevel(logging.WARNING)
+                l_log.warning("<E01: atraso de {}(s).".format(lf_now - lf_call_time))
 
-                    # calcula a separação vertical em metros entre eles
-                    lf_vrt = abs(ld_alt1 - ld_alt2)
+                # reinicia o timer
+                lf_call_time = time.time()
 
-                    M_LOG.debug(u"distâncias: H[%f] V[%f]" % (lf_hrz, lf_vrt))
+        # logger
+        # M_LOG.info("__run_check_trks:<<")
 
-                    # as duas estão em vôo ?
-                    if (not l_atv1.v_atv_solo) and (not l_atv2.v_atv_solo):
+    # ---------------------------------------------------------------------------------------------
 
-                        # separação horizontal menor que 300m (1s a 300 Kt) e separação vertical menor que 70m (200ft) ?
-                        if (lf_hrz < 300.) and (lf_vrt < 70.):
+    def __run_check_pred(self):
+        """
+        atualiza as previsões de trajetória e os conflitos de médio prazo
 
-                            # emite o aviso sonoro
-                            # self._snd_explode.play()
+        runs every prd.tchk seconds. Only the flights whose plan changed (pilot command) or whose
+        prediction expired (prd.tval) are predicted again
+        """
+        # logger
+        # M_LOG.info("__run_check_pred:>>")
 
-                            # gera colisão no ar entre as tráfegos
-                            # l_view.gera_colisao_ar(l_atv1, l_atv2)
-                            pass
+        # inicia o timer
+        lf_call_time = time.time()
 
-                        # separação horizontal menor que 450m (3s a 300 Kt) e separação vertical menor que 150m (300ft)?
-                        elif (lf_hrz < 900.) and (lf_vrt < 150.):
+        # loop de execução do check
+        while gdata.G_KEEP_RUN:
 
-                            # gera alerta de colisão no ar entre as tráfegos
-                            l_atv1.v_atv_alert = True
+            # atualiza as previsões e os conflitos de médio prazo
+            self.__predict.check(self.dct_flight)
 
-                            # emite o aviso sonoro
-                            # self._snd_alert.play()
+            # obtém o tempo atual em segundos
+            lf_now = time.time()
 
-                    # as duas estão no solo ?
-                    elif l_atv1.v_atv_solo and l_atv2.v_atv_solo:
+            # próxima verificação
+            lf_call_time += float(self.dct_config["prd.tchk"])
 
-                        # separação menor que 20m (1s a 20 Kt) ?
-                        if lf_hrz < 20.:
+            # está adiantado ?
+            if lf_call_time >= lf_now:
 
-                            # nova colisão ?
-                            # if 'X' != l_atv1.c_atv_status_solo:
+                # agenda a próxima execução
+                time.sleep(lf_call_time - lf_now)
 
-                                # emite o aviso sonoro
-                                # self._snd_explode.play()
+            # senão, atrasou...
+            else:
+                # registra o atraso
+                self.__sim_stat.add_late("CEmulaNewton::__run_check_pred", lf_now - lf_call_time)
 
-                                # gera colisão no solo entre as tráfegos
-                                # l_view.gera_colisao_solo(l_atv1, l_atv2)
-                            pass
-                            
-                        # separação menor que 150m (5s a 30 Kt) ?
-                        elif lf_hrz < 150.:
+                # logger
+                l_log = logging.getLogger("CEmulaNewton::__run_check_pred")
+                l_log.setLevel(logging.WARNING)
+                l_log.warning("<E01: atraso de {}(s).".format(lf_now - lf_call_time))
 
-                            # gera alerta de colisão no solo entre as tráfegos
-                            l_atv1.v_atv_alert = True
+                # reinicia o timer
+                lf_call_time = time.time()
 
-                            # emite o aviso sonoro
-                            # self._snd_alert.play()
+        # logger
+        # M_LOG.info("__run_check_pred:<<")
 
-                    # uma no solo e a outra em vôo
-                    else:
-                        # separação horizontal menor que 50m (1s a 50 Kt) e separação vertical menor que 25m ?
-                        if (lf_hrz < 50.) and (lf_vrt < 25.):
+    # ---------------------------------------------------------------------------------------------
 
-                            # nova colisão ?
-                            # if 'X' != l_atv1.c_atv_status_solo:
+    def __run_check_prox(self):
+        """
+        calculates the proximity of the flights in the flight pair
 
-                                # emite o aviso sonoro
-                                # self._snd_explode.play()
+        runs every tim.prox seconds. Flights are kept in a spatial grid by the conflict probe, so
+        each flight is only compared with the flights in the neighbouring cells
+        """
+        # logger
+        # M_LOG.info("__run_check_prox:>>")
 
-                                # gera colisão no solo e ar entre as tráfegos
-                                # l_view.gera_colisao_ar_solo(l_atv1, l_atv2)
-                            pass
-                            
-                        # separação horizontal menor que 100m (2s a 50 Kt) e separacão vertical menor que 50m ?
-                        elif (lf_hrz < 100.) and (lf_vrt < 50.):
+        # inicia o timer de check de colisão (1s)
+        lf_call_time = time.time()
 
-                            # gera colisão no solo e ar entre as tráfegos
-                            l_atv1.v_atv_alert = True
+        # loop de execução do check
+        while gdata.G_KEEP_RUN:
 
-                            # emite o aviso sonoro
-                            # self._snd_alert.play()
+            # verifica a proximidade entre os vôos ativos (células vizinhas da grade)
+            self.__check_prox()
 
             # obtém o tempo atual em segundos
             lf_now = time.time()
@@ -719,6 +1229,9 @@ class CEmulaNewton(model.CEmulaModel):
 
             # senão, atrasou...
             else:
+                # registra o atraso
+                self.__sim_stat.add_late("CEmulaNewton::__run_check_prox", lf_now - lf_call_time)
+
                 # logger
                 l_log = logging.getLogger("CEmulaNewton::__run_check_prox")
                 l_log.setLevel(logging.WARNING)
@@ -730,4 +1243,35 @@ class CEmulaNewton(model.CEmulaModel):
         # logger
         # M_LOG.info("__run_check_prox:<<")
                 
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def lst_alert(self):
+        """
+        get pares de aeronaves em alerta de proximidade
+        """
+        return self.__probe.lst_alert
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def dct_pred(self):
+        """
+        get previsões de trajetória (indicativo -> dicionário (rev, hora, trk, eta))
+        """
+        return self.__predict.dct_pred if self.__predict is not None else {}
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def lst_cnfl(self):
+        """
+        get conflitos de médio prazo previstos (indicativo 1, indicativo 2, hora)
+        """
+        return self.__predict.lst_cnfl if self.__predict is not None else []
+
 # < the end >--------------------------------------------------------------------------------------
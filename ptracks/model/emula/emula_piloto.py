@@ -27,16 +27,12 @@ import time
 
 # model
 from .. import glb_data as gdata
-from .. import glb_defs as gdefs
 
 from ..emula import emula_model as model
+from ..emula import trk_ingest as ingest
 
-from ..piloto import data_piloto as ldata
 from ..piloto import aircraft_piloto as canv
 
-# control
-from ...control.events import events_flight as events
-
 # < module data >----------------------------------------------------------------------------------
 
 # logger
@@ -90,95 +86,80 @@ class CEmulaPiloto(model.CEmulaModel):
                                         
     # ---------------------------------------------------------------------------------------------
 
-    def __msg_trk(self, flst_data):
+    def __cria_anv(self, fs_callsign, flst_data):
         """
-        checks whether it's time to created another flight.
+        cria uma aeronave recebida pela primeira vez (chamado com a trava da lista de vôos)
+
+        @param fs_callsign: callsign
+        @param flst_data: dados da mensagem de status
+
+        @return aeronave
+        """
+        # return
+        return canv.CAircraftPiloto(self, flst_data)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __msg_prf(self, fdct_new):
+        """
+        obtém do servidor as performances ainda não conhecidas das aeronaves de um lote (chamado
+        sem a trava da lista de vôos)
 
-        @param flst_data: mensagem de status
+        @param fdct_new: última mensagem de status de cada aeronave do lote (callsign -> dados)
         """
         # logger
-        # M_LOG.info("__msg_trk:>>")
+        # M_LOG.info("__msg_prf:>>")
 
         # check for requirements
         assert self.__sck_http is not None
         assert self.dct_config is not None
-        assert self.dct_flight is not None
         assert self.__dct_prf is not None
-                
-        # obtém o callsign da aeronave
-        ls_callsign = flst_data[10]
-        M_LOG.debug("__msg_trk:callsign:[{}]".format(ls_callsign))
-                            
-        # trava a lista de vôos
-        gdata.G_LCK_FLIGHT.acquire()
-
-        try:
-            # aeronave já está no dicionário ?
-            if ls_callsign in self.dct_flight:
-
-                # atualiza os dados da aeronave
-                self.dct_flight[ls_callsign].update_data(flst_data[1:])
-
-            # senão, aeronave nova...
-            else:
-                # create new aircraft
-                self.dct_flight[ls_callsign] = canv.CAircraftPiloto(self, flst_data[1:])
-                assert self.dct_flight[ls_callsign]
-                                                                                                                                                                                                                                                            
-        finally:
-
-            # libera a lista de vôos
-            gdata.G_LCK_FLIGHT.release()
-
-        # obtém o indicativo da performance
-        ls_prf_ind = flst_data[11]
-        M_LOG.debug("__msg_trk:ls_prf_ind:[{}]".format(ls_prf_ind))
+
+        # para todas as aeronaves do lote...
+        for llst_data in fdct_new.itervalues():
+
+            # obtém o indicativo da performance
+            ls_prf_ind = llst_data[11]
+            M_LOG.debug("__msg_prf:ls_prf_ind:[{}]".format(ls_prf_ind))
                             
-        # performance não está no dicionário ?
-        if self.__dct_prf.get(ls_prf_ind, None) is None:
+            # performance não está no dicionário ?
+            if self.__dct_prf.get(ls_prf_ind, None) is None:
 
-            # monta o request da performance
-            ls_req = "data/prf.json?{}".format(ls_prf_ind)
-            M_LOG.debug("__msg_trk:ls_req:[{}]".format(ls_req))
+                # monta o request da performance
+                ls_req = "data/prf.json?{}".format(ls_prf_ind)
+                M_LOG.debug("__msg_prf:ls_req:[{}]".format(ls_req))
 
-            # get server address
-            l_srv = self.dct_config.get("srv.addr", None)
+                # get server address
+                l_srv = self.dct_config.get("srv.addr", None)
             
-            if l_srv is not None:
+                if l_srv is not None:
 
-                # obtém os dados de performance do servidor
-                l_prf = self.__sck_http.get_data(l_srv, ls_req)
-                M_LOG.debug("__msg_trk:l_prf:[{}]".format(l_prf))
+                    # obtém os dados de performance do servidor
+                    l_prf = self.__sck_http.get_data(l_srv, ls_req)
+                    M_LOG.debug("__msg_prf:l_prf:[{}]".format(l_prf))
 
-                if (l_prf is not None) and (l_prf != ""):
+                    if (l_prf is not None) and (l_prf != ""):
 
-                    # salva a performance no dicionário
-                    self.__dct_prf[ls_prf_ind] = json.loads(l_prf)
-                    M_LOG.debug("__msg_trk:dct_prf:[{}]".format(self.__dct_prf))
+                        # salva a performance no dicionário
+                        self.__dct_prf[ls_prf_ind] = json.loads(l_prf)
+                        M_LOG.debug("__msg_prf:dct_prf:[{}]".format(self.__dct_prf))
 
-                # senão, não achou no servidor...
+                    # senão, não achou no servidor...
+                    else:
+                        # logger
+                        l_log = logging.getLogger("CEmulaPiloto::__msg_prf")
+                        l_log.setLevel(logging.WARNING)
+                        l_log.error(u"<E01: performance({}) não existe no servidor.".format(ls_prf_ind))
+
+                # senão, não achou endereço do servidor
                 else:
                     # logger
-                    l_log = logging.getLogger("CEmulaPiloto::__msg_trk")
+                    l_log = logging.getLogger("CEmulaPiloto::__msg_prf")
                     l_log.setLevel(logging.WARNING)
-                    l_log.error(u"<E01: performance({}) não existe no servidor.".format(ls_prf_ind))
-
-            # senão, não achou endereço do servidor
-            else:
-                # logger
-                l_log = logging.getLogger("CEmulaPiloto::__msg_trk")
-                l_log.setLevel(logging.WARNING)
-                l_log.warning(u"<E02: srv.addr não existe na configuração.")
-
-        # cria um evento de atualização de aeronave
-        l_evt = events.CFlightUpdate(ls_callsign)
-        assert l_evt
-
-        # dissemina o evento
-        self.event.post(l_evt)
+                    l_log.warning(u"<E02: srv.addr não existe na configuração.")
 
         # logger
-        # M_LOG.info("__msg_trk:<<")
+        # M_LOG.info("__msg_prf:<<")
 
     # ---------------------------------------------------------------------------------------------
 
@@ -206,60 +187,14 @@ class CEmulaPiloto(model.CEmulaModel):
         # inicia o recebimento de mensagens de pista
         lsck_rcv_trks.start()
 
-        # obtém a queue de dados
-        lq_rcv_trks = self.control.q_rcv_trks
-        assert lq_rcv_trks
+        # recebe as pistas em lotes, com um evento de atualização por quadro de tela
+        l_ingest = ingest.CTrkIngest(self, self.__cria_anv, self.__msg_prf)
+        assert l_ingest
 
-        # loop
-        while gdata.G_KEEP_RUN:
+        l_ingest.run()
 
-            # obtém um item da queue de entrada
-            llst_data = lq_rcv_trks.get()
-            # M_LOG.debug("llst_data:[{}]".format(llst_data))
-
-            # queue tem dados ?
-            if llst_data:
-
-                # mensagem de status de aeronave ?
-                if gdefs.D_MSG_NEW == int(llst_data[0]):
-
-                    # trata mensagem de status de aeronave
-                    self.__msg_trk(llst_data)
-                    
-                # mensagem de eliminação de aeronave ?
-                elif gdefs.D_MSG_KLL == int(llst_data[0]):
-
-                    # coloca a mensagem na queue
-                    # M_LOG.debug("Elimina:[{}]".format(ls_callsign))
-
-                    # trava a lista de vôos
-                    ldata.G_LCK_FLIGHT.acquire()
-
-                    try:
-                        # aeronave está no dicionário ?
-                        if ls_callsign in self.dct_flight:
-
-                            # retira a aeronave do dicionário
-                            del self.dct_flight[ls_callsign]
-
-                    finally:
-
-                        # libera a lista de vôos
-                        ldata.G_LCK_FLIGHT.release()
-
-                    # cria um evento de eliminação de aeronave
-                    l_evt = events.FlightKill(ls_callsign)
-                    assert l_evt
-
-                    # dissemina o evento
-                    self._event.post(l_evt)
-
-                # senão, mensagem não reconhecida ou não tratada
-                else:
-                    # logger
-                    l_log = logging.getLogger("CEmulaPiloto::run")
-                    l_log.setLevel(logging.WARNING)
-                    l_log.warning("Mensagem não reconhecida ou não tratada !")
+        # logger
+        # M_LOG.info("run:<<")
 
     # =============================================================================================
     # data
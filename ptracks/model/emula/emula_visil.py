@@ -27,14 +27,11 @@ import time
 
 # model
 from .. import glb_data as gdata
-from .. import glb_defs as gdefs
 
 from ..emula import emula_model as model
+from ..emula import trk_ingest as ingest
 from ..visil import aircraft_visil as canv
 
-# control
-from ...control.events import events_flight as events
-
 # < module data >----------------------------------------------------------------------------------
 
 # logger
@@ -82,6 +79,20 @@ class CEmulaVisil (model.CEmulaModel):
 
     # ---------------------------------------------------------------------------------------------
 
+    def __cria_anv(self, fs_callsign, flst_data):
+        """
+        cria uma aeronave recebida pela primeira vez (chamado com a trava da lista de vôos)
+
+        @param fs_callsign: callsign
+        @param flst_data: dados da mensagem de status
+
+        @return aeronave
+        """
+        # return
+        return canv.CAircraftVisil(self, flst_data)
+
+    # ---------------------------------------------------------------------------------------------
+
     def run(self):
         """
         checks whether it's time to created another flight.
@@ -106,88 +117,11 @@ class CEmulaVisil (model.CEmulaModel):
         # inicia o recebimento de mensagens de dados
         lsck_rcv_trks.start()
 
-        # obtém a queue de dados
-        lq_rcv_trks = self.control.q_rcv_trks
-        assert lq_rcv_trks
-
-        # loop
-        while gdata.G_KEEP_RUN:
-
-            # obtém um item da queue de entrada
-            llst_data = lq_rcv_trks.get()
-            # M_LOG.debug("llst_data:[{}]".format(llst_data))
-
-            # queue tem dados ?
-            if llst_data:
-
-                ls_callsign = llst_data[10]
-                M_LOG.debug("run:callsign:[{}]".format(llst_data[10]))
-
-                # mensagem de status de aeronave ?
-                if gdefs.D_MSG_NEW == int(llst_data[0]):
-
-                    # trava a lista de vôos
-                    gdata.G_LCK_FLIGHT.acquire()
-
-                    try:
-                        # aeronave já está no dicionário ?
-                        if ls_callsign in self.dct_flight:
-
-                            # atualiza os dados da aeronave
-                            self.dct_flight[ls_callsign].update_data(llst_data[1:])
-
-                        # senão, aeronave nova...
-                        else:
-                            # create new aircraft
-                            self.dct_flight[ls_callsign] = canv.CAircraftVisil(self, llst_data[1:])
-                            assert self.dct_flight[ls_callsign]
-
-                    finally:
-
-                        # libera a lista de vôos
-                        gdata.G_LCK_FLIGHT.release()
-
-                    # cria um evento de atualização de aeronave
-                    l_evt = events.CFlightUpdate(ls_callsign)
-                    assert l_evt
-
-                    # dissemina o evento
-                    self.event.post(l_evt)
-
-                # mensagem de eliminação de aeronave ?
-                elif gdefs.D_MSG_KLL == int(llst_data[0]):
-
-                    # coloca a mensagem na queue
-                    M_LOG.debug("Elimina:[{}]".format(ls_callsign))
-
-                    # trava a lista de vôos
-                    gdata.G_LCK_FLIGHT.acquire()
-
-                    try:
-                        # aeronave está no dicionário ?
-                        if ls_callsign in self.dct_flight:
-
-                            # retira a aeronave do dicionário
-                            del self.dct_flight[ls_callsign]
-
-                    finally:
-
-                        # libera a lista de vôos
-                        gdata.G_LCK_FLIGHT.release()
-
-                    # cria um evento de eliminação de aeronave
-                    l_evt = events.CFlightKill(ls_callsign)
-                    assert l_evt
-
-                    # dissemina o evento
-                    self.event.post(l_evt)
+        # recebe as pistas em lotes, com um evento de atualização por quadro de tela
+        l_ingest = ingest.CTrkIngest(self, self.__cria_anv)
+        assert l_ingest
 
-                # senão, mensagem não reconhecida ou não tratada
-                else:
-                    # logger
-                    l_log = logging.getLogger("CEmulaVisil::run")
-                    l_log.setLevel(logging.WARNING)
-                    l_log.warning("<E01: Mensagem não reconhecida ou não tratada.")
+        l_ingest.run()
 
         # logger
         # M_LOG.info("run:<<")
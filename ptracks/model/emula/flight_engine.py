@@ -88,6 +88,10 @@ class CFlightEngine(threading.Thread):
         self.__sim_time = f_control.sim_time
         assert self.__sim_time
 
+        # obtém o registro de métricas
+        self.__sim_stat = f_control.sim_stat
+        assert self.__sim_stat
+
         # obtém o model manager
         self.__model = f_control.model
         assert self.__model
@@ -114,6 +118,20 @@ class CFlightEngine(threading.Thread):
         self.__cine_voo = cinvoo.CCineVoo(self, f_control)
         assert self.__cine_voo
 
+        # revisão do plano (incrementada a cada comando de pilotagem, invalida as previsões de trajetória)
+        self.__i_rev = 0
+
+        # migração para outro rank solicitada ?
+        self.__v_migra = False
+
+        # sinaliza que a aeronave parou para migrar
+        self.__evt_migra = threading.Event()
+        assert self.__evt_migra
+
+        # trava do estado da aeronave (um passo x cópias do estado pela previsão e pelo snapshot)
+        self.__lck_step = threading.Lock()
+        assert self.__lck_step
+
         # logger
         # M_LOG.info("__init__:<<")
 
@@ -967,52 +985,26 @@ class CFlightEngine(threading.Thread):
             # aguarda 1 seg
             time.sleep(1.)
 
-        # timestamp of the last turn
-        self.__atv.l_atv_time_ant = self.__sim_time.obtem_hora_sim()
-        # M_LOG.debug("l_atv_time_ant:[{}]".format(self.__atv.l_atv_time_ant))
+        # inicia o relógio da aeronave
+        self.start_clock()
 
         # inicia o timer
         lf_call_time = time.time()
                 
         # loop de vida da aeronave
-        while gdata.G_KEEP_RUN and self.__atv.v_atv_ok and (ldefs.E_ATIVA == self.__atv.en_trf_est_atv):
-
-            # incrementa o contador global de loops
-            # CFlightEngine.C_COUNT += 1
-
-            # aeronave em movimento ?
-            if 1:  # self.__atv.v_atv_movi:
-
-                if self.__atv.ptr_trf_prc is not None:
-                    M_LOG.debug("run:en_trf_fnc_ope.:[{}/{}/{}]".format(self.__atv.s_trf_ind, ldefs.DCT_FNC_OPE[self.__atv.en_trf_fnc_ope], self.__atv.ptr_trf_prc.i_prc_id))
-
-                else:
-                    M_LOG.debug("run:en_trf_fnc_ope.:[{}/{}]".format(self.__atv.s_trf_ind, ldefs.DCT_FNC_OPE[self.__atv.en_trf_fnc_ope]))
-
-                M_LOG.debug("run:lst_atv_cmd_pil:[{}]".format(self.__atv.lst_atv_cmd_pil))
-
-                # existem comandos de pilotagem ?
-                if len(self.__atv.lst_atv_cmd_pil) > 0:
-
-                    # executa os comandos de pilotagem
-                    self.__comando_pilotagem(self.__atv)
-
-                # a aeronave está no solo ?
-                # if self.__atv.v_atv_solo:
+        while True:
 
-                    # movimenta no solo
-                    # self.__move_no_solo()
+            # obtém o início do passo
+            lf_ini = time.time()
 
-                # atualiza dados dinâmicos da aeronave
-                self.__cine_voo.update_cinematica()
+            # executa um passo da aeronave
+            if not self.step():
 
-                # M_LOG.debug("run:en_trf_fnc_ope(2):[{}]".format(ldefs.DCT_FNC_OPE[self.__atv.en_trf_fnc_ope]))
+                # aeronave não está mais ativa
+                break
 
-                # tem procedimento ?
-                if ldefs.E_NOPROC != self.__atv.en_trf_fnc_ope:
-
-                    # verifica qual o procedimento da aeronave
-                    self.__procedimentos(self.__atv)
+            # registra a duração do passo
+            self.__sim_stat.add_tick("engine", time.time() - lf_ini)
 
             # recálculo da posição (.75s)
             lf_call_time += lf_tim_wait
@@ -1028,6 +1020,9 @@ class CFlightEngine(threading.Thread):
 
             # senão, está atrasado
             else:
+                # registra o atraso
+                self.__sim_stat.add_late("CFlightEngine::run", lf_now - lf_call_time)
+
                 # logger
                 l_log = logging.getLogger("CFlightEngine::run")
                 l_log.setLevel(logging.WARNING)
@@ -1046,6 +1041,163 @@ class CFlightEngine(threading.Thread):
         # logger
         # M_LOG.info("run:<<")
 
+    # ---------------------------------------------------------------------------------------------
+
+    def start_clock(self):
+        """
+        inicia o timestamp da última atualização da aeronave
+        """
+        # logger
+        # M_LOG.info("start_clock:>>")
+
+        # verifica condições para execução
+        assert self.__atv
+        assert self.__sim_time
+
+        # timestamp of the last turn
+        self.__atv.l_atv_time_ant = self.__sim_time.obtem_hora_sim()
+        # M_LOG.debug("l_atv_time_ant:[{}]".format(self.__atv.l_atv_time_ant))
+
+        # logger
+        # M_LOG.info("start_clock:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def step(self):
+        """
+        executa um passo da aeronave: comandos de pilotagem, cinemática e procedimentos
+
+        @return True se a aeronave continua ativa, senão False
+        """
+        # logger
+        # M_LOG.info("step:>>")
+
+        # trava o estado da aeronave (só desta aeronave, os outros vôos continuam em paralelo)
+        self.__lck_step.acquire()
+
+        try:
+            # executa os comandos de pilotagem
+            if not self.step_comandos():
+
+                # logger
+                # M_LOG.info("step:<E01: aeronave não ativa.")
+
+                # cai fora...
+                return False
+
+            # atualiza dados dinâmicos da aeronave
+            self.__cine_voo.update_cinematica()
+
+            # executa os procedimentos
+            self.step_procedimentos()
+
+        finally:
+            # libera o estado da aeronave
+            self.__lck_step.release()
+
+        # logger
+        # M_LOG.info("step:<<")
+
+        # aeronave continua ativa
+        return True
+
+    # ---------------------------------------------------------------------------------------------
+
+    def step_comandos(self):
+        """
+        primeira fase do passo da aeronave: executa os comandos de pilotagem
+
+        @return True se a aeronave continua ativa, senão False
+        """
+        # logger
+        # M_LOG.info("step_comandos:>>")
+
+        # verifica condições para execução
+        assert self.__atv
+
+        # aeronave vai migrar para outro rank ?
+        if self.__v_migra:
+
+            # sinaliza que a aeronave parou (não executa mais nenhum passo neste rank)
+            self.__evt_migra.set()
+
+            # cai fora...
+            return False
+
+        # aeronave não está mais ativa ?
+        if not (gdata.G_KEEP_RUN and self.__atv.v_atv_ok and (ldefs.E_ATIVA == self.__atv.en_trf_est_atv)):
+
+            # logger
+            # M_LOG.info("step_comandos:<E01: aeronave não ativa.")
+
+            # cai fora...
+            return False
+
+        # incrementa o contador global de loops
+        # CFlightEngine.C_COUNT += 1
+
+        if self.__atv.ptr_trf_prc is not None:
+            M_LOG.debug("run:en_trf_fnc_ope.:[{}/{}/{}]".format(self.__atv.s_trf_ind, ldefs.DCT_FNC_OPE[self.__atv.en_trf_fnc_ope], self.__atv.ptr_trf_prc.i_prc_id))
+
+        else:
+            M_LOG.debug("run:en_trf_fnc_ope.:[{}/{}]".format(self.__atv.s_trf_ind, ldefs.DCT_FNC_OPE[self.__atv.en_trf_fnc_ope]))
+
+        M_LOG.debug("run:lst_atv_cmd_pil:[{}]".format(self.__atv.lst_atv_cmd_pil))
+
+        # existem comandos de pilotagem ?
+        if len(self.__atv.lst_atv_cmd_pil) > 0:
+
+            # o plano vai mudar
+            self.__i_rev += 1
+
+            # executa os comandos de pilotagem
+            self.__comando_pilotagem(self.__atv)
+
+        # a aeronave está no solo ?
+        # if self.__atv.v_atv_solo:
+
+            # movimenta no solo
+            # self.__move_no_solo()
+
+        # logger
+        # M_LOG.info("step_comandos:<<")
+
+        # aeronave continua ativa
+        return True
+
+    # ---------------------------------------------------------------------------------------------
+
+    def step_procedimentos(self):
+        """
+        última fase do passo da aeronave: verifica e executa o procedimento, após a cinemática
+        """
+        # logger
+        # M_LOG.info("step_procedimentos:>>")
+
+        # verifica condições para execução
+        assert self.__atv
+
+        # M_LOG.debug("run:en_trf_fnc_ope(2):[{}]".format(ldefs.DCT_FNC_OPE[self.__atv.en_trf_fnc_ope]))
+
+        # obtém o procedimento
+        len_fnc_ope = self.__atv.en_trf_fnc_ope
+
+        # tem procedimento ?
+        if ldefs.E_NOPROC != len_fnc_ope:
+
+            # obtém o início do procedimento
+            lf_ini = time.time()
+
+            # verifica qual o procedimento da aeronave
+            self.__procedimentos(self.__atv)
+
+            # registra o tempo do procedimento (prc_trajetoria, prc_espera, ...)
+            self.__sim_stat.add_prc("prc_" + ldefs.DCT_FNC_OPE.get(len_fnc_ope, str(len_fnc_ope)).lower(),
+                                    time.time() - lf_ini)
+
+        # logger
+        # M_LOG.info("step_procedimentos:<<")
+
     # =============================================================================================
     # data
     # =============================================================================================
@@ -1095,4 +1247,47 @@ class CFlightEngine(threading.Thread):
         """
         return self.__stk_context
 
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def evt_migra(self):
+        """
+        get evento de aeronave parada para migrar
+        """
+        return self.__evt_migra
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_rev(self):
+        """
+        get revisão do plano
+        """
+        return self.__i_rev
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def lck_step(self):
+        """
+        get trava do estado da aeronave
+        """
+        return self.__lck_step
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def v_migra(self):
+        """
+        get migração solicitada
+        """
+        return self.__v_migra
+
+    @v_migra.setter
+    def v_migra(self, f_val):
+        """
+        set migração solicitada
+        """
+        self.__v_migra = f_val
+
 # < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+flight_scheduler
+
+the flight scheduler steps a set of flight engines on a single fixed tick, instead of running one
+thread per active flight. In fast-time mode the emulator calls tick() directly, without the thread
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import logging
+import Queue
+import threading
+import time
+
+# model
+from .. import glb_data as gdata
+from ..emula.cine import cine_frota as cinfrota
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+M_LOG = logging.getLogger(__name__)
+M_LOG.setLevel(logging.DEBUG)
+
+# < class CFlightScheduler >-----------------------------------------------------------------------
+
+class CFlightScheduler(threading.Thread):
+    """
+    worker que executa, a cada tick (tim.wait), um passo de todos os flight engines que lhe foram
+    atribuídos: comandos de pilotagem, cinemática e procedimentos
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, f_control, fi_id=0):
+        """
+        @param f_control: control manager
+        @param fi_id: identificação do worker
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # check input parameters
+        assert f_control
+
+        # inicia a super classe
+        super(CFlightScheduler, self).__init__()
+
+        # salva o control manager localmente
+        self.__control = f_control
+        assert self.__control
+
+        # obtém o registro de métricas
+        self.__sim_stat = f_control.sim_stat
+        assert self.__sim_stat
+
+        # identificação do worker
+        self.__i_id = fi_id
+
+        # flight engines em execução neste worker
+        self.__lst_engines = []
+
+        # flight engines aguardando a entrada no próximo tick
+        self.__q_new_engines = Queue.Queue()
+        assert self.__q_new_engines
+
+        # tempo de parede do último tick (s)
+        self.__f_tick_wall = 0.
+
+        # intervalo entre relatórios de tempo de tick (s)
+        self.__f_tim_rprt = float(f_control.config.dct_config.get("sch.rprt", 10))
+
+        # lote de pistas por tick
+        self.__trk_batch = f_control.trk_batch
+
+        # cinemática vetorial da frota
+        self.__cine_frota = None
+
+        # cinemática vetorial (numpy) selecionada ?
+        if "numpy" == str(f_control.config.dct_config.get("sch.cine", "scalar")).lower():
+
+            # numpy disponível ?
+            if cinfrota.numpy_ok():
+
+                # cria a cinemática vetorial da frota
+                self.__cine_frota = cinfrota.CCineFrota(f_control.sim_time)
+                assert self.__cine_frota
+
+            # senão, usa a cinemática escalar
+            else:
+                # logger
+                l_log = logging.getLogger("CFlightScheduler::__init__")
+                l_log.setLevel(logging.WARNING)
+                l_log.warning(u"<E01: numpy não disponível, usando a cinemática escalar.")
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def add_engine(self, f_fe):
+        """
+        coloca um flight engine para ser executado a partir do próximo tick
+
+        @param f_fe: flight engine
+        """
+        # logger
+        # M_LOG.info("add_engine:>>")
+
+        # check input parameters
+        assert f_fe
+
+        # inicia o relógio da aeronave
+        f_fe.start_clock()
+
+        # coloca o flight engine na fila de entrada
+        self.__q_new_engines.put(f_fe)
+
+        # logger
+        # M_LOG.info("add_engine:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __get_new_engines(self):
+        """
+        transfere os flight engines recém ativados para a lista de execução
+        """
+        # logger
+        # M_LOG.info("__get_new_engines:>>")
+
+        try:
+            # esvazia a fila de entrada
+            while True:
+
+                # insere o flight engine na lista de execução
+                self.__lst_engines.append(self.__q_new_engines.get(False))
+
+        # em caso de não haver mais flight engines...
+        except Queue.Empty:
+
+            # não faz nada...
+            pass
+
+        # logger
+        # M_LOG.info("__get_new_engines:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def tick(self):
+        """
+        executa um passo de todos os flight engines do worker
+        """
+        # logger
+        # M_LOG.info("tick:>>")
+
+        # flight engines ativados desde o último tick
+        self.__get_new_engines()
+
+        # cinemática escalar ?
+        if self.__cine_frota is None:
+
+            # executa um passo de cada aeronave (cada uma com a sua trava) e mantém apenas as que
+            # continuam ativas
+            self.__lst_engines = [l_fe for l_fe in self.__lst_engines if l_fe.step()]
+
+        # senão, cinemática vetorial
+        else:
+            # o passo de cada aeronave é dividido em três fases: trava todas as aeronaves do worker
+            # durante o passo (só este worker trava mais de uma, então não há deadlock)
+            llst_trv = list(self.__lst_engines)
+
+            for l_fe in llst_trv:
+                l_fe.lck_step.acquire()
+
+            try:
+                # executa os comandos de pilotagem e mantém apenas as aeronaves ativas
+                self.__lst_engines = [l_fe for l_fe in llst_trv if l_fe.step_comandos()]
+
+                # atualiza a cinemática de toda a frota de uma só vez
+                self.__cine_frota.update_cinematica(self.__lst_engines)
+
+                # executa os procedimentos
+                for l_fe in self.__lst_engines:
+                    l_fe.step_procedimentos()
+
+            finally:
+                # libera as aeronaves
+                for l_fe in llst_trv:
+                    l_fe.lck_step.release()
+
+        # pistas em lote ?
+        if self.__trk_batch is not None:
+
+            # envia as pistas deste tick
+            self.__trk_batch.flush()
+
+        # logger
+        # M_LOG.info("tick:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def run(self):
+        """
+        executa um passo de todos os flight engines a cada tick
+        """
+        # logger
+        # M_LOG.info("run:>>")
+
+        # tempo de espera
+        lf_tim_wait = float(self.__control.config.dct_config["tim.wait"])
+
+        # enquanto não inicia...
+        while not gdata.G_KEEP_RUN:
+
+            # aguarda 1 seg
+            time.sleep(1.)
+
+        # acumuladores para o relatório de tempo de tick
+        li_ticks = 0
+        lf_wall_sum = 0.
+        lf_wall_max = 0.
+
+        # inicia o timer
+        lf_call_time = time.time()
+        lf_rprt_time = lf_call_time
+
+        # loop do scheduler
+        while gdata.G_KEEP_RUN:
+
+            # obtém o início do tick
+            lf_ini = time.time()
+
+            # executa um passo de todas as aeronaves
+            self.tick()
+
+            # calcula o tempo de parede do tick
+            self.__f_tick_wall = time.time() - lf_ini
+
+            # registra a duração do tick
+            self.__sim_stat.add_tick("sched.{}".format(self.__i_id), self.__f_tick_wall)
+
+            # acumula para o relatório
+            li_ticks += 1
+            lf_wall_sum += self.__f_tick_wall
+            lf_wall_max = max(lf_wall_max, self.__f_tick_wall)
+
+            # hora de relatar o tempo de tick ?
+            if (lf_ini - lf_rprt_time) >= self.__f_tim_rprt:
+
+                # logger
+                l_log = logging.getLogger("CFlightScheduler::run")
+                l_log.setLevel(logging.INFO)
+                l_log.info(u"<I01: worker {}: {} aeronaves, tick médio {:.4f}(s), máximo {:.4f}(s).".format(
+                           self.__i_id, len(self.__lst_engines), lf_wall_sum / li_ticks, lf_wall_max))
+
+                # reinicia os acumuladores
+                li_ticks = 0
+                lf_wall_sum = 0.
+                lf_wall_max = 0.
+
+                lf_rprt_time = lf_ini
+
+            # próximo tick
+            lf_call_time += lf_tim_wait
+
+            # obtém o tempo atual em segundos
+            lf_now = time.time()
+
+            # está adiantado ?
+            if lf_call_time >= lf_now:
+
+                # permite o scheduler
+                time.sleep(lf_call_time - lf_now)
+
+            # senão, está atrasado
+            else:
+                # registra o atraso
+                self.__sim_stat.add_late("CFlightScheduler::run", lf_now - lf_call_time)
+
+                # logger
+                l_log = logging.getLogger("CFlightScheduler::run")
+                l_log.setLevel(logging.WARNING)
+                l_log.warning(u"<E01: atraso de {}(s), tick de {}(s) com {} aeronaves.".format(
+                              lf_now - lf_call_time, self.__f_tick_wall, len(self.__lst_engines)))
+
+                # reinicia o timer
+                lf_call_time = time.time()
+
+        # logger
+        # M_LOG.info("run:<<")
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_engines(self):
+        """
+        get quantidade de flight engines no worker
+        """
+        return len(self.__lst_engines) + self.__q_new_engines.qsize()
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def f_tick_wall(self):
+        """
+        get tempo de parede do último tick (s)
+        """
+        return self.__f_tick_wall
+
+# < the end >--------------------------------------------------------------------------------------
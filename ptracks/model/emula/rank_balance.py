@@ -0,0 +1,353 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+rank_balance
+
+balanceamento dinâmico das aeronaves entre os ranks MPI: escolha do rank menos carregado para cada
+ativação, plano de migração e (de)serialização de uma aeronave ativa para migrar entre ranks
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import cPickle
+import cStringIO
+import logging
+
+# model
+from ..items import atv_new as atv
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+M_LOG = logging.getLogger(__name__)
+M_LOG.setLevel(logging.DEBUG)
+
+# tag MPI das mensagens de migração
+D_TAG_MIGRA = 77
+
+# ------------------------------------------------------------------------------------------------
+
+def plano(flst_carga, flst_trf, ff_tol, fi_max):
+    """
+    monta o plano de balanceamento de uma rodada (executado no rank 0)
+
+    a carga de cada rank é o tempo de tick (quando todos os ranks o informam) ou a quantidade de
+    aeronaves. Cada novo tráfego vai para o rank de menor carga projetada. Se, ainda assim, o rank
+    mais carregado passar do menos carregado por mais de ff_tol, até fi_max aeronaves migram
+
+    @param flst_carga: lista (por rank) de tuplas (quantidade de aeronaves, tempo de tick (s))
+    @param flst_trf: lista de (chave, id) dos tráfegos a ativar nesta rodada
+    @param ff_tol: tolerância de desbalanceamento (0.25 = 25%)
+    @param fi_max: quantidade máxima de aeronaves migradas por rodada
+
+    @return dicionário {"ativ": {chave: rank}, "migra": (origem, destino, quantidade) ou None}
+    """
+    # check input parameters
+    assert flst_carga
+
+    # todos os ranks informaram o tempo de tick ?
+    lv_tick = all(lf_tick > 0. for li_qtd, lf_tick in flst_carga)
+
+    # carga atual de cada rank
+    llst_carga = [lf_tick if lv_tick else float(li_qtd) for li_qtd, lf_tick in flst_carga]
+
+    # custo médio de uma aeronave
+    li_tot = sum(li_qtd for li_qtd, _ in flst_carga)
+    lf_custo = (sum(llst_carga) / li_tot) if (lv_tick and li_tot > 0) else 1.
+
+    # custo de uma aeronave em cada rank
+    llst_custo = [(lf_carga / li_qtd) if (lv_tick and li_qtd > 0) else lf_custo
+                  for lf_carga, (li_qtd, _) in zip(llst_carga, flst_carga)]
+
+    # quantidade projetada de aeronaves
+    llst_qtd = [li_qtd for li_qtd, _ in flst_carga]
+
+    # tráfegos a ativar
+    ldct_ativ = {}
+
+    # para cada tráfego (em ordem de id, igual em todos os ranks)...
+    for l_key, _ in sorted(flst_trf, key=lambda lt_trf: lt_trf[1]):
+
+        # rank de menor carga projetada
+        li_rank = min(xrange(len(llst_carga)), key=lambda li_ndx: (llst_carga[li_ndx], li_ndx))
+
+        # atribui o tráfego
+        ldct_ativ[l_key] = li_rank
+
+        # projeta a carga
+        llst_carga[li_rank] += llst_custo[li_rank]
+        llst_qtd[li_rank] += 1
+
+    # ranks mais e menos carregados
+    li_max = max(xrange(len(llst_carga)), key=lambda li_ndx: (llst_carga[li_ndx], -li_ndx))
+    li_min = min(xrange(len(llst_carga)), key=lambda li_ndx: (llst_carga[li_ndx], li_ndx))
+
+    # plano de migração
+    lt_migra = None
+
+    # desbalanceado além da tolerância ?
+    if (li_max != li_min) and (llst_carga[li_max] > llst_carga[li_min] * (1. + ff_tol)) and (llst_qtd[li_max] > 1):
+
+        # aeronaves necessárias para igualar a carga
+        li_qtd = int((llst_carga[li_max] - llst_carga[li_min]) / (2. * llst_custo[li_max]))
+
+        # limita à quantidade máxima por rodada (e às aeronaves já ativas no rank)
+        li_qtd = min(li_qtd, int(fi_max), flst_carga[li_max][0] - 1)
+
+        if li_qtd > 0:
+
+            # migra do mais para o menos carregado
+            lt_migra = (li_max, li_min, li_qtd)
+
+    # return
+    return {"ativ": ldct_ativ, "migra": lt_migra}
+
+# < class CMigraAtv >------------------------------------------------------------------------------
+
+class CMigraAtv(object):
+    """
+    serializa o estado de uma aeronave ativa (aeronave, dados de cinemática e pilha de contexto) para
+    migrar entre ranks. As referências aos objetos do modelo (procedimentos, breakpoints, fixos,
+    aeródromos, performances, ...) não são copiadas: são trocadas por um caminho estável, o mesmo
+    em todos os ranks (todos carregam as mesmas tabelas), e resolvidas no rank de destino
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, f_control):
+        """
+        @param f_control: control manager
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # check input parameters
+        assert f_control
+
+        # salva o control manager localmente
+        self.__control = f_control
+
+        # tabela de referências: id(objeto) -> caminho e caminho -> objeto (montada sob demanda)
+        self.__dct_ref = None
+        self.__dct_obj = None
+
+        # versão das tabelas do modelo em que a tabela de referências foi montada
+        self.__i_ver = None
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __monta_ref(self):
+        """
+        monta a tabela de referências percorrendo o modelo sempre na mesma ordem
+        """
+        # logger
+        # M_LOG.info("__monta_ref:>>")
+
+        # obtém o model manager
+        l_model = self.__control.model
+        assert l_model
+
+        self.__dct_ref = {}
+        self.__dct_obj = {}
+
+        # versão das tabelas percorridas
+        self.__i_ver = l_model.i_ver_tabs
+
+        # objetos únicos (não são percorridos)
+        for ls_nome, l_obj in (("control", self.__control), ("model", l_model),
+                               ("config", self.__control.config), ("event", self.__control.event),
+                               ("sim_time", self.__control.sim_time), ("coords", l_model.coords),
+                               ("exe", l_model.exe), ("emula", l_model.emula_model)):
+
+            # registra o objeto
+            self.__registra((ls_nome,), l_obj)
+
+        # percorre o espaço aéreo e as performances
+        self.__percorre(("airspace",), l_model.airspace)
+        self.__percorre(("prf",), l_model.dct_prf)
+
+        # logger
+        # M_LOG.info("__monta_ref:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __percorre(self, ft_path, f_obj):
+        """
+        registra os objetos do modelo alcançáveis a partir de f_obj
+
+        @param ft_path: caminho do objeto
+        @param f_obj: objeto
+        """
+        # pilha de objetos a percorrer (busca em profundidade, sem recursão)
+        llst_pilha = [(ft_path, f_obj)]
+
+        while llst_pilha:
+
+            lt_path, l_obj = llst_pilha.pop()
+
+            # dicionário ?
+            if isinstance(l_obj, dict):
+
+                # chaves em ordem estável
+                llst_item = [(lt_path + (l_key,), l_obj[l_key]) for l_key in sorted(l_obj.keys())]
+
+            # lista ou tupla ?
+            elif isinstance(l_obj, (list, tuple)):
+
+                llst_item = [(lt_path + (li_ndx,), l_val) for li_ndx, l_val in enumerate(l_obj)]
+
+            # instância ?
+            elif hasattr(l_obj, "__dict__") and not isinstance(l_obj, type):
+
+                # já registrado ?
+                if id(l_obj) in self.__dct_ref:
+
+                    # próximo objeto
+                    continue
+
+                # registra a instância
+                self.__registra(lt_path, l_obj)
+
+                # atributos em ordem estável (um dict derivado também tem seus itens)
+                llst_item = [(lt_path + (ls_attr,), l_val) for ls_attr, l_val in sorted(vars(l_obj).items())]
+
+                if isinstance(l_obj, dict):
+                    llst_item += [(lt_path + ("[]", l_key), l_obj[l_key]) for l_key in sorted(l_obj.keys())]
+
+            # senão, valor simples
+            else:
+                # próximo objeto
+                continue
+
+            # empilha em ordem inversa para percorrer na ordem natural
+            llst_pilha.extend(reversed(llst_item))
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __registra(self, ft_path, f_obj):
+        """
+        registra um objeto na tabela de referências
+        """
+        # registra só a primeira ocorrência
+        if (f_obj is not None) and (id(f_obj) not in self.__dct_ref):
+
+            self.__dct_ref[id(f_obj)] = ft_path
+            self.__dct_obj[ft_path] = f_obj
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __verifica_ref(self):
+        """
+        (re)monta a tabela de referências se ainda não foi montada ou se as tabelas do modelo foram
+        recarregadas desde a montagem (os ids antigos podem ter sido reaproveitados)
+        """
+        # tabela inexistente ou de outra versão das tabelas ?
+        if (self.__dct_ref is None) or (self.__i_ver != self.__control.model.i_ver_tabs):
+
+            # monta a tabela
+            self.__monta_ref()
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __persistent_id(self, f_obj):
+        """
+        objeto do modelo ? troca pelo seu caminho
+        """
+        # return
+        return self.__dct_ref.get(id(f_obj), None)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __persistent_load(self, ft_path):
+        """
+        resolve o caminho no modelo local
+        """
+        # return
+        return self.__dct_obj[ft_path]
+
+    # ---------------------------------------------------------------------------------------------
+
+    def pack(self, f_atv):
+        """
+        serializa uma aeronave ativa (o flight engine já deve estar parado)
+
+        @param f_atv: aeronave ativa
+
+        @return buffer serializado
+        """
+        # logger
+        # M_LOG.info("pack:>>")
+
+        # check input parameters
+        assert f_atv
+        assert f_atv.atv_fe
+
+        # tabela de referências atualizada
+        self.__verifica_ref()
+
+        # estado da aeronave, sem o flight engine
+        ldct_atv = dict(vars(f_atv))
+        ldct_atv["_CAtvNEW__atv_fe"] = None
+
+        # estado completo
+        ldct_estado = {"atv": ldct_atv,
+                       "cine": dict(vars(f_atv.atv_fe.cine_data)),
+                       "stk": list(f_atv.atv_fe.stk_context)}
+
+        # serializa trocando as referências ao modelo
+        l_buf = cStringIO.StringIO()
+
+        l_pickler = cPickle.Pickler(l_buf, 2)
+        l_pickler.persistent_id = self.__persistent_id
+        l_pickler.dump(ldct_estado)
+
+        # logger
+        # M_LOG.info("pack:<<")
+
+        # return
+        return l_buf.getvalue()
+
+    # ---------------------------------------------------------------------------------------------
+
+    def unpack(self, fs_buf):
+        """
+        recria a aeronave ativa a partir do buffer serializado
+
+        @param fs_buf: buffer serializado
+
+        @return tupla (aeronave ativa, estado da cinemática, pilha de contexto)
+        """
+        # logger
+        # M_LOG.info("unpack:>>")
+
+        # tabela de referências atualizada
+        self.__verifica_ref()
+
+        # desserializa resolvendo as referências ao modelo
+        l_unpickler = cPickle.Unpickler(cStringIO.StringIO(fs_buf))
+        l_unpickler.persistent_load = self.__persistent_load
+
+        ldct_estado = l_unpickler.load()
+
+        # recria a aeronave sem passar pelo construtor (o estado já está completo)
+        l_atv = atv.CAtvNEW.__new__(atv.CAtvNEW)
+        vars(l_atv).update(ldct_estado["atv"])
+
+        # logger
+        # M_LOG.info("unpack:<<")
+
+        # return
+        return l_atv, ldct_estado["cine"], ldct_estado["stk"]
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+trf_ativ
+
+índice de ativação dos tráfegos do exercício: heap ordenado pela hora de ativação, montado uma
+única vez na carga com os tráfegos automáticos do rank. Cada verificação só retira os tráfegos
+cuja hora já chegou, em vez de percorrer todo o dicionário de tráfegos do exercício
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import heapq
+import threading
+
+# model
+from ..newton import defs_newton as ldefs
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# -------------------------------------------------------------------------------------------------
+
+def hora_ativ(f_trf):
+    """
+    hora de ativação de um tráfego em segundos
+
+    @param f_trf: tráfego do exercício
+
+    @return hora de ativação (s)
+    """
+    # obtém a hora de ativação da aeronave (h, m, s)
+    lt_hatv = f_trf.t_trf_hor_atv
+
+    # return
+    return float((((lt_hatv[0] * 60) + lt_hatv[1]) * 60) + lt_hatv[2])
+
+# < class CTrfAtiv >-------------------------------------------------------------------------------
+
+class CTrfAtiv(object):
+    """
+    heap de (hora de ativação, id do tráfego, chave no dicionário de tráfegos do exercício)
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, fdct_trf, fi_rank=0, fi_size=1, flst_ent=None):
+        """
+        @param fdct_trf: dicionário de tráfegos do exercício
+        @param fi_rank: rank deste nó
+        @param fi_size: quantidade de ranks (1 = todos os tráfegos, p.ex. no balanceamento dinâmico)
+        @param flst_ent: entradas (hora, id, chave) já montadas (carga preguiçosa, ver items.trf_lazy)
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # check input parameters
+        assert fdct_trf is not None
+
+        # tráfegos automáticos deste rank
+        if flst_ent is None:
+            self.__lst_heap = [(hora_ativ(l_trf), l_trf.i_trf_id, l_key) for l_key, l_trf in fdct_trf.iteritems()
+                               if (fi_rank == l_trf.i_trf_id % fi_size) and (ldefs.E_AUTOMATICA == l_trf.en_trf_est_ope)]
+
+        # senão, entradas do índice da carga preguiçosa (os tráfegos ainda não existem)
+        else:
+            self.__lst_heap = list(flst_ent)
+
+        # ordena pela hora de ativação
+        heapq.heapify(self.__lst_heap)
+
+        # trava do heap (ativação e balanceamento podem rodar em threads diferentes)
+        self.__lck_heap = threading.Lock()
+        assert self.__lck_heap
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __len__(self):
+        """
+        quantidade de tráfegos aguardando ativação
+        """
+        return len(self.__lst_heap)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def prontos(self, ff_hora):
+        """
+        retira do índice os tráfegos cuja hora de ativação já chegou
+
+        @param ff_hora: hora atual da simulação (s)
+
+        @return lista de chaves, em ordem de ativação
+        """
+        # tráfegos prontos
+        llst_key = []
+
+        with self.__lck_heap:
+
+            # enquanto o primeiro do heap já deu o tempo...
+            while self.__lst_heap and (self.__lst_heap[0][0] <= ff_hora):
+
+                # retira do heap
+                llst_key.append(heapq.heappop(self.__lst_heap)[2])
+
+        # return
+        return llst_key
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def f_proximo(self):
+        """
+        get hora de ativação do próximo tráfego (s) ou None se não há tráfegos pendentes
+        """
+        with self.__lck_heap:
+
+            # return
+            return self.__lst_heap[0][0] if self.__lst_heap else None
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,414 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+trj_predict
+
+previsão de trajetória: projeta cada aeronave ativa prd.hrzn segundos à frente, executando a mesma
+cinemática (dados_dinamicos) e os mesmos procedimentos do flight engine sobre uma cópia do estado
+da aeronave. As previsões ficam em cache e só são refeitas quando a aeronave recebe um comando de
+pilotagem ou quando a previsão fica mais velha que prd.tval. Sobre as previsões é feita a detecção
+de conflitos a médio prazo
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import logging
+import math
+import time
+
+# model
+from ..newton import defs_newton as ldefs
+
+from ..items import atv_new as atv
+from ..emula.cine import cine_data as cindata
+from ..emula.cine import dados_dinamicos as cine
+from ..emula.cine import prc_decolagem as dep
+from ..emula.cine import prc_dir_fixo as dfix
+from ..emula.cine import prc_espera as esp
+from ..emula.cine import prc_pouso as arr
+from ..emula.cine import prc_subida as sub
+from ..emula.cine import prc_trajetoria as trj
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+M_LOG = logging.getLogger(__name__)
+M_LOG.setLevel(logging.DEBUG)
+
+# procedimentos executados na previsão (os mesmos de CFlightEngine.__procedimentos). Aproximação
+# e aproximação perdida só verificam a aeronave em CCineVoo, a previsão mantém os dados dinâmicos
+M_DCT_PRC = {ldefs.E_APROXIMACAO: lambda f_atv, f_cin, f_stk, ff_dt: None,
+             ldefs.E_APXPERDIDA: lambda f_atv, f_cin, f_stk, ff_dt: None,
+             ldefs.E_DECOLAGEM: lambda f_atv, f_cin, f_stk, ff_dt: dep.prc_decolagem(f_atv, f_cin, f_stk),
+             ldefs.E_DIRFIXO: lambda f_atv, f_cin, f_stk, ff_dt: dfix.prc_dir_fixo(f_atv, f_cin),
+             ldefs.E_ESPERA: lambda f_atv, f_cin, f_stk, ff_dt: esp.prc_espera(f_atv, f_cin, f_stk, ff_dt),
+             ldefs.E_POUSO: lambda f_atv, f_cin, f_stk, ff_dt: arr.prc_pouso(f_atv),
+             ldefs.E_SUBIDA: lambda f_atv, f_cin, f_stk, ff_dt: sub.prc_subida(f_atv, f_cin, f_stk),
+             ldefs.E_TRAJETORIA: lambda f_atv, f_cin, f_stk, ff_dt: trj.prc_trajetoria(f_atv, f_cin, f_stk)}
+
+# < class CTrjPredict >----------------------------------------------------------------------------
+
+class CTrjPredict(object):
+    """
+    serviço de previsão de trajetória. Cada previsão é um track 4D: pontos (hora, x, y, altitude)
+    nas horas múltiplas de prd.tsmp (as mesmas para todas as aeronaves, o que permite comparar os
+    tracks ponto a ponto) e as horas estimadas de passagem pelos breakpoints (ETA)
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, f_control):
+        """
+        @param f_control: control manager
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # check input parameters
+        assert f_control
+
+        # obtém o relógio da simulação
+        self.__sim_time = f_control.sim_time
+        assert self.__sim_time
+
+        # obtém o registro de métricas
+        self.__sim_stat = f_control.sim_stat
+        assert self.__sim_stat
+
+        # obtém o dicionário de configuração
+        ldct_config = f_control.config.dct_config
+        assert ldct_config
+
+        # horizonte da previsão (s)
+        self.__f_hrzn = float(ldct_config["prd.hrzn"])
+
+        # passo de integração da previsão (s)
+        self.__f_step = max(.1, float(ldct_config["prd.step"]))
+
+        # intervalo entre os pontos do track previsto (s)
+        self.__f_tsmp = max(self.__f_step, float(ldct_config["prd.tsmp"]))
+
+        # idade máxima de uma previsão (s de simulação)
+        self.__f_tval = float(ldct_config["prd.tval"])
+
+        # separação mínima horizontal e vertical (m) da detecção de conflitos
+        self.__f_dhrz = float(ldct_config["prd.dhrz"])
+        self.__f_dvrt = float(ldct_config["prd.dvrt"])
+
+        # previsões: indicativo -> dicionário (rev, hora, trk, eta)
+        self.__dct_pred = {}
+
+        # conflitos previstos: lista de (indicativo 1, indicativo 2, hora do primeiro ponto em conflito)
+        self.__lst_cnfl = []
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def check(self, fdct_flight):
+        """
+        refaz as previsões inválidas dos vôos ativos e detecta os conflitos previstos
+
+        @param fdct_flight: dicionário de vôos ativos (indicativo -> aeronave)
+        """
+        # logger
+        # M_LOG.info("check:>>")
+
+        # check input parameters
+        assert fdct_flight is not None
+
+        # cópia do dicionário (os vôos são ativados/desativados por outras threads)
+        ldct_flight = dict(fdct_flight)
+
+        # hora atual da simulação
+        lf_hora = self.__sim_time.obtem_hora_sim()
+
+        # remove as previsões dos vôos que não estão mais ativos
+        for ls_ind in [ls_ind for ls_ind in self.__dct_pred if ls_ind not in ldct_flight]:
+            del self.__dct_pred[ls_ind]
+
+        # para todos os vôos ativos...
+        for ls_ind, l_atv in ldct_flight.iteritems():
+
+            # aeronave não ativa ou ainda com comandos de pilotagem a executar ?
+            if (not l_atv.v_atv_ok) or (ldefs.E_ATIVA != l_atv.en_trf_est_atv) or l_atv.lst_atv_cmd_pil:
+
+                # mantém a previsão atual (será refeita depois dos comandos)
+                continue
+
+            # revisão do estado da aeronave (incrementada a cada comando de pilotagem)
+            li_rev = l_atv.atv_fe.i_rev if l_atv.atv_fe is not None else 0
+
+            # previsão atual
+            ldct_pred = self.__dct_pred.get(ls_ind, None)
+
+            # previsão ainda válida ?
+            if (ldct_pred is not None) and (ldct_pred["rev"] == li_rev) and \
+               (lf_hora - ldct_pred["hora"] < self.__f_tval):
+
+                # próximo vôo
+                continue
+
+            # obtém o início da previsão
+            lf_ini = time.time()
+
+            # refaz a previsão
+            self.__dct_pred[ls_ind] = self.predict(l_atv, lf_hora, li_rev)
+
+            # registra o custo da previsão
+            self.__sim_stat.add_tick("pred", time.time() - lf_ini)
+
+        # detecta os conflitos previstos
+        self.__lst_cnfl = self.__check_cnfl(lf_hora)
+
+        # logger
+        # M_LOG.info("check:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __check_cnfl(self, ff_hora):
+        """
+        compara os tracks previstos ponto a ponto. Em cada hora de amostragem as aeronaves ficam
+        numa grade de células de prd.dhrz x prd.dhrz, e cada uma só é comparada com as das
+        células vizinhas
+
+        @param ff_hora: hora atual da simulação
+
+        @return lista de (indicativo 1, indicativo 2, hora do primeiro ponto em conflito)
+        """
+        # pontos por hora de amostragem: hora -> lista de (indicativo, x, y, altitude)
+        ldct_slot = {}
+
+        for ls_ind, ldct_pred in self.__dct_pred.items():
+            for lf_t, lf_x, lf_y, lf_alt in ldct_pred["trk"]:
+
+                # ponto ainda no futuro ?
+                if lf_t >= ff_hora:
+                    ldct_slot.setdefault(lf_t, []).append((ls_ind, lf_x, lf_y, lf_alt))
+
+        # primeiro conflito de cada par: (indicativo 1, indicativo 2) -> hora
+        ldct_cnfl = {}
+
+        # para todas as horas de amostragem, em ordem...
+        for lf_t in sorted(ldct_slot):
+
+            # grade da hora: (x, y) -> lista de pontos
+            ldct_cel = {}
+
+            for lt_pto in ldct_slot[lf_t]:
+                ldct_cel.setdefault((int(math.floor(lt_pto[1] / self.__f_dhrz)),
+                                     int(math.floor(lt_pto[2] / self.__f_dhrz))), []).append(lt_pto)
+
+            # para todas as células...
+            for (li_x, li_y), llst_pto in ldct_cel.iteritems():
+
+                # pontos das células vizinhas
+                llst_viz = []
+
+                for li_dx in (-1, 0, 1):
+                    for li_dy in (-1, 0, 1):
+                        llst_viz.extend(ldct_cel.get((li_x + li_dx, li_y + li_dy), ()))
+
+                # compara os pontos da célula com os vizinhos
+                for ls_ind1, lf_x1, lf_y1, lf_alt1 in llst_pto:
+                    for ls_ind2, lf_x2, lf_y2, lf_alt2 in llst_viz:
+
+                        # cada par é verificado uma única vez (e só o primeiro conflito interessa)
+                        if (ls_ind2 <= ls_ind1) or ((ls_ind1, ls_ind2) in ldct_cnfl):
+                            continue
+
+                        # perda de separação ?
+                        if (abs(lf_alt1 - lf_alt2) < self.__f_dvrt) and \
+                           (math.hypot(lf_x1 - lf_x2, lf_y1 - lf_y2) < self.__f_dhrz):
+
+                            # salva o conflito
+                            ldct_cnfl[(ls_ind1, ls_ind2)] = lf_t
+
+        # return
+        return sorted((ls_ind1, ls_ind2, lf_t) for (ls_ind1, ls_ind2), lf_t in ldct_cnfl.iteritems())
+
+    # ---------------------------------------------------------------------------------------------
+
+    def predict(self, f_atv, ff_hora, fi_rev=0):
+        """
+        projeta a aeronave prd.hrzn segundos à frente
+
+        @param f_atv: aeronave ativa
+        @param ff_hora: hora atual da simulação
+        @param fi_rev: revisão do estado da aeronave
+
+        @return dicionário (rev, hora, trk, eta)
+        """
+        # logger
+        # M_LOG.info("predict:>>")
+
+        # check input parameters
+        assert f_atv
+
+        # cópia do estado: aeronave (sem flight engine nem comandos), cinemática e pilha de contexto
+        l_atv = atv.CAtvNEW.__new__(atv.CAtvNEW)
+        l_cin = cindata.CCineData.__new__(cindata.CCineData)
+        llst_stk = []
+
+        # flight engine da aeronave
+        l_fe = f_atv.atv_fe
+
+        # aeronave tem flight engine ?
+        if l_fe is not None:
+
+            # trava o estado da aeronave (o flight engine não executa um passo no meio da cópia)
+            l_fe.lck_step.acquire()
+
+            try:
+                vars(l_atv).update(vars(f_atv))
+                vars(l_cin).update(vars(l_fe.cine_data))
+                llst_stk = list(l_fe.stk_context)
+
+            finally:
+                # libera o estado da aeronave
+                l_fe.lck_step.release()
+
+        # senão, ninguém altera a aeronave
+        else:
+            vars(l_atv).update(vars(f_atv))
+
+        l_atv.atv_fe = None
+        l_atv.lst_atv_cmd_pil = []
+
+        # sem flight engine, cinemática inicial
+        if l_fe is None:
+            l_cin.__init__()
+
+        # track previsto, começando na posição atual
+        llst_trk = [(ff_hora, l_atv.f_trf_x, l_atv.f_trf_y, l_atv.f_trf_alt_atu)]
+
+        # horas de passagem pelos breakpoints
+        llst_eta = []
+
+        # próxima hora de amostragem (múltipla de prd.tsmp, calculada pelo índice para que as horas
+        # sejam exatamente as mesmas em todas as previsões)
+        li_smp = int(math.floor(ff_hora / self.__f_tsmp)) + 1
+        lf_smp = li_smp * self.__f_tsmp
+
+        # hora final
+        lf_fim = ff_hora + self.__f_hrzn
+
+        # estado anterior (para interpolar os pontos de amostragem)
+        lf_t = ff_hora
+        lt_ant = llst_trk[0]
+
+        # breakpoint atual
+        l_brk = l_atv.ptr_atv_brk
+
+        # projeta até o horizonte...
+        while lf_t < lf_fim:
+
+            # aeronave não está mais ativa (pousou, abortou, ...) ?
+            if (not l_atv.v_atv_ok) or (ldefs.E_ATIVA != l_atv.en_trf_est_atv):
+                break
+
+            # atualiza os dados dinâmicos
+            cine.dados_dinamicos(l_atv, l_cin, self.__f_step, self.__sim_time)
+            lf_t += self.__f_step
+
+            # executa o procedimento
+            self.__procedimentos(l_atv, l_cin, llst_stk, self.__f_step)
+
+            # passou por um breakpoint ?
+            if l_atv.ptr_atv_brk is not l_brk:
+
+                # breakpoint anterior passado
+                if l_brk is not None:
+                    llst_eta.append((l_brk.i_brk_id, lf_t))
+
+                l_brk = l_atv.ptr_atv_brk
+
+            # passou por horas de amostragem ?
+            while (lf_smp <= lf_t) and (lf_smp <= lf_fim):
+
+                # interpola entre o estado anterior e o atual
+                lf_k = (lf_smp - lt_ant[0]) / (lf_t - lt_ant[0])
+
+                llst_trk.append((lf_smp,
+                                 lt_ant[1] + lf_k * (l_atv.f_trf_x - lt_ant[1]),
+                                 lt_ant[2] + lf_k * (l_atv.f_trf_y - lt_ant[2]),
+                                 lt_ant[3] + lf_k * (l_atv.f_trf_alt_atu - lt_ant[3])))
+
+                # próxima amostragem
+                li_smp += 1
+                lf_smp = li_smp * self.__f_tsmp
+
+            # salva o estado
+            lt_ant = (lf_t, l_atv.f_trf_x, l_atv.f_trf_y, l_atv.f_trf_alt_atu)
+
+        # logger
+        # M_LOG.info("predict:<<")
+
+        # return
+        return {"rev": fi_rev, "hora": ff_hora, "trk": llst_trk, "eta": llst_eta}
+
+    # ---------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __procedimentos(f_atv, f_cin, f_stk, ff_dt):
+        """
+        executa o procedimento da aeronave prevista (como CFlightEngine.__procedimentos)
+
+        @param f_atv: aeronave prevista
+        @param f_cin: dados de cinemática
+        @param f_stk: pilha de contexto
+        @param ff_dt: passo de integração (s)
+        """
+        # manual ?
+        if ldefs.E_MANUAL == f_atv.en_trf_fnc_ope:
+
+            # obtém o sentido de curva atual
+            li_sinal = 1 if f_atv.f_atv_raz_crv >= 0 else -1
+
+            # verifica qual deve ser a razão de curva (limite de 14000 pés)
+            f_atv.f_atv_raz_crv = (1.5 if f_atv.f_trf_z > 4267.2 else 3.) * li_sinal
+
+            # cai fora...
+            return
+
+        # obtém o procedimento
+        l_prc = M_DCT_PRC.get(f_atv.en_trf_fnc_ope, None)
+
+        # tem procedimento ?
+        if l_prc is not None:
+
+            # executa o procedimento
+            l_prc(f_atv, f_cin, f_stk, ff_dt)
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def dct_pred(self):
+        """
+        get previsões (indicativo -> dicionário (rev, hora, trk, eta))
+        """
+        return self.__dct_pred
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def lst_cnfl(self):
+        """
+        get conflitos previstos (indicativo 1, indicativo 2, hora)
+        """
+        return self.__lst_cnfl
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+trk_ingest
+
+recebimento agrupado das pistas nos consoles (visil e piloto): as mensagens da queue de pistas são
+retiradas em lotes, só a última mensagem de cada aeronave no lote é aplicada (com uma única trava
+da lista de vôos por lote) e as aeronaves alteradas são informadas num único evento
+CFlightsUpdate por quadro de tela, em vez de um evento (e uma atualização de tela) por mensagem
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import logging
+import time
+
+import Queue
+
+# model
+from .. import glb_data as gdata
+from .. import glb_defs as gdefs
+
+# control
+from ...control.events import events_flight as events
+
+# < defines >--------------------------------------------------------------------------------------
+
+# quantidade máxima de mensagens retiradas da queue por lote
+D_ING_LOTE = 512
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+M_LOG = logging.getLogger(__name__)
+M_LOG.setLevel(logging.DEBUG)
+
+# < class CTrkIngest >-----------------------------------------------------------------------------
+
+class CTrkIngest(object):
+    """
+    estágio de recebimento das pistas de um console
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, f_emula, f_cria_anv, f_pos_lote=None):
+        """
+        @param f_emula: emulador do console (dct_flight, dct_config, event e control)
+        @param f_cria_anv: função (callsign, dados) que cria uma aeronave (chamada com a trava)
+        @param f_pos_lote: função (dicionário callsign -> dados) chamada sem a trava depois de
+                           cada lote aplicado (ou None)
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # verifica parâmetros de entrada
+        assert f_emula
+        assert f_cria_anv
+
+        # emulador
+        self.__emula = f_emula
+
+        # criação das aeronaves
+        self.__f_cria_anv = f_cria_anv
+
+        # tratamento posterior ao lote
+        self.__f_pos_lote = f_pos_lote
+
+        # intervalo mínimo entre os eventos de atualização (um quadro de tela)
+        self.__f_quadro = max(.01, float(f_emula.dct_config.get("tim.rfsh", gdefs.D_TIM_REFR)))
+
+        # aeronaves alteradas desde o último evento
+        self.__set_pend = set()
+
+        # hora do último evento
+        self.__f_ult = 0.
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __aplica(self, fdct_new, fset_kll):
+        """
+        aplica um lote à lista de vôos (uma única trava) e dissemina as eliminações
+
+        @param fdct_new: última mensagem de status de cada aeronave (callsign -> dados)
+        @param fset_kll: aeronaves eliminadas
+        """
+        # lista de vôos
+        ldct_flight = self.__emula.dct_flight
+
+        # trava a lista de vôos
+        gdata.G_LCK_FLIGHT.acquire()
+
+        try:
+            # para todas as aeronaves eliminadas...
+            for ls_callsign in fset_kll:
+
+                # aeronave está no dicionário ?
+                if ls_callsign in ldct_flight:
+
+                    # retira a aeronave do dicionário
+                    del ldct_flight[ls_callsign]
+
+            # para todas as aeronaves atualizadas...
+            for ls_callsign, llst_data in fdct_new.iteritems():
+
+                # aeronave já está no dicionário ?
+                if ls_callsign in ldct_flight:
+
+                    # atualiza os dados da aeronave
+                    ldct_flight[ls_callsign].update_data(llst_data[1:])
+
+                # senão, aeronave nova...
+                else:
+                    # create new aircraft
+                    ldct_flight[ls_callsign] = self.__f_cria_anv(ls_callsign, llst_data[1:])
+                    assert ldct_flight[ls_callsign]
+
+        finally:
+
+            # libera a lista de vôos
+            gdata.G_LCK_FLIGHT.release()
+
+        # para todas as aeronaves eliminadas...
+        for ls_callsign in fset_kll:
+
+            # não informa atualizações de uma aeronave que não existe mais
+            self.__set_pend.discard(ls_callsign)
+
+            # cria um evento de eliminação de aeronave
+            l_evt = events.CFlightKill(ls_callsign)
+            assert l_evt
+
+            # dissemina o evento
+            self.__emula.event.post(l_evt)
+
+        # aeronaves alteradas
+        self.__set_pend.update(fdct_new.iterkeys())
+
+        # tratamento posterior ao lote (sem a trava) ?
+        if fdct_new and (self.__f_pos_lote is not None):
+            self.__f_pos_lote(fdct_new)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __drena(self, fq_trks):
+        """
+        retira um lote de mensagens da queue (aguarda no máximo um quadro pela primeira)
+
+        @param fq_trks: queue de pistas
+
+        @return lista de mensagens (vazia se não chegou nenhuma)
+        """
+        # mensagens do lote
+        llst_lote = []
+
+        try:
+            # aguarda a primeira mensagem
+            llst_lote.append(fq_trks.get(True, self.__f_quadro))
+
+            # retira as demais mensagens já recebidas
+            while len(llst_lote) < D_ING_LOTE:
+                llst_lote.append(fq_trks.get_nowait())
+
+        # queue vazia
+        except Queue.Empty:
+            pass
+
+        # return
+        return llst_lote
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __publica(self):
+        """
+        dissemina as aeronaves alteradas num único evento, no máximo uma vez por quadro
+        """
+        # nada alterado ?
+        if not self.__set_pend:
+            return
+
+        # hora atual
+        lf_now = time.time()
+
+        # ainda no mesmo quadro ?
+        if (lf_now - self.__f_ult) < self.__f_quadro:
+            return
+
+        # cria o evento de atualização das aeronaves
+        l_evt = events.CFlightsUpdate(frozenset(self.__set_pend))
+        assert l_evt
+
+        # recomeça o quadro
+        self.__set_pend = set()
+        self.__f_ult = lf_now
+
+        # dissemina o evento
+        self.__emula.event.post(l_evt)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def run(self):
+        """
+        recebe as pistas enquanto a aplicação está ativa
+        """
+        # logger
+        # M_LOG.info("run:>>")
+
+        # obtém a queue de dados
+        lq_rcv_trks = self.__emula.control.q_rcv_trks
+        assert lq_rcv_trks
+
+        # loop
+        while gdata.G_KEEP_RUN:
+
+            # última mensagem de status de cada aeronave e aeronaves eliminadas
+            ldct_new = {}
+            lset_kll = set()
+
+            # para todas as mensagens do lote...
+            for llst_data in self.__drena(lq_rcv_trks):
+
+                # mensagem vazia ?
+                if not llst_data:
+                    continue
+
+                # mensagem de status de aeronave ?
+                if gdefs.D_MSG_NEW == int(llst_data[0]):
+
+                    ls_callsign = llst_data[10]
+
+                    # só a última mensagem da aeronave no lote é aplicada
+                    ldct_new[ls_callsign] = llst_data
+
+                    # eliminada e recriada no mesmo lote
+                    lset_kll.discard(ls_callsign)
+
+                # mensagem de eliminação de aeronave ?
+                elif gdefs.D_MSG_KLL == int(llst_data[0]):
+
+                    ls_callsign = llst_data[10]
+                    M_LOG.debug("Elimina:[{}]".format(ls_callsign))
+
+                    # descarta as atualizações anteriores da aeronave
+                    ldct_new.pop(ls_callsign, None)
+                    lset_kll.add(ls_callsign)
+
+                # senão, mensagem não reconhecida ou não tratada
+                else:
+                    # logger
+                    l_log = logging.getLogger("CTrkIngest::run")
+                    l_log.setLevel(logging.WARNING)
+                    l_log.warning(u"<E01: Mensagem não reconhecida ou não tratada.")
+
+            # lote com alterações ?
+            if ldct_new or lset_kll:
+
+                # aplica o lote
+                self.__aplica(ldct_new, lset_kll)
+
+            # dissemina as aeronaves alteradas (uma vez por quadro)
+            self.__publica()
+
+        # logger
+        # M_LOG.info("run:<<")
+
+# < the end >--------------------------------------------------------------------------------------
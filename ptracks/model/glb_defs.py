@@ -64,6 +64,7 @@ D_MSG_CAD = 112    # mensagens de dados SiCAD
 D_MSG_GAL = 113    # mensagens de dados galileu
 D_MSG_NEW = 114    # mensagens de dados newton
 D_MSG_PAR = 115    # mensagens de dados PAR
+D_MSG_NWB = 116    # mensagens de dados newton (binário, ver newton/trk_codec)
 
 # mensagens de controle de exibição
 
@@ -116,6 +117,8 @@ D_NET_TRKS = "235.12.2"
 D_NET_VOIP = "237.12.2"
 # porta de comunicação
 D_NET_PORT = 1970
+# tamanho máximo das queues de envio
+D_NET_QMAX = 4096
 
 # interface de entrada
 D_NET_IFIN = None
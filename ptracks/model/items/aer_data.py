@@ -23,12 +23,11 @@ __date__ = "2015/11"
 import logging
 import sys
 
-# PyQt library
-from PyQt4 import QtCore, QtXml
-
 # model
 from . import aer_new as model
 from . import parser_utils as parser
+from . import xml_cache as xcache
+from . import xml_stream as xstream
 
 # control
 from ...control.events import events_basic as events
@@ -222,83 +221,28 @@ class CAerData(dict):
 
     # ---------------------------------------------------------------------------------------------
 
-    def parse_aer_xml(self, fs_aer_pn):
+    def __parse_aer_stream(self, fs_aer_pn):
         """
-        carrega o arquivo de aeródromo
+        faz o parse do arquivo de aeródromo (streaming)
 
         @param fs_aer_pn: pathname do arquivo em disco
+
+        @return (dicionário do elemento raíz, lista de dicionários de dados)
         """
         # logger
-        # M_LOG.info("parse_aer_xml:>>")
+        # M_LOG.info("__parse_aer_stream:>>")
 
         # verifica parâmetros de entrada
         assert fs_aer_pn
 
-        # cria o QFile para o arquivo XML do aeródromo
-        l_data_file = QtCore.QFile(fs_aer_pn)
-        assert l_data_file is not None
-
-        # abre o arquivo XML do aeródromo
-        l_data_file.open(QtCore.QIODevice.ReadOnly)
-
-        # erro na abertura do arquivo ?
-        if not l_data_file.isOpen():
-
-            # logger
-            l_log = logging.getLogger("CAerData::parse_aer_xml")
-            l_log.setLevel(logging.CRITICAL)
-            l_log.critical(u"<E01: erro na abertura de {}.".format(fs_aer_pn))
-
-            # cria um evento de quit
-            l_evt = events.CQuit()
-            assert l_evt
-
-            # dissemina o evento
-            self.__event.post(l_evt)
-
-            # termina a aplicação
-            sys.exit(1)
-
-        # cria o documento XML do aeródromo
-        l_xdoc_aer = QtXml.QDomDocument("aerodromos")
-        assert l_xdoc_aer is not None
-
-        # erro na carga do documento ?
-        if not l_xdoc_aer.setContent(l_data_file):
-
-            # fecha o arquivo
-            l_data_file.close()
-
-            # logger
-            l_log = logging.getLogger("CAerData::parse_aer_xml")
-            l_log.setLevel(logging.CRITICAL)
-            l_log.critical(u"<E02: falha no parse de {}.".format(fs_aer_pn))
-
-            # cria um evento de quit
-            l_evt = events.CQuit()
-            assert l_evt
-
-            # dissemina o evento
-            self.__event.post(l_evt)
-
-            # termina a aplicação
-            sys.exit(1)
-
-        # fecha o arquivo
-        l_data_file.close()
-
-        # obtém o elemento raíz do documento
-        l_elem_root = l_xdoc_aer.documentElement()
-        assert l_elem_root is not None
+        # elemento raíz (vazio se o arquivo não tem elementos)
+        ldct_root = {}
 
-        # faz o parse dos atributos do elemento raíz
-        ldct_root = parser.parse_root_element(l_elem_root)
+        # dados de todos os elementos
+        llst_data = []
 
-        # cria uma lista com os elementos de aeródromo
-        l_node_list = l_elem_root.elementsByTagName("aerodromo")
-
-        # para todos os nós na lista...
-        for li_ndx in xrange(l_node_list.length()):
+        # para todos os elementos (lidos em streaming, à medida que são fechados)...
+        for ldct_root, l_element in xstream.iterparse(fs_aer_pn, "aerodromo", self.__event):
 
             # inicia o dicionário de dados
             ldct_data = {}
@@ -306,9 +250,6 @@ class CAerData(dict):
             # inicia a lista de pistas
             ldct_data["pistas"] = []
 
-            l_element = l_node_list.at(li_ndx).toElement()
-            assert l_element is not None
-
             # read identification if available
             if l_element.hasAttribute("nAer"):
                 ldct_data["nAer"] = str(l_element.attribute("nAer"))
@@ -346,7 +287,36 @@ class CAerData(dict):
                 l_node = l_node.nextSibling()
                 assert l_node is not None
 
-            # carrega os dados de aeródromo a partir de um dicionário
+            # salva os dados
+            llst_data.append(ldct_data)
+
+        # logger
+        # M_LOG.info("__parse_aer_stream:<<")
+
+        # return
+        return ldct_root, llst_data
+
+    # ---------------------------------------------------------------------------------------------
+
+    def parse_aer_xml(self, fs_aer_pn):
+        """
+        carrega o arquivo de aeródromo (do cache compilado, se o XML não mudou)
+
+        @param fs_aer_pn: pathname do arquivo em disco
+        """
+        # logger
+        # M_LOG.info("parse_aer_xml:>>")
+
+        # verifica parâmetros de entrada
+        assert fs_aer_pn
+
+        # obtém os dados do cache compilado (refaz o parse do XML se ele mudou)
+        ldct_root, llst_data = xcache.carrega(fs_aer_pn, self.__parse_aer_stream)
+
+        # para todos os elementos...
+        for ldct_data in llst_data:
+
+            # carrega os dados a partir do dicionário
             self.make_aer(ldct_root, ldct_data)
 
         # logger
@@ -23,12 +23,10 @@ __date__ = "2015/11"
 import logging
 import sys
 
-# PyQt library
-from PyQt4 import QtCore, QtXml
-
 # model
 from . import exe_new as model
 from . import parser_utils as parser
+from . import xml_stream as xstream
 
 # control
 from ...control.events import events_basic as events
@@ -233,79 +231,12 @@ class CExeData(dict):
         # check input parameters
         assert fs_exe_path
 
-        # cria o QFile para o arquivo XML do exercício
-        l_data_file = QtCore.QFile(fs_exe_path)
-        assert l_data_file is not None
-
-        # abre o arquivo XML do exercício
-        l_data_file.open(QtCore.QIODevice.ReadOnly)
-
-        # erro na abertura do arquivo ?
-        if not l_data_file.isOpen():
-
-            # logger
-            l_log = logging.getLogger("CExeData::parse_exe_xml")
-            l_log.setLevel(logging.CRITICAL)
-            l_log.critical(u"<E01: erro na abertura de {}".format(fs_exe_path))
-
-            # cria um evento de quit
-            l_evt = events.CQuit()
-            assert l_evt
-
-            # dissemina o evento
-            self.__event.post(l_evt)
-
-            # termina a aplicação
-            sys.exit(1)
-
-        # cria o documento XML do exercício
-        l_xdoc_exe = QtXml.QDomDocument("exercicios")
-        assert l_xdoc_exe is not None
-
-        # erro na carga do documento ?
-        if not l_xdoc_exe.setContent(l_data_file):
-
-            # fecha o arquivo
-            l_data_file.close()
-
-            # logger
-            l_log = logging.getLogger("CExeData::parse_exe_xml")
-            l_log.setLevel(logging.CRITICAL)
-            l_log.critical(u"<E02: falha no parse de {}".format(fs_exe_path))
-
-            # cria um evento de quit
-            l_evt = events.CQuit()
-            assert l_evt
-
-            # dissemina o evento
-            self.__event.post(l_evt)
-
-            # termina a aplicação
-            sys.exit(1)
-
-        # fecha o arquivo
-        l_data_file.close()
-
-        # obtém o elemento raíz do documento
-        l_elem_root = l_xdoc_exe.documentElement()
-        assert l_elem_root is not None
-
-        # faz o parse dos atributos do elemento raíz
-        ldct_root = parser.parse_root_element(l_elem_root)
-
-        # cria uma lista com os elementos de exercício
-        l_node_list = l_elem_root.elementsByTagName("exercicio")
-
-        # para todos os nós na lista...
-        for li_ndx in xrange(l_node_list.length()):
+        # para todos os elementos (lidos em streaming, à medida que são fechados)...
+        for ldct_root, l_element in xstream.iterparse(fs_exe_path, "exercicio", self.__event):
 
             # inicia o dicionário de dados
             ldct_data = {}
 
-            # obtém um nó da lista
-            l_element = l_node_list.at(li_ndx).toElement()
-            assert l_element is not None
-
             # read identification if available
             if l_element.hasAttribute("nExe"):
                 ldct_data["nExe"] = str(l_element.attribute("nExe"))
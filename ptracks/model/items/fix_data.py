@@ -23,12 +23,11 @@ __date__ = "2015/11"
 import logging
 import sys
 
-# PyQt library
-from PyQt4 import QtCore, QtXml
-
 # model
 from . import fix_new as model
 from . import parser_utils as parser
+from . import xml_cache as xcache
+from . import xml_stream as xstream
 
 # control
 from ...control.events import events_basic as events
@@ -230,90 +229,32 @@ class CFixData(dict):
 
     # ---------------------------------------------------------------------------------------------
 
-    def parse_fix_xml(self, fs_fix_pn):
+    def __parse_fix_stream(self, fs_fix_pn):
         """
-        carrega o arquivo de fixo
+        faz o parse do arquivo de fixo (streaming)
 
         @param fs_fix_pn: pathname do arquivo em disco
+
+        @return (dicionário do elemento raíz, lista de dicionários de dados)
         """
         # logger
-        # M_LOG.info("parse_fix_xml:>>")
+        # M_LOG.info("__parse_fix_stream:>>")
 
         # verifica parâmetros de entrada
         assert fs_fix_pn
 
-        # cria o QFile para o arquivo XML do fixo
-        l_data_file = QtCore.QFile(fs_fix_pn)
-        assert l_data_file is not None
-
-        # abre o arquivo XML do fixo
-        l_data_file.open(QtCore.QIODevice.ReadOnly)
-
-        # erro na abertura do arquivo ?
-        if not l_data_file.isOpen():
-
-            # logger
-            l_log = logging.getLogger("CFixData::parse_fix_xml")
-            l_log.setLevel(logging.CRITICAL)
-            l_log.critical(u"<E01: erro na abertura de {}".format(fs_fix_pn))
-
-            # cria um evento de quit
-            l_evt = events.CQuit()
-            assert l_evt
-
-            # dissemina o evento
-            self.__event.post(l_evt)
-
-            # termina a aplicação
-            sys.exit(1)
-
-        # cria o documento XML do fixo
-        l_xdoc_fix = QtXml.QDomDocument("fixos")
-        assert l_xdoc_fix is not None
-
-        # erro na carga do documento ?
-        if not l_xdoc_fix.setContent(l_data_file):
-
-            # fecha o arquivo
-            l_data_file.close()
-
-            # logger
-            l_log = logging.getLogger("CFixData::parse_fix_xml")
-            l_log.setLevel(logging.CRITICAL)
-            l_log.critical(u"<E02: falha no parse de {}".format(fs_fix_pn))
-
-            # cria um evento de quit
-            l_evt = events.CQuit()
-            assert l_evt
-
-            # dissemina o evento
-            self.__event.post(l_evt)
-
-            # termina a aplicação
-            sys.exit(1)
-
-        # fecha o arquivo
-        l_data_file.close()
-
-        # obtém o elemento raíz do documento
-        l_elem_root = l_xdoc_fix.documentElement()
-        assert l_elem_root is not None
+        # elemento raíz (vazio se o arquivo não tem elementos)
+        ldct_root = {}
 
-        # faz o parse dos atributos do elemento raíz
-        ldct_root = parser.parse_root_element(l_elem_root)
+        # dados de todos os elementos
+        llst_data = []
 
-        # cria uma lista com os elementos de fixo
-        l_node_list = l_elem_root.elementsByTagName("fixo")
-
-        # para todos os nós na lista...
-        for li_ndx in xrange(l_node_list.length()):
+        # para todos os elementos (lidos em streaming, à medida que são fechados)...
+        for ldct_root, l_element in xstream.iterparse(fs_fix_pn, "fixo", self.__event):
 
             # inicia o dicionário de dados
             ldct_data = {}
 
-            l_element = l_node_list.at(li_ndx).toElement()
-            assert l_element is not None
-
             # read identification if available
             if l_element.hasAttribute("nFix"):
                 ldct_data["nFix"] = int(str(l_element.attribute("nFix")))
@@ -342,7 +283,36 @@ class CFixData(dict):
                 l_node = l_node.nextSibling()
                 assert l_node is not None
 
-            # carrega os dados de fixo a partir de um dicionário
+            # salva os dados
+            llst_data.append(ldct_data)
+
+        # logger
+        # M_LOG.info("__parse_fix_stream:<<")
+
+        # return
+        return ldct_root, llst_data
+
+    # ---------------------------------------------------------------------------------------------
+
+    def parse_fix_xml(self, fs_fix_pn):
+        """
+        carrega o arquivo de fixo (do cache compilado, se o XML não mudou)
+
+        @param fs_fix_pn: pathname do arquivo em disco
+        """
+        # logger
+        # M_LOG.info("parse_fix_xml:>>")
+
+        # verifica parâmetros de entrada
+        assert fs_fix_pn
+
+        # obtém os dados do cache compilado (refaz o parse do XML se ele mudou)
+        ldct_root, llst_data = xcache.carrega(fs_fix_pn, self.__parse_fix_stream)
+
+        # para todos os elementos...
+        for ldct_data in llst_data:
+
+            # carrega os dados a partir do dicionário
             self.make_fix(ldct_root, ldct_data)
 
         # logger
@@ -23,7 +23,7 @@ __date__ = "2015/11"
 import logging
 
 # PyQt library
-from PyQt4 import QtCore
+# from PyQt4 import QtCore
 
 # < module data >----------------------------------------------------------------------------------
 
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+prc_geom.
+
+dados pré-calculados de um procedimento com breakpoints (trajetória, subida). Montados uma única
+vez na carga do procedimento e compartilhados por todas as aeronaves que o executam.
+
+revision 0.1  2016/out  mlabru
+initial release (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+# import logging
+import math
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# < class CPrcGeom >-------------------------------------------------------------------------------
+
+class CPrcGeom(object):
+    """
+    dados imutáveis de um procedimento: os breakpoints, as pernas entre eles e, por performance,
+    as restrições de altitude/velocidade e a antecipação de curva de cada breakpoint, montadas na
+    primeira aeronave de cada performance
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, flst_brk):
+        """
+        @param flst_brk: lista de breakpoints do procedimento
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # breakpoints
+        self.__t_brk = tuple(flst_brk)
+
+        # índice do último breakpoint
+        self.__i_brk_ult = len(self.__t_brk) - 1
+
+        # pernas: por breakpoint, (comprimento, rumo) da perna que chega nele ou None
+        self.__t_leg = self.__monta_legs()
+
+        # restrições por performance: performance -> tupla de (altitude, velocidade, antecipação)
+        self.__dct_rst = {}
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __monta_legs(self):
+        """
+        calcula comprimento e rumo de cada perna. Só existe perna entre dois breakpoints
+        cartesianos (i_brk_t = 0), os demais só têm coordenadas durante o vôo
+
+        @return tupla (por breakpoint) de (comprimento, rumo) da perna que chega no breakpoint
+        """
+        llst_leg = [None]
+
+        for l_ant, l_brk in zip(self.__t_brk, self.__t_brk[1:]):
+
+            # coordenadas dos dois extremos da perna
+            lf_ant_x = getattr(l_ant, "f_brk_x", None) if (l_ant is not None) and (0 == l_ant.i_brk_t) else None
+            lf_brk_x = getattr(l_brk, "f_brk_x", None) if (l_brk is not None) and (0 == l_brk.i_brk_t) else None
+
+            # perna indefinida ?
+            if (lf_ant_x is None) or (lf_brk_x is None):
+                llst_leg.append(None)
+                continue
+
+            # vetor da perna
+            lf_dx = lf_brk_x - lf_ant_x
+            lf_dy = l_brk.f_brk_y - l_ant.f_brk_y
+
+            # rumo com a mesma convenção de calc_proa_demanda (0 = norte, sentido horário)
+            llst_leg.append((math.sqrt((lf_dx ** 2) + (lf_dy ** 2)), math.degrees(math.atan2(lf_dx, lf_dy)) % 360.))
+
+        # return
+        return tuple(llst_leg)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __compila_rst(self, f_prf):
+        """
+        compila as restrições dos breakpoints para uma performance
+
+        @param f_prf: performance
+
+        @return tupla (por breakpoint) de (altitude limitada ao teto de serviço, velocidade limitada
+                à velocidade máxima de cruzeiro, antecipação de curva)
+        """
+        # limites da performance
+        lf_teto = f_prf.f_prf_teto_sv
+        lf_vel_max = f_prf.f_prf_vel_max_crz
+
+        llst_rst = []
+
+        for li_ndx, l_brk in enumerate(self.__t_brk):
+
+            # breakpoint inexistente ?
+            if l_brk is None:
+                llst_rst.append((0., 0., 0.))
+                continue
+
+            lf_vel = min(l_brk.f_brk_vel, lf_vel_max)
+
+            llst_rst.append((min(l_brk.f_brk_alt, lf_teto), lf_vel, self.__antecipacao(f_prf, li_ndx, lf_vel)))
+
+        # return
+        return tuple(llst_rst)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __antecipacao(self, f_prf, fi_ndx, ff_vel):
+        """
+        distância ao breakpoint em que a curva para a próxima perna deve começar, para que a
+        aeronave tangencie as duas pernas em vez de passar sobre o ponto e voltar
+
+        @param f_prf: performance
+        @param fi_ndx: índice do breakpoint
+        @param ff_vel: velocidade no breakpoint (restringida pela performance)
+
+        @return antecipação (m), zero se o breakpoint tem que ser sobrevoado
+        """
+        # último breakpoint ou breakpoint com procedimento associado, sobrevoa
+        if (fi_ndx >= self.__i_brk_ult) or (self.__t_brk[fi_ndx].ptr_brk_prc is not None):
+
+            # sem antecipação
+            return 0.
+
+        # pernas que chegam e que saem do breakpoint
+        lt_leg_ent = self.__t_leg[fi_ndx]
+        lt_leg_sai = self.__t_leg[fi_ndx + 1]
+
+        if (lt_leg_ent is None) or (lt_leg_sai is None):
+
+            # sem antecipação
+            return 0.
+
+        # ângulo de curva entre as pernas (0 a 180)
+        lf_crv = abs(((lt_leg_sai[1] - lt_leg_ent[1] + 180.) % 360.) - 180.)
+
+        # sem velocidade no breakpoint, usa a de cruzeiro
+        if ff_vel <= 0.:
+            ff_vel = f_prf.f_prf_vel_crz
+
+        if (lf_crv < 0.01) or (ff_vel <= 0.) or (f_prf.f_prf_raz_crv_rot <= 0.):
+
+            # sem antecipação
+            return 0.
+
+        # raio de curva (mesma fórmula de calc_razao_curva)
+        lf_raio = ff_vel / math.radians(f_prf.f_prf_raz_crv_rot)
+
+        # antecipação limitada à metade da menor perna, para não pular o breakpoint seguinte
+        return min(lf_raio * math.tan(math.radians(lf_crv) / 2.), min(lt_leg_ent[0], lt_leg_sai[0]) / 2.)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def rst_brk(self, f_prf, fi_ndx):
+        """
+        restrições de um breakpoint para uma performance
+
+        @param f_prf: performance
+        @param fi_ndx: índice do breakpoint
+
+        @return (altitude, velocidade, antecipação) ou None se a performance não é válida
+        """
+        # performance inválida ?
+        if (f_prf is None) or (not f_prf.v_prf_ok):
+
+            # sem restrições
+            return None
+
+        # return
+        return self.restricoes(f_prf)[fi_ndx]
+
+    # ---------------------------------------------------------------------------------------------
+
+    def restricoes(self, f_prf):
+        """
+        restrições dos breakpoints para uma performance (compiladas na primeira chamada)
+
+        @param f_prf: performance
+
+        @return tupla (por breakpoint) de (altitude, velocidade, antecipação)
+        """
+        # obtém as restrições
+        lt_rst = self.__dct_rst.get(f_prf, None)
+
+        # ainda não compiladas ?
+        if lt_rst is None:
+
+            # compila (se duas threads compilarem ao mesmo tempo, o resultado é o mesmo)
+            lt_rst = self.__dct_rst.setdefault(f_prf, self.__compila_rst(f_prf))
+
+        # return
+        return lt_rst
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def t_brk(self):
+        """
+        get breakpoints
+        """
+        return self.__t_brk
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_brk_ult(self):
+        """
+        get índice do último breakpoint
+        """
+        return self.__i_brk_ult
+
+# < the end >--------------------------------------------------------------------------------------
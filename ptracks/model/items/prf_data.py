@@ -23,12 +23,11 @@ __date__ = "2015/11"
 import logging
 import sys
 
-# PyQt library
-from PyQt4 import QtCore, QtXml
-
 # model
 from . import prf_new as model
 from . import parser_utils as parser
+from . import xml_cache as xcache
+from . import xml_stream as xstream
 
 # control
 from ...control.events import events_basic as events
@@ -239,91 +238,32 @@ class CPrfData(dict):
 
     # ---------------------------------------------------------------------------------------------
 
-    def parse_prf_xml(self, fs_prf_pn):
+    def __parse_prf_stream(self, fs_prf_pn):
         """
-        carrega o arquivo de performance
+        faz o parse do arquivo de performance (streaming)
 
         @param fs_prf_pn: pathname do arquivo em disco
+
+        @return (dicionário do elemento raíz, lista de dicionários de dados)
         """
         # logger
-        # M_LOG.info("parse_prf_xml:>>")
+        # M_LOG.info("__parse_prf_stream:>>")
 
         # verifica parâmetros de entrada
         assert fs_prf_pn
 
-        # cria o QFile para o arquivo XML do performance
-        l_data_file = QtCore.QFile(fs_prf_pn)
-        assert l_data_file is not None
-
-        # abre o arquivo XML do performance
-        l_data_file.open(QtCore.QIODevice.ReadOnly)
-
-        # erro na abertura do arquivo ?
-        if not l_data_file.isOpen():
-
-            # logger
-            l_log = logging.getLogger("CPrfData::parse_prf_xml")
-            l_log.setLevel(logging.CRITICAL)
-            l_log.critical(u"<E01: Erro na abertura de {}".format(fs_prf_pn))
-
-            # cria um evento de quit
-            l_evt = events.CQuit()
-            assert l_evt
-
-            # dissemina o evento
-            self.__event.post(l_evt)
-
-            # termina a aplicação
-            sys.exit(1)
-
-        # cria o documento XML do performance
-        l_xdoc_prf = QtXml.QDomDocument("performances")
-        assert l_xdoc_prf is not None
-
-        # erro na carga do documento ?
-        if not l_xdoc_prf.setContent(l_data_file):
-
-            # fecha o arquivo
-            l_data_file.close()
-
-            # logger
-            l_log = logging.getLogger("CPrfData::parse_prf_xml")
-            l_log.setLevel(logging.CRITICAL)
-            l_log.critical(u"<E02: Falha no parse de {}".format(fs_prf_pn))
-
-            # cria um evento de quit
-            l_evt = events.CQuit()
-            assert l_evt
-
-            # dissemina o evento
-            self.__event.post(l_evt)
-
-            # termina a aplicação
-            sys.exit(1)
-
-        # fecha o arquivo
-        l_data_file.close()
-
-        # obtém o elemento raíz do documento
-        l_elem_root = l_xdoc_prf.documentElement()
-        assert l_elem_root is not None
+        # elemento raíz (vazio se o arquivo não tem elementos)
+        ldct_root = {}
 
-        # faz o parse dos atributos do elemento raíz
-        ldct_root = parser.parse_root_element(l_elem_root)
+        # dados de todos os elementos
+        llst_data = []
 
-        # cria uma lista com os elementos de performance
-        l_node_list = l_elem_root.elementsByTagName("performance")
-
-        # para todos os nós na lista...
-        for li_ndx in xrange(l_node_list.length()):
+        # para todos os elementos (lidos em streaming, à medida que são fechados)...
+        for ldct_root, l_element in xstream.iterparse(fs_prf_pn, "performance", self.__event):
 
             # inicia o dicionário de dados
             ldct_data = {}
 
-            # obtém um nó da lista
-            l_element = l_node_list.at(li_ndx).toElement()
-            assert l_element is not None
-
             # read identification if available
             if l_element.hasAttribute("nPrf"):
                 ldct_data["nPrf"] = str(l_element.attribute("nPrf"))
@@ -352,7 +292,36 @@ class CPrfData(dict):
                 l_node = l_node.nextSibling()
                 assert l_node is not None
 
-            # carrega os dados de performance a partir de um dicionário
+            # salva os dados
+            llst_data.append(ldct_data)
+
+        # logger
+        # M_LOG.info("__parse_prf_stream:<<")
+
+        # return
+        return ldct_root, llst_data
+
+    # ---------------------------------------------------------------------------------------------
+
+    def parse_prf_xml(self, fs_prf_pn):
+        """
+        carrega o arquivo de performance (do cache compilado, se o XML não mudou)
+
+        @param fs_prf_pn: pathname do arquivo em disco
+        """
+        # logger
+        # M_LOG.info("parse_prf_xml:>>")
+
+        # verifica parâmetros de entrada
+        assert fs_prf_pn
+
+        # obtém os dados do cache compilado (refaz o parse do XML se ele mudou)
+        ldct_root, llst_data = xcache.carrega(fs_prf_pn, self.__parse_prf_stream)
+
+        # para todos os elementos...
+        for ldct_data in llst_data:
+
+            # carrega os dados a partir do dicionário
             self.make_prf(ldct_root, ldct_data)
 
         # logger
@@ -23,12 +23,11 @@ __date__ = "2015/11"
 import logging
 import sys
 
-# PyQt library
-from PyQt4 import QtCore, QtXml
-
 # model
 from . import sub_new as model
 from . import parser_utils as parser
+from . import xml_cache as xcache
+from . import xml_stream as xstream
 
 # control
 from ...control.events import events_basic as event
@@ -217,80 +216,25 @@ class CSubData(dict):
 
     # ---------------------------------------------------------------------------------------------
 
-    def parse_sub_xml(self, fs_sub_pn):
+    def __parse_sub_stream(self, fs_sub_pn):
         """
-        carrega o arquivo de procedimentos de subida
+        faz o parse do arquivo de procedimentos de subida (streaming)
 
         @param fs_sub_pn: pathname do arquivo em disco
+
+        @return (dicionário do elemento raíz, lista de dicionários de dados)
         """
         # verifica parâmetros de entrada
         assert fs_sub_pn
 
-        # cria o QFile para o arquivo XML do procedimentos de subida
-        l_data_file = QtCore.QFile(fs_sub_pn)
-        assert l_data_file is not None
-
-        # abre o arquivo XML do procedimentos de subida
-        l_data_file.open(QtCore.QIODevice.ReadOnly)
-
-        # erro na abertura do arquivo ?
-        if not l_data_file.isOpen():
-
-            # logger
-            l_log = logging.getLogger("CCSubData::parse_sub_xml")
-            l_log.setLevel(logging.CRITICAL)
-            l_log.critical(u"<E01: Erro na abertura de %s" % fs_sub_pn)
-
-            # cria um evento de quit
-            l_evt = event.Quit()
-            assert l_evt
-
-            # dissemina o evento
-            self.__event.post(l_evt)
-
-            # termina a aplicação
-            sys.exit(1)
-
-        # cria o documento XML do procedimento de subida
-        l_xdoc_sub = QtXml.QDomDocument("subidas")
-        assert l_xdoc_sub is not None
-
-        # erro na carga do documento ?
-        if not l_xdoc_sub.setContent(l_data_file):
-
-            # fecha o arquivo
-            l_data_file.close()
-
-            # logger
-            l_log = logging.getLogger("CCSubData::parse_sub_xml")
-            l_log.setLevel(logging.CRITICAL)
-            l_log.critical(u"<E02: Falha no parse de %s" % fs_sub_pn)
-
-            # cria um evento de quit
-            l_evt = event.Quit()
-            assert l_evt
-
-            # dissemina o evento
-            self.__event.post(l_evt)
-
-            # termina a aplicação
-            sys.exit(1)
-
-        # fecha o arquivo
-        l_data_file.close()
-
-        # obtém o elemento raíz do documento
-        l_elem_root = l_xdoc_sub.documentElement()
-        assert l_elem_root is not None
+        # elemento raíz (vazio se o arquivo não tem elementos)
+        ldct_root = {}
 
-        # faz o parse dos atributos do elemento raíz
-        ldct_root = parser.parse_root_element(l_elem_root)
+        # dados de todos os elementos
+        llst_data = []
 
-        # cria uma lista com os elementos de procedimento de subida
-        l_node_list = l_elem_root.elementsByTagName("subida")
-
-        # para todos os nós na lista...
-        for li_ndx in xrange(l_node_list.length()):
+        # para todos os elementos (lidos em streaming, à medida que são fechados)...
+        for ldct_root, l_element in xstream.iterparse(fs_sub_pn, "subida", self.__event):
 
             # inicia o dicionário de dados
             ldct_data = {}
@@ -298,10 +242,6 @@ class CSubData(dict):
             # inicia a lista de break-points
             ldct_data["breakpoints"] = []
 
-            # obtém um nó da lista
-            l_element = l_node_list.at(li_ndx).toElement()
-            assert l_element is not None
-
             # read identification if available
             if l_element.hasAttribute("nSub"):
                 ldct_data["nSub"] = int(l_element.attribute("nSub"))
@@ -339,9 +279,38 @@ class CSubData(dict):
                 l_node = l_node.nextSibling()
                 assert l_node is not None
 
-            # carrega os dados de procedimento de subida a partir de um dicionário
+            # salva os dados
+            llst_data.append(ldct_data)
+
+        # return
+        return ldct_root, llst_data
+
+    # ---------------------------------------------------------------------------------------------
+
+    def parse_sub_xml(self, fs_sub_pn):
+        """
+        carrega o arquivo de procedimentos de subida (do cache compilado, se o XML não mudou)
+
+        @param fs_sub_pn: pathname do arquivo em disco
+        """
+        # logger
+        # M_LOG.info("parse_sub_xml:>>")
+
+        # verifica parâmetros de entrada
+        assert fs_sub_pn
+
+        # obtém os dados do cache compilado (refaz o parse do XML se ele mudou)
+        ldct_root, llst_data = xcache.carrega(fs_sub_pn, self.__parse_sub_stream)
+
+        # para todos os elementos...
+        for ldct_data in llst_data:
+
+            # carrega os dados a partir do dicionário
             self.make_sub(ldct_root, ldct_data)
 
+        # logger
+        # M_LOG.info("parse_sub_xml:<<")
+
     # ---------------------------------------------------------------------------------------------
 
     def save2disk(self, fs_sub_pn=None):
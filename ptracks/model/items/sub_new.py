@@ -26,6 +26,7 @@ import sys
 # model
 from . import prc_model as model
 from . import brk_new as brknew
+from . import prc_geom as pgeo
 
 # control
 from ...control.events import events_basic as event
@@ -77,6 +78,9 @@ class CSubNEW(model.CPrcModel):
         # lista de breakpoints da subida
         self.__lst_sub_brk = []
 
+        # dados pré-calculados dos breakpoints
+        self.__geo = pgeo.CPrcGeom(self.__lst_sub_brk)
+
         # recebeu dados ?
         if f_data is not None:
 
@@ -119,6 +123,9 @@ class CSubNEW(model.CPrcModel):
         # lista de breakpoints da subida
         self.__lst_sub_brk = list(f_sub.lst_sub_brk)
 
+        # os dados pré-calculados são imutáveis, podem ser compartilhados
+        self.__geo = f_sub.geo
+
     # ---------------------------------------------------------------------------------------------
 
     def __load_sub(self, fdct_data, fs_ver="0001"):
@@ -227,6 +234,9 @@ class CSubNEW(model.CPrcModel):
                 # coloca o breakpoint na lista
                 self.__lst_sub_brk.append(lo_brk)
 
+        # compila os dados dos breakpoints
+        self.__geo = pgeo.CPrcGeom(self.__lst_sub_brk)
+
         # (bool)
         self.v_prc_ok = True
 
@@ -266,6 +276,18 @@ class CSubNEW(model.CPrcModel):
         """
         self.__lst_sub_brk = f_val
 
+        # recompila os dados dos breakpoints
+        self.__geo = pgeo.CPrcGeom(f_val)
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def geo(self):
+        """
+        get dados pré-calculados dos breakpoints
+        """
+        return self.__geo
+
     # ---------------------------------------------------------------------------------------------
 
     @property
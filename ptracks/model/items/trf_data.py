@@ -23,12 +23,10 @@ __date__ = "2015/11"
 import logging
 import sys
 
-# PyQt library
-from PyQt4 import QtCore, QtXml
-
 # model
 from . import trf_new as model
 from . import parser_utils as parser
+from . import xml_stream as xstream
 
 # control
 from ...control.events import events_basic as events
@@ -243,118 +241,70 @@ class CTrfData(dict):
 
     # ---------------------------------------------------------------------------------------------
 
-    def parse_trf_xml(self, fs_trf_pn):
+    def parse_trf_elem(self, f_element):
         """
-        carrega o arquivo de tráfego
+        faz o parse de um elemento <trafego>
 
-        @param fs_trf_pn: pathname do arquivo em disco
+        @param f_element: elemento (interface de QDomElement, ver xml_stream.CElemXml)
+
+        @return dicionário de dados do tráfego
         """
         # logger
-        # M_LOG.info("parse_trf_xml:>>")
-
-        # verifica parâmetros de entrada
-        assert fs_trf_pn
+        # M_LOG.info("parse_trf_elem:>>")
 
-        # cria o QFile para o arquivo XML do tráfego
-        l_data_file = QtCore.QFile(fs_trf_pn)
-        assert l_data_file is not None
+        # inicia o dicionário de dados
+        ldct_data = {}
 
-        # abre o arquivo XML do tráfego
-        l_data_file.open(QtCore.QIODevice.ReadOnly)
+        # read identification if available
+        if f_element.hasAttribute("nTrf"):
+            ldct_data["nTrf"] = int(f_element.attribute("nTrf"))
 
-        # erro na abertura do arquivo ?
-        if not l_data_file.isOpen():
+        # obtém o primeiro nó da sub-árvore
+        l_node = f_element.firstChild()
+        assert l_node is not None
 
-            # logger
-            l_log = logging.getLogger("CTrfData::parse_trf_xml")
-            l_log.setLevel(logging.CRITICAL)
-            l_log.critical(u"<E01: erro na abertura de {}.".format(fs_trf_pn))
+        # percorre a sub-árvore
+        while not l_node.isNull():
 
-            # cria um evento de quit
-            l_evt = events.CQuit()
-            assert l_evt
-
-            # dissemina o evento
-            self.__event.post(l_evt)
-
-            # termina a aplicação
-            sys.exit(1)
-
-        # cria o documento XML do tráfego
-        l_xdoc_trf = QtXml.QDomDocument("trafegos")
-        assert l_xdoc_trf is not None
-
-        # erro na carga do documento ?
-        if not l_xdoc_trf.setContent(l_data_file):
-
-            # fecha o arquivo
-            l_data_file.close()
-
-            # logger
-            l_log = logging.getLogger("CTrfData::parse_trf_xml")
-            l_log.setLevel(logging.CRITICAL)
-            l_log.critical(u"<E02: falha no parse de {}.".format(fs_trf_pn))
-
-            # cria um evento de quit
-            l_evt = events.CQuit()
-            assert l_evt
-
-            # dissemina o evento
-            self.__event.post(l_evt)
-
-            # termina a aplicação
-            sys.exit(1)
-
-        # fecha o arquivo
-        l_data_file.close()
-
-        # obtém o elemento raíz do documento
-        l_elem_root = l_xdoc_trf.documentElement()
-        assert l_elem_root is not None
-
-        # faz o parse dos atributos do elemento raíz
-        ldct_root = parser.parse_root_element(l_elem_root)
-
-        # cria uma lista com os elementos de tráfego
-        l_node_list = l_elem_root.elementsByTagName("trafego")
+            # tenta converter o nó em um elemento
+            l_element = l_node.toElement()
+            assert l_element is not None
 
-        # para todos os nós na lista...
-        for li_ndx in xrange(l_node_list.length()):
+            # o nó é um elemento ?
+            if not l_element.isNull():
 
-            # inicia o dicionário de dados
-            ldct_data = {}
+                # atualiza o dicionário de dados
+                ldct_data.update(parser.parse_trafego(l_element))
 
-            # obtém um nó da lista
-            l_element = l_node_list.at(li_ndx).toElement()
-            assert l_element is not None
+            # próximo nó
+            l_node = l_node.nextSibling()
+            assert l_node is not None
 
-            # read identification if available
-            if l_element.hasAttribute("nTrf"):
-                ldct_data["nTrf"] = int(l_element.attribute("nTrf"))
+        # logger
+        # M_LOG.info("parse_trf_elem:<<")
 
-            # obtém o primeiro nó da sub-árvore
-            l_node = l_element.firstChild()
-            assert l_node is not None
+        # return
+        return ldct_data
 
-            # percorre a sub-árvore
-            while not l_node.isNull():
+    # ---------------------------------------------------------------------------------------------
 
-                # tenta converter o nó em um elemento
-                l_element = l_node.toElement()
-                assert l_element is not None
+    def parse_trf_xml(self, fs_trf_pn):
+        """
+        carrega o arquivo de tráfego
 
-                # o nó é um elemento ?
-                if not l_element.isNull():
+        @param fs_trf_pn: pathname do arquivo em disco
+        """
+        # logger
+        # M_LOG.info("parse_trf_xml:>>")
 
-                    # atualiza o dicionário de dados
-                    ldct_data.update(parser.parse_trafego(l_element))
+        # verifica parâmetros de entrada
+        assert fs_trf_pn
 
-                # próximo nó
-                l_node = l_node.nextSibling()
-                assert l_node is not None
+        # para todos os elementos (lidos em streaming, à medida que são fechados)...
+        for ldct_root, l_element in xstream.iterparse(fs_trf_pn, "trafego", self.__event):
 
             # carrega os dados de tráfego a partir de um dicionário
-            self.make_trf(ldct_root, ldct_data)
+            self.make_trf(ldct_root, self.parse_trf_elem(l_element))
 
         # logger
         # M_LOG.info("parse_trf_xml:<<")
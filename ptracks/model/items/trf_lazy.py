@@ -0,0 +1,362 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+trf_lazy
+
+fonte preguiçosa de tráfegos: uma única passada pelo arquivo .trf.xml monta o índice (hora de
+ativação, id, posição no arquivo) e os CTrfNEW só são criados pouco antes da hora de ativação. Assim
+um exercício de 24 horas roda com memória proporcional às aeronaves ativas
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import bisect
+import logging
+import sys
+import threading
+import xml.parsers.expat as expat
+
+try:
+    import xml.etree.cElementTree as etree
+
+except ImportError:
+    import xml.etree.ElementTree as etree
+
+# model
+from . import xml_stream as xstream
+
+# control
+from ...control.events import events_basic as events
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# < class CTrfLazy >-------------------------------------------------------------------------------
+
+class CTrfLazy(object):
+    """
+    índice dos tráfegos de um exercício, ordenado pela hora de ativação. Cada entrada é uma tupla
+    (hora de ativação (s), id do tráfego, início do elemento <trafego> no arquivo, início da tag
+    de fechamento)
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, f_model, fs_trf_pn, fdct_trf):
+        """
+        @param f_model: model manager
+        @param fs_trf_pn: pathname do arquivo .trf.xml
+        @param fdct_trf: dicionário de tráfegos (CTrfData) onde os tráfegos são criados
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # check input parameters
+        assert f_model
+        assert fs_trf_pn
+        assert fdct_trf is not None
+
+        # salva o event manager localmente
+        self.__event = f_model.event
+        assert self.__event
+
+        # pathname do arquivo de tráfegos
+        self.__s_trf_pn = fs_trf_pn
+
+        # dicionário de tráfegos
+        self.__dct_trf = fdct_trf
+
+        # hora de início do exercício (s)
+        lt_hora_ini = f_model.exe.t_exe_hor_ini
+        self.__f_hora_ini = float((((lt_hora_ini[0] * 60) + lt_hora_ini[1]) * 60) + lt_hora_ini[2])
+
+        # declaração XML do arquivo (encoding) e atributos do elemento raíz
+        self.__s_decl = b""
+        self.__dct_root = {}
+
+        # índice ordenado pela hora de ativação
+        self.__lst_ndx = self.__indexa()
+
+        # horas de ativação (para a busca binária)
+        self.__lst_hora = [lt_ent[0] for lt_ent in self.__lst_ndx]
+
+        # posição no arquivo de cada tráfego (para a carga por id, ver carrega_ids)
+        self.__dct_pos = dict((li_id, (li_ini, li_fch)) for _, li_id, li_ini, li_fch in self.__lst_ndx)
+
+        # próxima entrada do índice ainda não carregada
+        self.__i_prx = 0
+
+        # trava da carga (ativação e balanceamento podem rodar em threads diferentes)
+        self.__lck_load = threading.Lock()
+        assert self.__lck_load
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __len__(self):
+        """
+        quantidade de tráfegos ainda não carregados
+        """
+        return len(self.__lst_ndx) - self.__i_prx
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __abort(self, fs_msg):
+        """
+        erro fatal: loga, dissemina o quit e termina a aplicação (como o CTrfData)
+        """
+        # logger
+        l_log = logging.getLogger("CTrfLazy::indexa")
+        l_log.setLevel(logging.CRITICAL)
+        l_log.critical(fs_msg)
+
+        # cria um evento de quit
+        l_evt = events.CQuit()
+        assert l_evt
+
+        # dissemina o evento
+        self.__event.post(l_evt)
+
+        # termina a aplicação
+        sys.exit(1)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __indexa(self):
+        """
+        percorre o arquivo uma única vez com o expat (sem montar os tráfegos) e monta o índice
+
+        @return lista de (hora de ativação, id, início, início da tag de fechamento), ordenada
+        """
+        # logger
+        # M_LOG.info("__indexa:>>")
+
+        # índice
+        llst_ndx = []
+
+        # estado do parse: profundidade, tráfego corrente [id, início, tempo], elemento de texto
+        ldct_st = {"prof": 0, "trf": None, "tag": None, "txt": []}
+
+        # cria o parser
+        l_xp = expat.ParserCreate()
+
+        # -----------------------------------------------------------------------------------------
+
+        def __xml_decl(fs_versao, fs_encoding, fi_standalone):
+            """
+            declaração XML (preserva o encoding para o parse dos fragmentos)
+            """
+            self.__s_decl = "<?xml version='{}' encoding='{}'?>".format(fs_versao or "1.0", fs_encoding or "UTF-8")
+
+        # -----------------------------------------------------------------------------------------
+
+        def __start(fs_tag, fdct_attr):
+            """
+            abertura de elemento
+            """
+            # elemento raíz ?
+            if 0 == ldct_st["prof"]:
+
+                # salva os atributos (como parser_utils.parse_root_element)
+                self.__dct_root = dict((str(ls_nome).upper(), ls_val) for ls_nome, ls_val in fdct_attr.iteritems())
+                self.__dct_root["tagName"] = fs_tag
+
+            # tráfego ?
+            elif "trafego" == fs_tag:
+
+                # id, início do elemento, tempo do tráfego (min)
+                ldct_st["trf"] = [int(fdct_attr.get("nTrf", 0)), l_xp.CurrentByteIndex, 0.]
+
+            # tempo do tráfego ?
+            elif ("temptrafego" == fs_tag) and (ldct_st["trf"] is not None):
+
+                # coleta o texto
+                ldct_st["tag"] = fs_tag
+                ldct_st["txt"] = []
+
+            # desce um nível
+            ldct_st["prof"] += 1
+
+        # -----------------------------------------------------------------------------------------
+
+        def __end(fs_tag):
+            """
+            fechamento de elemento
+            """
+            # sobe um nível
+            ldct_st["prof"] -= 1
+
+            # fim do tempo do tráfego ?
+            if fs_tag == ldct_st["tag"]:
+
+                try:
+                    # tempo do tráfego (min)
+                    ldct_st["trf"][2] = float(u"".join(ldct_st["txt"]))
+
+                # tempo inválido (make_trf trata)
+                except ValueError:
+                    pass
+
+                ldct_st["tag"] = None
+
+            # fim do tráfego ?
+            elif ("trafego" == fs_tag) and (ldct_st["trf"] is not None):
+
+                li_id, li_ini, lf_tmp = ldct_st["trf"]
+
+                # hora de ativação (como CTrfNEW.make_trf: segundos inteiros a partir do início)
+                llst_ndx.append((self.__f_hora_ini + int(lf_tmp * 60.), li_id, li_ini, l_xp.CurrentByteIndex))
+
+                ldct_st["trf"] = None
+
+        # -----------------------------------------------------------------------------------------
+
+        def __text(fs_txt):
+            """
+            texto de elemento
+            """
+            # coletando texto ?
+            if ldct_st["tag"] is not None:
+                ldct_st["txt"].append(fs_txt)
+
+        # instala os handlers
+        l_xp.XmlDeclHandler = __xml_decl
+        l_xp.StartElementHandler = __start
+        l_xp.EndElementHandler = __end
+        l_xp.CharacterDataHandler = __text
+
+        try:
+            # percorre o arquivo
+            with open(self.__s_trf_pn, "rb") as l_fd:
+                l_xp.ParseFile(l_fd)
+
+        # erro na abertura do arquivo ?
+        except IOError:
+
+            # aborta
+            self.__abort(u"<E01: erro na abertura de {}.".format(self.__s_trf_pn))
+
+        # erro no parse ?
+        except expat.ExpatError as ls_err:
+
+            # aborta
+            self.__abort(u"<E02: falha no parse de {}:[{}].".format(self.__s_trf_pn, ls_err))
+
+        # ordena pela hora de ativação
+        llst_ndx.sort()
+
+        # logger
+        # M_LOG.info("__indexa:<<")
+
+        # return
+        return llst_ndx
+
+    # ---------------------------------------------------------------------------------------------
+
+    def carrega(self, ff_hora, fi_rank=0, fi_size=1):
+        """
+        cria os tráfegos cuja hora de ativação é até ff_hora
+
+        @param ff_hora: hora limite (s), normalmente a hora atual mais a antecedência de carga
+        @param fi_rank: rank deste nó
+        @param fi_size: quantidade de ranks (1 = todos os tráfegos)
+
+        @return quantidade de tráfegos criados
+        """
+        # logger
+        # M_LOG.info("carrega:>>")
+
+        with self.__lck_load:
+
+            # última entrada a carregar
+            li_fim = bisect.bisect_right(self.__lst_hora, ff_hora)
+
+            # nada a carregar ?
+            if li_fim <= self.__i_prx:
+                return 0
+
+            # entradas a carregar
+            llst_ent = self.__lst_ndx[self.__i_prx:li_fim]
+            self.__i_prx = li_fim
+
+        # logger
+        # M_LOG.info("carrega:<<")
+
+        # cria os tráfegos deste rank
+        return self.__cria([(li_ini, li_fch) for _, li_id, li_ini, li_fch in llst_ent if fi_rank == li_id % fi_size])
+
+    # ---------------------------------------------------------------------------------------------
+
+    def carrega_ids(self, flst_id):
+        """
+        cria os tráfegos de uma lista de ids, independente da hora de ativação (no balanceamento
+        dinâmico cada rank cria somente os tráfegos que o rank 0 atribuiu a ele)
+
+        @param flst_id: ids dos tráfegos
+
+        @return quantidade de tráfegos criados
+        """
+        # cria os tráfegos existentes no índice
+        return self.__cria([self.__dct_pos[li_id] for li_id in flst_id if li_id in self.__dct_pos])
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __cria(self, flst_pos):
+        """
+        lê os elementos <trafego> do arquivo e cria os tráfegos no dicionário
+
+        @param flst_pos: lista de (início do elemento, início da tag de fechamento)
+
+        @return quantidade de tráfegos criados
+        """
+        # nada a criar ?
+        if not flst_pos:
+            return 0
+
+        with open(self.__s_trf_pn, "rb") as l_fd:
+
+            # para todas as entradas...
+            for li_ini, li_fch in flst_pos:
+
+                # lê o elemento (até o fim da tag de fechamento)
+                l_fd.seek(li_ini)
+                ls_buf = l_fd.read(li_fch - li_ini + 32)
+                ls_buf = ls_buf[:ls_buf.index(b">", li_fch - li_ini) + 1]
+
+                # faz o parse do fragmento (com a declaração do arquivo, por causa do encoding)
+                l_elem = etree.fromstring(self.__s_decl + ls_buf)
+
+                # cria o tráfego no dicionário
+                self.__dct_trf.make_trf(self.__dct_root, self.__dct_trf.parse_trf_elem(xstream.CElemXml(l_elem)))
+
+        # return
+        return len(flst_pos)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def entradas(self, fi_rank=0, fi_size=1):
+        """
+        entradas do índice de ativação de um rank (ver emula.trf_ativ)
+
+        @param fi_rank: rank deste nó
+        @param fi_size: quantidade de ranks (1 = todos os tráfegos)
+
+        @return lista de (hora de ativação, id do tráfego, chave no dicionário de tráfegos)
+        """
+        # return
+        return [(lf_hora, li_id, li_id) for lf_hora, li_id, _, _ in self.__lst_ndx if fi_rank == li_id % fi_size]
+
+# < the end >--------------------------------------------------------------------------------------
@@ -26,6 +26,7 @@ import sys
 # model
 from . import prc_model as model
 from . import brk_new as brktrj
+from . import prc_geom as pgeo
 
 # control
 from ...control.events import events_basic as events
@@ -95,6 +96,9 @@ class CTrjNEW(model.CPrcModel):
         # lista de breakpoints da trajetória
         self.__lst_trj_brk = []
 
+        # dados pré-calculados dos breakpoints
+        self.__geo = pgeo.CPrcGeom(self.__lst_trj_brk)
+
         # recebeu dados ?
         if f_data is not None:
 
@@ -137,6 +141,9 @@ class CTrjNEW(model.CPrcModel):
         # lista de breakpoints
         self.__lst_trj_brk = list(f_trj.lst_trj_brk)
 
+        # os dados pré-calculados são imutáveis, podem ser compartilhados
+        self.__geo = f_trj.geo
+
         # logger
         # M_LOG.info("copy_trj:<<")
 
@@ -222,6 +229,9 @@ class CTrjNEW(model.CPrcModel):
                 # coloca o breakpoint na lista
                 self.__lst_trj_brk.append(lo_brk)
 
+        # compila os dados dos breakpoints
+        self.__geo = pgeo.CPrcGeom(self.__lst_trj_brk)
+
         # (bool)
         self.v_prc_ok = True
 
@@ -248,6 +258,18 @@ class CTrjNEW(model.CPrcModel):
         """
         self.__lst_trj_brk = f_val
 
+        # recompila os dados dos breakpoints
+        self.__geo = pgeo.CPrcGeom(f_val)
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def geo(self):
+        """
+        get dados pré-calculados dos breakpoints
+        """
+        return self.__geo
+
     # ---------------------------------------------------------------------------------------------
 
     @property
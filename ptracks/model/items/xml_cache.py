@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+xml_cache
+
+cache compilado das tabelas XML (tabFix, tabPrf, tabTrj, ...). O resultado do parse (dicionário
+do elemento raíz e lista de dicionários de dados) é gravado em formato binário (marshal) ao lado
+do XML e carregado nas execuções seguintes sem montar o DOM. O cache é refeito automaticamente
+quando o XML muda (tamanho, mtime e hash SHA-1)
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import hashlib
+import logging
+import marshal
+import os
+import sys
+
+# < defines >--------------------------------------------------------------------------------------
+
+# versão do formato do cache (inclui a versão do python, o formato marshal depende dela)
+D_CCH_VERSION = "ptracks.xml_cache.1/{}.{}".format(*sys.version_info[:2])
+
+# extensão dos arquivos de cache
+D_CCH_EXT = ".cch"
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# -------------------------------------------------------------------------------------------------
+
+def __grava(fs_cch_pn, ft_cch):
+    """
+    grava o cache (num temporário que é renomeado, para quem lê nunca ver o arquivo pela metade)
+
+    @param fs_cch_pn: pathname do cache
+    @param ft_cch: tupla (versão, tamanho, mtime, hash, dados)
+    """
+    # arquivo temporário
+    ls_tmp = "{}.{}".format(fs_cch_pn, os.getpid())
+
+    try:
+        # grava o cache
+        with open(ls_tmp, "wb") as l_fd:
+            marshal.dump(ft_cch, l_fd)
+
+        # substitui o cache anterior
+        os.rename(ls_tmp, fs_cch_pn)
+
+    # em caso de erro (diretório sem permissão de escrita, disco cheio, ...)
+    except (IOError, OSError, ValueError) as ls_err:
+
+        # logger
+        l_log = logging.getLogger("xml_cache::grava")
+        l_log.setLevel(logging.WARNING)
+        l_log.warning(u"<E01: erro na gravação do cache {}:[{}].".format(fs_cch_pn, ls_err))
+
+        # remove o temporário, se existir
+        if os.path.exists(ls_tmp):
+            os.remove(ls_tmp)
+
+# -------------------------------------------------------------------------------------------------
+
+def __hash(fs_xml_pn):
+    """
+    calcula o hash SHA-1 do arquivo XML
+
+    @param fs_xml_pn: pathname do XML
+
+    @return hash (hexa)
+    """
+    # cria o hash
+    l_sha = hashlib.sha1()
+
+    # lê o arquivo em blocos
+    with open(fs_xml_pn, "rb") as l_fd:
+        for ls_blk in iter(lambda: l_fd.read(65536), b""):
+            l_sha.update(ls_blk)
+
+    # return
+    return l_sha.hexdigest()
+
+# -------------------------------------------------------------------------------------------------
+
+def carrega(fs_xml_pn, f_parse):
+    """
+    obtém os dados de uma tabela XML, do cache compilado se ele ainda corresponde ao XML
+
+    @param fs_xml_pn: pathname do XML
+    @param f_parse: função que faz o parse do XML e retorna (dicionário raíz, lista de dados)
+
+    @return (dicionário raíz, lista de dados)
+    """
+    # logger
+    # M_LOG.info("carrega:>>")
+
+    # check input parameters
+    assert fs_xml_pn
+    assert f_parse
+
+    try:
+        # obtém o tamanho e a data de modificação do XML
+        l_stat = os.stat(fs_xml_pn)
+
+    # XML inexistente ?
+    except OSError:
+
+        # o parse trata o erro
+        return f_parse(fs_xml_pn)
+
+    # pathname do cache
+    ls_cch_pn = fs_xml_pn + D_CCH_EXT
+
+    # cache anterior
+    lt_cch = None
+
+    try:
+        # carrega o cache
+        with open(ls_cch_pn, "rb") as l_fd:
+            lt_cch = marshal.load(l_fd)
+
+        # formato diferente ?
+        if (not isinstance(lt_cch, tuple)) or (5 != len(lt_cch)) or (D_CCH_VERSION != lt_cch[0]):
+            lt_cch = None
+
+    # cache inexistente ou corrompido
+    except (IOError, OSError, EOFError, ValueError, TypeError):
+
+        # refaz
+        lt_cch = None
+
+    # cache do mesmo arquivo (tamanho e data de modificação) ?
+    if (lt_cch is not None) and (lt_cch[1] == l_stat.st_size) and (lt_cch[2] == l_stat.st_mtime):
+
+        # logger
+        # M_LOG.info("carrega:<<")
+
+        # dados do cache
+        return lt_cch[4]
+
+    # calcula o hash do XML
+    ls_hash = __hash(fs_xml_pn)
+
+    # o XML foi só tocado (mesmo conteúdo) ?
+    if (lt_cch is not None) and (lt_cch[3] == ls_hash):
+
+        # atualiza o cabeçalho do cache
+        __grava(ls_cch_pn, (D_CCH_VERSION, l_stat.st_size, l_stat.st_mtime, ls_hash, lt_cch[4]))
+
+        # dados do cache
+        return lt_cch[4]
+
+    # faz o parse do XML
+    lt_data = f_parse(fs_xml_pn)
+
+    # grava o cache
+    __grava(ls_cch_pn, (D_CCH_VERSION, l_stat.st_size, l_stat.st_mtime, ls_hash, lt_data))
+
+    # logger
+    # M_LOG.info("carrega:<<")
+
+    # return
+    return lt_data
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+xml_stream
+
+leitura em streaming dos arquivos XML (tabelas e exercícios) com cElementTree.iterparse. Os
+elementos são entregues à medida que são fechados e descartados depois de processados, o que
+mantém a memória limitada a um elemento de cada vez e dispensa o Qt (QDomDocument)
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import logging
+import sys
+
+try:
+    import xml.etree.cElementTree as etree
+
+except ImportError:
+    import xml.etree.ElementTree as etree
+
+# control
+from ...control.events import events_basic as events
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# < class CElemXml >-------------------------------------------------------------------------------
+
+class CElemXml(object):
+    """
+    adaptador de um elemento do ElementTree para a interface de QDomElement/QDomNode usada pelo
+    parser_utils (tagName, text, attribute, firstChild, nextSibling, ...). Assim o streaming
+    reaproveita o mesmo parse e as mesmas validações do DOM. Só os nós elemento são percorridos
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, f_elem, f_pai=None, fi_ndx=0):
+        """
+        @param f_elem: elemento do ElementTree (None = nó nulo)
+        @param f_pai: elemento pai (para o nextSibling)
+        @param fi_ndx: índice do elemento no pai
+        """
+        # elemento
+        self.__elem = f_elem
+
+        # elemento pai e índice no pai
+        self.__pai = f_pai
+        self.__i_ndx = fi_ndx
+
+    # ---------------------------------------------------------------------------------------------
+
+    def attribute(self, fs_nome, fs_default=u""):
+        """
+        valor de um atributo (como QDomElement.attribute)
+        """
+        return unicode(self.__elem.get(fs_nome, fs_default))
+
+    # ---------------------------------------------------------------------------------------------
+
+    def firstChild(self):
+        """
+        primeiro elemento filho (nó nulo se não existir)
+        """
+        # tem filhos ?
+        if len(self.__elem):
+            return CElemXml(self.__elem[0], self.__elem, 0)
+
+        # senão, nó nulo
+        return CElemXml(None)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def hasAttribute(self, fs_nome):
+        """
+        o atributo existe ?
+        """
+        return fs_nome in self.__elem.attrib
+
+    # ---------------------------------------------------------------------------------------------
+
+    def isNull(self):
+        """
+        nó nulo ?
+        """
+        return self.__elem is None
+
+    # ---------------------------------------------------------------------------------------------
+
+    def nextSibling(self):
+        """
+        próximo elemento irmão (nó nulo se não existir)
+        """
+        # tem próximo irmão ?
+        if (self.__pai is not None) and (self.__i_ndx + 1 < len(self.__pai)):
+            return CElemXml(self.__pai[self.__i_ndx + 1], self.__pai, self.__i_ndx + 1)
+
+        # senão, nó nulo
+        return CElemXml(None)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def tagName(self):
+        """
+        nome do elemento
+        """
+        return self.__elem.tag
+
+    # ---------------------------------------------------------------------------------------------
+
+    def text(self):
+        """
+        texto do elemento e dos descendentes (como QDomElement.text)
+        """
+        return unicode(u"".join(self.__elem.itertext()))
+
+    # ---------------------------------------------------------------------------------------------
+
+    def toElement(self):
+        """
+        o nó já é um elemento
+        """
+        return self
+
+# -------------------------------------------------------------------------------------------------
+
+def __abort(f_event, fs_msg):
+    """
+    erro fatal na carga: loga, dissemina o quit e termina a aplicação (como os loaders DOM)
+
+    @param f_event: event manager (None = não dissemina)
+    @param fs_msg: mensagem
+    """
+    # logger
+    l_log = logging.getLogger("xml_stream::iterparse")
+    l_log.setLevel(logging.CRITICAL)
+    l_log.critical(fs_msg)
+
+    # tem event manager ?
+    if f_event is not None:
+
+        # cria um evento de quit
+        l_evt = events.CQuit()
+        assert l_evt
+
+        # dissemina o evento
+        f_event.post(l_evt)
+
+    # termina a aplicação
+    sys.exit(1)
+
+# -------------------------------------------------------------------------------------------------
+
+def iterparse(fs_xml_pn, fs_tag, f_event=None):
+    """
+    percorre em streaming os elementos fs_tag de um arquivo XML
+
+    @param fs_xml_pn: pathname do arquivo
+    @param fs_tag: nome dos elementos procurados (em qualquer profundidade, como elementsByTagName)
+    @param f_event: event manager (para o quit em caso de erro)
+
+    @return gera (dicionário do elemento raíz, elemento adaptado) para cada elemento fechado
+    """
+    # logger
+    # M_LOG.info("iterparse:>>")
+
+    # check input parameters
+    assert fs_xml_pn
+    assert fs_tag
+
+    # elemento raíz e seus atributos (como parser_utils.parse_root_element)
+    l_root = None
+    ldct_root = None
+
+    # profundidade atual (raíz = 1)
+    li_prof = 0
+
+    try:
+        # abre o arquivo
+        l_fd = open(fs_xml_pn, "rb")
+
+    # erro na abertura do arquivo ?
+    except IOError:
+
+        # aborta
+        __abort(f_event, u"<E01: erro na abertura de {}.".format(fs_xml_pn))
+
+    try:
+        # para todos os eventos de abertura e fechamento de elementos...
+        for ls_evt, l_elem in etree.iterparse(l_fd, events=("start", "end")):
+
+            # abertura ?
+            if "start" == ls_evt:
+
+                # elemento raíz ?
+                if l_root is None:
+
+                    # salva o elemento raíz e seus atributos
+                    l_root = l_elem
+                    ldct_root = dict((str(ls_nome).upper(), unicode(ls_val)) for ls_nome, ls_val in l_elem.items())
+                    ldct_root["tagName"] = l_elem.tag
+
+                # desce um nível
+                li_prof += 1
+                continue
+
+            # sobe um nível
+            li_prof -= 1
+
+            # elemento procurado ?
+            if fs_tag == l_elem.tag:
+
+                # entrega o elemento
+                yield ldct_root, CElemXml(l_elem)
+
+            # filho direto da raíz fechado ?
+            if 1 == li_prof:
+
+                # descarta os elementos já processados (memória limitada a um elemento)
+                del l_root[:]
+
+    # erro no parse ?
+    except SyntaxError as ls_err:
+
+        # aborta
+        __abort(f_event, u"<E02: falha no parse de {}:[{}].".format(fs_xml_pn, ls_err))
+
+    finally:
+        # fecha o arquivo
+        l_fd.close()
+
+    # logger
+    # M_LOG.info("iterparse:<<")
+
+# < the end >--------------------------------------------------------------------------------------
@@ -32,6 +32,7 @@ from .emula import emula_newton as emula
 from .items import exe_data as exedata
 from .items import prf_data as prfdata
 from .items import trf_data as trfdata
+from .items import trf_lazy as trflazy
 
 from .newton import airspace_newton as airs
 
@@ -80,9 +81,15 @@ class CModelNewton(model.CModelManager):
         # dicionário de performances
         self.__dct_prf = {}
 
+        # versão da tabela de performances (incrementada a cada carga)
+        self.__i_ver_prf = 0
+
         # dicionário de tráfegos
         self.__dct_trf = {}
 
+        # índice da carga preguiçosa dos tráfegos (None = exercício carregado na partida)
+        self.__trf_lazy = None
+
         # exercício
         self.__exe = None
 
@@ -198,6 +205,9 @@ class CModelNewton(model.CModelManager):
         self.__dct_prf = prfdata.CPrfData(self, ls_path)
         assert self.__dct_prf is not None
 
+        # tabela recarregada
+        self.__i_ver_prf += 1
+
         # monta o nome do arquivo de exercício
         ls_path = os.path.join(self.dct_config["dir.exe"], self.dct_config["glb.exe"])
 
@@ -212,9 +222,22 @@ class CModelNewton(model.CModelManager):
         # monta o nome do arquivo de tráfegos
         ls_path = os.path.join(self.dct_config["dir.trf"], self.dct_config["glb.exe"])
 
-        # carrega a tabela de tráfegos do exercício
-        self.__dct_trf = trfdata.CTrfData(self, ls_path, self.__exe)
-        assert self.__dct_trf is not None
+        # carga preguiçosa dos tráfegos ?
+        if float(self.dct_config["sch.lazy"]) > 0.:
+
+            # cria a tabela de tráfegos vazia (preenchida à medida que a hora de ativação se aproxima)
+            self.__dct_trf = trfdata.CTrfData(self, None, self.__exe)
+            assert self.__dct_trf is not None
+
+            # monta o índice de ativação com uma única passada pelo arquivo
+            self.__trf_lazy = trflazy.CTrfLazy(self, ls_path + ".trf.xml", self.__dct_trf)
+            assert self.__trf_lazy
+
+        # senão, carrega todo o exercício
+        else:
+            # carrega a tabela de tráfegos do exercício
+            self.__dct_trf = trfdata.CTrfData(self, ls_path, self.__exe)
+            assert self.__dct_trf is not None
 
         # coloca a tabela de tráfegos no exercício
         self.__exe.dct_exe_trf = self.__dct_trf
@@ -325,6 +348,15 @@ class CModelNewton(model.CModelManager):
 
     # ---------------------------------------------------------------------------------------------
 
+    @property
+    def trf_lazy(self):
+        """
+        get índice da carga preguiçosa dos tráfegos (None = exercício carregado na partida)
+        """
+        return self.__trf_lazy
+
+    # ---------------------------------------------------------------------------------------------
+
     @property
     def dct_trj(self):
         """
@@ -332,4 +364,13 @@ class CModelNewton(model.CModelManager):
         """
         return self.__airspace.dct_trj
 
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_ver_tabs(self):
+        """
+        get versão das tabelas (soma de contadores que só crescem, muda a cada carga ou troca)
+        """
+        return self.__airspace.i_ver + self.__i_ver_prf
+
 # < the end >--------------------------------------------------------------------------------------
@@ -80,6 +80,9 @@ class CAirspaceNewton(airs.CAirspaceBasic):
         # procedimentos de trajetória
         self.__dct_trj = {}
 
+        # versão das tabelas de procedimentos (incrementada a cada carga ou troca de tabela)
+        self.__i_ver = 0
+
         # logger
         # M_LOG.info("__init__:<<")
 
@@ -259,6 +262,9 @@ class CAirspaceNewton(airs.CAirspaceBasic):
         self.__dct_trj = trjdata.CTrjData(self.model, ls_path)
         assert self.__dct_trj is not None
 
+        # tabelas recarregadas
+        self.__i_ver += 1
+
         # resolve os procedimentos dos break-points
         # self.resolv_procs()
 
@@ -295,6 +301,7 @@ class CAirspaceNewton(airs.CAirspaceBasic):
         set esperas
         """
         self.__dct_esp = f_val
+        self.__i_ver += 1
 
     # ---------------------------------------------------------------------------------------------
 
@@ -311,6 +318,7 @@ class CAirspaceNewton(airs.CAirspaceBasic):
         set subidas
         """
         self.__dct_sub = f_val
+        self.__i_ver += 1
 
     # ---------------------------------------------------------------------------------------------
 
@@ -327,5 +335,15 @@ class CAirspaceNewton(airs.CAirspaceBasic):
         set trajetórias
         """
         self.__dct_trj = f_val
+        self.__i_ver += 1
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_ver(self):
+        """
+        get versão das tabelas de procedimentos
+        """
+        return self.__i_ver
 
 # < the end >--------------------------------------------------------------------------------------
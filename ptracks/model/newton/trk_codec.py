@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+trk_codec
+
+codificação das mensagens de pista newton, texto ('#') e binária (struct). A mensagem binária
+convive com a mensagem texto: o listener reconhece as duas e entrega à queue a mesma lista de
+campos. Um datagrama binário leva uma pista ou um lote com as pistas de um tick
+
+revision 0.1  2016/out  mlabru
+initial release (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import struct
+
+# model
+from .. import glb_defs as gdefs
+
+# < defines >--------------------------------------------------------------------------------------
+
+# versões do layout binário
+D_BIN_VRS_TRK = 1     # uma pista por datagrama
+D_BIN_VRS_LOTE = 2    # lote de pistas de um tick por datagrama
+
+# cabeçalho: versão do conjunto de mensagens, código da mensagem, versão do layout
+# (o primeiro byte é sempre 0, o que nunca acontece numa mensagem texto)
+D_BIN_HDR = struct.Struct("!HHB")
+
+# cabeçalho do lote: número de seqüência, quantidade de pistas
+D_BIN_LOTE = struct.Struct("!IH")
+
+# tamanho máximo do indicativo e da performance na mensagem binária
+D_BIN_IND = 8
+D_BIN_PRF = 8
+
+# pista: id, ssr, spi (com sinal, -1 = sem SPI), altitude (ft), latitude, longitude, velocidade (kt),
+# razão de subida, proa, indicativo, performance, hora da simulação
+D_BIN_TRK = struct.Struct("!IHhfddfff{}s{}sd".format(D_BIN_IND, D_BIN_PRF))
+
+# < module data >----------------------------------------------------------------------------------
+
+# prefixo de toda mensagem binária
+M_BIN_PFX = struct.pack("!H", gdefs.D_MSG_VRS)
+
+# cabeçalhos pré-montados
+M_BIN_HDR_TRK = D_BIN_HDR.pack(gdefs.D_MSG_VRS, gdefs.D_MSG_NWB, D_BIN_VRS_TRK)
+M_BIN_HDR_LOTE = D_BIN_HDR.pack(gdefs.D_MSG_VRS, gdefs.D_MSG_NWB, D_BIN_VRS_LOTE)
+
+# tamanho dos cabeçalhos do lote
+M_BIN_LOTE_SIZE = D_BIN_HDR.size + D_BIN_LOTE.size
+
+# lotes atrasados aceitos como reordenação; um recuo maior é um sender reiniciado
+D_BIN_SEQ_JANELA = 64
+
+# ------------------------------------------------------------------------------------------------
+
+def __unpack_trk(fs_data, fi_ofs):
+    """
+    decodifica uma pista a partir de um offset
+
+    @return lista no mesmo formato da mensagem texto ([D_MSG_NEW, id, ssr, ...])
+    """
+    # decodifica a pista
+    llst_trk = list(D_BIN_TRK.unpack_from(fs_data, fi_ofs))
+
+    # remove o preenchimento do indicativo e da performance
+    llst_trk[9] = llst_trk[9].rstrip('\0')
+    llst_trk[10] = llst_trk[10].rstrip('\0')
+
+    # return
+    return [gdefs.D_MSG_NEW] + llst_trk
+
+# ------------------------------------------------------------------------------------------------
+
+def decode_trks(fs_data):
+    """
+    decodifica uma mensagem binária de pista ou de lote de pistas
+
+    @param fs_data: mensagem recebida
+
+    @return lista de pistas, cada uma no mesmo formato da mensagem texto ([D_MSG_NEW, id, ssr, ...]),
+            vazia se a mensagem não for reconhecida
+    """
+    # mensagem curta demais ?
+    if len(fs_data) < D_BIN_HDR.size:
+
+        # não reconhecida
+        return []
+
+    # decodifica o cabeçalho
+    li_vrs, li_msg, li_bin = D_BIN_HDR.unpack_from(fs_data)
+
+    # versão ou tipo não reconhecido ?
+    if (gdefs.D_MSG_VRS != li_vrs) or (gdefs.D_MSG_NWB != li_msg):
+
+        # não reconhecida
+        return []
+
+    # uma pista ?
+    if D_BIN_VRS_TRK == li_bin:
+
+        # pista completa ?
+        if len(fs_data) >= D_BIN_HDR.size + D_BIN_TRK.size:
+
+            # return
+            return [__unpack_trk(fs_data, D_BIN_HDR.size)]
+
+    # lote de pistas ?
+    elif D_BIN_VRS_LOTE == li_bin:
+
+        # cabeçalho do lote completo ?
+        if len(fs_data) >= M_BIN_LOTE_SIZE:
+
+            # obtém a quantidade de pistas (a seqüência é verificada pelo listener, ver seq_lote)
+            _, li_qtd = D_BIN_LOTE.unpack_from(fs_data, D_BIN_HDR.size)
+
+            # lote completo ?
+            if len(fs_data) >= M_BIN_LOTE_SIZE + (li_qtd * D_BIN_TRK.size):
+
+                # return
+                return [__unpack_trk(fs_data, M_BIN_LOTE_SIZE + (li_ndx * D_BIN_TRK.size)) for li_ndx in xrange(li_qtd)]
+
+    # não reconhecida
+    return []
+
+# ------------------------------------------------------------------------------------------------
+
+def encode_lote(fi_seq, flst_trk):
+    """
+    monta uma mensagem de lote de pistas
+
+    @param fi_seq: número de seqüência do lote
+    @param flst_trk: lista de pistas codificadas por pack_trk
+
+    @return mensagem binária
+    """
+    # return
+    return M_BIN_HDR_LOTE + D_BIN_LOTE.pack(fi_seq & 0xffffffff, len(flst_trk)) + "".join(flst_trk)
+
+# ------------------------------------------------------------------------------------------------
+
+def encode_trk(fi_id, fi_ssr, fi_spi, ff_alt, ff_lat, ff_lng, ff_vel, ff_raz, ff_pro, fs_ind, fs_prf, ff_hora):
+    """
+    codifica uma mensagem binária de uma pista (mesmos campos da mensagem texto)
+
+    @return mensagem binária
+    """
+    # return
+    return M_BIN_HDR_TRK + pack_trk(fi_id, fi_ssr, fi_spi, ff_alt, ff_lat, ff_lng, ff_vel, ff_raz, ff_pro,
+                                    fs_ind, fs_prf, ff_hora)
+
+# ------------------------------------------------------------------------------------------------
+
+def encode_txt(fi_id, fi_ssr, fi_spi, ff_alt, ff_lat, ff_lng, ff_vel, ff_raz, ff_pro, fs_ind, fs_prf, ff_hora):
+    """
+    codifica uma mensagem texto de uma pista
+
+    @return mensagem texto
+    """
+    # return
+    return str(gdefs.D_MSG_VRS) + \
+           gdefs.D_MSG_SEP + str(gdefs.D_MSG_NEW) + \
+           gdefs.D_MSG_SEP + str(fi_id) + \
+           gdefs.D_MSG_SEP + str(fi_ssr) + \
+           gdefs.D_MSG_SEP + str(fi_spi) + \
+           gdefs.D_MSG_SEP + str(round(ff_alt, 1)) + \
+           gdefs.D_MSG_SEP + str(round(ff_lat, 6)) + \
+           gdefs.D_MSG_SEP + str(round(ff_lng, 6)) + \
+           gdefs.D_MSG_SEP + str(round(ff_vel, 1)) + \
+           gdefs.D_MSG_SEP + str(round(ff_raz, 1)) + \
+           gdefs.D_MSG_SEP + str(round(ff_pro, 1)) + \
+           gdefs.D_MSG_SEP + str(fs_ind) + \
+           gdefs.D_MSG_SEP + str(fs_prf) + \
+           gdefs.D_MSG_SEP + str(ff_hora)
+
+# ------------------------------------------------------------------------------------------------
+
+def is_binary(fs_data):
+    """
+    verifica se a mensagem recebida está no formato binário
+
+    @param fs_data: mensagem recebida
+    """
+    # return
+    return fs_data[:2] == M_BIN_PFX
+
+# ------------------------------------------------------------------------------------------------
+
+def seq_lote(fs_data):
+    """
+    número de seqüência de uma mensagem binária de lote de pistas
+
+    @param fs_data: mensagem recebida
+
+    @return número de seqüência ou None se a mensagem não é um lote
+    """
+    # cabeçalho do lote incompleto ?
+    if len(fs_data) < M_BIN_LOTE_SIZE:
+
+        # não é um lote
+        return None
+
+    # decodifica o cabeçalho
+    li_vrs, li_msg, li_bin = D_BIN_HDR.unpack_from(fs_data)
+
+    # não é um lote de pistas ?
+    if (gdefs.D_MSG_VRS != li_vrs) or (gdefs.D_MSG_NWB != li_msg) or (D_BIN_VRS_LOTE != li_bin):
+
+        # não é um lote
+        return None
+
+    # return
+    return D_BIN_LOTE.unpack_from(fs_data, D_BIN_HDR.size)[0]
+
+# ------------------------------------------------------------------------------------------------
+
+def verifica_seq(fi_ult, fi_seq):
+    """
+    compara o número de seqüência de um lote com o do último lote aceito do mesmo sender
+    (aritmética módulo 2^32)
+
+    @param fi_ult: seqüência do último lote aceito (None = primeiro lote do sender)
+    @param fi_seq: seqüência do lote recebido
+
+    @return (aceita o lote ?, quantidade de lotes perdidos)
+    """
+    # primeiro lote do sender ?
+    if fi_ult is None:
+
+        # return
+        return True, 0
+
+    # distância até o lote esperado
+    li_dif = (fi_seq - fi_ult - 1) & 0xffffffff
+
+    # lote esperado ou posterior (os intermediários foram perdidos) ?
+    if li_dif < 0x80000000:
+
+        # return
+        return True, li_dif
+
+    # lote repetido ou atrasado (reordenado) ?
+    if (0x100000000 - li_dif) <= D_BIN_SEQ_JANELA:
+
+        # descarta (as pistas são mais antigas que as já aplicadas)
+        return False, 0
+
+    # senão, o sender reiniciou a seqüência
+    return True, 0
+
+# ------------------------------------------------------------------------------------------------
+
+def pack_trk(fi_id, fi_ssr, fi_spi, ff_alt, ff_lat, ff_lng, ff_vel, ff_raz, ff_pro, fs_ind, fs_prf, ff_hora):
+    """
+    codifica os campos de uma pista, sem cabeçalho
+
+    @return pista codificada (D_BIN_TRK.size bytes)
+
+    @raise ValueError: indicativo ou performance não cabem na mensagem binária (struct truncaria)
+    """
+    # indicativo e performance
+    ls_ind = str(fs_ind)
+    ls_prf = str(fs_prf)
+
+    # não cabem nos campos da mensagem ?
+    if (len(ls_ind) > D_BIN_IND) or (len(ls_prf) > D_BIN_PRF):
+
+        # rejeita (o chamador envia a pista no formato texto)
+        raise ValueError("indicativo/performance longo demais para a mensagem binária: [{}]/[{}]".format(ls_ind, ls_prf))
+
+    # return
+    return D_BIN_TRK.pack(int(fi_id), int(fi_ssr), int(fi_spi), ff_alt, ff_lat, ff_lng, ff_vel, ff_raz, ff_pro,
+                          ls_ind, ls_prf, ff_hora)
+
+# < the end >--------------------------------------------------------------------------------------
@@ -30,6 +30,7 @@ from .. import tMath as tmath
 
 from ..coords import pos_lat_lng as pll
 from . import aircraft as sanv
+from . import radar_trail as rtrl
 
 # < module data >----------------------------------------------------------------------------------
 
@@ -75,8 +76,14 @@ class CAircraftBasic(sanv.CAircraft):
         self.__airspace = f_emula.model.airspace
         # assert self.__airspace
         
+        # rastro radar (buffer circular de tamanho fixo)
+        self.__trail = rtrl.CRadarTrail(int(f_emula.dct_config.get("trl.tam", rtrl.D_TRL_TAM)))
+        assert self.__trail is not None
+
+        # intervalo entre as posições do rastro
+        self.__f_trail_interval = 0.
+
         # create vectors
-        self.__lst_trail = []
         self.__lst_instructions = []
 
         self.__v_uninitialized = True
@@ -261,7 +268,7 @@ class CAircraftBasic(sanv.CAircraft):
         # logger
         # M_LOG.info("radar_ground_speed:>>")
 
-        if len(self.__lst_trail) < 3:
+        if len(self.__trail) < 3:
 
             # logger
             # M_LOG.info("radar_ground_speed:<E01")
@@ -269,8 +276,8 @@ class CAircraftBasic(sanv.CAircraft):
             # return
             return 0
 
-        # calculate ground speed
-        l_gs = tmath.distLL(self.__lst_trail[-1], self.pos) / (self.__f_trail_interval / 1000.) * 3600.
+        # calculate ground speed (última posição do rastro)
+        l_gs = tmath.distLL(pll.CPosLatLng(*self.__trail.lat_lng(0)), self.pos) / (self.__f_trail_interval / 1000.) * 3600.
 
         # logger
         # M_LOG.info("radar_ground_speed:<<")
@@ -287,7 +294,7 @@ class CAircraftBasic(sanv.CAircraft):
         # logger
         # M_LOG.info("radar_magnetic_track:>>")
 
-        if len(self.__lst_trail) < 3:
+        if len(self.__trail) < 3:
 
             # logger
             # M_LOG.info("radar_magnetic_track:<E01")
@@ -295,8 +302,8 @@ class CAircraftBasic(sanv.CAircraft):
             # return
             return 0
 
-        # determine magnetic track
-        l_tr = round(tmath.track(self.__lst_trail[-1], self.pos) + self.__airspace.f_variation, 0)
+        # determine magnetic track (última posição do rastro)
+        l_tr = round(tmath.track(pll.CPosLatLng(*self.__trail.lat_lng(0)), self.pos) + self.__airspace.f_variation, 0)
 
         # need normalize ?
         if l_tr < 0:
@@ -318,8 +325,11 @@ class CAircraftBasic(sanv.CAircraft):
         # logger
         # M_LOG.info("trail:>>")
 
-        # exists trail ?
-        if not self.__lst_trail:
+        # obtém a posição do rastro
+        lt_pos = self.__trail.lat_lng(fi_ndx)
+
+        # index out of range (or no trail) ?
+        if lt_pos is None:
 
             # logger
             # M_LOG.info("trail:<E01")
@@ -327,20 +337,22 @@ class CAircraftBasic(sanv.CAircraft):
             # return
             return None
 
-        # index out of range ?
-        if fi_ndx >= len(self.__lst_trail):
+        # logger
+        # M_LOG.info("trail:<<")
 
-            # logger
-            # M_LOG.info("trail:<E02")
+        # return
+        return pll.CPosLatLng(*lt_pos)
 
-            # return
-            return None
+    # ---------------------------------------------------------------------------------------------
 
-        # logger
-        # M_LOG.info("trail:<<")
+    def trail_lat_lng(self, fi_ndx):
+        """
+        get (lat, lng) of radar history point #n, sem criar objetos de posição (desenho do rastro)
 
+        @return (lat, lng) ou None se o índice está fora do rastro
+        """
         # return
-        return self.__lst_trail[len(self.__lst_trail) - 1 - fi_ndx]
+        return self.__trail.lat_lng(fi_ndx)
 
     # ---------------------------------------------------------------------------------------------
 
@@ -369,12 +381,8 @@ class CAircraftBasic(sanv.CAircraft):
         # verifica parâmetros de entrada
         # assert f_control
 
-        # obtém a última posção conhecida
-        l_last_pos = pll.CPosLatLng(self.pos)
-        assert l_last_pos is not None
-
-        # coloca no rastro
-        self.__lst_trail.append(l_last_pos)
+        # coloca a última posição conhecida no rastro (sobrescreve a mais antiga se cheio)
+        self.__trail.append(self.pos.f_lat, self.pos.f_lng)
 
         # atualiza a posição da aeronave
         # self.pos = self.pos
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+radar_trail
+
+rastro radar de uma aeronave: buffer circular de capacidade fixa com as posições das últimas
+varreduras, guardadas em dois arrays de floats (latitude e longitude) em vez de uma lista de
+objetos de posição. A inclusão de uma posição e o acesso a qualquer posição são O(1) e a memória
+não cresce com a duração do exercício
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import array
+
+# < defines >--------------------------------------------------------------------------------------
+
+# quantidade default de posições do rastro (o radar scope desenha no máximo 100)
+D_TRL_TAM = 100
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# < class CRadarTrail >----------------------------------------------------------------------------
+
+class CRadarTrail(object):
+    """
+    buffer circular das posições do rastro (a mais antiga é sobrescrita quando o buffer enche)
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, fi_tam=D_TRL_TAM):
+        """
+        @param fi_tam: quantidade máxima de posições
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # capacidade (pelo menos uma posição)
+        self.__i_tam = max(1, int(fi_tam))
+
+        # latitudes e longitudes (alocadas uma única vez)
+        self.__ar_lat = array.array('d', [0.]) * self.__i_tam
+        self.__ar_lng = array.array('d', [0.]) * self.__i_tam
+
+        # índice da próxima inclusão
+        self.__i_ini = 0
+
+        # quantidade de posições
+        self.__i_qtd = 0
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __len__(self):
+        """
+        quantidade de posições no rastro
+        """
+        return self.__i_qtd
+
+    # ---------------------------------------------------------------------------------------------
+
+    def append(self, ff_lat, ff_lng):
+        """
+        inclui uma posição no rastro (sobrescreve a mais antiga se o buffer está cheio)
+
+        @param ff_lat: latitude
+        @param ff_lng: longitude
+        """
+        # salva a posição
+        self.__ar_lat[self.__i_ini] = ff_lat
+        self.__ar_lng[self.__i_ini] = ff_lng
+
+        # avança o índice
+        self.__i_ini = (self.__i_ini + 1) % self.__i_tam
+
+        # buffer ainda não cheio ?
+        if self.__i_qtd < self.__i_tam:
+            self.__i_qtd += 1
+
+    # ---------------------------------------------------------------------------------------------
+
+    def clear(self):
+        """
+        esvazia o rastro
+        """
+        # reinicia os índices (os arrays são reaproveitados)
+        self.__i_ini = 0
+        self.__i_qtd = 0
+
+    # ---------------------------------------------------------------------------------------------
+
+    def lat_lng(self, fi_ndx):
+        """
+        posição do rastro
+
+        @param fi_ndx: índice da posição (0 = a mais recente)
+
+        @return (lat, lng) ou None se o índice está fora do rastro
+        """
+        # índice fora do rastro ?
+        if (fi_ndx < 0) or (fi_ndx >= self.__i_qtd):
+
+            # return
+            return None
+
+        # posição no buffer
+        li_pos = (self.__i_ini - 1 - fi_ndx) % self.__i_tam
+
+        # return
+        return self.__ar_lat[li_pos], self.__ar_lng[li_pos]
+
+    # =============================================================================================
+    # dados
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_tam(self):
+        """
+        get capacidade do rastro
+        """
+        return self.__i_tam
+
+# < the end >--------------------------------------------------------------------------------------
@@ -74,7 +74,7 @@ class CAircraftVisil(sanv.CAircraftBasic):
 
         # herdado de CAircraftBasic
         # self.airspace            # airspace
-        # self.lst_trail           # trail list
+        # self.trail               # radar trail (ring buffer)
         # self.lst_instructions    # instructions list
         # self.v_uninitialized     # flag uninitialized
                                                         
@@ -86,7 +86,6 @@ class CAircraftVisil(sanv.CAircraftBasic):
         # assert self.__weather
 
         # create vectors
-        self.__lst_trail = []
         self.__lst_instructions = []
 
         self.__v_uninitialized = True
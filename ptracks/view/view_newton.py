@@ -24,12 +24,16 @@ import logging
 import threading
 import time
 
+import Queue
 import SocketServer
 
 # model
 from ..model import glb_data as gdata
 
 # view
+from .visweb import anv_feed as afeed
+from .visweb import anv_snap as asnap
+from .visweb import json_cache as jcache
 from .visweb import view_handler as vhnd
 
 # < module data >----------------------------------------------------------------------------------
@@ -137,7 +141,13 @@ class CViewNewton(threading.Thread):
 # < class CViewServer >----------------------------------------------------------------------------
 
 class CViewServer(SocketServer.TCPServer):
-    
+    """
+    servidor web concorrente: a thread do serve_forever só aceita as conexões e as coloca numa
+    fila limitada, atendida por um pool fixo de workers (HTTP/1.1 com keep-alive, ver view_handler)
+    """
+    # tamanho da fila de conexões do listen
+    request_queue_size = 64
+
     # ---------------------------------------------------------------------------------------------
 
     def __init__(self, f_model, f_control, f_server_address, f_handler_class=vhnd.CViewHandler):
@@ -186,10 +196,127 @@ class CViewServer(SocketServer.TCPServer):
         self.__dct_trj = f_model.dct_trj
         assert self.__dct_trj is not None                
 
+        # obtém o dicionário de configuração
+        ldct_config = f_control.config.dct_config
+        assert ldct_config is not None
+
+        # cache das respostas json estáticas (descartado quando as tabelas são recarregadas)
+        self.__json_cache = jcache.CJsonCache(self.__versao_tabs, int(ldct_config.get("srv.gzip", 1)) > 0)
+        assert self.__json_cache
+
+        # snapshot das aeronaves, um por tick (aircraft.json, status.json e feed)
+        self.__anv_snap = asnap.CAnvSnap(self, float(ldct_config.get("srv.tfed", 1)))
+        assert self.__anv_snap
+
+        # feed contínuo das aeronaves (data/aircraft.sse)
+        self.__anv_feed = afeed.CAnvFeed(self, float(ldct_config.get("srv.tfed", 1)))
+        assert self.__anv_feed
+
+        # tempo máximo de espera por uma requisição numa conexão keep-alive (s)
+        self.__f_tout = float(ldct_config.get("srv.tout", 10))
+
+        # conexão atual de cada worker entregue a outra thread (feed de aeronaves) ?
+        self.__tls_wrk = threading.local()
+
+        # conexões aceitas aguardando um worker (limitada, o excesso é recusado)
+        self.__q_req = Queue.Queue(max(1, int(ldct_config.get("srv.fila", 64))))
+        assert self.__q_req
+
+        # cria o pool de workers
+        for li_ndx in xrange(max(1, int(ldct_config.get("srv.wrks", 32)))):
+
+            # cria o worker
+            l_thr = threading.Thread(target=self.__run_worker, name="http-{}".format(li_ndx))
+            assert l_thr
+
+            # não impede o término da aplicação
+            l_thr.daemon = True
+
+            # inicia o worker
+            l_thr.start()
+
         # logger
         # M_LOG.info("__init__:<<")
 
     # ---------------------------------------------------------------------------------------------
+
+    def process_request(self, f_request, f_client_address):
+        """
+        coloca a conexão aceita na fila dos workers (chamado pela thread do serve_forever)
+
+        @param f_request: socket da conexão
+        @param f_client_address: endereço do cliente
+        """
+        try:
+            # coloca na fila
+            self.__q_req.put_nowait((f_request, f_client_address))
+
+        # fila cheia ?
+        except Queue.Full:
+
+            # logger
+            l_log = logging.getLogger("CViewServer::process_request")
+            l_log.setLevel(logging.WARNING)
+            l_log.warning(u"<E01: fila de conexões cheia, recusando {}.".format(f_client_address))
+
+            # recusa a conexão
+            self.shutdown_request(f_request)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __run_worker(self):
+        """
+        worker do pool: atende as conexões da fila, uma de cada vez, até o cliente fechar ou
+        ficar ocioso por mais de srv.tout segundos
+        """
+        # loop
+        while True:
+
+            # obtém a próxima conexão
+            l_request, l_client_address = self.__q_req.get()
+
+            # conexão do worker
+            self.__tls_wrk.v_desanexa = False
+
+            try:
+                # atende a conexão (todas as requisições do keep-alive)
+                self.finish_request(l_request, l_client_address)
+
+            # em caso de erro...
+            except Exception:
+
+                # mostra o erro (como o TCPServer)
+                self.handle_error(l_request, l_client_address)
+
+            finally:
+                # conexão não foi entregue a outra thread ?
+                if not self.__tls_wrk.v_desanexa:
+
+                    # fecha a conexão
+                    self.shutdown_request(l_request)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def desanexa(self):
+        """
+        a conexão atendida por este worker foi entregue a outra thread (feed de aeronaves), que
+        passa a ser responsável por fechá-la
+        """
+        # sinaliza ao worker
+        self.__tls_wrk.v_desanexa = True
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __versao_tabs(self):
+        """
+        versão das tabelas do espaço aéreo (contador do model, incrementado a cada carga ou troca)
+
+        @return versão
+        """
+        # return
+        return self.__model.i_ver_tabs
+
+    # ---------------------------------------------------------------------------------------------
     
     @property
     def control(self):
@@ -227,6 +354,87 @@ class CViewServer(SocketServer.TCPServer):
                                             
     # ---------------------------------------------------------------------------------------------
     
+    @property
+    def json_cache(self):
+        """
+        get cache das respostas json estáticas
+        """
+        return self.__json_cache
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def anv_feed(self):
+        """
+        get feed contínuo das aeronaves
+        """
+        return self.__anv_feed
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def anv_snap(self):
+        """
+        get snapshot das aeronaves
+        """
+        return self.__anv_snap
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def f_tout(self):
+        """
+        get tempo máximo de espera numa conexão keep-alive (s)
+        """
+        return self.__f_tout
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_fila(self):
+        """
+        get quantidade de conexões aguardando um worker
+        """
+        return self.__q_req.qsize()
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def lst_alert(self):
+        """
+        get pares de aeronaves em alerta de proximidade
+        """
+        return self.__model.emula_model.lst_alert
+                                            
+    # ---------------------------------------------------------------------------------------------
+    
+    @property
+    def dct_pred(self):
+        """
+        get previsões de trajetória
+        """
+        return self.__model.emula_model.dct_pred
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def lst_cnfl(self):
+        """
+        get conflitos de médio prazo previstos
+        """
+        return self.__model.emula_model.lst_cnfl
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def sim_stat(self):
+        """
+        get registro de métricas
+        """
+        return self.__control.sim_stat
+                                            
+    # ---------------------------------------------------------------------------------------------
+    
     @property
     def dct_esp(self):
         """
@@ -21,6 +21,7 @@ __date__ = "2015/12"
 
 # python library
 import logging
+import weakref
 
 # PyQt library
 from PyQt4 import QtCore, QtGui
@@ -29,7 +30,6 @@ from PyQt4 import QtCore, QtGui
 from ...model.newton import defs_newton as ldefs
 from ...model import tMath as tMath
 
-from ...model.coords import pos_lat_lng as pll
 from ...model.stock import fix as cfix
 
 # < module data >----------------------------------------------------------------------------------
@@ -57,11 +57,131 @@ class CPaintEngine(object):
         # inicia a super classe
         super(CPaintEngine, self).__init__()
 
+        # painter do quadro (entre begin e end todos os desenhos usam o mesmo painter)
+        self.__painter = None
+
+        # fontes por tamanho (em pontos)
+        self.__dct_font = {}
+
+        # labels das aeronaves: aeronave -> (callsign, nível, proa, velocidade) e os textos
+        self.__dct_label = weakref.WeakKeyDictionary()
+
         # logger
         # M_LOG.info("__init__:<<")
 
     # ---------------------------------------------------------------------------------------------
 
+    def begin(self, f_painter):
+        """
+        inicia um quadro: até o end, os métodos de desenho usam este painter em vez de criar um
+        QPainter (e as suas fontes e canetas) a cada elemento
+
+        @param f_painter: painter do quadro (já aberto no dispositivo de desenho)
+        """
+        # verifica parâmetros de entrada
+        assert f_painter
+
+        # salva o estado do painter do chamador
+        f_painter.save()
+
+        # painter do quadro
+        self.__painter = f_painter
+
+    # ---------------------------------------------------------------------------------------------
+
+    def end(self):
+        """
+        termina o quadro iniciado por begin
+        """
+        # há um quadro ativo ?
+        if self.__painter is not None:
+
+            # restaura o estado do painter do chamador
+            self.__painter.restore()
+
+        # sem quadro
+        self.__painter = None
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __font(self, ff_size):
+        """
+        fonte dos textos, criada uma única vez por tamanho
+
+        @param ff_size: tamanho (pontos)
+
+        @return QFont
+        """
+        # tamanho inteiro
+        li_size = int(ff_size)
+
+        # obtém a fonte
+        l_font = self.__dct_font.get(li_size, None)
+
+        # ainda não criada ?
+        if l_font is None:
+
+            # cria a fonte
+            l_font = QtGui.QFont("Arial", li_size)
+            assert l_font
+
+            self.__dct_font[li_size] = l_font
+
+        # return
+        return l_font
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __labels(self, f_anv):
+        """
+        textos do label de uma aeronave, formatados de novo só quando callsign, nível, proa ou
+        velocidade mudam
+
+        @param f_anv: aeronave
+
+        @return (callsign, nível, proa, velocidade)
+        """
+        # estado atual do label
+        lt_key = (f_anv.s_callsign, int(f_anv.f_altitude / 100.), int(f_anv.f_true_heading), int(f_anv.f_ias))
+
+        # label anterior
+        lt_label = self.__dct_label.get(f_anv, None)
+
+        # label desatualizado ?
+        if (lt_label is None) or (lt_label[0] != lt_key):
+
+            # formata os textos
+            lt_label = (lt_key, ("{}".format(lt_key[0]),
+                                 "{:d}".format(lt_key[1]),
+                                 "{:03d}".format(lt_key[2]),
+                                 "{:d}".format(lt_key[3])))
+
+            self.__dct_label[f_anv] = lt_label
+
+        # return
+        return lt_label[1]
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __get_painter(self, f_screen):
+        """
+        painter para um desenho: o do quadro, se há um ativo, ou um novo sobre o dispositivo
+
+        @param f_screen: dispositivo de desenho (radar scope ou camada estática)
+
+        @return QPainter
+        """
+        # há um quadro ativo ?
+        if self.__painter is not None:
+
+            # return
+            return self.__painter
+
+        # return
+        return QtGui.QPainter(f_screen)
+
+    # ---------------------------------------------------------------------------------------------
+
     def draw_aerodromo(self, f_screen, f_aer):
 
         # logger
@@ -70,31 +190,27 @@ class CPaintEngine(object):
         # verifica parâmetros de entrada
         assert f_screen
 
-        # obtém a posição do aeródromo
-        l_pos = f_screen.viewport.translate_pos(pll.CPosLatLng(f_aer.f_aer_lat, f_aer.f_aer_lng))
+        # obtém a posição (X/Y) do aeródromo
+        lf_x, lf_y = f_screen.viewport.translate_ll(f_aer.f_aer_lat, f_aer.f_aer_lng)
         # M_LOG.debug("[{}] L/L:[{}]/[{}]".format(f_aer.s_aer_indc, f_aer.f_aer_lat, f_aer.f_aer_lng))
 
-        # X/Y do aeródromo
-        lf_x = l_pos.f_x
-        lf_y = l_pos.f_y
-
         # obtém o blip size
         lf_blip_size = f_screen.viewport.f_blip_size
 
         # cria um QPainter
-        l_painter = QtGui.QPainter(f_screen)
+        l_painter = self.__get_painter(f_screen)
         assert l_painter is not None
 
         # seleciona a cor do aeródromo
-        l_painter.setPen(self.__clr_aerodromo)
+        l_painter.setPen(self.__pen_aerodromo)
 
         # desenha o aeródromo (...um +)
         l_painter.drawLine(int(lf_x - lf_blip_size / 2.), int(lf_y), int(lf_x + lf_blip_size / 2.), int(lf_y))
         l_painter.drawLine(int(lf_x), int(lf_y - lf_blip_size / 2.), int(lf_x), int(lf_y + lf_blip_size / 2.))
 
         # seleciona a cor e fonte do texto
-        l_painter.setPen(self.__clr_name)
-        l_painter.setFont(QtGui.QFont("Arial", int(lf_blip_size * 1.5)))
+        l_painter.setPen(self.__pen_name)
+        l_painter.setFont(self.__font(lf_blip_size * 1.5))
 
         # desenha o texto (indicativo do aeródromo)
         l_painter.drawText(int(lf_x + lf_blip_size), int(lf_y + lf_blip_size * 2), f_aer.s_aer_indc)
@@ -104,26 +220,18 @@ class CPaintEngine(object):
         for l_pis in f_aer.dct_aer_pistas.values():
 
             # obtém a posição da cabeceira da pista
-            l_cab = f_screen.viewport.translate_pos(pll.CPosLatLng(l_pis.f_pst_lat, l_pis.f_pst_lng))
+            lf_cab_x, lf_cab_y = f_screen.viewport.translate_ll(l_pis.f_pst_lat, l_pis.f_pst_lng)
             # M_LOG.debug("[{}] L/L:[{}]/[{}]".format(f_aer.s_aer_indc, l_pis.f_pst_lat, l_pis.f_pst_lng))
 
             # obtém a posição da cabeceira oposta da pista
-            l_cab_opos = f_screen.viewport.translate_pos(pll.CPosLatLng(l_pis.f_pst_cab_opos_lat, l_pis.f_pst_cab_opos_lng))
+            lf_opos_x, lf_opos_y = f_screen.viewport.translate_ll(l_pis.f_pst_cab_opos_lat, l_pis.f_pst_cab_opos_lng)
             # M_LOG.debug("[{}] L/L:[{}]/[{}]".format(f_aer.s_aer_indc, l_pis.f_pst_cab_opos_lat, l_pis.f_pst_cab_opos_lng))
 
-            # cria uma caneta 
-            l_pen = QtGui.QPen()
-            assert l_pen
-
-            # configura cor e estilo da caneta
-            l_pen.setColor(self.__clr_pista)
-            l_pen.setStyle(QtCore.Qt.DashDotLine)
-
-            # seleciona a caneta
-            l_painter.setPen(l_pen)
+            # seleciona a caneta (cor e estilo da pista)
+            l_painter.setPen(self.__pen_pista)
 
             # desenha a pista ( ...uma + )
-            l_painter.drawLine(int(l_cab.f_x), int(l_cab.f_y), int(l_cab_opos.f_x), int(l_cab_opos.f_y))
+            l_painter.drawLine(int(lf_cab_x), int(lf_cab_y), int(lf_opos_x), int(lf_opos_y))
 
         # libera o QPainter
         del l_painter
@@ -161,10 +269,10 @@ class CPaintEngine(object):
         x3 = int(lf_x + f_screen.viewport.pPNM() * tMath.dsin(l_track - 4) * 11)
         y3 = int(lf_y - f_screen.viewport.pPNM() * tMath.dcos(l_track - 4) * 11)
 
-        l_painter = QtGui.QPainter(f_screen)
+        l_painter = self.__get_painter(f_screen)
         assert l_painter is not None
 
-        l_painter.setPen(self.__clr_instruction)
+        l_painter.setPen(self.__pen_instruction)
 
         l_painter.drawLine(x, y, x1, y1)
         l_painter.drawLine(x, y, x2, y2)
@@ -177,7 +285,7 @@ class CPaintEngine(object):
 
         str = "APP-%s" % f_name
 
-        l_painter.setFont(QtGui.QFont("Arial", int(lf_blip_size * 1.5)))
+        l_painter.setFont(self.__font(lf_blip_size * 1.5))
         l_painter.drawText(int(l_pos.f_x + lf_blip_size), int(l_pos.f_y + lf_blip_size * 2), str)
 
         del l_painter
@@ -208,19 +316,19 @@ class CPaintEngine(object):
         lf_blip_size = f_screen.viewport.f_blip_size
 
         # cria um QPainter
-        l_painter = QtGui.QPainter(f_screen)
+        l_painter = self.__get_painter(f_screen)
         assert l_painter is not None
 
         # seleciona a cor do fixo
-        l_painter.setPen(self.__clr_arp)
+        l_painter.setPen(self.__pen_arp)
 
         # desenha o fixo (...um +)
         l_painter.drawLine(int(lf_x - lf_blip_size / 2.), int(lf_y), int(lf_x + lf_blip_size / 2.), int(lf_y))
         l_painter.drawLine(int(lf_x), int(lf_y - lf_blip_size / 2.), int(lf_x), int(lf_y + lf_blip_size / 2.))
 
         # seleciona a cor e fonte do texto
-        l_painter.setPen(self.__clr_arp)
-        l_painter.setFont(QtGui.QFont("Arial", int(lf_blip_size * 1.5)))
+        l_painter.setPen(self.__pen_arp)
+        l_painter.setFont(self.__font(lf_blip_size * 1.5))
 
         # desenha o texto (indicativo do fixo)
         l_painter.drawText(int(lf_x + lf_blip_size), int(lf_y + lf_blip_size * 2), "ARP")
@@ -249,10 +357,10 @@ class CPaintEngine(object):
             name = rt._aoItem[i].sName
             # M_LOG.debug("name: " + str ( name ))
 
-            l_painter = QtGui.QPainter(f_screen)
+            l_painter = self.__get_painter(f_screen)
             assert l_painter is not None
 
-            l_painter.setPen(self.__clr_arrival)
+            l_painter.setPen(self.__pen_arrival)
 
             if (i + 1) < len(rt._aoItem):
 
@@ -293,7 +401,7 @@ class CPaintEngine(object):
         assert f_painter
 
         # preenche o background com a cor de fundo
-        f_painter.fillRect(QtCore.QRect(0, 0, f_screen.width() - 1, f_screen.height() - 1), self.__clr_background)
+        f_painter.fillRect(QtCore.QRect(0, 0, f_screen.width() - 1, f_screen.height() - 1), self.__brush_background)
 
         # logger
         # M_LOG.info("draw_background:<<")
@@ -308,23 +416,25 @@ class CPaintEngine(object):
         # verifica parâmetros de entrada
         assert f_screen
 
+        # posição lat/lng da aeronave
+        l_pos = f_anv.position
+
         # converte a posição lat/lng da aeronave para x/y
-        l_pos = f_screen.viewport.translate_pos(f_anv.position)
-        # M_LOG.debug("l_pos:[{}]".format(l_pos))
-                        
-        lf_x = l_pos.f_x
-        lf_y = l_pos.f_y
-        # M_LOG.debug("l_pos: x:[{}] y:[{}]".format(l_pos.f_x, l_pos.f_y))
+        lf_x, lf_y = f_screen.viewport.translate_ll(l_pos.f_lat, l_pos.f_lng)
+        # M_LOG.debug("l_pos: x:[{}] y:[{}]".format(lf_x, lf_y))
 
         # tamanho do blip
         lf_blip_size = f_screen.viewport.f_blip_size
 
-        # cria o painter
-        l_painter = QtGui.QPainter(f_screen)
+        # obtém o painter (o do quadro, se há um ativo)
+        l_painter = self.__get_painter(f_screen)
         assert l_painter is not None
 
+        # textos do label (callsign, nível, proa e velocidade)
+        ls_cs, ls_niv, ls_pro, ls_ias = self.__labels(f_anv)
+
         # configura a caneta
-        l_painter.setPen(self.__clr_blip)
+        l_painter.setPen(self.__pen_blip)
 
         # paint blip
         l_painter.drawArc(int(lf_x - lf_blip_size * 0.7),
@@ -339,22 +449,21 @@ class CPaintEngine(object):
                             int(lf_y - lf_blip_size * 5))
 
         # configura a fonte
-        l_painter.setFont(QtGui.QFont("Arial", int(lf_blip_size * 1.5)))
+        l_painter.setFont(self.__font(lf_blip_size * 1.5))
 
         # paint callsign
         l_rect_cs = l_painter.drawText(int(lf_x + lf_blip_size * 6),
                                        int(lf_y - lf_blip_size * 7),
                                        int(lf_blip_size * 20), 
                                        int(lf_blip_size * 2),
-                                       QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop, "{}".format(f_anv.s_callsign))
+                                       QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop, ls_cs)
 
         # move drawing rect down (next line)
         l_rect_cs.setTop(int(l_rect_cs.y() + lf_blip_size * 2))
         l_rect_cs.setBottom(int(l_rect_cs.bottom() + lf_blip_size * 2))
 
         # nível
-        l_str = "{:d}".format(int(f_anv.f_altitude / 100.))
-        l_rect_niv = l_painter.drawText(l_rect_cs, QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop, l_str)
+        l_rect_niv = l_painter.drawText(l_rect_cs, QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop, ls_niv)
                         
         # move drawing rect down (next line)
         l_rect_cs.setTop(int(l_rect_cs.y() + lf_blip_size * 2))
@@ -362,13 +471,11 @@ class CPaintEngine(object):
 
         # magnetic track
         # l_str = "{:03d}".format(f_anv.radar_magnetic_track())
-        l_str = "{:03d}".format(int(f_anv.f_true_heading))
-        l_rect_pro = l_painter.drawText(l_rect_cs, QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop, l_str)
+        l_rect_pro = l_painter.drawText(l_rect_cs, QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop, ls_pro)
                                 
         # groundspeed
         # l_str = "{:d}".format(f_anv.radar_ground_speed())
-        l_str = "{:d}".format(int(f_anv.f_ias))
-        l_rect_ias = l_painter.drawText(l_rect_cs, QtCore.Qt.AlignRight | QtCore.Qt.AlignTop, l_str)
+        l_rect_ias = l_painter.drawText(l_rect_cs, QtCore.Qt.AlignRight | QtCore.Qt.AlignTop, ls_ias)
 
         # arrow
         center = l_rect_niv.right() + (l_rect_ias.left() - l_rect_niv.right()) / 2.
@@ -393,14 +500,17 @@ class CPaintEngine(object):
         # para todas as posições do rastro...
         for li_ndx in xrange(100):
 
-            # converte a posição do rastro
-            l_pos = f_screen.viewport.translate_pos(f_anv.trail(li_ndx))
+            # obtém a posição do rastro
+            lt_pos = f_anv.trail_lat_lng(li_ndx)
 
-            if l_pos is None:
+            if lt_pos is None:
                 break
 
+            # converte a posição do rastro
+            lf_trl_x, lf_trl_y = f_screen.viewport.translate_ll(*lt_pos)
+
             # desenha o rastro
-            l_painter.drawPoint(l_pos.f_x, l_pos.f_y)
+            l_painter.drawPoint(lf_trl_x, lf_trl_y)
 
         # remove o painter
         del l_painter
@@ -419,20 +529,16 @@ class CPaintEngine(object):
         assert f_screen
 
         i = 0
-        pen = QtGui.QPen()
         name = ""
 
         while (i < len(rt._aoItem)):
             name = rt._aoItem[i].s_name
             l_log.info("name: " + str(name))
 
-            l_painter = QtGui.QPainter(f_screen)
+            l_painter = self.__get_painter(f_screen)
             assert l_painter is not None
 
-            pen.setColor(self.__clr_departure)
-            pen.setStyle(QtCore.Qt.DashLine)
-
-            l_painter.setPen(pen)
+            l_painter.setPen(self.__pen_departure)
 
             if (i + 1) < len(rt._aoItem):
 
@@ -476,13 +582,13 @@ class CPaintEngine(object):
 
         l_pos = f_screen.viewport.translate_pos(f_screen._airspace.getPosition(f_name))
 
-        l_painter = QtGui.QPainter(f_screen)
+        l_painter = self.__get_painter(f_screen)
         assert l_painter is not None
 
-        l_painter.setPen(self.__clr_instruction)
+        l_painter.setPen(self.__pen_instruction)
         l_painter.drawLine(l_pos.f_x, l_pos.f_y, lf_x, lf_y)
 
-        l_painter.setFont(QtGui.QFont("Arial", int(lf_blip_size * 1.5)))
+        l_painter.setFont(self.__font(lf_blip_size * 1.5))
         l_painter.drawText(int(l_pos.f_x + lf_blip_size), int(l_pos.f_y + lf_blip_size * 2), f_name)
 
         del l_painter
@@ -500,39 +606,35 @@ class CPaintEngine(object):
         # verifica parâmetros de entrada
         assert f_screen
 
-        # obtém a posição do fixo
-        l_pos = f_screen.viewport.translate_pos(pll.CPosLatLng(f_fix.f_fix_lat, f_fix.f_fix_lng))
-
-        # X/Y do fixo
-        lf_x = l_pos.f_x
-        lf_y = l_pos.f_y
+        # obtém a posição (X/Y) do fixo
+        lf_x, lf_y = f_screen.viewport.translate_ll(f_fix.f_fix_lat, f_fix.f_fix_lng)
 
         # obtém o blip size
         lf_blip_size = f_screen.viewport.f_blip_size
 
         # cria um QPainter
-        l_painter = QtGui.QPainter(f_screen)
+        l_painter = self.__get_painter(f_screen)
         assert l_painter is not None
 
         # DME ?
         if ldefs.E_DME == f_fix.en_fix_tipo:
             # seleciona a cor do fixo
-            l_painter.setPen(self.__clr_dme)
+            l_painter.setPen(self.__pen_dme)
 
         # NDB ?
         elif ldefs.E_NDB == f_fix.en_fix_tipo:    
             # seleciona a cor do fixo
-            l_painter.setPen(self.__clr_ndb)
+            l_painter.setPen(self.__pen_ndb)
 
         # VOR ?
         elif ldefs.E_VOR == f_fix.en_fix_tipo:    
             # seleciona a cor do fixo
-            l_painter.setPen(self.__clr_vor)
+            l_painter.setPen(self.__pen_vor)
 
         # senão,...
         else:
             # seleciona a cor do fixo
-            l_painter.setPen(self.__clr_navaid)
+            l_painter.setPen(self.__pen_navaid)
 
         # desenha o fixo ( ...uma + )
         l_painter.drawLine(int(lf_x - lf_blip_size / 2.), int(lf_y), int(lf_x + lf_blip_size / 2.), int(lf_y))
@@ -542,8 +644,8 @@ class CPaintEngine(object):
         if f_kind is None:
 
             # seleciona a cor e fonte do texto
-            l_painter.setPen(self.__clr_name)
-            l_painter.setFont(QtGui.QFont("Arial", int(lf_blip_size * 1.5)))
+            l_painter.setPen(self.__pen_name)
+            l_painter.setFont(self.__font(lf_blip_size * 1.5))
 
             # desenha o texto (indicativo do fixo)
             l_painter.drawText(int(lf_x + lf_blip_size), int(lf_y + lf_blip_size * 2), f_fix.s_fix_indc)
@@ -569,10 +671,10 @@ class CPaintEngine(object):
 
         srt = f_screen._airspace.route(f_name)
 
-        l_painter = QtGui.QPainter(f_screen)
+        l_painter = self.__get_painter(f_screen)
         assert l_painter is not None
 
-        l_painter.setPen(self.__clr_instruction)
+        l_painter.setPen(self.__pen_instruction)
 
         i = 0
         while (i + 1) < len(srt._aoItem):
@@ -589,7 +691,7 @@ class CPaintEngine(object):
 
         l_pos = f_screen.viewport.translate_pos(f_anv.radarPosition())
 
-        l_painter.setFont(QtGui.QFont("Arial", int(lf_blip_size * 1.5)))
+        l_painter.setFont(self.__font(lf_blip_size * 1.5))
         l_painter.drawText(int(l_pos.f_x + lf_blip_size), int(l_pos.f_y + lf_blip_size * 2), f_name)
 
         del l_painter
@@ -621,11 +723,11 @@ class CPaintEngine(object):
         y_mile = -f_screen.viewport.pPNM() * tMath.dcos(l_track)
 
         # cria um painter
-        l_painter = QtGui.QPainter(f_screen)
+        l_painter = self.__get_painter(f_screen)
         assert l_painter is not None
 
         # seleciona a caneta
-        l_painter.setPen(self.__clr_runway)
+        l_painter.setPen(self.__pen_runway)
 
         for li_ndx in xrange(1, 25, 2):
             l_painter.drawLine(int(lf_x + li_ndx * x_mile), int(lf_y + li_ndx * y_mile),
@@ -662,7 +764,7 @@ class CPaintEngine(object):
             if 0 == l_ndx:
             
                 # calcula a posição do primeiro breakpoint
-                l_pos_ant = f_screen.viewport.translate_pos(pll.CPosLatLng(l_brk.f_brk_lat, l_brk.f_brk_lng))
+                lt_pos_ant = f_screen.viewport.translate_ll(l_brk.f_brk_lat, l_brk.f_brk_lng)
 
                 # continua...
                 continue
@@ -672,36 +774,28 @@ class CPaintEngine(object):
             # M_LOG.debug("l_id: " + str(l_id))
 
             # cria um painter
-            l_painter = QtGui.QPainter(f_screen)
+            l_painter = self.__get_painter(f_screen)
             assert l_painter is not None
 
-            # cria uma caneta 
-            l_pen = QtGui.QPen()
-            assert l_pen
-
-            # configura cor e estilo da caneta
-            l_pen.setColor(self.__clr_subida)
-            l_pen.setStyle(QtCore.Qt.DashLine)
-
-            # seleciona a caneta
-            l_painter.setPen(l_pen)
+            # seleciona a caneta (cor e estilo da subida)
+            l_painter.setPen(self.__pen_subida)
 
             # calcula a posição do breakpoint
-            l_pos = f_screen.viewport.translate_pos(pll.CPosLatLng(l_brk.f_brk_lat, l_brk.f_brk_lng))
+            lt_pos = f_screen.viewport.translate_ll(l_brk.f_brk_lat, l_brk.f_brk_lng)
 
             # desenha a linha
-            l_painter.drawLine(tMath.round(l_pos_ant.f_x, 0), tMath.round(l_pos_ant.f_y, 0),
-                               tMath.round(l_pos.f_x, 0), tMath.round(l_pos.f_y, 0))
+            l_painter.drawLine(tMath.round(lt_pos_ant[0], 0), tMath.round(lt_pos_ant[1], 0),
+                               tMath.round(lt_pos[0], 0), tMath.round(lt_pos[1], 0))
 
             # seleciona a cor e fonte do texto
-            l_painter.setPen(self.__clr_name)
-            l_painter.setFont(QtGui.QFont("Arial", int(lf_blip_size)))
+            l_painter.setPen(self.__pen_name)
+            l_painter.setFont(self.__font(lf_blip_size))
 
             # desenha o texto (indicativo do breakpoint)
-            l_painter.drawText(int(l_pos.f_x + lf_blip_size), int(l_pos.f_y + lf_blip_size * 2), l_id)
+            l_painter.drawText(int(lt_pos[0] + lf_blip_size), int(lt_pos[1] + lf_blip_size * 2), l_id)
 
             # salva a posição anterior
-            l_pos_ant = l_pos
+            lt_pos_ant = lt_pos
             
             # remove o painter
             del l_painter
@@ -726,19 +820,9 @@ class CPaintEngine(object):
         lf_blip_size = f_screen.viewport.f_blip_size
 
         # cria um painter
-        l_painter = QtGui.QPainter(f_screen)
+        l_painter = self.__get_painter(f_screen)
         assert l_painter is not None
 
-        # cria uma caneta 
-        l_pen = QtGui.QPen()
-        assert l_pen
-
-        # configura cor e estilo da caneta
-        l_pen.setColor(self.__clr_trajetoria)
-        l_pen.setStyle(QtCore.Qt.DashLine)
-
-        # seleciona a caneta
-        #l_painter.setPen(l_pen)
 
         # para todos os breakpoints da lista...
         for l_ndx, l_brk in enumerate(f_trj.lst_trj_brk):
@@ -747,7 +831,7 @@ class CPaintEngine(object):
             if 0 == l_ndx:
             
                 # calcula a posição do primeiro breakpoint
-                l_pos_ant = f_screen.viewport.translate_pos(pll.CPosLatLng(l_brk.f_brk_lat, l_brk.f_brk_lng))
+                lt_pos_ant = f_screen.viewport.translate_ll(l_brk.f_brk_lat, l_brk.f_brk_lng)
 
                 # continua...
                 continue
@@ -757,37 +841,25 @@ class CPaintEngine(object):
             ls_id = "TRJ{}/{}".format(f_trj.i_prc_id, l_brk.i_brk_id)
             # M_LOG.debug("ls_id: " + str(ls_id))
 
-            # cria um painter
-            #l_painter = QtGui.QPainter(f_screen)
-            #assert l_painter is not None
-
-            # cria uma caneta 
-            #l_pen = QtGui.QPen()
-            #assert l_pen
-
-            # configura cor e estilo da caneta
-            #l_pen.setColor(self.__clr_trajetoria)
-            #l_pen.setStyle(QtCore.Qt.DashLine)
-
-            # seleciona a caneta
-            l_painter.setPen(l_pen)
+            # seleciona a caneta (cor e estilo da trajetória)
+            l_painter.setPen(self.__pen_trajetoria)
 
             # calcula a posição do breakpoint
-            l_pos = f_screen.viewport.translate_pos(pll.CPosLatLng(l_brk.f_brk_lat, l_brk.f_brk_lng))
+            lt_pos = f_screen.viewport.translate_ll(l_brk.f_brk_lat, l_brk.f_brk_lng)
 
             # desenha a linha
-            l_painter.drawLine(tMath.round(l_pos_ant.f_x, 0), tMath.round(l_pos_ant.f_y, 0),
-                               tMath.round(l_pos.f_x, 0), tMath.round(l_pos.f_y, 0))
+            l_painter.drawLine(tMath.round(lt_pos_ant[0], 0), tMath.round(lt_pos_ant[1], 0),
+                               tMath.round(lt_pos[0], 0), tMath.round(lt_pos[1], 0))
 
             # seleciona a cor e fonte do texto
-            l_painter.setPen(self.__clr_name)
-            l_painter.setFont(QtGui.QFont("Arial", int(lf_blip_size)))
+            l_painter.setPen(self.__pen_name)
+            l_painter.setFont(self.__font(lf_blip_size))
 
             # desenha o texto (indicativo do breakpoint)
-            l_painter.drawText(int(l_pos.f_x + lf_blip_size), int(l_pos.f_y + lf_blip_size * 2), ls_id)
+            l_painter.drawText(int(lt_pos[0] + lf_blip_size), int(lt_pos[1] + lf_blip_size * 2), ls_id)
 
             # salva a posição anterior
-            l_pos_ant = l_pos
+            lt_pos_ant = lt_pos
             
             # remove o painter
             #del l_painter
@@ -808,10 +880,10 @@ class CPaintEngine(object):
         i = 0
         while (i < len(rt._aoItem)):
 
-            l_painter = QtGui.QPainter(f_screen)
+            l_painter = self.__get_painter(f_screen)
             assert l_painter is not None
 
-            l_painter.setPen(self.__clr_transition)
+            l_painter.setPen(self.__pen_transition)
 
             if (i + 1) < len(rt._aoItem):
                 l_pos = f_screen.viewport.translate_pos(f_screen._airspace.getPosition(rt._aoItem[i].s_name))
@@ -849,18 +921,18 @@ class CPaintEngine(object):
         str = "%03d" % rv
         rvec = rv - f_screen._airspace.variation()
 
-        l_painter = QtGui.QPainter(f_screen)
+        l_painter = self.__get_painter(f_screen)
         assert l_painter is not None
 
-        l_painter.setFont(QtGui.QFont("Arial", int(lf_blip_size * 1.5)))
-        l_painter.setPen(self.__clr_instruction)
+        l_painter.setFont(self.__font(lf_blip_size * 1.5))
+        l_painter.setPen(self.__pen_instruction)
 
         l_painter.drawLine(int(l_pos.f_x),
                            int(l_pos.f_y),
                            int(l_pos.f_x + 2000 * tMath.dsin(rvec)),
                            int(l_pos.f_y - 2000 * tMath.dcos(rvec)))
 
-        l_painter.setFont(QtGui.QFont("Arial", int(lf_blip_size * 1.5)))
+        l_painter.setFont(self.__font(lf_blip_size * 1.5))
 
         if (rvec < 90) or ((rvec > 180) and (rvec < 270)):
             l_painter.drawText(int(lf_blip_size + l_pos.f_x + lf_blip_size * 25 * tMath.dsin(rvec)),
@@ -926,17 +998,17 @@ class CPaintEngine(object):
 
         lf_blip_size = f_screen.viewport.f_blip_size
 
-        l_painter = QtGui.QPainter(f_screen)
+        l_painter = self.__get_painter(f_screen)
         assert l_painter is not None
 
-        l_painter.setPen(self.__clr_waypoint)
+        l_painter.setPen(self.__pen_waypoint)
         l_painter.drawLine(int(lf_x - lf_blip_size / 2.), int(lf_y), int(lf_x + lf_blip_size / 2.), int(lf_y))
         l_painter.drawLine(int(lf_x), int(lf_y - lf_blip_size / 2.), int(lf_x), int(lf_y + lf_blip_size / 2.))
 
         if not fv_nameless:
 
-            l_painter.setPen(self.__clr_name)
-            l_painter.setFont(QtGui.QFont("Arial", int(lf_blip_size * 1.5)))
+            l_painter.setPen(self.__pen_name)
+            l_painter.setFont(self.__font(lf_blip_size * 1.5))
             l_painter.drawText(int(lf_x + lf_blip_size), int(lf_y + lf_blip_size * 2.), f_fix.s_name)
 
         del l_painter
@@ -1010,7 +1082,48 @@ class CPaintEngine(object):
 
             self.__clr_navaid = QtGui.QColor(200, 0, 0, 255)
 
+        # monta as canetas e os pincéis do esquema de cores
+        self.__make_pens()
+
         # logger
         # M_LOG.info("setColors:<<")
 
+    # ---------------------------------------------------------------------------------------------
+
+    def __make_pens(self):
+        """
+        cria as canetas e os pincéis uma única vez por esquema de cores, em vez de a cada elemento
+        desenhado
+        """
+        # canetas sólidas
+        self.__pen_aerodromo = QtGui.QPen(self.__clr_aerodromo)
+        self.__pen_arp = QtGui.QPen(self.__clr_arp)
+        self.__pen_arrival = QtGui.QPen(self.__clr_arrival)
+        self.__pen_blip = QtGui.QPen(self.__clr_blip)
+        self.__pen_dme = QtGui.QPen(self.__clr_dme)
+        self.__pen_instruction = QtGui.QPen(self.__clr_instruction)
+        self.__pen_name = QtGui.QPen(self.__clr_name)
+        self.__pen_navaid = QtGui.QPen(self.__clr_navaid)
+        self.__pen_ndb = QtGui.QPen(self.__clr_ndb)
+        self.__pen_runway = QtGui.QPen(self.__clr_runway)
+        self.__pen_transition = QtGui.QPen(self.__clr_transition)
+        self.__pen_vor = QtGui.QPen(self.__clr_vor)
+        self.__pen_waypoint = QtGui.QPen(self.__clr_waypoint)
+
+        # canetas tracejadas (pistas e procedimentos)
+        self.__pen_departure = QtGui.QPen(self.__clr_departure)
+        self.__pen_departure.setStyle(QtCore.Qt.DashLine)
+
+        self.__pen_pista = QtGui.QPen(self.__clr_pista)
+        self.__pen_pista.setStyle(QtCore.Qt.DashDotLine)
+
+        self.__pen_subida = QtGui.QPen(self.__clr_subida)
+        self.__pen_subida.setStyle(QtCore.Qt.DashLine)
+
+        self.__pen_trajetoria = QtGui.QPen(self.__clr_trajetoria)
+        self.__pen_trajetoria.setStyle(QtCore.Qt.DashLine)
+
+        # pincel do fundo
+        self.__brush_background = QtGui.QBrush(self.__clr_background)
+
 # < the end >--------------------------------------------------------------------------------------
@@ -30,7 +30,6 @@ from PyQt4 import QtCore, QtGui
 
 # model
 from ...model import tMath as tMath
-from ...model.newton import defs_newton as ldefs
 
 # import model.coords.pos_lat_lng as pll
 from ...model.coords import pos_xy as pxy
@@ -39,6 +38,7 @@ from ...model.coords import pos_xy as pxy
 # view
 from . import viewport as vwp
 from . import paint_engine as peng
+from . import static_layer as slyr
 #import view.visil.map.displayElement as displayElement
 #import view.visil.map.viewMap as viewMap
 
@@ -136,6 +136,16 @@ class CRadarScope(QtGui.QWidget):
 
         self.__paint_engine.setColors(False)
 
+        # cores invertidas ?
+        self.__v_inverted = False
+
+        # camada estática (pixmap refeito só quando o estado da tela muda)
+        self.__static_layer = None
+
+        # índice espacial do espaço aéreo (refeito só quando as tabelas mudam)
+        self.__spatial_index = None
+        self.__t_index_key = None
+
         # get color background area
         l_clr = None  # colorMngr.getColor("WND_MAIN_AREA_BKGRND")
 
@@ -677,98 +687,52 @@ class CRadarScope(QtGui.QWidget):
         # set background mode
         # f_painter.setBackgroundMode(QtCore.Qt.TransparentMode)
 
-        # desenha o fundo de tela
-        self.__paint_engine.draw_background(self, f_painter)
-
-        # para todas as prioridades...
-        #for l_iPrio in xrange(displayElement.PRIO_MAP_MAX, -1, -1):
-
-            #M_LOG.debug("l_iPrio: " + str(l_iPrio))
-
-            # para todos os mapas da lista...
-            #for l_oVMap in self.__lst_view_maps:
+        # estado da tela da camada estática
+        lt_key = self.__static_key()
 
-                # desenha o elemento
-                #l_oVMap.onDraw(self, f_painter, l_iPrio)
+        # camada estática desatualizada (tamanho, zoom, centro, cores ou tabelas) ?
+        if (self.__static_layer is None) or (self.__static_layer.t_key != lt_key):
 
-        # desenha o ARP
-        self.__paint_engine.draw_arp(self)
+            # cria e desenha a nova camada estática
+            self.__static_layer = slyr.CStaticLayer(self, lt_key)
+            assert self.__static_layer
 
-        # para todos os aeródromos...
-        for l_aer in self.__airspace.dct_aer.values():
-            # desenha o aeródromo
-            self.__paint_engine.draw_aerodromo(self, l_aer)
-        '''
-        # init index
-        l_iI = 0
-        l_iJ = 0
+            # tabelas do espaço aéreo
+            lt_index_key = lt_key[-3:]
 
-        # draw standard routes
-        while self.__airspace.arrivalRunway(l_iI):
-            while self.__airspace.arrival(l_iJ):
-                if self.__airspace.arrival(l_iJ).belongsToRunway(self.__airspace.arrivalRunway(l_iI)):
-                    self.__paint_engine.drawArrival(self, self.__airspace.arrival(l_iJ))
+            # tabelas recarregadas (ou índice ainda não montado) ?
+            if (self.__spatial_index is None) or (self.__t_index_key != lt_index_key):
 
-                l_iJ += 1
-            l_iJ = 0
+                # monta o índice espacial
+                self.__spatial_index = slyr.monta_indice(self.__airspace)
+                self.__t_index_key = lt_index_key
 
-            while self.__airspace.transition(l_iJ):
-                if self.__airspace.transition(l_iJ).belongsToRunway(self.__airspace.arrivalRunway(l_iI)):
-                    self.__paint_engine.drawTransition(self, self.__airspace.transition(l_iJ))
+            self.__static_layer.render(self.__paint_engine, self.__spatial_index)
 
-                l_iJ += 1
-            l_iI += 1
-        l_iI = 0
+        # copia a camada estática (fundo, ARP, aeródromos, auxílios e trajetórias)
+        f_painter.drawPixmap(0, 0, self.__static_layer)
 
-        # draw standard routes
-        while self.__airspace.departureRunway(l_iI):
+        # para todas as prioridades...
+        #for l_iPrio in xrange(displayElement.PRIO_MAP_MAX, -1, -1):
 
-            l_iJ = 0
+            #M_LOG.debug("l_iPrio: " + str(l_iPrio))
 
-            while self.__airspace.departure(l_iJ):
-                if self.__airspace.departure(l_iJ).belongsToRunway(self.__airspace.departureRunway(l_iI)):
-                    self.__paint_engine.drawDeparture(self, self.__airspace.departure(l_iJ))
+            # para todos os mapas da lista...
+            #for l_oVMap in self.__lst_view_maps:
 
-                l_iJ += 1
-            l_iI += 1
-        '''
-        # draw DMEs navaids
-        for l_dme in [fix for fix in self.__airspace.dct_fix.values() if ldefs.E_DME == fix.en_fix_tipo]:
-            # desenha o DME
-            self.__paint_engine.draw_navaid(self, l_dme)
-
-        # draw NDBs navaids
-        for l_ndb in [fix for fix in self.__airspace.dct_fix.values() if ldefs.E_NDB == fix.en_fix_tipo]:
-            # desenha o NDB
-            self.__paint_engine.draw_navaid(self, l_ndb)
-
-        # draw VORs navaids
-        for l_vor in [fix for fix in self.__airspace.dct_fix.values() if ldefs.E_VOR == fix.en_fix_tipo]:
-            # desenha o VOR
-            self.__paint_engine.draw_navaid(self, l_vor)
-
-        # draw waypoints
-        #for l_wpt in [fix for fix in self.__airspace.dct_fix.values() if ldefs.E_BRANCO == fix.en_fix_tipo]:
-            #self.__paint_engine.draw_navaid(self, l_wpt)
-        '''
-        # draw runways
-        for l_oRWY in self.__airspace.aoRWY:
-            self.__paint_engine.drawRunway(self, l_oRWY)
-        '''
-        # para todas as subidas...
-        #for l_sub in self.__airspace.dct_sub.values():
-            # desenha o procedimento de subida
-            #self.__paint_engine.draw_subida(self, l_sub)
+                # desenha o elemento
+                #l_oVMap.onDraw(self, f_painter, l_iPrio)
 
-        # para todas as trajetórias...
-        for l_trj in self.__airspace.dct_trj.values():
-            # desenha o procedimento de trajetória
-            self.__paint_engine.draw_trajetoria(self, l_trj)
+        # inicia o quadro (as aeronaves são desenhadas com o painter da tela)
+        self.__paint_engine.begin(f_painter)
 
         # draw aircraft targets
         for l_anv in self.__dct_flight.values():
             # desenha a aeronave
             self.__paint_engine.draw_blip(self, l_anv)
+
+        # termina o quadro
+        self.__paint_engine.end()
         '''
         if self.__i_active_ac >= 0:
             if self.C_LMODE_HDG == self.__i_lateral_mode:
@@ -817,6 +781,19 @@ class CRadarScope(QtGui.QWidget):
 
     # ---------------------------------------------------------------------------------------------
 
+    def __static_key(self):
+        """
+        estado da tela que define a camada estática
+
+        @return tupla (tamanho, zoom, centro, blip size, inversão e tabelas do espaço aéreo)
+        """
+        # return
+        return (self.width(), self.height(), self.__viewport.f_zoom,
+                self.__viewport.center.f_lat, self.__viewport.center.f_lng, self.__viewport.f_blip_size,
+                self.__v_inverted, id(self.__airspace.dct_aer), id(self.__airspace.dct_fix), id(self.__airspace.dct_trj))
+
+    # ---------------------------------------------------------------------------------------------
+
     def showLateral(self, f_iVal):
 
         # logger
@@ -843,6 +820,7 @@ class CRadarScope(QtGui.QWidget):
 
         # inverte as cores dos elementos
         self.__paint_engine.setColors(f_vInverted)
+        self.__v_inverted = f_vInverted
 
         # redesenha
         self.repaint()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+spatial_index
+
+índice espacial (grade regular em lat/lng) dos elementos do espaço aéreo desenhados no radar
+scope. Cada elemento é registrado em todas as células que o seu retângulo envolvente toca; a
+consulta com o retângulo visível da viewport devolve só os elementos que podem aparecer na tela
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+# import logging
+import math
+
+# < defines >--------------------------------------------------------------------------------------
+
+# tamanho da célula da grade (graus, ~30NM)
+D_IDX_CELULA = .5
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# < class CSpatialIndex >--------------------------------------------------------------------------
+
+class CSpatialIndex(object):
+    """
+    grade de células: (linha, coluna) -> lista de (ordem de inserção, elemento)
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, ff_celula=D_IDX_CELULA):
+        """
+        @param ff_celula: tamanho da célula (graus)
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # tamanho da célula
+        self.__f_celula = float(ff_celula)
+
+        # células
+        self.__dct_cel = {}
+
+        # quantidade de elementos
+        self.__i_qtd = 0
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __len__(self):
+        """
+        quantidade de elementos
+        """
+        return self.__i_qtd
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __faixa(self, ff_min, ff_max):
+        """
+        índices das células que cobrem um intervalo
+
+        @return xrange dos índices
+        """
+        # return
+        return xrange(int(math.floor(ff_min / self.__f_celula)), int(math.floor(ff_max / self.__f_celula)) + 1)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def consulta(self, ff_lat_min, ff_lng_min, ff_lat_max, ff_lng_max):
+        """
+        elementos cujo retângulo envolvente pode tocar o retângulo consultado
+
+        @return lista de elementos, na ordem de inserção e sem repetição
+        """
+        # elementos encontrados: ordem de inserção -> elemento
+        ldct_ach = {}
+
+        # para todas as células do retângulo...
+        for li_lin in self.__faixa(ff_lat_min, ff_lat_max):
+            for li_col in self.__faixa(ff_lng_min, ff_lng_max):
+
+                # para todos os elementos da célula...
+                for li_ord, l_item in self.__dct_cel.get((li_lin, li_col), ()):
+                    ldct_ach[li_ord] = l_item
+
+        # return
+        return [ldct_ach[li_ord] for li_ord in sorted(ldct_ach)]
+
+    # ---------------------------------------------------------------------------------------------
+
+    def insere(self, f_item, ff_lat_min, ff_lng_min, ff_lat_max, ff_lng_max):
+        """
+        registra um elemento em todas as células do seu retângulo envolvente
+
+        @param f_item: elemento
+        """
+        # para todas as células do retângulo...
+        for li_lin in self.__faixa(ff_lat_min, ff_lat_max):
+            for li_col in self.__faixa(ff_lng_min, ff_lng_max):
+
+                # registra o elemento na célula
+                self.__dct_cel.setdefault((li_lin, li_col), []).append((self.__i_qtd, f_item))
+
+        # mais um elemento
+        self.__i_qtd += 1
+
+# < the end >--------------------------------------------------------------------------------------
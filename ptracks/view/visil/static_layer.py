@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+static_layer
+
+camada estática do radar scope: fundo, ARP, aeródromos (com as pistas), auxílios à navegação e
+trajetórias são desenhados uma única vez num pixmap, refeito só quando muda o tamanho, o zoom, o
+centro, a inversão de cores ou as tabelas do espaço aéreo. A cada quadro o scope só copia o
+pixmap e desenha a camada dinâmica (aeronaves). Só os elementos no retângulo visível (índice
+espacial) e permitidos no zoom atual (nível de detalhe) são convertidos e desenhados
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import logging
+
+# PyQt library
+from PyQt4 import QtGui
+
+# model
+from ...model.newton import defs_newton as ldefs
+
+# view
+from . import spatial_index as sidx
+
+# < defines >--------------------------------------------------------------------------------------
+
+# categorias dos elementos da camada, na ordem de desenho (os de baixo primeiro)
+D_LYR_AER = "aer"
+D_LYR_TRJ = "trj"
+
+D_LYR_ORDEM = (D_LYR_AER, ldefs.E_DME, ldefs.E_NDB, ldefs.E_VOR, D_LYR_TRJ)
+
+# nível de detalhe: zoom máximo (NM na largura da tela) em que cada categoria é desenhada
+D_LYR_LOD = {D_LYR_AER: 420.,
+             ldefs.E_DME: 160.,
+             ldefs.E_NDB: 320.,
+             ldefs.E_VOR: 420.,
+             D_LYR_TRJ: 320.}
+
+# margem da consulta ao índice (em blips), para os textos dos elementos junto à borda
+D_LYR_MARGEM = 12.
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+M_LOG = logging.getLogger(__name__)
+M_LOG.setLevel(logging.DEBUG)
+
+# -------------------------------------------------------------------------------------------------
+
+def __insere(f_index, ft_elem, flst_pos):
+    """
+    registra um elemento no índice pelo retângulo envolvente das suas posições
+
+    @param f_index: índice espacial
+    @param ft_elem: (categoria, elemento)
+    @param flst_pos: lista de (lat, lng) do elemento
+    """
+    # elemento sem posição ?
+    if not flst_pos:
+        return
+
+    # latitudes e longitudes
+    llst_lat = [lt_pos[0] for lt_pos in flst_pos]
+    llst_lng = [lt_pos[1] for lt_pos in flst_pos]
+
+    # registra o elemento
+    f_index.insere(ft_elem, min(llst_lat), min(llst_lng), max(llst_lat), max(llst_lng))
+
+# -------------------------------------------------------------------------------------------------
+
+def monta_indice(f_airspace):
+    """
+    monta o índice espacial dos elementos da camada estática (uma vez por carga das tabelas)
+
+    @param f_airspace: espaço aéreo
+
+    @return índice espacial de (categoria, elemento)
+    """
+    # logger
+    M_LOG.info("monta_indice:>>")
+
+    # verifica parâmetros de entrada
+    assert f_airspace
+
+    # cria o índice
+    l_index = sidx.CSpatialIndex()
+    assert l_index is not None
+
+    # para todos os aeródromos (com as cabeceiras das pistas)...
+    for l_aer in f_airspace.dct_aer.values():
+
+        # posições do aeródromo
+        llst_pos = [(l_aer.f_aer_lat, l_aer.f_aer_lng)]
+
+        for l_pis in l_aer.dct_aer_pistas.values():
+            llst_pos.append((l_pis.f_pst_lat, l_pis.f_pst_lng))
+            llst_pos.append((l_pis.f_pst_cab_opos_lat, l_pis.f_pst_cab_opos_lng))
+
+        # registra o aeródromo
+        __insere(l_index, (D_LYR_AER, l_aer), llst_pos)
+
+    # para todos os fixos...
+    for l_fix in f_airspace.dct_fix.values():
+
+        # auxílio desenhado (DME, NDB ou VOR) ?
+        if l_fix.en_fix_tipo in D_LYR_LOD:
+
+            # registra o auxílio
+            __insere(l_index, (l_fix.en_fix_tipo, l_fix), [(l_fix.f_fix_lat, l_fix.f_fix_lng)])
+
+    # para todas as trajetórias...
+    for l_trj in f_airspace.dct_trj.values():
+
+        # registra a trajetória (pelos breakpoints)
+        __insere(l_index, (D_LYR_TRJ, l_trj), [(l_brk.f_brk_lat, l_brk.f_brk_lng) for l_brk in l_trj.lst_trj_brk])
+
+    # logger
+    M_LOG.info("monta_indice:<<")
+
+    # return
+    return l_index
+
+# < class CStaticLayer >---------------------------------------------------------------------------
+
+class CStaticLayer(QtGui.QPixmap):
+    """
+    pixmap da camada estática. Tem o mesmo viewport do scope, então os métodos do paint engine
+    desenham nele como se fosse a própria tela
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, f_screen, ft_key):
+        """
+        @param f_screen: radar scope (viewport)
+        @param ft_key: estado da tela para o qual a camada é desenhada (ver CRadarScope)
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # verifica parâmetros de entrada
+        assert f_screen
+
+        # inicia a super classe
+        super(CStaticLayer, self).__init__(f_screen.width(), f_screen.height())
+
+        # salva o radar scope localmente
+        self.__screen = f_screen
+
+        # estado da tela
+        self.__t_key = ft_key
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def render(self, f_paint_engine, f_index):
+        """
+        desenha a camada estática
+
+        @param f_paint_engine: paint engine (cores da inversão atual)
+        @param f_index: índice espacial do espaço aéreo (ver monta_indice)
+        """
+        # logger
+        M_LOG.info("render:>>")
+
+        # verifica parâmetros de entrada
+        assert f_paint_engine
+        assert f_index is not None
+
+        # cria o painter da camada (único para todos os elementos)
+        l_painter = QtGui.QPainter(self)
+        assert l_painter is not None
+
+        # inicia o quadro do paint engine
+        f_paint_engine.begin(l_painter)
+
+        # desenha o fundo de tela
+        f_paint_engine.draw_background(self, l_painter)
+
+        # desenha o ARP
+        f_paint_engine.draw_arp(self)
+
+        # zoom atual
+        lf_zoom = self.viewport.f_zoom
+
+        # elementos visíveis por categoria (só as categorias do nível de detalhe do zoom)
+        ldct_vis = dict((l_cat, []) for l_cat in D_LYR_ORDEM if lf_zoom <= D_LYR_LOD[l_cat])
+
+        # consulta o índice com o retângulo visível
+        for l_cat, l_obj in f_index.consulta(*self.viewport.bounds(self.viewport.f_blip_size * D_LYR_MARGEM)):
+
+            # categoria desenhada neste zoom ?
+            if l_cat in ldct_vis:
+                ldct_vis[l_cat].append(l_obj)
+
+        # para todas as categorias, na ordem de desenho...
+        for l_cat in D_LYR_ORDEM:
+
+            # para todos os elementos visíveis da categoria...
+            for l_obj in ldct_vis.get(l_cat, ()):
+
+                # aeródromo ?
+                if D_LYR_AER == l_cat:
+                    # desenha o aeródromo (e as pistas)
+                    f_paint_engine.draw_aerodromo(self, l_obj)
+
+                # trajetória ?
+                elif D_LYR_TRJ == l_cat:
+                    # desenha o procedimento de trajetória
+                    f_paint_engine.draw_trajetoria(self, l_obj)
+
+                # senão, auxílio (DME, NDB e VOR)
+                else:
+                    # desenha o auxílio
+                    f_paint_engine.draw_navaid(self, l_obj)
+
+        # draw waypoints
+        #for l_wpt in [fix for fix in f_airspace.dct_fix.values() if ldefs.E_BRANCO == fix.en_fix_tipo]:
+            #f_paint_engine.draw_navaid(self, l_wpt)
+
+        # para todas as subidas...
+        #for l_sub in f_airspace.dct_sub.values():
+            # desenha o procedimento de subida
+            #f_paint_engine.draw_subida(self, l_sub)
+
+        # termina o quadro e libera o QPainter
+        f_paint_engine.end()
+        l_painter.end()
+
+        # logger
+        M_LOG.info("render:<<")
+
+    # =============================================================================================
+    # dados
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def t_key(self):
+        """
+        get estado da tela para o qual a camada foi desenhada
+        """
+        return self.__t_key
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def viewport(self):
+        """
+        get viewport (o mesmo do radar scope)
+        """
+        return self.__screen.viewport
+
+# < the end >--------------------------------------------------------------------------------------
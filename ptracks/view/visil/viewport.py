@@ -72,6 +72,45 @@ class CViewport(object):
 
     # ---------------------------------------------------------------------------------------------
 
+    def bounds(self, ff_margem=0.):
+        """
+        retângulo visível em lat/lng (consulta do índice espacial)
+
+        @param ff_margem: margem em pixels (p.ex. para os textos dos elementos fora da tela)
+
+        @return (lat mínima, lng mínima, lat máxima, lng máxima)
+        """
+        # escala (graus por pixel)
+        lf_esc = float(self.__f_zoom / self.__f_width) / cdefs.D_CNV_GR2NM
+
+        # meia altura e meia largura (graus)
+        lf_dlat = (self.__f_height / 2. + ff_margem) * lf_esc
+        lf_dlng = (self.__f_width / 2. + ff_margem) * lf_esc / math.cos(math.radians(self.__center.f_lat))
+
+        # return
+        return (self.__center.f_lat - lf_dlat, self.__center.f_lng - lf_dlng,
+                self.__center.f_lat + lf_dlat, self.__center.f_lng + lf_dlng)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def translate_ll(self, ff_lat, ff_lng):
+        """
+        converte lat/lng para x/y sem criar objetos de posição (desenho das camadas)
+
+        @param ff_lat: latitude
+        @param ff_lng: longitude
+
+        @return (x, y)
+        """
+        # escala
+        lf_esc = self.__f_width / self.__f_zoom
+
+        # return
+        return (self.__f_width / 2. + (ff_lng - self.__center.f_lng) * cdefs.D_CNV_GR2NM * math.cos(math.radians(self.__center.f_lat)) * lf_esc,
+                self.__f_height / 2. - (ff_lat - self.__center.f_lat) * cdefs.D_CNV_GR2NM * lf_esc)
+
+    # ---------------------------------------------------------------------------------------------
+
     def translate_pos(self, f_pos):
         """
         DOCUMENT ME!
@@ -0,0 +1,470 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+anv_feed
+
+feed contínuo das aeronaves para o mapa web (Server-Sent Events em data/aircraft.sse). Uma única
+thread compara, a cada tick, o snapshot das aeronaves (ver anv_snap) com o último estado enviado,
+serializa só as aeronaves alteradas e as que saíram e escreve a mesma mensagem em todas as
+conexões assinantes, em vez de cada browser buscar o aircraft.json completo a cada segundo. As
+conexões são entregues pelo servidor web a esta thread (sockets não bloqueantes), de modo que um
+assinante não ocupa um worker do servidor
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import errno
+import json
+import select
+import socket
+import threading
+import time
+
+# model
+from ...model import glb_data as gdata
+
+# < defines >--------------------------------------------------------------------------------------
+
+# bytes pendentes por assinante (cliente lento: fecha a conexão, o browser reconecta e recebe um
+# novo snapshot)
+D_FED_PEND = 256 * 1024
+
+# reenvio de uma aeronave sem alteração (s), para o cliente não considerá-la perdida
+D_FED_REFRESH = 30.
+
+# intervalo dos comentários de keep-alive (s)
+D_FED_PING = 15.
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# < class CAssinante >-----------------------------------------------------------------------------
+
+class CAssinante(object):
+    """
+    assinante do feed (uma conexão SSE, escrita só pela thread do feed)
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, f_sck, fs_ini):
+        """
+        @param f_sck: socket da conexão (headers da resposta já enviados)
+        @param fs_ini: primeiro trecho do corpo (snapshot inicial)
+        """
+        # socket da conexão (não bloqueante: um cliente lento não trava a thread do feed)
+        self.__sck = f_sck
+        self.__sck.setblocking(0)
+
+        # bytes ainda não escritos
+        self.__s_pend = fs_ini
+
+        # hora da última mensagem
+        self.f_ult = time.time()
+
+    # ---------------------------------------------------------------------------------------------
+
+    def entrega(self, fs_msg):
+        """
+        acrescenta uma mensagem aos bytes pendentes
+
+        @param fs_msg: mensagem SSE completa
+        """
+        # acrescenta
+        self.__s_pend += fs_msg
+
+        # hora da última mensagem
+        self.f_ult = time.time()
+
+    # ---------------------------------------------------------------------------------------------
+
+    def escreve(self):
+        """
+        escreve o que o socket aceitar sem bloquear
+
+        @return False se a conexão foi fechada (cliente fechou ou lento demais), senão True
+        """
+        # cliente lento demais ?
+        if len(self.__s_pend) > D_FED_PEND:
+
+            # fecha (o browser reconecta e recebe um novo snapshot)
+            self.fecha()
+
+            # return
+            return False
+
+        # enquanto há bytes pendentes...
+        while self.__s_pend:
+
+            try:
+                # escreve
+                li_qtd = self.__sck.send(self.__s_pend)
+
+            # em caso de erro...
+            except socket.error as l_err:
+
+                # socket cheio ?
+                if l_err.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+
+                    # continua na próxima vez
+                    break
+
+                # cliente fechou a conexão
+                self.fecha()
+
+                # return
+                return False
+
+            # descarta os bytes escritos
+            self.__s_pend = self.__s_pend[li_qtd:]
+
+        # return
+        return True
+
+    # ---------------------------------------------------------------------------------------------
+
+    def fecha(self):
+        """
+        fecha a conexão (como o servidor web faria)
+        """
+        try:
+            # encerra a escrita
+            self.__sck.shutdown(socket.SHUT_WR)
+
+        # conexão já encerrada
+        except socket.error:
+            pass
+
+        # fecha o socket
+        self.__sck.close()
+
+    # ---------------------------------------------------------------------------------------------
+
+    def fileno(self):
+        """
+        descritor do socket (select)
+        """
+        return self.__sck.fileno()
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def v_pendente(self):
+        """
+        get existem bytes pendentes
+        """
+        return bool(self.__s_pend)
+
+# < class CAnvFeed >-------------------------------------------------------------------------------
+
+class CAnvFeed(object):
+    """
+    montagem e distribuição das alterações das aeronaves
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, f_server, ff_tick=1.):
+        """
+        @param f_server: servidor web (snapshot das aeronaves)
+        @param ff_tick: intervalo entre as mensagens (s)
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # check input parameters
+        assert f_server
+
+        # servidor web
+        self.__server = f_server
+
+        # intervalo entre as mensagens
+        self.__f_tick = max(.1, float(ff_tick))
+
+        # último estado enviado de cada aeronave: hex -> (registro, hora do envio)
+        self.__dct_ult = {}
+
+        # contador de mensagens
+        self.__i_msg = 0
+
+        # assinantes
+        self.__lst_ass = []
+
+        # thread do feed (só roda enquanto há assinantes)
+        self.__thr_feed = None
+
+        # trava dos assinantes e do estado
+        self.__lck_feed = threading.Lock()
+        assert self.__lck_feed
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def assina(self, f_sck):
+        """
+        recebe uma conexão SSE (headers já enviados), envia o snapshot com todas as aeronaves e
+        inicia a thread do feed, se necessário. Daqui em diante a conexão pertence ao feed, que a
+        fecha quando o cliente fechar, ficar lento demais ou a aplicação terminar
+
+        @param f_sck: socket da conexão
+        """
+        with self.__lck_feed:
+
+            # estado atual
+            l_snap = self.__server.anv_snap.obtem()
+
+            # nenhum assinante ?
+            if not self.__lst_ass:
+
+                # o snapshot passa a ser o último estado enviado (o primeiro tick não repete tudo)
+                self.__dct_ult = dict((l_rec.hex, (l_rec, l_snap.f_now)) for l_rec in l_snap.t_rec)
+
+            # cria o assinante com o intervalo de reconexão do cliente (ms) e o snapshot inicial.
+            # As alterações entregues depois são todas posteriores ao snapshot
+            l_ass = CAssinante(f_sck, "retry: 2000\nevent: snapshot\ndata: {}\n\n".format(self.__mensagem(l_snap, l_snap.t_rec)))
+            assert l_ass
+
+            # conexão já caiu ?
+            if not l_ass.escreve():
+
+                # return
+                return
+
+            # coloca na lista
+            self.__lst_ass.append(l_ass)
+
+            # thread do feed parada ?
+            if self.__thr_feed is None:
+
+                # cria a thread
+                self.__thr_feed = threading.Thread(target=self.__run_feed, name="anv-feed")
+                assert self.__thr_feed
+
+                # não impede o término da aplicação
+                self.__thr_feed.daemon = True
+
+                # inicia a thread
+                self.__thr_feed.start()
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __mensagem(self, f_snap, flst_rec, flst_rem=None):
+        """
+        serializa uma mensagem do feed
+
+        @param f_snap: snapshot das aeronaves
+        @param flst_rec: registros das aeronaves a enviar
+        @param flst_rem: aeronaves removidas (hex)
+
+        @return corpo json
+        """
+        # aeronaves no formato do aircraft.json, com o contador de mensagens do feed
+        llst_anv = [f_snap.anv_dict(l_rec) for l_rec in flst_rec]
+
+        for ldct_anv in llst_anv:
+            ldct_anv["messages"] = self.__i_msg
+
+        # monta a mensagem
+        ldct_msg = {"now": round(f_snap.f_now, 1), "messages": self.__i_msg, "aircraft": llst_anv}
+
+        # tem remoções ?
+        if flst_rem is not None:
+            ldct_msg["removed"] = flst_rem
+
+        # return
+        return json.dumps(ldct_msg)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __delta(self):
+        """
+        monta a mensagem com as alterações desde o último tick (com a trava do feed)
+
+        @return mensagem SSE ou None se nada mudou
+        """
+        # snapshot atual
+        l_snap = self.__server.anv_snap.obtem()
+
+        # aeronaves presentes
+        lset_hex = set()
+
+        # aeronaves alteradas (ou sem reenvio há muito tempo)
+        llst_rec = []
+
+        for l_rec in l_snap.t_rec:
+
+            # presente
+            lset_hex.add(l_rec.hex)
+
+            # último envio
+            lt_ult = self.__dct_ult.get(l_rec.hex, None)
+
+            # alterada ?
+            if (lt_ult is None) or (lt_ult[0] != l_rec) or ((l_snap.f_now - lt_ult[1]) > D_FED_REFRESH):
+
+                # envia
+                self.__dct_ult[l_rec.hex] = (l_rec, l_snap.f_now)
+                llst_rec.append(l_rec)
+
+        # aeronaves removidas
+        llst_rem = [ls_hex for ls_hex in self.__dct_ult if ls_hex not in lset_hex]
+
+        for ls_hex in llst_rem:
+
+            # remove do último estado
+            del self.__dct_ult[ls_hex]
+
+        # nada mudou ?
+        if (not llst_rec) and (not llst_rem):
+
+            # return
+            return None
+
+        # serializa uma única vez
+        ls_msg = "event: delta\ndata: {}\n\n".format(self.__mensagem(l_snap, llst_rec, llst_rem))
+
+        # incrementa contador de mensagens
+        self.__i_msg += 1
+
+        # return
+        return ls_msg
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __escreve(self, flst_ass):
+        """
+        escreve os bytes pendentes e remove os assinantes cujas conexões foram fechadas (com a
+        trava do feed)
+
+        @param flst_ass: assinantes a escrever
+        """
+        # para todos os assinantes...
+        for l_ass in flst_ass:
+
+            # conexão fechada ?
+            if (not l_ass.escreve()) and (l_ass in self.__lst_ass):
+
+                # remove da lista
+                self.__lst_ass.remove(l_ass)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __run_feed(self):
+        """
+        thread do feed: a cada tick monta as alterações e escreve em todos os assinantes; entre os
+        ticks, termina de escrever nas conexões que não aceitaram tudo de uma vez
+        """
+        # logger
+        # M_LOG.info("__run_feed:>>")
+
+        # hora do próximo tick
+        lf_prox = time.time() + self.__f_tick
+
+        # loop
+        while True:
+
+            # tempo até o próximo tick
+            lf_espera = lf_prox - time.time()
+
+            # ainda não chegou o tick ?
+            if lf_espera > 0.:
+
+                with self.__lck_feed:
+
+                    # assinantes com bytes pendentes
+                    llst_pend = [l_ass for l_ass in self.__lst_ass if l_ass.v_pendente]
+
+                # nada pendente ?
+                if not llst_pend:
+
+                    # aguarda o tick
+                    time.sleep(lf_espera)
+                    continue
+
+                try:
+                    # aguarda alguma conexão aceitar mais bytes (no máximo até o tick)
+                    _, llst_wr, _ = select.select([], llst_pend, [], lf_espera)
+
+                # conexão fechada durante a espera
+                except (select.error, socket.error, ValueError):
+
+                    # tenta escrever em todas (as fechadas são removidas)
+                    llst_wr = llst_pend
+
+                with self.__lck_feed:
+
+                    # escreve
+                    self.__escreve(llst_wr)
+
+                # continua aguardando o tick
+                continue
+
+            # próximo tick
+            lf_prox += self.__f_tick
+
+            # atrasado ? (não acumula ticks)
+            if lf_prox < time.time():
+                lf_prox = time.time() + self.__f_tick
+
+            with self.__lck_feed:
+
+                # não há mais assinantes ou a aplicação terminou ?
+                if (not self.__lst_ass) or (not gdata.G_KEEP_RUN):
+
+                    # fecha as conexões
+                    for l_ass in self.__lst_ass:
+                        l_ass.fecha()
+
+                    self.__lst_ass = []
+
+                    # descarta o estado (o próximo assinante começa por um snapshot)
+                    self.__dct_ult = {}
+
+                    # termina a thread
+                    self.__thr_feed = None
+                    break
+
+                # alterações deste tick
+                ls_msg = self.__delta()
+
+                # hora atual
+                lf_now = time.time()
+
+                # para todos os assinantes...
+                for l_ass in self.__lst_ass:
+
+                    # houve alterações ?
+                    if ls_msg is not None:
+
+                        # envia as alterações
+                        l_ass.entrega(ls_msg)
+
+                    # senão, conexão sem mensagens há muito tempo ?
+                    elif (lf_now - l_ass.f_ult) >= D_FED_PING:
+
+                        # comentário de keep-alive (detecta também o cliente que fechou)
+                        l_ass.entrega(": ping\n\n")
+
+                # escreve em todos
+                self.__escreve(list(self.__lst_ass))
+
+        # logger
+        # M_LOG.info("__run_feed:<<")
+
+# < the end >--------------------------------------------------------------------------------------
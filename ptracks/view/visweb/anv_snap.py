@@ -0,0 +1,341 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+anv_snap
+
+snapshot das aeronaves para o servidor web: uma vez por tick os flight engines são lidos e
+convertidos (lat/long, pés, nós) em registros imutáveis. Todos os consumidores (aircraft.json,
+status.json, feed contínuo) usam o mesmo snapshot, então vêem uma imagem coerente entre si, e o
+corpo do aircraft.json é montado uma única vez por tick, qualquer que seja o número de clientes
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import collections
+import copy
+import json
+import logging
+import threading
+import time
+
+# model
+from ...model.coords import coord_defs as cdefs
+
+# view
+from . import generate_status_json as sttjson
+
+# < defines >--------------------------------------------------------------------------------------
+
+# registro de uma aeronave no snapshot (campos do aircraft.json + status operacional)
+CAnvRec = collections.namedtuple("CAnvRec", ["callsign", "hex", "squawk", "flight", "lat", "lon",
+                                             "altitude", "vert_rate", "track", "speed", "alert",
+                                             "fnc_ope", "prc_id"])
+
+# campos do registro enviados no aircraft.json
+D_SNP_CAMPOS = ("hex", "squawk", "flight", "lat", "lon", "altitude", "vert_rate", "track", "speed", "alert")
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# < class CSnapshot >------------------------------------------------------------------------------
+
+class CSnapshot(object):
+    """
+    imagem das aeronaves num instante (não é alterada depois de montada)
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, fi_seq, ff_now, ft_rec):
+        """
+        @param fi_seq: número de sequência do snapshot
+        @param ff_now: hora da captura
+        @param ft_rec: tupla de registros (CAnvRec)
+        """
+        # número de sequência (contador de mensagens do aircraft.json)
+        self.__i_seq = fi_seq
+
+        # hora da captura
+        self.__f_now = ff_now
+
+        # registros
+        self.__t_rec = ft_rec
+
+        # registros por callsign
+        self.__dct_rec = dict((l_rec.callsign, l_rec) for l_rec in ft_rec)
+
+        # corpo do aircraft.json (montado no primeiro pedido)
+        self.__s_anv_json = None
+
+    # ---------------------------------------------------------------------------------------------
+
+    def anv_dict(self, f_rec):
+        """
+        registro de uma aeronave no formato do aircraft.json
+
+        @param f_rec: registro (CAnvRec)
+
+        @return dicionário da aeronave
+        """
+        # campos do registro
+        ldct_anv = dict((ls_cpo, getattr(f_rec, ls_cpo)) for ls_cpo in D_SNP_CAMPOS)
+
+        # campos fixos do formato dump1090 e contador de mensagens
+        ldct_anv.update(nucp=15, seen_pos=1., category="11", seen=1., messages=self.__i_seq)
+
+        # return
+        return ldct_anv
+
+    # ---------------------------------------------------------------------------------------------
+
+    def get_rec(self, fs_callsign):
+        """
+        registro de uma aeronave
+
+        @param fs_callsign: callsign
+
+        @return registro (CAnvRec) ou None se a aeronave não existe
+        """
+        # return
+        return self.__dct_rec.get(fs_callsign, None)
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def f_now(self):
+        """
+        get hora da captura
+        """
+        return self.__f_now
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def i_seq(self):
+        """
+        get número de sequência
+        """
+        return self.__i_seq
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def s_anv_json(self):
+        """
+        get corpo do aircraft.json (montado uma única vez; numa corrida duas threads montam o
+        mesmo corpo)
+        """
+        # ainda não montado ?
+        if self.__s_anv_json is None:
+
+            # monta o corpo
+            self.__s_anv_json = json.dumps({"now": round(self.__f_now, 1), "messages": self.__i_seq,
+                                            "aircraft": [self.anv_dict(l_rec) for l_rec in self.__t_rec]})
+
+        # return
+        return self.__s_anv_json
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def t_rec(self):
+        """
+        get registros
+        """
+        return self.__t_rec
+
+# < class CAnvSnap >-------------------------------------------------------------------------------
+
+class CAnvSnap(object):
+    """
+    captura dos snapshots, no máximo um por tick, sob demanda dos consumidores
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, f_server, ff_tick=1.):
+        """
+        @param f_server: servidor web (dct_flight e coords)
+        @param ff_tick: intervalo mínimo entre as capturas (s)
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # check input parameters
+        assert f_server
+
+        # servidor web
+        self.__server = f_server
+
+        # intervalo entre as capturas
+        self.__f_tick = max(.1, float(ff_tick))
+
+        # última conversão para lat/long de cada aeronave: id -> ((x, y, z), (lat, lng, alt))
+        self.__dct_geo = {}
+
+        # snapshot atual
+        self.__snap = CSnapshot(0, 0., ())
+
+        # trava da captura
+        self.__lck_snap = threading.Lock()
+        assert self.__lck_snap
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __captura(self, ff_now):
+        """
+        lê os flight engines e monta um novo snapshot (com a trava da captura)
+
+        @param ff_now: hora da captura
+
+        @return snapshot
+        """
+        # sistema de coordenadas
+        l_coords = self.__server.coords
+
+        # conversões do snapshot anterior
+        ldct_geo = self.__dct_geo
+
+        # conversões deste snapshot (as aeronaves que saíram são descartadas)
+        self.__dct_geo = {}
+
+        # registros
+        llst_rec = []
+
+        # para todas as aeronaves (cópia, os flight engines entram e saem durante a captura)...
+        for l_atv_viva in list(self.__server.dct_flight.values()):
+
+            # cópia da aeronave com a trava do passo (o flight engine não altera a aeronave no meio
+            # da cópia); as conversões e o status são feitos sobre a cópia, fora da trava
+            l_atv = self.__copia(l_atv_viva)
+
+            # posição cartesiana
+            lt_xyz = (l_atv.f_trf_x, l_atv.f_trf_y, l_atv.f_trf_z)
+
+            # última conversão
+            lt_geo = ldct_geo.get(l_atv.i_trf_id, None)
+
+            # a aeronave se moveu ?
+            if (lt_geo is None) or (lt_geo[0] != lt_xyz):
+
+                # converte para lat/long
+                lt_geo = (lt_xyz, l_coords.xyz2geo(*lt_xyz))
+
+            self.__dct_geo[l_atv.i_trf_id] = lt_geo
+
+            # status operacional
+            try:
+                ldct_stt = sttjson.make_status(l_atv)
+
+            # status inválido (procedimento ou ponteiros inconsistentes) ?
+            except (AttributeError, KeyError, TypeError, ValueError) as l_err:
+
+                # logger
+                l_log = logging.getLogger("CAnvSnap::__captura")
+                l_log.setLevel(logging.WARNING)
+                l_log.warning(u"<E01: status da aeronave [{}] não gerado: {}.".format(l_atv.s_trf_ind, l_err))
+
+                # só esta aeronave fica sem status
+                ldct_stt = {"fnc_ope": "", "prc_id": ""}
+
+            # monta o registro
+            llst_rec.append(CAnvRec(callsign=l_atv.s_trf_ind,
+                                    hex="{:6x}".format(l_atv.i_trf_id),
+                                    squawk="{:04o}".format(int(l_atv.i_trf_ssr, 8)),
+                                    flight=l_atv.s_trf_ind,
+                                    lat=lt_geo[1][0],
+                                    lon=lt_geo[1][1],
+                                    altitude=int(l_atv.f_trf_alt_atu * cdefs.D_CNV_M2FT),
+                                    vert_rate=l_atv.f_atv_raz_sub,
+                                    track=int(l_atv.f_trf_pro_atu),
+                                    speed=int(l_atv.f_trf_vel_atu * cdefs.D_CNV_MS2KT),
+                                    alert=bool(l_atv.v_atv_alert),
+                                    fnc_ope=ldct_stt["fnc_ope"],
+                                    prc_id=ldct_stt["prc_id"]))
+
+        # return
+        return CSnapshot(self.__snap.i_seq + 1, ff_now, tuple(llst_rec))
+
+    # ---------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __copia(f_atv):
+        """
+        cópia rasa e consistente de uma aeronave ativa
+
+        @param f_atv: aeronave ativa (viva, alterada pelo flight engine)
+
+        @return cópia da aeronave
+        """
+        # flight engine da aeronave
+        l_fe = f_atv.atv_fe
+
+        # sem flight engine, ninguém altera a aeronave
+        if l_fe is None:
+
+            # return
+            return copy.copy(f_atv)
+
+        # trava o estado da aeronave
+        l_fe.lck_step.acquire()
+
+        try:
+            # return
+            return copy.copy(f_atv)
+
+        finally:
+            # libera o estado da aeronave
+            l_fe.lck_step.release()
+
+    # ---------------------------------------------------------------------------------------------
+
+    def obtem(self):
+        """
+        obtém o snapshot atual, capturando um novo se o atual tem mais de um tick
+
+        @return snapshot
+        """
+        # snapshot atual
+        l_snap = self.__snap
+
+        # hora atual
+        lf_now = time.time()
+
+        # ainda no mesmo tick ?
+        if (lf_now - l_snap.f_now) < self.__f_tick:
+
+            # return
+            return l_snap
+
+        with self.__lck_snap:
+
+            # outra thread já capturou ?
+            if (lf_now - self.__snap.f_now) < self.__f_tick:
+
+                # return
+                return self.__snap
+
+            # captura e publica o novo snapshot
+            self.__snap = self.__captura(lf_now)
+
+            # return
+            return self.__snap
+
+# < the end >--------------------------------------------------------------------------------------
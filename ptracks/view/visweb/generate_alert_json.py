@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+generate_alert_json
+
+monta o json dos pares de aeronaves em alerta de proximidade
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import json
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# ------------------------------------------------------------------------------------------------
+
+def generate_alert_json(flst_alert):
+    """
+    monta o json dos pares em alerta
+
+    @param flst_alert: lista de pares de indicativos em alerta
+    """
+    # logger
+    # M_LOG.info("generate_alert_json:>>")
+
+    # check input parameters
+    assert flst_alert is not None
+
+    # monta buffer
+    ls_buf = json.dumps({"alert": [list(lt_par) for lt_par in flst_alert]})
+    # M_LOG.debug("generate_alert_json:ls_buf:[{}]".format(ls_buf))
+
+    # logger
+    # M_LOG.info("generate_alert_json:<<")
+
+    # return
+    return ls_buf
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+generate_metrics_json
+
+monta o json do registro de métricas da simulação
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import json
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# ------------------------------------------------------------------------------------------------
+
+def generate_metrics_json(f_sim_stat):
+    """
+    monta o json das métricas
+
+    @param f_sim_stat: registro de métricas
+    """
+    # logger
+    # M_LOG.info("generate_metrics_json:>>")
+
+    # check input parameters
+    assert f_sim_stat
+
+    # monta buffer
+    ls_buf = json.dumps(f_sim_stat.snapshot())
+    # M_LOG.debug("generate_metrics_json:ls_buf:[{}]".format(ls_buf))
+
+    # logger
+    # M_LOG.info("generate_metrics_json:<<")
+
+    # return
+    return ls_buf
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+generate_pred_json
+
+monta o json das trajetórias previstas e dos conflitos de médio prazo
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import json
+
+# model
+from ...model.coords import coord_defs as cdefs
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# ------------------------------------------------------------------------------------------------
+
+def generate_pred_json(fdct_pred, flst_cnfl, f_coords):
+    """
+    monta o json das previsões
+
+    @param fdct_pred: previsões (indicativo -> dicionário (rev, hora, trk, eta))
+    @param flst_cnfl: conflitos previstos (indicativo 1, indicativo 2, hora)
+    @param f_coords: conversor de coordenadas
+    """
+    # logger
+    # M_LOG.info("generate_pred_json:>>")
+
+    # check input parameters
+    assert fdct_pred is not None
+    assert flst_cnfl is not None
+    assert f_coords
+
+    # trajetórias previstas
+    llst_pred = []
+
+    # para todas as previsões (cópia, o serviço de previsão substitui as entradas)...
+    for ls_ind, ldct_pred in fdct_pred.items():
+
+        # pontos do track (hora, lat, lng, altitude em pés)
+        llst_trk = []
+
+        for lf_t, lf_x, lf_y, lf_alt in ldct_pred["trk"]:
+
+            # converte para lat/long
+            lf_lat, lf_lng, _ = f_coords.xyz2geo(lf_x, lf_y, lf_alt)
+
+            llst_trk.append([lf_t, lf_lat, lf_lng, int(lf_alt * cdefs.D_CNV_M2FT)])
+
+        llst_pred.append({"flight": ls_ind,
+                          "hora": ldct_pred["hora"],
+                          "trk": llst_trk,
+                          "eta": [list(lt_eta) for lt_eta in ldct_pred["eta"]]})
+
+    # monta buffer
+    ls_buf = json.dumps({"pred": llst_pred, "cnfl": [list(lt_cnfl) for lt_cnfl in flst_cnfl]})
+    # M_LOG.debug("generate_pred_json:ls_buf:[{}]".format(ls_buf))
+
+    # logger
+    # M_LOG.info("generate_pred_json:<<")
+
+    # return
+    return ls_buf
+
+# < the end >--------------------------------------------------------------------------------------
@@ -22,7 +22,6 @@ __date__ = "2016/04"
 # python library
 import json
 import logging
-import time
 
 # model
 from ...model.newton import defs_newton as ldefs
@@ -35,26 +34,65 @@ from ...model.newton import defs_newton as ldefs
 
 # ------------------------------------------------------------------------------------------------
 
-def generate_status_json(fdct_flight, fs_callsign):
+def make_status(f_atv):
+    """
+    status operacional de uma aeronave (lido do flight engine na captura do snapshot, ver anv_snap)
+
+    @param f_atv: flight engine
+
+    @return dicionário com a função operacional e a identificação do procedimento
+    """
+    # está em procedimento ?
+    if f_atv.ptr_trf_prc is not None:
+
+        # pouso/decolagem ?
+        if f_atv.en_trf_fnc_ope in [ldefs.E_DECOLAGEM, ldefs.E_POUSO]:
+
+            # identificação do pouso/decolagem
+            ls_prc_id = "{}/{}".format(f_atv.ptr_atv_aer.s_aer_indc, f_atv.ptr_atv_pst.s_pst_indc)
+
+        # direcionamento a fixo ?
+        elif f_atv.en_trf_fnc_ope in [ldefs.E_DIRFIXO]:
+
+            # identificação do fixo
+            ls_prc_id = "{}/{}".format(f_atv.ptr_atv_fix_prc.i_fix_id, f_atv.ptr_atv_fix_prc.s_fix_indc)
+
+        # senão,...
+        else:
+            # obtém o número do procedimento
+            ls_prc_id = str(f_atv.ptr_trf_prc.i_prc_id)
+
+    # senão,...
+    else:
+        # sem identificação
+        ls_prc_id = ""
+
+    # return
+    return {"fnc_ope": ldefs.DCT_FNC_OPE[f_atv.en_trf_fnc_ope],
+            "prc_id": ls_prc_id}
+
+# ------------------------------------------------------------------------------------------------
+
+def generate_status_json(f_snap, fs_callsign):
     """
     DOCUMENT ME!
 
-    @param fdct_flight: dicionário de flight engines
+    @param f_snap: snapshot das aeronaves (ver anv_snap)
     @param fs_callsign: aircraft callsign
     """
     # logger
     # M_LOG.info("generate_status_json:>>")
 
     # check input parameters
-    assert fdct_flight is not None
+    assert f_snap is not None
     assert fs_callsign
 
     # M_LOG.debug(u"generate_status_json::fs_callsign:[{}]".format(fs_callsign))
 
-    # aeronave existe no dicionário ?
-    l_atv = fdct_flight.get(fs_callsign, None)
+    # aeronave existe no snapshot ?
+    l_rec = f_snap.get_rec(fs_callsign)
 
-    if l_atv is None:
+    if l_rec is None:
 
         # logger
         l_log = logging.getLogger("generate_status_json")
@@ -64,36 +102,9 @@ def generate_status_json(fdct_flight, fs_callsign):
         # return
         return None
 
-    # M_LOG.debug(u"generate_status_json:en_trf_fnc_ope:[{}]".format(ldefs.DCT_FNC_OPE[l_atv.en_trf_fnc_ope]))
-
-    # está em procedimento ?
-    if l_atv.ptr_trf_prc is not None:
-
-        # pouso/decolagem ?
-        if l_atv.en_trf_fnc_ope in [ldefs.E_DECOLAGEM, ldefs.E_POUSO]:
-
-            # identificação do pouso/decolagem
-            ls_prc_id = "{}/{}".format(l_atv.ptr_atv_aer.s_aer_indc, l_atv.ptr_atv_pst.s_pst_indc)
-
-        # direcionamento a fixo ?
-        elif l_atv.en_trf_fnc_ope in [ldefs.E_DIRFIXO]:
-
-            # identificação do fixo
-            ls_prc_id = "{}/{}".format(l_atv.ptr_atv_fix_prc.i_fix_id, l_atv.ptr_atv_fix_prc.s_fix_indc)
-
-        # senão,...
-        else:
-            # obtém o número do procedimento
-            ls_prc_id = str(l_atv.ptr_trf_prc.i_prc_id)
-
-    # senão,...
-    else:
-        # sem identificação
-        ls_prc_id = ""
-        
     # monta um dicionário com o status
-    ldct_status = { "fnc_ope": ldefs.DCT_FNC_OPE[l_atv.en_trf_fnc_ope],
-                    "prc_id": ls_prc_id,
+    ldct_status = { "fnc_ope": l_rec.fnc_ope,
+                    "prc_id": l_rec.prc_id,
                   }
 
     # converte para json
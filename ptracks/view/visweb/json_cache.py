@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+json_cache
+
+cache das respostas json estáticas do servidor web (fixos, trajetórias, subidas, esperas,
+performances, pousos e decolagens). O corpo é serializado (e opcionalmente comprimido com gzip)
+uma única vez, com ETag e Last-Modified para as respostas 304. O cache é descartado quando as
+tabelas do espaço aéreo são recarregadas
+
+revision 0.1  2016/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "mlabru, sophosoft"
+__date__ = "2016/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import email.utils
+import gzip
+import hashlib
+import threading
+import time
+
+import cStringIO
+
+# < defines >--------------------------------------------------------------------------------------
+
+# quantidade máxima de respostas em cache (as queries vêm do cliente)
+D_CCH_MAX = 2048
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+# M_LOG = logging.getLogger(__name__)
+# M_LOG.setLevel(logging.DEBUG)
+
+# < class CJsonResp >------------------------------------------------------------------------------
+
+class CJsonResp(object):
+    """
+    resposta pré-serializada
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, fs_body, fv_gzip):
+        """
+        @param fs_body: corpo json
+        @param fv_gzip: monta também o corpo comprimido
+        """
+        # corpo json (bytes)
+        self.s_body = fs_body.encode("utf-8") if isinstance(fs_body, unicode) else fs_body
+
+        # corpo comprimido (None = sem compressão)
+        self.s_gzip = None
+
+        # comprime ?
+        if fv_gzip:
+
+            # comprime o corpo
+            l_buf = cStringIO.StringIO()
+
+            with gzip.GzipFile(fileobj=l_buf, mode="wb", compresslevel=6) as l_gz:
+                l_gz.write(self.s_body)
+
+            self.s_gzip = l_buf.getvalue()
+
+        # hash do conteúdo
+        ls_hash = hashlib.sha1(self.s_body).hexdigest()[:20]
+
+        # ETags do corpo json e do corpo comprimido (são representações diferentes)
+        self.s_etag = '"{}"'.format(ls_hash)
+        self.s_etag_gz = '"{}-gz"'.format(ls_hash)
+
+        # hora da montagem
+        self.f_time = int(time.time())
+
+        # Last-Modified (formato HTTP)
+        self.s_last_mod = email.utils.formatdate(self.f_time, usegmt=True)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def etag(self, fv_gzip):
+        """
+        ETag da representação enviada
+
+        @param fv_gzip: corpo comprimido
+        """
+        # return
+        return self.s_etag_gz if fv_gzip else self.s_etag
+
+    # ---------------------------------------------------------------------------------------------
+
+    def v_nao_modificado(self, fs_if_none_match, fs_if_mod_since, fv_gzip=False):
+        """
+        o cliente já tem esta versão ? (If-None-Match tem precedência sobre If-Modified-Since)
+
+        @param fs_if_none_match: header If-None-Match (ou None)
+        @param fs_if_mod_since: header If-Modified-Since (ou None)
+        @param fv_gzip: a representação a enviar é o corpo comprimido
+        """
+        # recebeu ETag ?
+        if fs_if_none_match:
+
+            # alguma das ETags confere com a da representação ?
+            return ("*" == fs_if_none_match.strip()) or \
+                   (self.etag(fv_gzip) in [ls_tag.strip() for ls_tag in fs_if_none_match.split(",")])
+
+        # recebeu data ?
+        if fs_if_mod_since:
+
+            # converte a data
+            lt_data = email.utils.parsedate_tz(fs_if_mod_since)
+
+            # data válida ?
+            if lt_data is not None:
+
+                # não modificado desde a data
+                return self.f_time <= email.utils.mktime_tz(lt_data)
+
+        # senão, modificado
+        return False
+
+# < class CJsonCache >-----------------------------------------------------------------------------
+
+class CJsonCache(object):
+    """
+    cache das respostas json estáticas
+    """
+    # ---------------------------------------------------------------------------------------------
+
+    def __init__(self, f_versao, fv_gzip=True):
+        """
+        @param f_versao: função que retorna a versão das tabelas (muda quando são recarregadas)
+        @param fv_gzip: monta também os corpos comprimidos
+        """
+        # logger
+        # M_LOG.info("__init__:>>")
+
+        # check input parameters
+        assert f_versao
+
+        # versão das tabelas
+        self.__f_versao = f_versao
+        self.__versao = None
+
+        # compressão
+        self.__v_gzip = fv_gzip
+
+        # respostas: chave (path + query) -> CJsonResp
+        self.__dct_resp = {}
+
+        # trava do cache
+        self.__lck_cache = threading.Lock()
+        assert self.__lck_cache
+
+        # logger
+        # M_LOG.info("__init__:<<")
+
+    # ---------------------------------------------------------------------------------------------
+
+    def obtem(self, fs_key, f_gera):
+        """
+        obtém a resposta de uma chave, montando-a na primeira vez
+
+        @param fs_key: chave (path + query)
+        @param f_gera: função sem parâmetros que gera o corpo json (None = não existe)
+
+        @return CJsonResp ou None se o corpo não existe
+        """
+        # obtém a versão das tabelas
+        l_versao = self.__f_versao()
+
+        with self.__lck_cache:
+
+            # tabelas recarregadas ?
+            if l_versao != self.__versao:
+
+                # descarta as respostas
+                self.__dct_resp = {}
+                self.__versao = l_versao
+
+            # obtém a resposta
+            l_resp = self.__dct_resp.get(fs_key, None)
+
+        # já em cache ?
+        if l_resp is not None:
+
+            # return
+            return l_resp
+
+        # gera o corpo (fora da trava; se duas threads gerarem ao mesmo tempo, o resultado é o mesmo)
+        ls_body = f_gera()
+
+        # corpo inexistente ?
+        if ls_body is None:
+
+            # não guarda
+            return None
+
+        # monta a resposta
+        l_resp = CJsonResp(ls_body, self.__v_gzip)
+
+        with self.__lck_cache:
+
+            # cache cheio ?
+            if len(self.__dct_resp) >= D_CCH_MAX:
+
+                # recomeça
+                self.__dct_resp = {}
+
+            # guarda a resposta
+            self.__dct_resp[fs_key] = l_resp
+
+        # return
+        return l_resp
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+
+    @property
+    def v_gzip(self):
+        """
+        get compressão
+        """
+        return self.__v_gzip
+
+# < the end >--------------------------------------------------------------------------------------
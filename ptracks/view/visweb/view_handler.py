@@ -26,11 +26,14 @@ import os
 import SimpleHTTPServer
 
 # view
+from . import generate_alert_json as alrjson
 from . import generate_anv_json as anvjson
 from . import generate_arr_json as arrjson
 from . import generate_dep_json as depjson
 from . import generate_esp_json as espjson
 from . import generate_fix_json as fixjson
+from . import generate_metrics_json as mtrjson
+from . import generate_pred_json as prdjson
 from . import generate_prf_json as prfjson
 from . import generate_status_json as sttjson
 from . import generate_sub_json as subjson
@@ -44,6 +47,7 @@ D_MODES_CONTENT_TYPE_HTML = "text/html;charset=utf-8"
 D_MODES_CONTENT_TYPE_JPG  = "image/jpg"
 D_MODES_CONTENT_TYPE_JS   = "application/javascript;charset=utf-8"
 D_MODES_CONTENT_TYPE_JSON = "application/json;charset=utf-8"
+D_MODES_CONTENT_TYPE_SSE  = "text/event-stream;charset=utf-8"
 
 # < module data >----------------------------------------------------------------------------------
 
@@ -57,6 +61,36 @@ class CViewHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
     """
     handles any incoming request from the browser
     """
+    # HTTP/1.1 (keep-alive): toda resposta com corpo leva Content-Length
+    protocol_version = "HTTP/1.1"
+
+    # ---------------------------------------------------------------------------------------------
+
+    def setup(self):
+        """
+        prepara a conexão
+        """
+        # espera máxima por uma requisição numa conexão ociosa (libera o worker)
+        self.timeout = self.server.f_tout
+
+        # init super class
+        SimpleHTTPServer.SimpleHTTPRequestHandler.setup(self)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def end_headers(self):
+        """
+        termina os headers da resposta
+        """
+        # há conexões aguardando um worker ?
+        if (self.server.i_fila > 0) and (not self.close_connection):
+
+            # encerra o keep-alive desta conexão depois da resposta, liberando o worker
+            self.send_header("Connection", "close")
+
+        # init super class
+        SimpleHTTPServer.SimpleHTTPRequestHandler.end_headers(self)
+
     # ---------------------------------------------------------------------------------------------
 
     def do_GET(self):
@@ -87,148 +121,132 @@ class CViewHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
                 # aircraft ?
                 if "/data/aircraft.json" == self.path:
 
-                    self.send_response(200)
-                    self.send_header("Content-type", D_MODES_CONTENT_TYPE_JSON)
-                    self.end_headers()
-
                     # monta e envia mensagem de aeronave
-                    self.wfile.write(anvjson.generate_anv_json(self.server.dct_flight, self.server.coords))
+                    self.__send_json(anvjson.generate_anv_json(self.server.anv_snap.obtem()))
+
+                # alertas de proximidade ?
+                elif "/data/alert.json" == self.path:
+
+                    # create and send json
+                    self.__send_json(alrjson.generate_alert_json(self.server.lst_alert))
 
                 # pouso ?
                 elif "/data/arr.json" == self.path:
 
-                    # create and send headers
-                    self.send_response(200)
-                    self.send_header("Content-type", D_MODES_CONTENT_TYPE_JSON)
-                    self.end_headers()
-
                     # recebeu pouso ?
                     if len(llst_path) > 1:
 
-                        # create and send json
-                        self.wfile.write(arrjson.generate_arr_json(self.server.lst_arr_dep, llst_path[1]))
+                        # create and send json (cached)
+                        self.__send_json_cache(lambda: arrjson.generate_arr_json(self.server.lst_arr_dep, llst_path[1]), llst_path)
 
                     # senão, envia todo dicionário
                     else:
-                        # create and send json
-                        self.wfile.write(arrjson.generate_arr_json(self.server.lst_arr_dep))
+                        # create and send json (cached)
+                        self.__send_json_cache(lambda: arrjson.generate_arr_json(self.server.lst_arr_dep), llst_path)
 
                 # decolagem ?
                 elif "/data/dep.json" == self.path:
 
-                    # create and send headers
-                    self.send_response(200)
-                    self.send_header("Content-type", D_MODES_CONTENT_TYPE_JSON)
-                    self.end_headers()
-
                     # recebeu decolagem ?
                     if len(llst_path) > 1:
 
-                        # create and send json
-                        self.wfile.write(depjson.generate_dep_json(self.server.lst_arr_dep, llst_path[1]))
+                        # create and send json (cached)
+                        self.__send_json_cache(lambda: depjson.generate_dep_json(self.server.lst_arr_dep, llst_path[1]), llst_path)
 
                     # senão, envia todo dicionário
                     else:
-                        # create and send json
-                        self.wfile.write(depjson.generate_dep_json(self.server.lst_arr_dep))
+                        # create and send json (cached)
+                        self.__send_json_cache(lambda: depjson.generate_dep_json(self.server.lst_arr_dep), llst_path)
 
                 # espera ?
                 elif "/data/esp.json" == self.path:
 
-                    # create and send headers
-                    self.send_response(200)
-                    self.send_header("Content-type", D_MODES_CONTENT_TYPE_JSON)
-                    self.end_headers()
-
                     # recebeu espera ?
                     if len(llst_path) > 1:
 
-                        # create and send json
-                        self.wfile.write(espjson.generate_esp_json(self.server.dct_esp, llst_path[1]))
+                        # create and send json (cached)
+                        self.__send_json_cache(lambda: espjson.generate_esp_json(self.server.dct_esp, llst_path[1]), llst_path)
 
                     # senão, envia todo dicionário
                     else:
-                        # create and send json
-                        self.wfile.write(espjson.generate_esp_json(self.server.dct_esp))
+                        # create and send json (cached)
+                        self.__send_json_cache(lambda: espjson.generate_esp_json(self.server.dct_esp), llst_path)
 
                 # fixo ?
                 elif "/data/fix.json" == self.path:
 
-                    # create and send headers
-                    self.send_response(200)
-                    self.send_header("Content-type", D_MODES_CONTENT_TYPE_JSON)
-                    self.end_headers()
-
                     # recebeu fixo ?
                     if len(llst_path) > 1:
 
-                        # create and send json
-                        self.wfile.write(fixjson.generate_fix_json(self.server.dct_fix, llst_path[1]))
+                        # create and send json (cached)
+                        self.__send_json_cache(lambda: fixjson.generate_fix_json(self.server.dct_fix, llst_path[1]), llst_path)
 
                     # senão, envia todo dicionário
                     else:
-                        # create and send json
-                        self.wfile.write(fixjson.generate_fix_json(self.server.dct_fix))
+                        # create and send json (cached)
+                        self.__send_json_cache(lambda: fixjson.generate_fix_json(self.server.dct_fix), llst_path)
+
+                # métricas ?
+                elif "/data/metrics.json" == self.path:
+
+                    # create and send json
+                    self.__send_json(mtrjson.generate_metrics_json(self.server.sim_stat))
+
+                # trajetórias previstas ?
+                elif "/data/predict.json" == self.path:
+
+                    # create and send json
+                    self.__send_json(prdjson.generate_pred_json(self.server.dct_pred, self.server.lst_cnfl, self.server.coords))
 
                 # performance ?
                 elif "/data/prf.json" == self.path:
 
-                    # create and send headers
-                    self.send_response(200)
-                    self.send_header("Content-type", D_MODES_CONTENT_TYPE_JSON)
-                    self.end_headers()
-
-                    # create and send json file
-                    self.wfile.write(prfjson.generate_prf_json(self.server.dct_prf, llst_path[1]))
+                    # create and send json file (cached)
+                    self.__send_json_cache(lambda: prfjson.generate_prf_json(self.server.dct_prf, llst_path[1]), llst_path)
 
                 # subida ?
                 elif "/data/sub.json" == self.path:
 
-                    # create and send headers
-                    self.send_response(200)
-                    self.send_header("Content-type", D_MODES_CONTENT_TYPE_JSON)
-                    self.end_headers()
-
                     # recebeu subida ?
                     if len(llst_path) > 1:
 
-                        # create and send json
-                        self.wfile.write(subjson.generate_sub_json(self.server.dct_sub, llst_path[1]))
+                        # create and send json (cached)
+                        self.__send_json_cache(lambda: subjson.generate_sub_json(self.server.dct_sub, llst_path[1]), llst_path)
 
                     # senão, envia todo dicionário
                     else:
-                        # create and send json
-                        self.wfile.write(subjson.generate_sub_json(self.server.dct_sub))
+                        # create and send json (cached)
+                        self.__send_json_cache(lambda: subjson.generate_sub_json(self.server.dct_sub), llst_path)
 
                 # trajetórias ?
                 elif "/data/trj.json" == self.path:
 
-                    # create and send headers
-                    self.send_response(200)
-                    self.send_header("Content-type", D_MODES_CONTENT_TYPE_JSON)
-                    self.end_headers()
-
                     # recebeu trajetória ?
                     if len(llst_path) > 1:
 
-                        # create and send json
-                        self.wfile.write(trjjson.generate_trj_json(self.server.dct_trj, llst_path[1]))
+                        # create and send json (cached)
+                        self.__send_json_cache(lambda: trjjson.generate_trj_json(self.server.dct_trj, llst_path[1]), llst_path)
 
                     # senão, envia todo dicionário
                     else:
-                        # create and send json
-                        self.wfile.write(trjjson.generate_trj_json(self.server.dct_trj))
+                        # create and send json (cached)
+                        self.__send_json_cache(lambda: trjjson.generate_trj_json(self.server.dct_trj), llst_path)
 
                 # status ?
                 elif "/data/status.json" == self.path:
 
-                    # create and send headers
-                    self.send_response(200)
-                    self.send_header("Content-type", D_MODES_CONTENT_TYPE_JSON)
-                    self.end_headers()
-
                     # create and send json file
-                    self.wfile.write(sttjson.generate_status_json(self.server.dct_flight, llst_path[1]))
+                    self.__send_json(sttjson.generate_status_json(self.server.anv_snap.obtem(), llst_path[1]))
+
+                # senão, json desconhecido (HTTP/1.1: toda requisição precisa de resposta)
+                else:
+                    raise IOError(self.path)
+
+            # feed contínuo de aeronaves ?
+            elif "/data/aircraft.sse" == self.path:
+
+                # envia as alterações até o cliente fechar
+                self.__send_anv_feed()
 
             # html file ?
             elif self.path.endswith(".html"):
@@ -260,24 +278,27 @@ class CViewHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
                 mimetype = D_MODES_CONTENT_TYPE_JS
                 lv_send_reply = True
 
+            # senão, tipo de arquivo não servido
+            else:
+                raise IOError(self.path)
+
             if lv_send_reply:
 
-                # open the static file requested and send it
-                f = open(os.curdir + os.sep + "public_html" + self.path)
+                # open the static file requested and read it
+                with open(os.curdir + os.sep + "public_html" + self.path, "rb") as f:
+                    ls_body = f.read()
 
-                # create and send headers
+                # create and send headers (HTTP/1.1: o tamanho delimita a resposta no keep-alive)
                 self.send_response(200)
                 self.send_header("Content-type", mimetype)
+                self.send_header("Content-Length", str(len(ls_body)))
                 self.end_headers()
 
                 # create and send contents
-                self.wfile.write(f.read())
-
-                # close file
-                f.close()
+                self.wfile.write(ls_body)
 
-        # em caso de erro...
-        except IOError:
+        # em caso de erro (arquivo inexistente ou requisição sem a query obrigatória)...
+        except (IOError, IndexError):
 
             # send error
             self.send_error(404, "File Not Found:[{}]".format(self.path))
@@ -286,6 +307,125 @@ class CViewHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
         # M_LOG.info("do_GET:<<")
 
     # ---------------------------------------------------------------------------------------------
+
+    def __send_anv_feed(self):
+        """
+        feed contínuo de aeronaves (Server-Sent Events): um snapshot inicial com todas as aeronaves
+        e, a cada tick, só as alterações e remoções (ver anv_feed). Depois dos headers, a conexão
+        é entregue à thread do feed e o worker fica livre para as outras requisições
+        """
+        # create and send headers (sem Content-Length: o corpo termina com o fechamento)
+        self.send_response(200)
+        self.send_header("Content-type", D_MODES_CONTENT_TYPE_SSE)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.flush()
+
+        # o worker não fecha a conexão ao terminar a requisição
+        self.server.desanexa()
+
+        # entrega a conexão ao feed
+        self.server.anv_feed.assina(self.connection)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __send_json(self, fs_body):
+        """
+        envia uma resposta json dinâmica
+
+        @param fs_body: corpo json (None = não existe)
+        """
+        # corpo inexistente ?
+        if fs_body is None:
+
+            # send error
+            self.send_error(404, "File Not Found:[{}]".format(self.path))
+
+            # return
+            return
+
+        # corpo em bytes
+        if isinstance(fs_body, unicode):
+            fs_body = fs_body.encode("utf-8")
+
+        # create and send headers
+        self.send_response(200)
+        self.send_header("Content-type", D_MODES_CONTENT_TYPE_JSON)
+        self.send_header("Content-Length", str(len(fs_body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        # send json
+        self.wfile.write(fs_body)
+
+    # ---------------------------------------------------------------------------------------------
+
+    def __send_json_cache(self, f_gera, flst_path):
+        """
+        envia uma resposta json estática a partir do cache do servidor (json_cache). O corpo só é
+        gerado na primeira requisição de cada path + query; as seguintes recebem o corpo pronto
+        (comprimido se o cliente aceita gzip) ou 304 se o cliente já tem esta versão
+
+        @param f_gera: função sem parâmetros que gera o corpo json
+        @param flst_path: path e query da requisição
+        """
+        # obtém a resposta (chave = path + query)
+        l_resp = self.server.json_cache.obtem('?'.join(flst_path), f_gera)
+
+        # corpo inexistente ?
+        if l_resp is None:
+
+            # send error
+            self.send_error(404, "File Not Found:[{}]".format(self.path))
+
+            # return
+            return
+
+        # o cliente aceita gzip e o corpo comprimido existe ?
+        lv_gzip = (l_resp.s_gzip is not None) and ("gzip" in (self.headers.getheader("Accept-Encoding") or ""))
+
+        # o cliente já tem esta versão (da mesma representação) ?
+        if l_resp.v_nao_modificado(self.headers.getheader("If-None-Match"), self.headers.getheader("If-Modified-Since"), lv_gzip):
+
+            # create and send headers (sem corpo)
+            self.send_response(304)
+            self.send_header("ETag", l_resp.etag(lv_gzip))
+            self.send_header("Last-Modified", l_resp.s_last_mod)
+            self.send_header("Cache-Control", "no-cache")
+
+            # a resposta varia com o Accept-Encoding
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+
+            # return
+            return
+
+        # corpo a enviar
+        ls_body = l_resp.s_gzip if lv_gzip else l_resp.s_body
+
+        # create and send headers
+        self.send_response(200)
+        self.send_header("Content-type", D_MODES_CONTENT_TYPE_JSON)
+        self.send_header("Content-Length", str(len(ls_body)))
+        self.send_header("ETag", l_resp.etag(lv_gzip))
+        self.send_header("Last-Modified", l_resp.s_last_mod)
+
+        # revalida sempre (If-None-Match), o conteúdo muda com a recarga das tabelas
+        self.send_header("Cache-Control", "no-cache")
+
+        # corpo comprimido ?
+        if lv_gzip:
+            self.send_header("Content-Encoding", "gzip")
+
+        # a resposta varia com o Accept-Encoding (caches intermediários guardam as duas representações)
+        self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+
+        # send json
+        self.wfile.write(ls_body)
+
+    # ---------------------------------------------------------------------------------------------
     
     def log_message(self, format, *args): pass
         
@@ -20,6 +20,12 @@ MessageRateInTitle = false;
 Metric = false;
 ShowOtherUnits = true;
 
+// -- Update Settings -------------------------------------
+// Receive the aircraft from the server push feed (only the
+// changes are sent). If false, or if the browser has no
+// EventSource, the full aircraft list is polled instead.
+UseEventStream = true;
+
 // -- Map settings ----------------------------------------
 // These settings are overridden by any position information
 // provided by VisNewton itself. All positions are in decimal
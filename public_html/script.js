@@ -33,6 +33,7 @@ var ReceiverClock = null;
 var LastReceiverTimestamp = 0;
 var StaleReceiverCount = 0;
 var FetchPending = null;
+var EventFeed = null;
 
 var MessageCountHistory = [];
 var MessageRate = 0;
@@ -89,6 +90,68 @@ function processReceiverUpdate(data) {
 	}
 }
 
+// Apply an update (full or delta) and refresh the page
+function applyReceiverUpdate(data, checkStale) {
+        var now = data.now;
+
+        processReceiverUpdate(data);
+
+        // update timestamps, visibility, history track for all planes - not only those updated
+        for (var i = 0; i < PlanesOrdered.length; ++i) {
+                var plane = PlanesOrdered[i];
+                plane.updateTick(now, LastReceiverTimestamp);
+        }
+        
+        refreshTableInfo();
+        refreshSelected();
+        
+        if (ReceiverClock) {
+                var rcv = new Date(now * 1000);
+                ReceiverClock.render(rcv.getUTCHours(),rcv.getUTCMinutes(),rcv.getUTCSeconds());
+        }
+
+        // Check for stale receiver data (polling only, the feed is silent when nothing changes)
+        if (checkStale && LastReceiverTimestamp === now) {
+                StaleReceiverCount++;
+                if (StaleReceiverCount > 5) {
+                        $("#update_error_detail").text("The data from Newton hasn't been updated in a while. Maybe Newton is no longer running?");
+                        $("#update_error").css('display','block');
+                }
+        } else { 
+                StaleReceiverCount = 0;
+                LastReceiverTimestamp = now;
+                $("#update_error").css('display','none');
+        }
+}
+
+// Remove planes that left the simulation
+function removePlanes(removed) {
+        if (removed.length === 0)
+                return;
+
+        var gone = {};
+        for (var i = 0; i < removed.length; ++i) {
+                var plane = Planes[removed[i]];
+                if (plane) {
+                        if (SelectedPlane === plane.icao)
+                                selectPlaneByHex(plane.icao, false);
+                        if (plane.tr.parentNode)
+                                plane.tr.parentNode.removeChild(plane.tr);
+                        plane.tr = null;
+                        delete Planes[plane.icao];
+                        plane.destroy();
+                        gone[plane.icao] = true;
+                }
+        }
+
+        var newPlanes = [];
+        for (var i = 0; i < PlanesOrdered.length; ++i) {
+                if (!gone[PlanesOrdered[i].icao])
+                        newPlanes.push(PlanesOrdered[i]);
+        }
+        PlanesOrdered = newPlanes;
+}
+
 function fetchData() {
         if (FetchPending !== null && FetchPending.state() == 'pending') {
                 // don't double up on fetches, let the last one resolve
@@ -100,36 +163,7 @@ function fetchData() {
                                 cache: false,
                                 dataType: 'json' });
         FetchPending.done(function(data) {
-                var now = data.now;
-
-                processReceiverUpdate(data);
-
-                // update timestamps, visibility, history track for all planes - not only those updated
-                for (var i = 0; i < PlanesOrdered.length; ++i) {
-                        var plane = PlanesOrdered[i];
-                        plane.updateTick(now, LastReceiverTimestamp);
-                }
-                
-		refreshTableInfo();
-		refreshSelected();
-                
-                if (ReceiverClock) {
-                        var rcv = new Date(now * 1000);
-                        ReceiverClock.render(rcv.getUTCHours(),rcv.getUTCMinutes(),rcv.getUTCSeconds());
-                }
-
-                // Check for stale receiver data
-                if (LastReceiverTimestamp === now) {
-                        StaleReceiverCount++;
-                        if (StaleReceiverCount > 5) {
-                                $("#update_error_detail").text("The data from Newton hasn't been updated in a while. Maybe Newton is no longer running?");
-                                $("#update_error").css('display','block');
-                        }
-                } else { 
-                        StaleReceiverCount = 0;
-                        LastReceiverTimestamp = now;
-                        $("#update_error").css('display','none');
-                }
+                applyReceiverUpdate(data, true);
 	});
 
         FetchPending.fail(function(jqxhr, status, error) {
@@ -138,6 +172,53 @@ function fetchData() {
         });
 }
 
+// Receive the aircraft from the server push feed (data/aircraft.sse): one
+// snapshot with all aircraft, then only the changed and removed ones.
+// Falls back to polling data/aircraft.json without EventSource.
+function startUpdates() {
+        if (!UseEventStream || typeof(EventSource) === "undefined") {
+                window.setInterval(fetchData, RefreshInterval);
+                fetchData();
+                return;
+        }
+
+        EventFeed = new EventSource('data/aircraft.sse');
+
+        // full state (on connect, reconnect and after a slow client lost messages)
+        EventFeed.addEventListener('snapshot', function(e) {
+                var data = JSON.parse(e.data);
+                var present = {};
+                for (var i = 0; i < data.aircraft.length; ++i)
+                        present[data.aircraft[i].hex] = true;
+
+                var removed = [];
+                for (var hex in Planes) {
+                        if (!present[hex])
+                                removed.push(hex);
+                }
+                removePlanes(removed);
+                applyReceiverUpdate(data, false);
+        });
+
+        // changes since the last message
+        EventFeed.addEventListener('delta', function(e) {
+                var data = JSON.parse(e.data);
+                if (data.removed)
+                        removePlanes(data.removed);
+                applyReceiverUpdate(data, false);
+        });
+
+        EventFeed.onopen = function() {
+                $("#update_error").css('display','none');
+        };
+
+        // the browser reconnects by itself
+        EventFeed.onerror = function() {
+                $("#update_error_detail").text("Lost the connection to the Newton live feed, reconnecting...");
+                $("#update_error").css('display','block');
+        };
+}
+
 var PositionHistorySize = 0;
 function initialize() {
         // Set page basics
@@ -288,13 +369,10 @@ function end_load_history() {
         refreshSelected();
         reaper();
 
-        // Setup our timer to poll from the server.
-        window.setInterval(fetchData, RefreshInterval);
+        // Setup the live feed (or our timer to poll from the server).
+        startUpdates();
         window.setInterval(reaper, 60000);
 
-        // And kick off one refresh immediately.
-        fetchData();
-
 }
 
 // Initalizes the map and starts up our timers to call various functions